@@ -0,0 +1,4 @@
+"""MyPM 성능 벤치마크 모음.
+
+``backend`` 디렉터리에서 ``python -m benchmarks.<모듈>`` 형태로 실행합니다.
+"""
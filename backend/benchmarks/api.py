@@ -0,0 +1,219 @@
+"""프로세스 내 HTTP 벤치마크.
+
+``mypm.app.create_app`` 으로 만든 앱을 ASGI 전송으로 직접 호출하므로 네트워크와 서버
+프로세스 없이 라우트, 의존성, 검증, 서비스, 직렬화 비용을 잽니다. 시나리오:
+
+- ``board``: 대시보드 로드. 상태별 목록 첫 페이지(50개) 네 번과 통계 한 번
+- ``drag``: 보드에서 카드를 옮기는 상태 수정 (``PATCH /tasks/{id}``)
+- ``attach``: Task 를 회고에 연결 (이전 회고에서 빼기 포함)
+- ``mixed``: 반복마다 board 70%, drag 20%, attach 10%
+
+요청 종류별 p50/p95/p99 와 처리량을 출력합니다. 저장소 백엔드는 ``MYPM_STORAGE_BACKEND``
+로 고릅니다.
+
+사용법::
+
+    python -m benchmarks.api --size 10000 --users 16 --requests 3000 --output
+    results/api.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import time
+from collections import defaultdict
+from collections.abc import Awaitable
+from datetime import date, timedelta
+
+import httpx
+
+from benchmarks.report import add_comparison_arguments, finish, summarize
+from benchmarks.storage import STATUSES
+
+SCENARIOS = ("board", "drag", "attach", "mixed")
+_SEED_BATCH = 5000
+_RETROSPECTIVES = 30
+
+# (요청 종류, 응답, 지연 나노초)
+Timed = tuple[str, httpx.Response, int]
+
+
+async def _timed(kind: str, request: Awaitable[httpx.Response]) -> Timed:
+    started = time.perf_counter_ns()
+    response = await request
+    return kind, response, time.perf_counter_ns() - started
+
+
+class _Fixture:
+    """시드된 Task/회고 ID 와 시나리오별 요청 묶음."""
+
+    def __init__(self, task_ids: list[str], retrospective_ids: list[str]) -> None:
+        self.task_ids = task_ids
+        self.retrospective_ids = retrospective_ids
+
+    async def board(self, client: httpx.AsyncClient, rng: random.Random) -> list[Timed]:
+        responses = [
+            await _timed(
+                "list",
+                client.get(
+                    "/tasks/", params={"status_filter": status.value, "limit": 50}
+                ),
+            )
+            for status in STATUSES
+        ]
+        responses.append(await _timed("stats", client.get("/tasks/stats")))
+        return responses
+
+    async def drag(self, client: httpx.AsyncClient, rng: random.Random) -> list[Timed]:
+        task_id, status = rng.choice(self.task_ids), rng.choice(STATUSES)
+        return [
+            await _timed(
+                "patch",
+                client.patch(f"/tasks/{task_id}", json={"status": status.value}),
+            )
+        ]
+
+    async def attach(
+        self, client: httpx.AsyncClient, rng: random.Random
+    ) -> list[Timed]:
+        retrospective_id, task_id = (
+            rng.choice(self.retrospective_ids),
+            rng.choice(self.task_ids),
+        )
+        return [
+            await _timed(
+                "attach",
+                client.post(f"/retrospectives/{retrospective_id}/tasks/{task_id}"),
+            )
+        ]
+
+    async def mixed(self, client: httpx.AsyncClient, rng: random.Random) -> list[Timed]:
+        roll = rng.random()
+        if roll < 0.7:
+            return await self.board(client, rng)
+        if roll < 0.9:
+            return await self.drag(client, rng)
+        return await self.attach(client, rng)
+
+
+async def _seed(client: httpx.AsyncClient, size: int) -> _Fixture:
+    rng = random.Random(0)
+    base = date(2026, 1, 1)
+    task_ids = []
+    for start in range(0, size, _SEED_BATCH):
+        items = [
+            {
+                "title": f"task {index}",
+                "description": f"description {index}",
+                "due_date": (base + timedelta(days=rng.randrange(365))).isoformat(),
+            }
+            for index in range(start, min(start + _SEED_BATCH, size))
+        ]
+        response = await client.post("/tasks/batch", json={"items": items})
+        response.raise_for_status()
+        task_ids.extend(item["task"]["id"] for item in response.json()["results"])
+
+    # 상태가 한쪽에 몰리지 않도록 고르게 나눕니다.
+    updates = [
+        {"id": task_id, "status": STATUSES[index % len(STATUSES)].value}
+        for index, task_id in enumerate(task_ids)
+    ]
+    for start in range(0, len(updates), _SEED_BATCH):
+        response = await client.patch(
+            "/tasks/batch", json={"items": updates[start : start + _SEED_BATCH]}
+        )
+        response.raise_for_status()
+
+    retrospective_ids = []
+    for offset in range(_RETROSPECTIVES):
+        day = (base + timedelta(days=offset)).isoformat()
+        response = await client.post(
+            "/retrospectives/", json={"title": f"retro {offset}", "date": day}
+        )
+        response.raise_for_status()
+        retrospective_ids.append(response.json()["id"])
+    return _Fixture(task_ids, retrospective_ids)
+
+
+async def _run_scenario(
+    client: httpx.AsyncClient,
+    fixture: _Fixture,
+    scenario: str,
+    users: int,
+    iterations: int,
+) -> list[dict]:
+    step = getattr(fixture, scenario)
+    latencies: dict[str, list[int]] = defaultdict(list)
+    remaining = iterations
+    errors = 0
+    clock = time.perf_counter_ns
+
+    async def _user(seed: int) -> None:
+        nonlocal remaining, errors
+        rng = random.Random(seed)
+        while remaining > 0:
+            remaining -= 1
+            for kind, response, elapsed in await step(client, rng):
+                latencies[kind].append(elapsed)
+                # 동시 수정 충돌(409)은 정상 응답으로 봅니다.
+                if response.status_code >= 400 and response.status_code != 409:
+                    errors += 1
+
+    started = clock()
+    await asyncio.gather(*(_user(seed) for seed in range(users)))
+    seconds = (clock() - started) / 1e9
+    if errors:
+        raise RuntimeError(f"{scenario}: {errors} failed requests")
+
+    rows = [
+        {"name": f"api/{scenario}/{kind}", **summarize(values, seconds)}
+        for kind, values in latencies.items()
+    ]
+    combined = [value for values in latencies.values() for value in values]
+    rows.append({"name": f"api/{scenario}/all", **summarize(combined, seconds)})
+    return rows
+
+
+async def run(
+    size: int, users: int, iterations: int, scenarios: list[str]
+) -> list[dict]:
+    # 설정은 임포트 시점의 환경 변수로 정해지므로 앱은 실행할 때 임포트합니다.
+    from mypm.app import create_app
+
+    transport = httpx.ASGITransport(app=create_app())
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://bench", timeout=60.0
+    ) as client:
+        fixture = await _seed(client, size)
+        results = []
+        for scenario in scenarios:
+            results.extend(
+                await _run_scenario(client, fixture, scenario, users, iterations)
+            )
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--size", type=int, default=10_000, help="시드할 Task 수")
+    parser.add_argument("--users", type=int, default=16, help="동시 가상 사용자 수")
+    parser.add_argument(
+        "--requests", type=int, default=3_000, help="시나리오별 반복 횟수"
+    )
+    parser.add_argument(
+        "--scenarios", nargs="+", choices=SCENARIOS, default=list(SCENARIOS)
+    )
+    add_comparison_arguments(parser)
+    args = parser.parse_args()
+
+    return finish(
+        asyncio.run(run(args.size, args.users, args.requests, args.scenarios)), args
+    )
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,162 @@
+"""변경 피드 벤치마크.
+
+- ``refresh``: Task 하나를 바꾼 뒤 전체 목록(``GET /tasks/``)을 다시 받는 경우와
+  ``GET /changes?since=`` 로 변경분만 받는 경우의 응답 크기와 시간
+- ``fanout``: 구독자 수별로 변경이 기록된 뒤 각 구독자가 받기까지의 지연. 읽지 않고 멈춰
+  있는 구독자 하나를 함께 두어 다른 구독자가 그 때문에 늦어지지 않는지 봅니다.
+
+사용법::
+
+    python -m benchmarks.changes --sizes 1000 10000 100000 --subscribers 1 100 1000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import time
+
+import httpx
+
+from benchmarks.storage import make_tasks
+from mypm.application.tasks import ChangeService
+from mypm.infrastructure.tasks import (
+    ChangeLog,
+    InMemoryRetrospectiveRepository,
+    InMemoryTaskRepository,
+)
+
+_SEED_BATCH = 5000
+
+
+async def bench_refresh(sizes: list[int], repeat: int) -> list[dict]:
+    from mypm.app import app
+
+    rows = []
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://bench"
+    ) as client:
+        seeded = 0
+        for size in sizes:
+            while seeded < size:
+                count = min(_SEED_BATCH, size - seeded)
+                items = [{"title": f"task {seeded + index}"} for index in range(count)]
+                (
+                    await client.post("/tasks/batch", json={"items": items})
+                ).raise_for_status()
+                seeded += count
+            task_id = (await client.get("/tasks/", params={"limit": 1})).json()[0]["id"]
+            cursor = (await client.get("/changes/", params={"limit": 1})).json()[
+                "cursor"
+            ]
+
+            full = delta = 0.0
+            full_bytes = delta_bytes = 0
+            for index in range(repeat):
+                await client.patch(
+                    f"/tasks/{task_id}", json={"title": f"renamed {index}"}
+                )
+
+                started = time.perf_counter()
+                response = await client.get("/tasks/")
+                full += time.perf_counter() - started
+                full_bytes = len(response.content)
+
+                started = time.perf_counter()
+                response = await client.get("/changes/", params={"since": cursor})
+                delta += time.perf_counter() - started
+                delta_bytes = len(response.content)
+                cursor = response.json()["cursor"]
+
+            rows.append(
+                {
+                    "size": size,
+                    "full_ms": full / repeat * 1000,
+                    "full_bytes": full_bytes,
+                    "delta_ms": delta / repeat * 1000,
+                    "delta_bytes": delta_bytes,
+                }
+            )
+    return rows
+
+
+async def bench_fanout(subscribers: int, writes: int, capacity: int) -> dict:
+    changes = ChangeLog(capacity)
+    tasks = InMemoryTaskRepository(changes=changes)
+    service = ChangeService(
+        changes, tasks, InMemoryRetrospectiveRepository(changes=changes)
+    )
+    written: dict[int, float] = {}
+    latencies: list[float] = []
+
+    async def _subscribe(cursor: int) -> None:
+        while True:
+            result = await service.get_deltas(cursor, 500)
+            now = time.perf_counter()
+            latencies.extend(
+                now - written[change.sequence] for change in result.changes
+            )
+            cursor = result.cursor
+            if not result.has_more:
+                await service.wait_for_changes(cursor, 1.0)
+
+    start = await service.get_latest()
+    # 멈춰 있는 구독자: 커서만 들고 읽지 않습니다. 나중에 읽으면 만료(reset)를 받습니다.
+    stalled = start
+    readers = [asyncio.create_task(_subscribe(start)) for _ in range(subscribers)]
+    await asyncio.sleep(0)
+
+    for task in make_tasks(writes):
+        await tasks.add(task)
+        written[await service.get_latest()] = time.perf_counter()
+        await asyncio.sleep(0)
+    await asyncio.sleep(0.05)
+    for reader in readers:
+        reader.cancel()
+
+    latencies.sort()
+    return {
+        "subscribers": subscribers,
+        "delivered": len(latencies) / (subscribers * writes),
+        "p50_us": statistics.median(latencies) * 1e6,
+        "p99_us": latencies[int(len(latencies) * 0.99)] * 1e6,
+        "stalled_reset": (await service.get_deltas(stalled, 500)).reset,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000]
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--subscribers", type=int, nargs="+", default=[1, 100, 1000])
+    parser.add_argument("--writes", type=int, default=2000)
+    parser.add_argument("--capacity", type=int, default=1000)
+    args = parser.parse_args()
+
+    print(f"{'size':>9} {'full ms':>9} {'full KiB':>10} {'delta ms':>9} {'delta B':>8}")
+    for row in asyncio.run(bench_refresh(args.sizes, args.repeat)):
+        print(
+            f"{row['size']:>9} {row['full_ms']:>9.2f} {row['full_bytes'] / 1024:>10.1f}"
+            f" {row['delta_ms']:>9.2f} {row['delta_bytes']:>8}"
+        )
+
+    print()
+    print(
+        f"{'subscribers':>11} {'delivered':>9} "
+        f"{'p50 us':>9} {'p99 us':>9} {'stalled':>8}"
+    )
+    for subscribers in args.subscribers:
+        row = asyncio.run(bench_fanout(subscribers, args.writes, args.capacity))
+        print(
+            f"{row['subscribers']:>11} {row['delivered']:>9.0%} {row['p50_us']:>9.1f}"
+            f" {row['p99_us']:>9.1f} {'reset' if row['stalled_reset'] else 'ok':>8}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+"""열 기반(compact) 저장소 vs 메모리 저장소 메모리/지연 시간 벤치마크.
+
+(백엔드, 크기) 조합마다 새 프로세스에서 Task 를 배치 단위로 적재한 뒤, 적재 후에도 살아
+있는 할당량과 주요 연산의 평균 지연 시간을 잽니다. 할당량은 ``--trace-max`` 이하
+크기에서는 tracemalloc 으로 재며 이때 적재 시간은 tracemalloc 이 켜진 상태의 값입니다.
+그보다 큰 크기는 RSS 증가량으로 재므로 배치 하나 분량의 임시 Task 가 섞여 있습니다.
+메모리 저장소는 검색 색인을 포함해 Task 당 수 KB 를 쓰므로 ``--memory-max`` 이하
+크기에서만 실행합니다.
+
+사용법::
+
+    python -m benchmarks.compact --sizes 1000000 10000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gc
+import multiprocessing
+import os
+import random
+import time
+import tracemalloc
+from datetime import date, timedelta
+
+from benchmarks.storage import make_tasks
+from mypm.domain.tasks import TaskKeyset, TaskRepository, TaskSortField
+from mypm.infrastructure.tasks import CompactTaskRepository, InMemoryTaskRepository
+
+_BATCH = 100_000
+_PAGE_SIZE = 50
+
+
+def _rss_bytes() -> int:
+    with open("/proc/self/statm") as statm:
+        return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+
+async def _per_op_us(operations: int, func) -> float:
+    started = time.perf_counter()
+    for index in range(operations):
+        await func(index)
+    return (time.perf_counter() - started) / operations * 1e6
+
+
+async def _bench(backend: str, size: int, operations: int, trace: bool) -> dict:
+    repository: TaskRepository = (
+        CompactTaskRepository() if backend == "compact" else InMemoryTaskRepository()
+    )
+    rng = random.Random(size)
+    sample_ids = []
+
+    gc.collect()
+    if trace:
+        tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0] if trace else _rss_bytes()
+    started = time.perf_counter()
+    for offset in range(0, size, _BATCH):
+        batch = make_tasks(min(_BATCH, size - offset), seed=offset)
+        await repository.add_many(batch)
+        sample_ids.extend(
+            task.id for task in rng.sample(batch, min(len(batch), operations // 10 + 1))
+        )
+        del batch
+    load_seconds = time.perf_counter() - started
+    gc.collect()
+    memory = (tracemalloc.get_traced_memory()[0] if trace else _rss_bytes()) - baseline
+    tracemalloc.stop()
+
+    first_page = await repository.list_page(limit=_PAGE_SIZE)
+    middle = first_page[-1]
+    cursor = TaskKeyset(middle.created_at, middle.id)
+    base = date(2026, 1, 1)
+
+    async def _get(index: int) -> object:
+        return await repository.get(sample_ids[index % len(sample_ids)])
+
+    async def _page(index: int) -> object:
+        return await repository.list_page(
+            status="todo", order_by=TaskSortField.DUE_DATE, limit=_PAGE_SIZE
+        )
+
+    async def _cursor(index: int) -> object:
+        return await repository.list_page(after=cursor, limit=_PAGE_SIZE)
+
+    async def _due(index: int) -> object:
+        day = base + timedelta(days=index % 300)
+        return await repository.list_by_due_range(
+            due_after=day, due_before=day + timedelta(days=8), limit=_PAGE_SIZE
+        )
+
+    async def _update(index: int) -> object:
+        task = await repository.get(sample_ids[index % len(sample_ids)])
+        task.rename(f"{task.title}!")
+        task.touch()
+        return await repository.update(task)
+
+    async def _stats(index: int) -> object:
+        return await repository.stats(base)
+
+    return {
+        "backend": backend,
+        "size": size,
+        "load_s": load_seconds,
+        "bytes_per_task": memory / size,
+        "get_us": await _per_op_us(operations, _get),
+        "page_us": await _per_op_us(operations // 10, _page),
+        "cursor_us": await _per_op_us(operations // 10, _cursor),
+        "due_us": await _per_op_us(operations // 10, _due),
+        "update_us": await _per_op_us(operations, _update),
+        "stats_us": await _per_op_us(operations // 10, _stats),
+    }
+
+
+def _run(
+    backend: str,
+    size: int,
+    operations: int,
+    trace: bool,
+    results: multiprocessing.Queue,
+) -> None:
+    results.put(asyncio.run(_bench(backend, size, operations, trace)))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000_000, 10_000_000])
+    parser.add_argument("--ops", type=int, default=10_000)
+    parser.add_argument(
+        "--memory-max",
+        type=int,
+        default=1_000_000,
+        help="메모리 저장소를 실행할 최대 크기",
+    )
+    parser.add_argument(
+        "--trace-max", type=int, default=1_000_000, help="tracemalloc 으로 잴 최대 크기"
+    )
+    args = parser.parse_args()
+
+    columns = (
+        "load_s",
+        "bytes_per_task",
+        "get_us",
+        "page_us",
+        "cursor_us",
+        "due_us",
+        "update_us",
+        "stats_us",
+    )
+    print(
+        f"{'backend':>8} {'size':>9} " + " ".join(f"{column:>14}" for column in columns)
+    )
+    context = multiprocessing.get_context("spawn")
+    for size in args.sizes:
+        backends = ["memory", "compact"] if size <= args.memory_max else ["compact"]
+        for backend in backends:
+            results = context.Queue()
+            trace = size <= args.trace_max
+            process = context.Process(
+                target=_run, args=(backend, size, args.ops, trace, results)
+            )
+            process.start()
+            row = results.get()
+            process.join()
+            print(
+                f"{row['backend']:>8} {row['size']:>9} "
+                + " ".join(f"{row[column]:>14.1f}" for column in columns),
+                flush=True,
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,287 @@
+"""동시 쓰기 스트레스 벤치마크: 엔티티별 잠금 vs 전역 잠금.
+
+여러 작성자가 동시에 Task 상태 수정, 회고 연결(이전 회고에서 빼기 포함), 하나의 "핫"
+Task 카운터 증가를 섞어 실행합니다. 끝난 뒤 다음을 검사합니다.
+
+- 핫 카운터 값이 성공한 증가 횟수와 같은지 (잃어버린 갱신 ``lost``)
+- 모든 Task 의 ``retrospective_id`` 와 회고의 ``tasks`` 목록, 회고별 상태 카운터가
+  서로 일치하는지 (``mismatch``)
+- 통계 카운터가 전체 재계산 결과와 같은지 (``drift``)
+
+같은 작업을 저장소 자체의 엔티티별 잠금과, 비교용으로 모든 쓰기를 하나의 잠금으로
+직렬화하는 저장소로 각각 실행해 처리량을 비교합니다. 메모리 저장소는 저널(fsync 끔)을
+켜서 커밋이 실제로 양보하도록 합니다.
+
+사용법::
+
+    python -m benchmarks.concurrency --workers 8 64 --ops 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import random
+import tempfile
+import time
+import uuid
+from collections.abc import Callable, Iterable
+from contextlib import AbstractAsyncContextManager
+from datetime import date, timedelta
+
+from benchmarks.storage import STATUSES, make_tasks
+from mypm.application.tasks import RetrospectiveService, TaskService
+from mypm.application.tasks.dto import TaskUpdateInput
+from mypm.application.tasks.unit_of_work import UnitOfWork
+from mypm.domain.tasks import (
+    ConflictError,
+    Retrospective,
+    RetrospectiveRepository,
+    Task,
+    TaskRepository,
+    TransactionalStore,
+)
+from mypm.infrastructure.tasks import (
+    CompactTaskRepository,
+    InMemoryRetrospectiveRepository,
+    InMemoryTransactionalStore,
+    Journal,
+    SQLiteConnectionPool,
+    SQLiteRetrospectiveRepository,
+    SQLiteTaskRepository,
+    SQLiteTransactionalStore,
+    open_journaled_repositories,
+)
+
+TODAY = date(2026, 6, 1)
+BACKENDS = ("memory", "compact", "sqlite")
+LOCKS = ("entity", "global")
+
+
+class GlobalLockStore(TransactionalStore):
+    """비교 기준: 관계없는 엔티티의 쓰기까지 하나의 잠금으로 직렬화합니다."""
+
+    def __init__(self, store: TransactionalStore) -> None:
+        self._store = store
+        self._lock = asyncio.Lock()
+
+    def lock(
+        self, entity_ids: Iterable[uuid.UUID]
+    ) -> AbstractAsyncContextManager[None]:
+        return self._lock
+
+    async def commit(
+        self, tasks: list[Task], retrospectives: list[Retrospective]
+    ) -> None:
+        await self._store.commit(tasks, retrospectives)
+
+
+def _open(
+    backend: str, directory: str
+) -> tuple[
+    TaskRepository, RetrospectiveRepository, TransactionalStore, Callable[[], None]
+]:
+    if backend == "memory":
+        journal = Journal(directory, fsync=False)
+        tasks, retrospectives = open_journaled_repositories(journal)
+        return (
+            tasks,
+            retrospectives,
+            InMemoryTransactionalStore(tasks, retrospectives, journal),
+            journal.close,
+        )
+
+    if backend == "compact":
+        compact, retrospectives = (
+            CompactTaskRepository(),
+            InMemoryRetrospectiveRepository(),
+        )
+        return (
+            compact,
+            retrospectives,
+            InMemoryTransactionalStore(compact, retrospectives),
+            lambda: None,
+        )
+
+    pool = SQLiteConnectionPool(os.path.join(directory, "bench.sqlite3"))
+    sqlite = SQLiteTaskRepository(pool)
+    return (
+        sqlite,
+        SQLiteRetrospectiveRepository(pool),
+        SQLiteTransactionalStore(pool, sqlite),
+        pool.close,
+    )
+
+
+async def _count_mismatches(
+    tasks: TaskRepository,
+    retrospectives: RetrospectiveRepository,
+    task_ids: list[uuid.UUID],
+    retrospective_ids: list[uuid.UUID],
+) -> int:
+    """Task 쪽 연결과 회고 쪽 목록/카운터가 어긋난 항목 수."""
+
+    members: dict[uuid.UUID, list[uuid.UUID]] = {}
+    sizes: dict[uuid.UUID, int] = {}
+    for retrospective_id in retrospective_ids:
+        retrospective = await retrospectives.get(retrospective_id)
+        sizes[retrospective_id] = len(retrospective.tasks)
+        for task_id in retrospective.tasks:
+            members.setdefault(task_id, []).append(retrospective_id)
+
+    mismatches = 0
+    for task_id, task in (await tasks.get_many(task_ids)).items():
+        expected = [task.retrospective_id] if task.retrospective_id is not None else []
+        mismatches += members.get(task_id, []) != expected
+
+    counts = await tasks.count_by_retrospective(retrospective_ids)
+    for retrospective_id, size in sizes.items():
+        mismatches += sum(counts.get(retrospective_id, {}).values()) != size
+    return mismatches
+
+
+async def bench(
+    backend: str,
+    locks: str,
+    workers: int,
+    operations: int,
+    size: int,
+    retrospective_count: int,
+    hot: float,
+) -> dict:
+    with tempfile.TemporaryDirectory() as directory:
+        task_repository, retrospective_repository, store, close = _open(
+            backend, directory
+        )
+        try:
+            if locks == "global":
+                store = GlobalLockStore(store)
+            task_service = TaskService(task_repository, retrospective_repository, store)
+            retrospective_service = RetrospectiveService(
+                retrospective_repository, task_repository, store
+            )
+
+            tasks = make_tasks(size)
+            counter = tasks[0]
+            counter.description = "0"
+            await task_repository.add_many(tasks)
+            task_ids = [task.id for task in tasks[1:]]
+            retrospective_ids = []
+            for index in range(retrospective_count):
+                retrospective = Retrospective(
+                    title=f"retro {index}", date=TODAY + timedelta(days=index)
+                )
+                await retrospective_repository.add(retrospective)
+                retrospective_ids.append(retrospective.id)
+
+            latencies: list[float] = []
+            increments = conflicts = 0
+
+            async def _increment() -> None:
+                async with UnitOfWork(
+                    store,
+                    task_repository,
+                    retrospective_repository,
+                    task_ids=[counter.id],
+                ) as uow:
+                    task = await uow.get_task(counter.id)
+                    task.describe(str(int(task.description) + 1))
+                    task.touch()
+                    await uow.commit()
+
+            async def _worker(seed: int) -> None:
+                nonlocal increments, conflicts
+                rng = random.Random(seed)
+                for _ in range(operations // workers):
+                    choice = rng.random()
+                    started = time.perf_counter()
+                    try:
+                        if choice < hot:
+                            await _increment()
+                            increments += 1
+                        elif choice < (1 + hot) / 2:
+                            await retrospective_service.attach_task(
+                                rng.choice(retrospective_ids), rng.choice(task_ids)
+                            )
+                        else:
+                            await task_service.update_task(
+                                rng.choice(task_ids),
+                                TaskUpdateInput(status=rng.choice(STATUSES)),
+                            )
+                    except ConflictError:
+                        conflicts += 1
+                    latencies.append(time.perf_counter() - started)
+
+            started = time.perf_counter()
+            await asyncio.gather(*(_worker(seed) for seed in range(workers)))
+            elapsed = time.perf_counter() - started
+
+            value = int((await task_repository.get(counter.id)).description)
+            mismatches = await _count_mismatches(
+                task_repository, retrospective_repository, task_ids, retrospective_ids
+            )
+            drift = await task_service.check_stats(TODAY)
+        finally:
+            close()
+
+    latencies.sort()
+    return {
+        "backend": backend,
+        "locks": locks,
+        "workers": workers,
+        "ops_s": len(latencies) / elapsed,
+        "p50_ms": latencies[len(latencies) // 2] * 1000,
+        "p99_ms": latencies[int(len(latencies) * 0.99)] * 1000,
+        "conflicts": conflicts,
+        "lost": increments - value,
+        "mismatch": mismatches,
+        "drift": len(drift),
+    }
+
+
+async def run(args: argparse.Namespace) -> None:
+    print(
+        f"{'backend':>8} {'locks':>7} {'workers':>8} {'ops/s':>9} "
+        f"{'p50 ms':>8} {'p99 ms':>8} "
+        f"{'conflicts':>9} {'lost':>5} {'mismatch':>8} {'drift':>6}"
+    )
+    for backend in args.backends:
+        for workers in args.workers:
+            for locks in LOCKS:
+                row = await bench(
+                    backend,
+                    locks,
+                    workers,
+                    args.ops,
+                    args.size,
+                    args.retrospectives,
+                    args.hot,
+                )
+                print(
+                    f"{row['backend']:>8} {row['locks']:>7} {row['workers']:>8} "
+                    f"{row['ops_s']:>9.0f} "
+                    f"{row['p50_ms']:>8.2f} {row['p99_ms']:>8.2f} "
+                    f"{row['conflicts']:>9} {row['lost']:>5} "
+                    f"{row['mismatch']:>8} {row['drift']:>6}",
+                    flush=True,
+                )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument(
+        "--backends", nargs="+", choices=BACKENDS, default=list(BACKENDS)
+    )
+    parser.add_argument("--workers", type=int, nargs="+", default=[8, 64])
+    parser.add_argument("--ops", type=int, default=20_000, help="작성자 전체의 연산 수")
+    parser.add_argument("--size", type=int, default=10_000, help="Task 수")
+    parser.add_argument("--retrospectives", type=int, default=50)
+    parser.add_argument("--hot", type=float, default=0.1, help="핫 카운터 증가 비율")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""마감일 범위 인덱스 vs 선형 스캔 벤치마크.
+
+사용법::
+
+    python -m benchmarks.due_dates --sizes 10000 100000 1000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+from datetime import date, timedelta
+
+from benchmarks.storage import make_tasks
+from mypm.domain.tasks import Task
+from mypm.infrastructure.tasks import InMemoryTaskRepository
+
+
+def linear_scan(tasks: list[Task], due_after: date, due_before: date) -> list[Task]:
+    """인덱스 도입 전 방식: 전체 목록을 받아 거른 뒤 정렬합니다."""
+
+    matched = [
+        task
+        for task in tasks
+        if task.due_date is not None and due_after < task.due_date < due_before
+    ]
+    matched.sort(key=lambda task: (task.due_date, task.id.int))
+    return matched
+
+
+async def bench(size: int, queries: int, window_days: int) -> dict:
+    repository = InMemoryTaskRepository()
+    await repository.add_many(make_tasks(size))
+    start = date(2026, 1, 1)
+    windows = [
+        (
+            start + timedelta(days=offset),
+            start + timedelta(days=offset + window_days + 1),
+        )
+        for offset in range(
+            0, 365 - window_days, max(1, (365 - window_days) // queries)
+        )
+    ][:queries]
+
+    started = time.perf_counter()
+    indexed_rows = 0
+    for due_after, due_before in windows:
+        indexed_rows += len(
+            await repository.list_by_due_range(
+                due_after=due_after, due_before=due_before
+            )
+        )
+    indexed = (time.perf_counter() - started) / len(windows)
+
+    started = time.perf_counter()
+    scanned_rows = 0
+    for due_after, due_before in windows:
+        scanned_rows += len(
+            linear_scan(await repository.list_by_status(None), due_after, due_before)
+        )
+    scanned = (time.perf_counter() - started) / len(windows)
+
+    assert indexed_rows == scanned_rows
+    return {
+        "size": size,
+        "rows": indexed_rows / len(windows),
+        "indexed_ms": indexed * 1000,
+        "scan_ms": scanned * 1000,
+    }
+
+
+async def run(args: argparse.Namespace) -> None:
+    print(
+        f"{'size':>9} {'rows/query':>11} {'index ms':>10} {'scan ms':>10} "
+        f"{'speedup':>8}"
+    )
+    for size in args.sizes:
+        row = await bench(size, args.queries, args.window_days)
+        print(
+            f"{row['size']:>9} {row['rows']:>11.0f} {row['indexed_ms']:>10.3f} "
+            f"{row['scan_ms']:>10.3f} {row['scan_ms'] / row['indexed_ms']:>8.1f}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000]
+    )
+    parser.add_argument("--queries", type=int, default=20)
+    parser.add_argument("--window-days", type=int, default=7)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
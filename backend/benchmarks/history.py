@@ -0,0 +1,280 @@
+"""상태 전이 기록과 흐름 지표 조회.
+
+``--size`` 건의 전이를 ``--tasks`` 개 Task 에 무작위로 1년에 걸쳐 기록한 뒤, 지표 하나를
+``--window`` 일 구간으로 조회하는 시간을 두 방식으로 잽니다.
+
+- ``objects``: 전이마다 객체 하나를 목록에 쌓고, 조회마다 전체를 파이썬 반복문으로 훑어
+  Task 별 시작 시각을 이어 붙이는 방식
+- ``columns``: ``TransitionLog``. 구간을 이분 탐색으로 찾고 열 조각을 C 수준으로
+  집계합니다.
+
+기록 처리량과 전이 한 건이 차지하는 메모리(tracemalloc)도 함께 출력합니다. 파일에
+남기는 ``TransitionLog`` 는 임시 디렉터리에 같은 전이를 기록해 기록 처리량과 다시 여는
+시간(``reopen_ms``)을 잽니다.
+
+사용법::
+
+    python -m benchmarks.history --size 2000000 --window 90
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gc
+import math
+import random
+import tempfile
+import time
+import tracemalloc
+import uuid
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+
+from mypm.domain.tasks import DEFAULT_PERCENTILES, Task, TaskStatus
+from mypm.infrastructure.tasks import TransitionLog
+
+_START = datetime(2026, 1, 1)
+_YEAR_SECONDS = 365 * 86_400
+_OPEN = frozenset(status for status in TaskStatus if status is not TaskStatus.DONE)
+
+
+@dataclass(slots=True)
+class _Transition:
+    task_id: uuid.UUID
+    from_status: TaskStatus | None
+    to_status: TaskStatus
+    at: datetime
+
+
+class _ObjectHistory:
+    """비교 기준: 전이 객체 목록을 조회마다 처음부터 훑습니다."""
+
+    def __init__(self) -> None:
+        self.transitions: list[_Transition] = []
+        self._status: dict[uuid.UUID, TaskStatus] = {}
+
+    def record(self, tasks: list[Task]) -> None:
+        for task in tasks:
+            before = self._status.get(task.id)
+            if before is not task.status:
+                self._status[task.id] = task.status
+                self.transitions.append(
+                    _Transition(task.id, before, task.status, task.updated_at)
+                )
+
+    def cycle_times(self, start: date, end: date) -> dict[int, timedelta]:
+        low, high = _bounds(start, end)
+        started: dict[uuid.UUID, datetime] = {}
+        cycles = []
+        for transition in self.transitions:
+            if transition.to_status is TaskStatus.IN_PROGRESS:
+                started.setdefault(transition.task_id, transition.at)
+            elif transition.to_status is TaskStatus.DONE:
+                began = started.pop(transition.task_id, None)
+                if began is not None and low <= transition.at < high:
+                    cycles.append(transition.at - began)
+        cycles.sort()
+        return {
+            percentile: cycles[max(math.ceil(percentile * len(cycles) / 100), 1) - 1]
+            for percentile in DEFAULT_PERCENTILES
+        }
+
+    def throughput(self, start: date, end: date) -> dict[date, int]:
+        low, high = _bounds(start, end)
+        counts: dict[date, int] = {}
+        for transition in self.transitions:
+            if transition.to_status is TaskStatus.DONE and low <= transition.at < high:
+                day = transition.at.date()
+                counts[day] = counts.get(day, 0) + 1
+        return counts
+
+    def burndown(self, start: date, end: date) -> dict[date, int]:
+        _, high = _bounds(start, end)
+        remaining: dict[date, int] = {}
+        count = 0
+        for transition in self.transitions:
+            if transition.at >= high:
+                break
+            count += (transition.to_status in _OPEN) - (transition.from_status in _OPEN)
+            remaining[transition.at.date()] = count
+        return {day: value for day, value in remaining.items() if day >= start}
+
+
+def _bounds(start: date, end: date) -> tuple[datetime, datetime]:
+    return datetime.combine(start, datetime.min.time()), datetime.combine(
+        end + timedelta(days=1), datetime.min.time()
+    )
+
+
+def _workload(size: int, task_count: int) -> list[tuple[int, TaskStatus, datetime]]:
+    """(Task 번호, 새 상태, 시각). 대부분 할 일 -> 진행 중 -> 완료 순으로 흐르고 일부는
+    막힙니다."""
+
+    rng = random.Random(0)
+    offsets = sorted(rng.randrange(_YEAR_SECONDS * 1_000_000) for _ in range(size))
+    flow = {
+        TaskStatus.TODO: (TaskStatus.IN_PROGRESS,) * 8
+        + (TaskStatus.DONE, TaskStatus.BLOCKED),
+        TaskStatus.IN_PROGRESS: (TaskStatus.DONE,) * 6
+        + (TaskStatus.BLOCKED,) * 2
+        + (TaskStatus.TODO,) * 2,
+        TaskStatus.BLOCKED: (TaskStatus.IN_PROGRESS,) * 9 + (TaskStatus.TODO,),
+        TaskStatus.DONE: (TaskStatus.TODO,),
+    }
+    statuses = [TaskStatus.TODO] * task_count
+    workload = []
+    for offset in offsets:
+        index = rng.randrange(task_count)
+        statuses[index] = rng.choice(flow[statuses[index]])
+        workload.append(
+            (index, statuses[index], _START + timedelta(microseconds=offset))
+        )
+    return workload
+
+
+def _replay(
+    workload: list[tuple[int, TaskStatus, datetime]],
+    tasks: list[Task],
+    record: Callable,
+) -> float:
+    for task in tasks:
+        task.status = TaskStatus.TODO
+        task.updated_at = _START
+    record(tasks)
+
+    started = time.perf_counter()
+    for index, status, at in workload:
+        task = tasks[index]
+        task.status = status
+        task.updated_at = at
+        record([task])
+    return time.perf_counter() - started
+
+
+async def _median_ms(
+    run: Callable[[], Awaitable[object] | object], repeat: int
+) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = run()
+        if asyncio.iscoroutine(result):
+            await result
+        timings.append(time.perf_counter() - started)
+    timings.sort()
+    return timings[len(timings) // 2] * 1000
+
+
+def _traced_mib(build: Callable[[], object]) -> tuple[object, float]:
+    gc.collect()
+    tracemalloc.start()
+    try:
+        built = build()
+        return built, tracemalloc.get_traced_memory()[0] / (1 << 20)
+    finally:
+        tracemalloc.stop()
+
+
+async def bench(
+    size: int, task_count: int, window: int, repeat: int
+) -> dict[str, float]:
+    workload = _workload(size, task_count)
+    tasks = [
+        Task(title=f"task {index}", updated_at=_START) for index in range(task_count)
+    ]
+
+    def _columns() -> tuple[TransitionLog, float]:
+        log = TransitionLog()
+        return log, _replay(workload, tasks, log.record)
+
+    def _objects() -> tuple[_ObjectHistory, float]:
+        history = _ObjectHistory()
+        return history, _replay(workload, tasks, history.record)
+
+    # 기록 시간은 추적 없이 재고, 메모리는 같은 기록을 한 번 더 추적하며 잽니다.
+    log, columns_seconds = _columns()
+    objects, objects_seconds = _objects()
+    _, columns_mib = _traced_mib(_columns)
+    _, objects_mib = _traced_mib(_objects)
+    recorded = len(log)
+    assert recorded == len(objects.transitions)
+
+    with tempfile.TemporaryDirectory() as directory:
+        persisted = TransitionLog(directory)
+        file_seconds = _replay(workload, tasks, persisted.record)
+        persisted.close()
+        started = time.perf_counter()
+        reopened = TransitionLog(directory)
+        reopen_seconds = time.perf_counter() - started
+        reopened.close()
+    assert len(reopened) == recorded
+
+    end = date(2026, 12, 31)
+    start = end - timedelta(days=window - 1)
+    # 두 방식의 결과가 같은지 먼저 확인합니다.
+    stats = await log.cycle_times(start, end, DEFAULT_PERCENTILES)
+    assert stats.percentiles == objects.cycle_times(start, end)
+    expected = objects.throughput(start, end)
+    assert [day.count for day in await log.throughput(start, end)] == [
+        expected.get(start + timedelta(days=offset), 0) for offset in range(window)
+    ]
+    expected = objects.burndown(start, end)
+    assert all(
+        day.count == expected[day.day]
+        for day in await log.burndown(start, end)
+        if day.day in expected
+    )
+
+    results: dict[str, float] = {
+        "transitions": recorded,
+        "record_columns_per_s": recorded / columns_seconds,
+        "record_objects_per_s": recorded / objects_seconds,
+        "record_file_per_s": recorded / file_seconds,
+        "reopen_ms": reopen_seconds * 1000,
+        "bytes_per_transition_columns": columns_mib * (1 << 20) / recorded,
+        "bytes_per_transition_objects": objects_mib * (1 << 20) / recorded,
+    }
+    for name, columns, baseline in (
+        (
+            "cycle_time",
+            lambda: log.cycle_times(start, end, DEFAULT_PERCENTILES),
+            lambda: objects.cycle_times(start, end),
+        ),
+        (
+            "throughput",
+            lambda: log.throughput(start, end),
+            lambda: objects.throughput(start, end),
+        ),
+        (
+            "burndown",
+            lambda: log.burndown(start, end),
+            lambda: objects.burndown(start, end),
+        ),
+    ):
+        results[f"{name}_objects_ms"] = await _median_ms(baseline, repeat)
+        results[f"{name}_columns_ms"] = await _median_ms(columns, repeat)
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument(
+        "--size", type=int, default=2_000_000, help="기록할 상태 변경 수"
+    )
+    parser.add_argument("--tasks", type=int, default=100_000)
+    parser.add_argument("--window", type=int, default=90, help="조회 구간 일 수")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    for name, value in asyncio.run(
+        bench(args.size, args.tasks, args.window, args.repeat)
+    ).items():
+        print(f"{name:<32} {value:>14.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""멱등 키 재시도 비용.
+
+``POST /tasks/`` 를 키 없이, 새 키로(첫 실행과 응답 저장), 같은 키로(저장된 응답 재생)
+보낼 때의 지연과, 같은 키로 동시에 보낸 요청이 한 번만 실행되는지 봅니다.
+
+사용법::
+
+    python -m benchmarks.idempotency --requests 2000 --concurrency 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import time
+import uuid
+
+import httpx
+
+
+async def _median_ms(count: int, send) -> float:
+    latencies = []
+    for index in range(count):
+        started = time.perf_counter()
+        response = await send(index)
+        latencies.append((time.perf_counter() - started) * 1000)
+        response.raise_for_status()
+    return statistics.median(latencies)
+
+
+async def bench(requests: int, concurrency: int) -> dict[str, float]:
+    from mypm.app import create_app
+
+    payload = {"title": "retried task", "description": "created once"}
+    transport = httpx.ASGITransport(app=create_app())
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://bench"
+    ) as client:
+        plain = await _median_ms(
+            requests, lambda _: client.post("/tasks/", json=payload)
+        )
+        keys = [uuid.uuid4().hex for _ in range(requests)]
+        first = await _median_ms(
+            requests,
+            lambda index: client.post(
+                "/tasks/", json=payload, headers={"Idempotency-Key": keys[index]}
+            ),
+        )
+        replay = await _median_ms(
+            requests,
+            lambda index: client.post(
+                "/tasks/", json=payload, headers={"Idempotency-Key": keys[index]}
+            ),
+        )
+
+        before = len((await client.get("/tasks/")).json())
+        headers = {"Idempotency-Key": uuid.uuid4().hex}
+        await asyncio.gather(
+            *(
+                client.post("/tasks/", json=payload, headers=headers)
+                for _ in range(concurrency)
+            )
+        )
+        created = len((await client.get("/tasks/")).json()) - before
+
+    return {
+        "no_key_ms": plain,
+        "first_ms": first,
+        "replay_ms": replay,
+        "concurrent_created": created,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--requests", type=int, default=2_000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    args = parser.parse_args()
+
+    for name, value in asyncio.run(bench(args.requests, args.concurrency)).items():
+        print(f"{name:<20} {value:>8.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""저널 처리량과 복구 시간 벤치마크.
+
+사용법::
+
+    python -m benchmarks.journal --writes 20000 --sizes 100000 1000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import tempfile
+import time
+
+from benchmarks.storage import make_tasks
+from mypm.infrastructure.tasks import Journal, open_journaled_repositories
+
+
+async def bench_throughput(writes: int, concurrency: int, fsync: bool) -> float:
+    """``concurrency`` 개의 동시 작성자가 Task 를 추가할 때 초당 쓰기 수."""
+
+    tasks = make_tasks(writes)
+    with tempfile.TemporaryDirectory() as directory:
+        journal = Journal(directory, fsync=fsync, snapshot_every=writes * 2)
+        repository, _ = open_journaled_repositories(journal)
+
+        async def _writer(offset: int) -> None:
+            for index in range(offset, writes, concurrency):
+                await repository.add(tasks[index])
+
+        started = time.perf_counter()
+        await asyncio.gather(*(_writer(offset) for offset in range(concurrency)))
+        elapsed = time.perf_counter() - started
+        journal.close()
+    return writes / elapsed
+
+
+async def bench_recovery(size: int) -> dict:
+    with tempfile.TemporaryDirectory() as directory:
+        journal = Journal(directory, snapshot_every=size * 2)
+        repository, _ = open_journaled_repositories(journal)
+        tasks = make_tasks(size)
+        # 절반은 스냅샷, 나머지 절반은 저널 꼬리로 남깁니다.
+        half = size // 2
+        await repository.add_many(tasks[:half])
+
+        started = time.perf_counter()
+        await journal.snapshot()
+        snapshot_seconds = time.perf_counter() - started
+
+        await repository.add_many(tasks[half:])
+        journal.close()
+
+        started = time.perf_counter()
+        recovered = Journal(directory)
+        recovered_repository, _ = open_journaled_repositories(recovered)
+        recovery_seconds = time.perf_counter() - started
+        count = len(await recovered_repository.list_by_status(None))
+        recovered.close()
+
+    return {
+        "size": size,
+        "recovered": count,
+        "snapshot_s": snapshot_seconds,
+        "recovery_s": recovery_seconds,
+    }
+
+
+async def run(args: argparse.Namespace) -> None:
+    print(f"{'writers':>8} {'fsync':>6} {'writes/s':>10}")
+    for concurrency in args.concurrency:
+        for fsync in (True, False):
+            rate = await bench_throughput(args.writes, concurrency, fsync)
+            print(f"{concurrency:>8} {str(fsync):>6} {rate:>10.0f}")
+
+    print()
+    print(f"{'size':>9} {'recovered':>10} {'snapshot s':>11} {'recovery s':>11}")
+    for size in args.sizes:
+        row = await bench_recovery(size)
+        print(
+            f"{row['size']:>9} {row['recovered']:>10} "
+            f"{row['snapshot_s']:>11.2f} {row['recovery_s']:>11.2f}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--writes", type=int, default=20_000)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 16, 256])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100_000, 1_000_000])
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
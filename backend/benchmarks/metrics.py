@@ -0,0 +1,122 @@
+"""지표 수집이 요청 경로에 더하는 비용.
+
+- ``observe``: 히스토그램 기록 한 번
+- ``middleware``: 아무것도 하지 않는 ASGI 앱을 ``MetricsMiddleware`` 로 감쌌을 때 요청당
+  추가 시간. ``passthrough`` 는 ``send`` 만 전달하는 빈 미들웨어로, 어떤 ASGI 미들웨어든
+  내는 비용입니다.
+- ``repository``: 메모리 리포지토리 ``get`` 을 ``InstrumentedTaskRepository`` 로 감쌌을
+  때 호출당 추가 시간
+
+사용법::
+
+    python -m benchmarks.metrics --calls 200000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+
+from benchmarks.storage import make_tasks
+from mypm.core.metrics import MetricsRegistry
+from mypm.infrastructure.tasks import (
+    InMemoryTaskRepository,
+    InstrumentedTaskRepository,
+    repository_histogram,
+)
+from mypm.presentation.api.metrics import MetricsMiddleware
+
+
+class _Route:
+    path_format = "/{task_id}"
+
+
+async def _best_of(
+    repeat: int, calls: int, call: Callable[[], Awaitable[object]]
+) -> float:
+    """``calls`` 번 호출의 호출당 시간(마이크로초) 중 가장 짧은 값."""
+
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for _ in range(calls):
+            await call()
+        best = min(best, (time.perf_counter() - started) / calls * 1e6)
+    return best
+
+
+async def bench(calls: int, repeat: int) -> list[tuple[str, float, float]]:
+    registry = MetricsRegistry()
+    histogram = registry.histogram("bench_seconds", "bench", ("route",))
+
+    async def _observe() -> None:
+        histogram.observe(("/tasks/{task_id}",), 0.001)
+
+    async def _noop() -> None:
+        pass
+
+    observe = await _best_of(repeat, calls, _observe) - await _best_of(
+        repeat, calls, _noop
+    )
+
+    route = _Route()
+
+    async def _app(scope: dict, receive: object, send: Callable) -> None:
+        scope["route"] = route
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b""})
+
+    async def _send(message: dict) -> None:
+        pass
+
+    async def _passthrough(scope: dict, receive: object, send: Callable) -> None:
+        async def _forward(message: dict) -> None:
+            await send(message)
+
+        await _app(scope, receive, _forward)
+
+    middleware = MetricsMiddleware(_app, registry)
+    scope = {"type": "http", "method": "GET", "path": "/tasks/0b7c"}
+    plain = await _best_of(repeat, calls, lambda: _app(dict(scope), None, _send))
+    forwarded = await _best_of(
+        repeat, calls, lambda: _passthrough(dict(scope), None, _send)
+    )
+    wrapped = await _best_of(
+        repeat, calls, lambda: middleware(dict(scope), None, _send)
+    )
+
+    repository = InMemoryTaskRepository()
+    tasks = make_tasks(10_000)
+    await repository.add_many(tasks)
+    instrumented = InstrumentedTaskRepository(
+        repository, repository_histogram(registry)
+    )
+    task_id = tasks[0].id
+    direct = await _best_of(repeat, calls, lambda: repository.get(task_id))
+    timed = await _best_of(repeat, calls, lambda: instrumented.get(task_id))
+
+    return [
+        ("observe", 0.0, observe),
+        ("passthrough", plain, forwarded - plain),
+        ("middleware", plain, wrapped - plain),
+        ("repository", direct, timed - direct),
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--calls", type=int, default=200_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'path':<12} {'base us':>9} {'overhead us':>12}")
+    for name, base, overhead in asyncio.run(bench(args.calls, args.repeat)):
+        print(f"{name:<12} {base:>9.3f} {overhead:>12.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""요청 프로파일링 비용.
+
+같은 목록 요청을 프로파일 없이, ``X-Profile: 1`` 로 프로파일하며 보내 경과 시간을
+비교하고, 프로파일 중인 요청과 동시에 실행된 다른 요청이 얼마나 느려지는지 봅니다.
+프로파일링을 끄면(기본값) 미들웨어가 등록되지 않으므로 비용이 없습니다.
+
+사용법::
+
+    MYPM_PROFILING_ENABLED=1 python -m benchmarks.profiling --size 2000 --repeat 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import statistics
+import time
+
+import httpx
+
+
+async def _elapsed_ms(request) -> float:
+    started = time.perf_counter()
+    response = await request
+    response.raise_for_status()
+    return (time.perf_counter() - started) * 1000
+
+
+async def bench(size: int, repeat: int) -> dict[str, float]:
+    os.environ.setdefault("MYPM_PROFILING_ENABLED", "1")
+    from mypm.app import create_app
+
+    transport = httpx.ASGITransport(app=create_app())
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://bench"
+    ) as client:
+        items = [{"title": f"task {index}"} for index in range(size)]
+        (await client.post("/tasks/batch", json={"items": items})).raise_for_status()
+        # 첫 요청의 지연 임포트와 캐시 채우기가 결과에 섞이지 않도록 먼저 한 번
+        # 보냅니다.
+        await client.get("/tasks/")
+        await client.get("/tasks/", headers={"X-Profile": "1"})
+
+        plain, profiled, neighbour = [], [], []
+        for _ in range(repeat):
+            plain.append(await _elapsed_ms(client.get("/tasks/")))
+            profiled.append(
+                await _elapsed_ms(client.get("/tasks/", headers={"X-Profile": "1"}))
+            )
+            _, concurrent = await asyncio.gather(
+                _elapsed_ms(client.get("/tasks/", headers={"X-Profile": "1"})),
+                _elapsed_ms(client.get("/tasks/stats")),
+            )
+            neighbour.append(concurrent)
+        stats = [await _elapsed_ms(client.get("/tasks/stats")) for _ in range(repeat)]
+
+    return {
+        "list_ms": statistics.median(plain),
+        "list_profiled_ms": statistics.median(profiled),
+        "stats_ms": statistics.median(stats),
+        "stats_during_profile_ms": statistics.median(neighbour),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--size", type=int, default=2_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    for name, value in asyncio.run(bench(args.size, args.repeat)).items():
+        print(f"{name:<24} {value:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
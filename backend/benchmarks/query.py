@@ -0,0 +1,154 @@
+"""복합 필터 조회 비용.
+
+모든 Task 를 읽어 파이썬에서 거르고 정렬하던 방식(이전: 목록 조회 후 애플리케이션에서
+필터링)과 ``TaskRepository.query`` 의 인덱스 선택을 필터 종류별로 비교하고, 각 필터의
+실행 계획(사용한 인덱스와 단계별 후보 수)을 출력합니다.
+
+사용법::
+
+    python -m benchmarks.query --size 50000 --repeat 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+import uuid
+from datetime import date, timedelta
+
+from benchmarks.storage import make_tasks
+from mypm.domain.tasks import (
+    Task,
+    TaskFilter,
+    TaskRepository,
+    TaskSortField,
+    TaskStatus,
+)
+from mypm.infrastructure.tasks import (
+    CompactTaskRepository,
+    InMemoryTaskRepository,
+    SQLiteConnectionPool,
+    SQLiteTaskRepository,
+)
+
+_LIMIT = 50
+
+
+def _filters(tasks: list[Task], retrospective_id: uuid.UUID) -> dict[str, TaskFilter]:
+    middle = tasks[len(tasks) // 2].created_at
+    return {
+        # 흔한 조건: 정렬 인덱스를 훑다가 limit 에서 멈춥니다.
+        "status": TaskFilter(statuses=frozenset({TaskStatus.TODO})),
+        # (상태, 마감일) 복합 인덱스 하나로 끝나는 조건
+        "status_due_week": TaskFilter(
+            statuses=frozenset({TaskStatus.TODO, TaskStatus.IN_PROGRESS}),
+            due_after=date(2026, 3, 1),
+            due_before=date(2026, 3, 8),
+        ),
+        # 작은 집합(회고)과 큰 범위(생성 시각)의 교집합
+        "retro_created": TaskFilter(
+            retrospective_id=retrospective_id, created_after=middle
+        ),
+        # 접두어 색인과 상태 조건
+        "prefix_status": TaskFilter(
+            statuses=frozenset({TaskStatus.DONE}), title_prefix="TASK 123"
+        ),
+    }
+
+
+def _scan(tasks: list[Task], task_filter: TaskFilter) -> list[Task]:
+    matched = [task for task in tasks if task_filter.matches(task)]
+    matched.sort(key=lambda task: (task.created_at, task.id.int))
+    return matched[:_LIMIT]
+
+
+async def _best_ms(repeat: int, run) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        await run()
+        timings.append((time.perf_counter() - started) * 1000)
+    return min(timings)
+
+
+async def _bench_backend(
+    name: str,
+    repository: TaskRepository,
+    tasks: list[Task],
+    filters: dict[str, TaskFilter],
+    repeat: int,
+) -> dict[str, float]:
+    await repository.add_many(tasks)
+    results = {}
+    for label, task_filter in filters.items():
+
+        async def _full_scan() -> None:
+            _scan(await repository.list_by_status(), task_filter)
+
+        async def _planned() -> None:
+            await repository.query(
+                task_filter, order_by=TaskSortField.CREATED_AT, limit=_LIMIT
+            )
+
+        results[f"{name}_{label}_scan_ms"] = await _best_ms(repeat, _full_scan)
+        results[f"{name}_{label}_query_ms"] = await _best_ms(repeat, _planned)
+
+        plan = (await repository.query(task_filter, limit=_LIMIT, explain=True)).plan
+        steps = " -> ".join(
+            f"{step.index}({step.estimated}→{step.candidates})" for step in plan.steps
+        )
+        print(
+            f"# {name} {label}: {steps} residual={plan.residual} scanned={plan.scanned}"
+        )
+    return results
+
+
+async def bench(size: int, repeat: int) -> dict[str, float]:
+    tasks = make_tasks(size)
+    # 생성 시각이 고르게 퍼지도록 한 초씩 띄웁니다.
+    base = tasks[0].created_at
+    retrospective_id = uuid.uuid4()
+    for index, task in enumerate(tasks):
+        task.created_at = task.updated_at = base + timedelta(seconds=index)
+        if index % 100 == 0:
+            task.retrospective_id = retrospective_id
+        task.clear_changes()
+    filters = _filters(tasks, retrospective_id)
+
+    results = {}
+    results.update(
+        await _bench_backend("memory", InMemoryTaskRepository(), tasks, filters, repeat)
+    )
+    results.update(
+        await _bench_backend("compact", CompactTaskRepository(), tasks, filters, repeat)
+    )
+    with tempfile.TemporaryDirectory() as directory:
+        pool = SQLiteConnectionPool(os.path.join(directory, "bench.sqlite3"))
+        try:
+            results.update(
+                await _bench_backend(
+                    "sqlite", SQLiteTaskRepository(pool), tasks, filters, repeat
+                )
+            )
+        finally:
+            pool.close()
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--size", type=int, default=50_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    for name, value in asyncio.run(bench(args.size, args.repeat)).items():
+        print(f"{name:<36} {value:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+"""벤치마크 결과 집계, 저장과 기준선 비교."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import time
+from collections.abc import Iterable
+
+# 기준선과 비교하는 지표와 방향 (True 면 클수록 좋음)
+COMPARED_METRICS = {"p50_us": False, "ops_per_s": True}
+
+
+def summarize(latencies_ns: list[int], seconds: float) -> dict:
+    """요청별 지연(나노초)과 전체 소요 시간으로 백분위 지연(마이크로초)과 처리량을
+    계산합니다."""
+
+    if not latencies_ns:
+        return {
+            "count": 0,
+            "p50_us": 0.0,
+            "p95_us": 0.0,
+            "p99_us": 0.0,
+            "ops_per_s": 0.0,
+        }
+
+    ordered = sorted(latencies_ns)
+    last = len(ordered) - 1
+
+    def _percentile(fraction: float) -> float:
+        return ordered[round(last * fraction)] / 1000
+
+    return {
+        "count": len(ordered),
+        "p50_us": _percentile(0.50),
+        "p95_us": _percentile(0.95),
+        "p99_us": _percentile(0.99),
+        "ops_per_s": len(ordered) / seconds if seconds > 0 else 0.0,
+    }
+
+
+def environment() -> dict:
+    """결과를 비교할 때 참고할 실행 환경 정보."""
+
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "commit": commit,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+    }
+
+
+def save_results(path: str, results: list[dict]) -> None:
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump({"environment": environment(), "results": results}, file, indent=2)
+        file.write("\n")
+
+
+def load_results(path: str) -> list[dict]:
+    with open(path, encoding="utf-8") as file:
+        return json.load(file)["results"]
+
+
+def compare(
+    baseline: Iterable[dict], current: Iterable[dict], tolerance: float
+) -> list[str]:
+    """``name`` 이 같은 결과끼리 비교해 ``tolerance`` 비율 넘게 나빠진 지표를 설명하는
+    문장 목록을 반환합니다.
+
+    꼬리 지연(p95/p99)은 실행마다 흔들림이 커서 비교하지 않고 보고만 합니다.
+    """
+
+    previous = {row["name"]: row for row in baseline}
+    regressions = []
+    for row in current:
+        base = previous.get(row["name"])
+        if base is None:
+            continue
+        for metric, higher_is_better in COMPARED_METRICS.items():
+            old, new = base.get(metric), row.get(metric)
+            if not old or new is None:
+                continue
+            change = (new - old) / old
+            if (-change if higher_is_better else change) > tolerance:
+                regressions.append(
+                    f"{row['name']}: {metric} {old:.1f} -> {new:.1f} ({change:+.1%})"
+                )
+    return regressions
+
+
+def print_table(results: list[dict]) -> None:
+    width = max((len(row["name"]) for row in results), default=4)
+    print(
+        f"{'name':<{width}} {'count':>8} {'p50 us':>10} {'p95 us':>10} "
+        f"{'p99 us':>10} {'ops/s':>10}"
+    )
+    for row in results:
+        print(
+            f"{row['name']:<{width}} {row['count']:>8} "
+            f"{row['p50_us']:>10.1f} {row['p95_us']:>10.1f}"
+            f" {row['p99_us']:>10.1f} {row['ops_per_s']:>10.0f}"
+        )
+
+
+def add_comparison_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--output", help="결과 JSON 을 저장할 경로")
+    parser.add_argument("--baseline", help="비교할 기준선 결과 JSON")
+    parser.add_argument(
+        "--tolerance", type=float, default=0.10, help="회귀로 볼 악화 비율 (기본 10%%)"
+    )
+
+
+def finish(results: list[dict], args: argparse.Namespace) -> int:
+    """결과를 출력/저장하고 기준선보다 나빠진 항목이 있으면 1 을 반환합니다."""
+
+    print_table(results)
+    if args.output:
+        save_results(args.output, results)
+    if not args.baseline:
+        return 0
+
+    regressions = compare(load_results(args.baseline), results, args.tolerance)
+    for line in regressions:
+        print(f"REGRESSION {line}")
+    return 1 if regressions else 0
@@ -0,0 +1,148 @@
+"""Task 리포지토리 연산별 지연 마이크로벤치마크.
+
+저장소를 ``size`` 개로 채운 뒤 ``add`` / ``get`` / ``list_by_status`` / ``update`` /
+``delete`` 를 하나씩 호출하며 호출마다 지연을 잽니다. ``add`` 로 늘어난 만큼 ``delete``
+로 지우므로 측정 동안 저장소 크기는 거의 그대로입니다. ``list_by_status`` 는 상태 하나의
+Task 를 모두 돌려주므로 ``--scan-ops`` 번만 실행합니다.
+
+사용법::
+
+    python -m benchmarks.repositories --sizes 1000 10000 100000 1000000 --output
+    results/repositories.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import random
+import tempfile
+import time
+from collections.abc import Awaitable, Callable
+
+from benchmarks.report import add_comparison_arguments, finish, summarize
+from benchmarks.storage import STATUSES, make_tasks
+from mypm.domain.tasks import Task, TaskRepository
+from mypm.infrastructure.tasks import (
+    CompactTaskRepository,
+    InMemoryTaskRepository,
+    SQLiteConnectionPool,
+    SQLiteTaskRepository,
+)
+
+BACKENDS = ("memory", "compact", "sqlite")
+OPERATIONS = ("add", "get", "list_by_status", "update", "delete")
+_LOAD_BATCH = 5000
+
+
+async def _measure(count: int, call: Callable[[int], Awaitable[object]]) -> dict:
+    latencies = []
+    clock = time.perf_counter_ns
+    started = clock()
+    for index in range(count):
+        before = clock()
+        await call(index)
+        latencies.append(clock() - before)
+    return summarize(latencies, (clock() - started) / 1e9)
+
+
+async def bench_repository(
+    repository: TaskRepository, size: int, ops: int, scan_ops: int
+) -> dict[str, dict]:
+    tasks = make_tasks(size)
+    for start in range(0, size, _LOAD_BATCH):
+        await repository.add_many(tasks[start : start + _LOAD_BATCH])
+
+    rng = random.Random(1)
+    sample = [rng.choice(tasks).id for _ in range(ops)]
+    added: list[Task] = make_tasks(ops, seed=2)
+
+    async def _add(index: int) -> object:
+        return await repository.add(added[index])
+
+    async def _get(index: int) -> object:
+        return await repository.get(sample[index])
+
+    async def _list(index: int) -> object:
+        return await repository.list_by_status(STATUSES[index % len(STATUSES)].value)
+
+    async def _update(index: int) -> object:
+        # 라우트와 같은 경로: 읽고, 바꾸고, 바뀐 필드만 저장합니다.
+        task = await repository.get(sample[index])
+        task.set_status(STATUSES[index % len(STATUSES)])
+        task.touch()
+        return await repository.update(task)
+
+    async def _delete(index: int) -> object:
+        return await repository.delete(added[index].id)
+
+    calls = {
+        "add": _add,
+        "get": _get,
+        "list_by_status": _list,
+        "update": _update,
+        "delete": _delete,
+    }
+    return {
+        operation: await _measure(
+            scan_ops if operation == "list_by_status" else ops, calls[operation]
+        )
+        for operation in OPERATIONS
+    }
+
+
+async def run(
+    backends: list[str], sizes: list[int], ops: int, scan_ops: int
+) -> list[dict]:
+    results = []
+    for size in sizes:
+        for backend in backends:
+            with tempfile.TemporaryDirectory() as directory:
+                pool = None
+                if backend == "memory":
+                    repository: TaskRepository = InMemoryTaskRepository()
+                elif backend == "compact":
+                    repository = CompactTaskRepository()
+                else:
+                    pool = SQLiteConnectionPool(
+                        os.path.join(directory, "bench.sqlite3")
+                    )
+                    repository = SQLiteTaskRepository(pool)
+                try:
+                    measured = await bench_repository(repository, size, ops, scan_ops)
+                finally:
+                    if pool is not None:
+                        pool.close()
+
+            results.extend(
+                {"name": f"repository/{backend}/{size}/{operation}", **summary}
+                for operation, summary in measured.items()
+            )
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument(
+        "--backends", nargs="+", choices=BACKENDS, default=list(BACKENDS)
+    )
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000, 1_000_000]
+    )
+    parser.add_argument("--ops", type=int, default=2_000, help="연산별 측정 횟수")
+    parser.add_argument(
+        "--scan-ops", type=int, default=20, help="list_by_status 측정 횟수"
+    )
+    add_comparison_arguments(parser)
+    args = parser.parse_args()
+
+    return finish(
+        asyncio.run(run(args.backends, args.sizes, args.ops, args.scan_ops)), args
+    )
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
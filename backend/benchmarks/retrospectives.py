@@ -0,0 +1,179 @@
+"""회고 멤버십 비용.
+
+Task ID 를 회고에 하나씩 추가할 때 목록(이전 구현: 포함 검사와 변경 기록이 매번 O(n))과
+``TaskIdSet`` 의 비용, 연결된 Task 를 하나씩 ``get`` 할 때와 ``TaskLoader`` 로
+``get_many`` 한 번에 읽을 때의 비용, Task 를 API 로 하나씩 연결할 때와 일괄 연결할 때의
+지연을 비교합니다.
+
+사용법::
+
+    python -m benchmarks.retrospectives --size 2000 --repeat 5
+
+일괄 요청 한도(5000)보다 큰 ``--size`` 는 쓸 수 없습니다.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+import uuid
+
+import httpx
+
+from benchmarks.storage import make_tasks
+from mypm.application.tasks import TaskLoader
+from mypm.domain.tasks import Retrospective, TaskRepository
+from mypm.infrastructure.tasks import (
+    InMemoryTaskRepository,
+    SQLiteConnectionPool,
+    SQLiteTaskRepository,
+)
+
+
+def _list_membership(task_ids: list[uuid.UUID]) -> None:
+    # 이전 ``add_task``: 목록 포함 검사와 매번 만들던 변경 기록 튜플
+    tasks: list[uuid.UUID] = []
+    changes: dict[str, tuple[uuid.UUID, ...]] = {}
+    for task_id in task_ids:
+        if task_id not in tasks:
+            changes.setdefault("tasks", tuple(tasks))
+            tasks.append(task_id)
+
+
+def _set_membership(task_ids: list[uuid.UUID]) -> None:
+    retrospective = Retrospective(title="bench")
+    for task_id in task_ids:
+        retrospective.add_task(task_id)
+
+
+def _best_ms(repeat: int, run) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        run()
+        timings.append((time.perf_counter() - started) * 1000)
+    return min(timings)
+
+
+async def _best_async_ms(repeat: int, run) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        await run()
+        timings.append((time.perf_counter() - started) * 1000)
+    return min(timings)
+
+
+async def _bench_loader(
+    name: str, repository: TaskRepository, size: int, repeat: int
+) -> dict[str, float]:
+    tasks = make_tasks(size)
+    await repository.add_many(tasks)
+    # 같은 Task 를 두 번 요청하는 경우까지 포함해 중복 제거를 확인합니다.
+    members = [task.id for task in tasks] + [task.id for task in tasks[: size // 10]]
+
+    async def _one_by_one() -> None:
+        for task_id in members:
+            await repository.get(task_id)
+
+    async def _loader() -> None:
+        await TaskLoader(repository).load_many(members)
+
+    return {
+        f"{name}_get_each_ms": await _best_async_ms(repeat, _one_by_one),
+        f"{name}_loader_ms": await _best_async_ms(repeat, _loader),
+    }
+
+
+async def bench(size: int, repeat: int) -> dict[str, float]:
+    task_ids = [uuid.uuid4() for _ in range(size)]
+    results = {
+        "add_list_ms": _best_ms(repeat, lambda: _list_membership(task_ids)),
+        "add_set_ms": _best_ms(repeat, lambda: _set_membership(task_ids)),
+    }
+
+    results.update(
+        await _bench_loader("memory", InMemoryTaskRepository(), size, repeat)
+    )
+    with tempfile.TemporaryDirectory() as directory:
+        pool = SQLiteConnectionPool(os.path.join(directory, "bench.sqlite3"))
+        try:
+            results.update(
+                await _bench_loader("sqlite", SQLiteTaskRepository(pool), size, repeat)
+            )
+        finally:
+            pool.close()
+
+    from mypm.app import create_app
+
+    transport = httpx.ASGITransport(app=create_app())
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://bench"
+    ) as client:
+        items = [{"title": f"task {index}"} for index in range(size)]
+        created = (await client.post("/tasks/batch", json={"items": items})).json()[
+            "results"
+        ]
+        ids = [result["task"]["id"] for result in created]
+        single = (
+            await client.post(
+                "/retrospectives/", json={"title": "single", "date": "2026-01-01"}
+            )
+        ).json()
+        batch = (
+            await client.post(
+                "/retrospectives/", json={"title": "batch", "date": "2026-01-02"}
+            )
+        ).json()
+
+        started = time.perf_counter()
+        for task_id in ids:
+            (
+                await client.post(f"/retrospectives/{single['id']}/tasks/{task_id}")
+            ).raise_for_status()
+        results["attach_each_ms"] = (time.perf_counter() - started) * 1000
+
+        started = time.perf_counter()
+        (
+            await client.post(
+                f"/retrospectives/{batch['id']}/tasks/batch", json={"ids": ids}
+            )
+        ).raise_for_status()
+        results["attach_batch_ms"] = (time.perf_counter() - started) * 1000
+
+        expand = []
+        for _ in range(repeat):
+            # 캐시된 응답이 아니라 매번 다시 읽도록 Task 하나를 바꿉니다.
+            await client.patch(
+                f"/tasks/{ids[0]}", json={"title": f"renamed {len(expand)}"}
+            )
+            started = time.perf_counter()
+            (
+                await client.get(
+                    f"/retrospectives/{batch['id']}", params={"expand": "tasks"}
+                )
+            ).raise_for_status()
+            expand.append((time.perf_counter() - started) * 1000)
+        results["expand_ms"] = statistics.median(expand)
+
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--size", type=int, default=2_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    for name, value in asyncio.run(bench(args.size, args.repeat)).items():
+        print(f"{name:<20} {value:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""전문 검색 색인 벤치마크.
+
+사용법::
+
+    python -m benchmarks.search --sizes 100000 1000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import random
+import statistics
+import time
+
+from mypm.domain.tasks import Task
+from mypm.infrastructure.tasks.search import TaskSearchIndex
+
+_SYLLABLES = (
+    "가나다라마바사아자차카타파하고노도로모보소오조초코토포호구누두루무부수우주추"
+)
+_LETTERS = "abcdefghijklmnopqrstuvwxyz"
+
+
+class Vocabulary:
+    """실제 텍스트처럼 빈도가 치우친(Zipf) 분포로 단어를 뽑는 어휘."""
+
+    def __init__(self, words: list[str]) -> None:
+        self.words = words
+        self.cumulative = list(
+            itertools.accumulate(1 / (rank + 1) for rank in range(len(words)))
+        )
+
+    def sample(self, rng: random.Random, count: int) -> list[str]:
+        return rng.choices(self.words, cum_weights=self.cumulative, k=count)
+
+
+def make_vocabularies(rng: random.Random, size: int) -> tuple[Vocabulary, Vocabulary]:
+    korean = sorted(
+        {"".join(rng.choices(_SYLLABLES, k=rng.randint(2, 3))) for _ in range(size)}
+    )
+    english = sorted(
+        {"".join(rng.choices(_LETTERS, k=rng.randint(4, 8))) for _ in range(size)}
+    )
+    rng.shuffle(korean)
+    rng.shuffle(english)
+    return Vocabulary(korean), Vocabulary(english)
+
+
+def make_task(
+    rng: random.Random, index: int, korean: Vocabulary, english: Vocabulary
+) -> Task:
+    title_words = korean.sample(rng, 2) + english.sample(rng, 1)
+    description_words = korean.sample(rng, 4) + english.sample(rng, 2)
+    return Task(
+        title=f"{' '.join(title_words)} #{index}",
+        description=f"{' '.join(description_words)} 작업을 진행합니다",
+    )
+
+
+def bench(size: int, queries: int, limit: int, vocabulary: int) -> dict:
+    rng = random.Random(size)
+    korean, english = make_vocabularies(rng, vocabulary)
+    index = TaskSearchIndex()
+    started = time.perf_counter()
+    for number in range(size):
+        index.index(make_task(rng, number, korean, english))
+    build_seconds = time.perf_counter() - started
+
+    # 사용자가 실제 입력할 법한 질의: 한 단어 또는 두 단어 조합
+    query_set = []
+    for _ in range(queries):
+        words = korean.sample(rng, 1) + english.sample(rng, 1)
+        query_set.append(" ".join(words[: rng.randint(1, 2)]))
+
+    latencies = []
+    matched = 0
+    for query in query_set:
+        started = time.perf_counter()
+        _, total = index.search(query, limit=limit)
+        latencies.append((time.perf_counter() - started) * 1000)
+        matched += total
+
+    latencies.sort()
+    return {
+        "size": size,
+        "build_s": build_seconds,
+        "matches": matched / queries,
+        "p50_ms": statistics.median(latencies),
+        "p95_ms": latencies[int(len(latencies) * 0.95) - 1],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100_000, 1_000_000])
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--vocabulary", type=int, default=5000, help="언어별 어휘 크기")
+    args = parser.parse_args()
+
+    print(f"{'size':>9} {'build s':>8} {'matches':>9} {'p50 ms':>8} {'p95 ms':>8}")
+    for size in args.sizes:
+        row = bench(size, args.queries, args.limit, args.vocabulary)
+        print(
+            f"{row['size']:>9} {row['build_s']:>8.1f} {row['matches']:>9.0f} "
+            f"{row['p50_ms']:>8.2f} {row['p95_ms']:>8.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""목록 응답 직렬화 항목당 비용 벤치마크.
+
+- ``pydantic``: 기존 경로 (DTO -> ``model_validate`` -> ``TypeAdapter.dump_json``)
+- ``compiled``: 생성된 인코더로 DTO 를 바로 인코딩
+- ``fragments``: 조각 캐시가 채워진 상태에서 DTO 를 인코딩
+- ``entities``: DTO 변환 없이 엔티티를 바로 인코딩 (직렬화 자체 비용)
+
+사용법::
+
+    python -m benchmarks.serialization --sizes 1000 10000 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+import uuid
+from collections.abc import Callable
+
+from pydantic import TypeAdapter
+
+from benchmarks.storage import make_tasks
+from mypm.application.tasks.dto import to_task_outputs
+from mypm.presentation.api.encoding import FragmentCache, compile_encoder
+from mypm.presentation.api.schemas.task import TaskResponseSchema
+
+
+def _per_item_us(
+    func: Callable[[], bytes], items: int, repeat: int
+) -> tuple[float, bytes]:
+    body = func()
+    started = time.perf_counter()
+    for _ in range(repeat):
+        body = func()
+    return (time.perf_counter() - started) / repeat / items * 1e6, body
+
+
+def bench(size: int, repeat: int) -> dict:
+    tasks = make_tasks(size)
+    for task in tasks[::3]:
+        task.retrospective_id = uuid.uuid4()
+
+    adapter = TypeAdapter(list[TaskResponseSchema])
+    encoder = compile_encoder(TaskResponseSchema)
+    fragments = FragmentCache(encoder, max_entries=size)
+    uncached = FragmentCache(encoder, max_entries=0)
+
+    def _pydantic() -> bytes:
+        return adapter.dump_json(
+            [TaskResponseSchema.model_validate(item) for item in to_task_outputs(tasks)]
+        )
+
+    results = {}
+    results["pydantic"], expected = _per_item_us(_pydantic, size, repeat)
+    for name, func in (
+        ("compiled", lambda: uncached.encode_many(to_task_outputs(tasks))),
+        ("fragments", lambda: fragments.encode_many(to_task_outputs(tasks))),
+        ("entities", lambda: fragments.encode_many(tasks)),
+    ):
+        results[name], body = _per_item_us(func, size, repeat)
+        assert body == expected, name
+
+    return {"size": size, **results}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000]
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    names = ("pydantic", "compiled", "fragments", "entities")
+    print(
+        f"{'size':>9} "
+        + " ".join(f"{name + ' us':>13}" for name in names)
+        + f" {'speedup':>8}"
+    )
+    for size in args.sizes:
+        row = bench(size, args.repeat)
+        print(
+            f"{row['size']:>9} "
+            + " ".join(f"{row[name]:>13.2f}" for name in names)
+            + f" {row['pydantic'] / row['fragments']:>8.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
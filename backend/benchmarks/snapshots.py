@@ -0,0 +1,172 @@
+"""고정 뷰(``pin``) 읽기와 쓰기의 혼합 처리량.
+
+긴 읽기(전체 Task 를 ``updated_at`` 순 페이지로 끝까지 순회)와 짧은 쓰기(Task 하나
+수정)를 동시에 돌리면서 세 방식을 비교합니다.
+
+- ``unpinned``: 격리 없음. 페이지 사이의 쓰기로 같은 Task 를 두 번 보거나 놓칩니다.
+- ``lock``: 긴 읽기와 쓰기를 하나의 잠금으로 직렬화하는 기준선. 읽는 동안 쓰기가
+  멈춥니다.
+- ``pinned``: 읽기 시작 때 ``pin()`` 으로 고정한 뷰를 순회합니다. 쓰기는 멈추지 않고,
+  고정 뒤의 쓰기는 건드린 인덱스 조각만 복사합니다.
+
+고정 비용과 고정 뒤 첫 쓰기의 지연은 ``--copy-sizes`` 의 크기마다 따로 잽니다.
+
+사용법::
+
+    python -m benchmarks.snapshots --size 20000 --seconds 3 --copy-sizes 100000 1000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import copy
+import random
+import time
+
+from benchmarks.storage import make_tasks
+from mypm.domain.tasks import TaskKeyset, TaskRepository, TaskSortField
+from mypm.infrastructure.tasks import InMemoryTaskRepository
+
+_PAGE = 500
+_LOAD_BATCH = 10_000
+
+
+async def _read_all(repository: TaskRepository, expected: int) -> bool:
+    """페이지 단위로 끝까지 읽고, 모든 Task 를 정확히 한 번씩 봤는지 반환합니다."""
+
+    seen = []
+    after = None
+    while True:
+        page = await repository.list_page(
+            order_by=TaskSortField.UPDATED_AT, after=after, limit=_PAGE
+        )
+        seen.extend(task.id for task in page)
+        if len(page) < _PAGE:
+            break
+        after = TaskKeyset(page[-1].updated_at, page[-1].id)
+        # 페이지 사이에 쓰기가 끼어들 수 있도록 양보합니다(요청 경계나 응답 전송에
+        # 해당).
+        await asyncio.sleep(0)
+    return len(seen) == expected and len(set(seen)) == expected
+
+
+async def _run(
+    mode: str, size: int, seconds: float, readers: int, writers: int
+) -> dict[str, float]:
+    repository = InMemoryTaskRepository()
+    tasks = make_tasks(size)
+    await repository.add_many(tasks)
+    ids = [task.id for task in tasks]
+    lock = asyncio.Lock()
+    guard = lock if mode == "lock" else contextlib.nullcontext()
+    deadline = time.perf_counter() + seconds
+    counts = {"reads": 0, "torn": 0, "writes": 0}
+    write_latencies: list[float] = []
+
+    async def _reader() -> None:
+        while time.perf_counter() < deadline:
+            async with guard:
+                view = repository.pin() if mode == "pinned" else repository
+                consistent = await _read_all(view, size)
+            counts["reads"] += 1
+            counts["torn"] += not consistent
+
+    async def _writer(seed: int) -> None:
+        rng = random.Random(seed)
+        while time.perf_counter() < deadline:
+            started = time.perf_counter()
+            async with guard:
+                task = copy.copy(await repository.get(rng.choice(ids)))
+                task.rename(f"renamed {counts['writes']}")
+                task.touch()
+                await repository.update(task)
+            write_latencies.append(time.perf_counter() - started)
+            counts["writes"] += 1
+            await asyncio.sleep(0)
+
+    started = time.perf_counter()
+    await asyncio.gather(
+        *(_reader() for _ in range(readers)),
+        *(_writer(seed) for seed in range(writers)),
+    )
+    elapsed = time.perf_counter() - started
+
+    write_latencies.sort()
+    return {
+        f"{mode}_reads_per_s": counts["reads"] / elapsed,
+        f"{mode}_torn_reads": counts["torn"],
+        f"{mode}_writes_per_s": counts["writes"] / elapsed,
+        f"{mode}_write_p99_ms": write_latencies[int(len(write_latencies) * 0.99)]
+        * 1000,
+    }
+
+
+async def _copy_cost(size: int) -> dict[str, float]:
+    repository = InMemoryTaskRepository()
+    tasks = make_tasks(size)
+    for start in range(0, size, _LOAD_BATCH):
+        await repository.add_many(tasks[start : start + _LOAD_BATCH])
+
+    started = time.perf_counter()
+    view = repository.pin()
+    pin_ms = (time.perf_counter() - started) * 1000
+
+    task = copy.copy(tasks[0])
+    task.rename("renamed")
+    task.touch()
+    started = time.perf_counter()
+    await repository.update(task)
+    first_write_ms = (time.perf_counter() - started) * 1000
+
+    task = copy.copy(task)
+    task.rename("renamed again")
+    task.touch()
+    started = time.perf_counter()
+    await repository.update(task)
+    next_write_ms = (time.perf_counter() - started) * 1000
+    assert (await view.get(task.id)).title == tasks[0].title
+    return {
+        f"pin_{size}_ms": pin_ms,
+        f"first_write_after_pin_{size}_ms": first_write_ms,
+        f"next_write_{size}_ms": next_write_ms,
+    }
+
+
+async def bench(
+    size: int, seconds: float, readers: int, writers: int, copy_sizes: list[int]
+) -> dict[str, float]:
+    results: dict[str, float] = {}
+    for copy_size in copy_sizes:
+        results.update(await _copy_cost(copy_size))
+    for mode in ("unpinned", "lock", "pinned"):
+        results.update(await _run(mode, size, seconds, readers, writers))
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--size", type=int, default=20_000)
+    parser.add_argument("--seconds", type=float, default=3.0)
+    parser.add_argument("--readers", type=int, default=2)
+    parser.add_argument("--writers", type=int, default=4)
+    parser.add_argument(
+        "--copy-sizes",
+        type=int,
+        nargs="+",
+        default=[20_000, 1_000_000],
+        help="고정 뒤 첫 쓰기를 잴 Task 수",
+    )
+    args = parser.parse_args()
+
+    for name, value in asyncio.run(
+        bench(args.size, args.seconds, args.readers, args.writers, args.copy_sizes)
+    ).items():
+        print(f"{name:<36} {value:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
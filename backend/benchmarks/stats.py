@@ -0,0 +1,179 @@
+"""Task 통계 카운터 vs 전체 재계산 벤치마크 (드리프트 검사 포함).
+
+무작위 추가/수정/삭제를 섞어 실행하면서 ``--check-every`` 번마다 카운터를 전체
+재계산 결과와 비교하고, 마지막에 두 방식의 조회 시간을 비교합니다.
+
+사용법::
+
+    python -m benchmarks.stats --sizes 10000 100000 --mutations 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import random
+import tempfile
+import time
+import uuid
+from datetime import date, timedelta
+
+from benchmarks.storage import STATUSES, make_tasks
+from mypm.application.tasks import TaskService
+from mypm.domain.tasks import (
+    RetrospectiveRepository,
+    TaskRepository,
+    TransactionalStore,
+    compute_task_stats,
+)
+from mypm.infrastructure.tasks import (
+    InMemoryRetrospectiveRepository,
+    InMemoryTaskRepository,
+    InMemoryTransactionalStore,
+    SQLiteConnectionPool,
+    SQLiteRetrospectiveRepository,
+    SQLiteTaskRepository,
+    SQLiteTransactionalStore,
+)
+
+TODAY = date(2026, 6, 1)
+
+
+async def mutate(
+    repository: TaskRepository,
+    rng: random.Random,
+    task_ids: list[uuid.UUID],
+    retrospectives: list[uuid.UUID],
+) -> None:
+    roll = rng.random()
+    if roll < 0.1:
+        task = make_tasks(1, seed=rng.randrange(1 << 30))[0]
+        await repository.add(task)
+        task_ids.append(task.id)
+        return
+
+    position = rng.randrange(len(task_ids))
+    if roll < 0.2:
+        task_ids[position], task_ids[-1] = task_ids[-1], task_ids[position]
+        await repository.delete(task_ids.pop())
+        return
+
+    task = await repository.get(task_ids[position])
+    assert task is not None
+    if roll < 0.6:
+        task.set_status(rng.choice(STATUSES))
+    elif roll < 0.8:
+        task.reschedule(
+            TODAY + timedelta(days=rng.randrange(-30, 30))
+            if rng.random() < 0.9
+            else None
+        )
+    elif rng.random() < 0.8:
+        task.attach_to_retrospective(rng.choice(retrospectives))
+    else:
+        task.detach_from_retrospective()
+    task.touch()
+    await repository.update(task)
+
+
+async def bench(
+    name: str,
+    repositories: tuple[TaskRepository, RetrospectiveRepository, TransactionalStore],
+    size: int,
+    mutations: int,
+    check_every: int,
+    reads: int,
+) -> dict:
+    repository = repositories[0]
+    rng = random.Random(size)
+    retrospectives = [uuid.uuid4() for _ in range(30)]
+    tasks = make_tasks(size)
+    for task in tasks:
+        if rng.random() < 0.3:
+            task.retrospective_id = rng.choice(retrospectives)
+    await repository.add_many(tasks)
+    task_ids = [task.id for task in tasks]
+    service = TaskService(*repositories)
+
+    checks = drift = 0
+    for index in range(1, mutations + 1):
+        await mutate(repository, rng, task_ids, retrospectives)
+        if index % check_every == 0 or index == mutations:
+            differences = await service.check_stats(TODAY)
+            checks += 1
+            if differences:
+                drift += 1
+                print(f"  [{name}] drift after {index} mutations: {differences}")
+
+    started = time.perf_counter()
+    for _ in range(reads):
+        await repository.stats(TODAY)
+    counters = (time.perf_counter() - started) / reads
+
+    started = time.perf_counter()
+    for _ in range(reads):
+        compute_task_stats(await repository.list_by_status(), TODAY)
+    recompute = (time.perf_counter() - started) / reads
+
+    return {
+        "backend": name,
+        "size": size,
+        "checks": checks,
+        "drift": drift,
+        "counter_ms": counters * 1000,
+        "recompute_ms": recompute * 1000,
+    }
+
+
+async def run(args: argparse.Namespace) -> None:
+    print(
+        f"{'backend':>8} {'size':>9} {'checks':>7} {'drift':>6} "
+        f"{'counter ms':>11} {'recompute ms':>13}"
+    )
+    for size in args.sizes:
+        options = (args.mutations, args.check_every, args.reads)
+        memory, memory_retrospectives = (
+            InMemoryTaskRepository(),
+            InMemoryRetrospectiveRepository(),
+        )
+        memory_store = InMemoryTransactionalStore(memory, memory_retrospectives)
+        rows = [
+            await bench(
+                "memory", (memory, memory_retrospectives, memory_store), size, *options
+            )
+        ]
+        with tempfile.TemporaryDirectory() as directory:
+            pool = SQLiteConnectionPool(os.path.join(directory, "bench.sqlite3"))
+            try:
+                sqlite = SQLiteTaskRepository(pool)
+                sqlite_repositories = (
+                    sqlite,
+                    SQLiteRetrospectiveRepository(pool),
+                    SQLiteTransactionalStore(pool, sqlite),
+                )
+                rows.append(await bench("sqlite", sqlite_repositories, size, *options))
+            finally:
+                pool.close()
+
+        for row in rows:
+            print(
+                f"{row['backend']:>8} {row['size']:>9} {row['checks']:>7} "
+                f"{row['drift']:>6} {row['counter_ms']:>11.3f} "
+                f"{row['recompute_ms']:>13.3f}"
+            )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--mutations", type=int, default=2_000)
+    parser.add_argument("--check-every", type=int, default=500)
+    parser.add_argument("--reads", type=int, default=5)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+"""메모리 / SQLite 리포지토리 비교 벤치마크.
+
+사용법::
+
+    python -m benchmarks.storage --sizes 10000 100000 1000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import random
+import tempfile
+import time
+from collections.abc import Awaitable, Callable
+from datetime import date, timedelta
+
+from mypm.domain.tasks import Task, TaskRepository, TaskSortField, TaskStatus
+from mypm.infrastructure.tasks import (
+    InMemoryTaskRepository,
+    SQLiteConnectionPool,
+    SQLiteTaskRepository,
+)
+
+STATUSES = list(TaskStatus)
+
+
+def make_tasks(count: int, seed: int = 0) -> list[Task]:
+    rng = random.Random(seed)
+    base = date(2026, 1, 1)
+    return [
+        Task(
+            title=f"task {index}",
+            description=f"description {index}",
+            status=rng.choice(STATUSES),
+            due_date=base + timedelta(days=rng.randrange(365))
+            if rng.random() < 0.7
+            else None,
+        )
+        for index in range(count)
+    ]
+
+
+async def _timed(operations: int, func: Callable[[int], Awaitable[object]]) -> float:
+    """``operations`` 번 실행한 뒤 초당 처리량을 반환합니다."""
+
+    started = time.perf_counter()
+    for index in range(operations):
+        await func(index)
+    return operations / (time.perf_counter() - started)
+
+
+async def bench_repository(
+    name: str, repository: TaskRepository, tasks: list[Task], ops: int
+) -> dict:
+    rng = random.Random(1)
+    sample = [rng.choice(tasks) for _ in range(ops)]
+
+    started = time.perf_counter()
+    for task in tasks:
+        await repository.add(task)
+    load_seconds = time.perf_counter() - started
+
+    async def _get(index: int) -> object:
+        return await repository.get(sample[index].id)
+
+    async def _page(index: int) -> object:
+        return await repository.list_page(
+            status=STATUSES[index % len(STATUSES)].value,
+            order_by=TaskSortField.DUE_DATE,
+            limit=50,
+        )
+
+    async def _update(index: int) -> object:
+        task = sample[index]
+        task.set_status(STATUSES[index % len(STATUSES)])
+        task.touch()
+        return await repository.update(task)
+
+    return {
+        "backend": name,
+        "size": len(tasks),
+        "load_per_s": len(tasks) / load_seconds,
+        "get_per_s": await _timed(ops, _get),
+        "page_per_s": await _timed(ops, _page),
+        "update_per_s": await _timed(ops, _update),
+    }
+
+
+async def run(sizes: list[int], ops: int, pool_size: int) -> list[dict]:
+    results = []
+    for size in sizes:
+        results.append(
+            await bench_repository(
+                "memory", InMemoryTaskRepository(), make_tasks(size), ops
+            )
+        )
+
+        with tempfile.TemporaryDirectory() as directory:
+            pool = SQLiteConnectionPool(
+                os.path.join(directory, "bench.sqlite3"), size=pool_size
+            )
+            try:
+                repository = SQLiteTaskRepository(pool)
+                results.append(
+                    await bench_repository("sqlite", repository, make_tasks(size), ops)
+                )
+            finally:
+                pool.close()
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000]
+    )
+    parser.add_argument("--ops", type=int, default=2_000, help="측정 연산당 반복 횟수")
+    parser.add_argument("--pool-size", type=int, default=4)
+    args = parser.parse_args()
+
+    header = (
+        f"{'backend':<8} {'size':>9} {'load/s':>10} {'get/s':>10} "
+        f"{'page/s':>10} {'update/s':>10}"
+    )
+    print(header)
+    for row in asyncio.run(run(args.sizes, args.ops, args.pool_size)):
+        print(
+            f"{row['backend']:<8} {row['size']:>9} {row['load_per_s']:>10.0f} "
+            f"{row['get_per_s']:>10.0f} {row['page_per_s']:>10.0f} "
+            f"{row['update_per_s']:>10.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
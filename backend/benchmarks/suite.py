@@ -0,0 +1,75 @@
+"""리포지토리 마이크로벤치마크와 프로세스 내 HTTP 벤치마크를 함께 실행합니다.
+
+두 결과를 하나의 JSON 으로 저장하고, 기준선 JSON 을 주면 같은 이름의 항목과 비교해 p50
+지연이나 처리량이 ``--tolerance`` 넘게 나빠진 항목을 출력하고 종료 코드 1 로 끝납니다.
+기준선은 같은 머신에서 변경 전 코드로 ``--output`` 을 남겨 만듭니다.
+
+- ``quick``: Task 1e3~1e5 개, HTTP 시나리오별 1000 회 (변경마다 확인용)
+- ``full``: Task 1e3~1e6 개, HTTP 시나리오별 5000 회
+
+사용법::
+
+    python -m benchmarks.suite --profile quick --output baseline.json
+    python -m benchmarks.suite --profile quick --baseline baseline.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+
+from benchmarks import api, repositories
+from benchmarks.report import add_comparison_arguments, finish
+
+PROFILES = {
+    "quick": {
+        "sizes": [1_000, 10_000, 100_000],
+        "ops": 1_000,
+        "api_size": 10_000,
+        "requests": 1_000,
+    },
+    "full": {
+        "sizes": [1_000, 10_000, 100_000, 1_000_000],
+        "ops": 5_000,
+        "api_size": 100_000,
+        "requests": 5_000,
+    },
+}
+
+
+async def run(profile: dict, backends: list[str], users: int) -> list[dict]:
+    results = await repositories.run(
+        backends, profile["sizes"], profile["ops"], scan_ops=20
+    )
+    results.extend(
+        await api.run(
+            profile["api_size"], users, profile["requests"], list(api.SCENARIOS)
+        )
+    )
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--profile", choices=PROFILES, default="quick")
+    parser.add_argument(
+        "--backends",
+        nargs="+",
+        choices=repositories.BACKENDS,
+        default=list(repositories.BACKENDS),
+    )
+    parser.add_argument(
+        "--users", type=int, default=16, help="HTTP 동시 가상 사용자 수"
+    )
+    add_comparison_arguments(parser)
+    args = parser.parse_args()
+
+    return finish(
+        asyncio.run(run(PROFILES[args.profile], args.backends, args.users)), args
+    )
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,255 @@
+"""스트리밍 가져오기/내보내기 처리량과 메모리.
+
+- ``sequential``: 이전 방식. 행마다 ``POST /tasks`` 한 번 (``--sample`` 행을 재서 환산)
+- ``import``: ``/tasks/import`` 와 ``mypm import`` 가 쓰는 파이프라인. 64 KiB 조각으로
+  나눈 본문을 ``batch_size`` 행씩 검증해 ``add_many`` 로 추가합니다.
+- ``export``: ``/tasks/export`` 의 스트림과 이전 방식(``GET /tasks`` 전체를 한 본문으로
+  인코딩)의 처리량과 추적한 최대 할당량(tracemalloc)
+
+사용법::
+
+    python -m benchmarks.transfer --size 1000000 --sample 5000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import csv
+import gc
+import io
+import json
+import os
+import random
+import tempfile
+import time
+import tracemalloc
+from collections.abc import AsyncIterator, Awaitable, Callable
+from datetime import date, timedelta
+from functools import partial
+
+import httpx
+
+from mypm.application.tasks import TaskService
+from mypm.application.tasks.dto import to_task_outputs
+from mypm.application.tasks.transfer import (
+    TransferFormat,
+    export_task_stream,
+    import_task_stream,
+)
+from mypm.domain.tasks import TaskRepository
+from mypm.infrastructure.tasks import (
+    CompactTaskRepository,
+    InMemoryRetrospectiveRepository,
+    InMemoryTaskRepository,
+    InMemoryTransactionalStore,
+    SQLiteConnectionPool,
+    SQLiteRetrospectiveRepository,
+    SQLiteTaskRepository,
+    SQLiteTransactionalStore,
+)
+from mypm.presentation.api.encoding import FragmentCache, compile_encoder
+from mypm.presentation.api.schemas.task import TaskResponseSchema
+
+_CHUNK_BYTES = 64 * 1024
+_STATUSES = ("todo", "in_progress", "done", "blocked")
+
+
+def _rows(size: int) -> list[dict]:
+    rng = random.Random(0)
+    base = date(2026, 1, 1)
+    return [
+        {
+            "title": f"task {index}",
+            "description": f'description {index}, with "quotes"'
+            if index % 10 == 0
+            else None,
+            "status": rng.choice(_STATUSES),
+            "due_date": base + timedelta(days=rng.randrange(365))
+            if rng.random() < 0.7
+            else None,
+        }
+        for index in range(size)
+    ]
+
+
+def _body(rows: list[dict], file_format: TransferFormat) -> list[bytes]:
+    if file_format is TransferFormat.NDJSON:
+        text = "".join(json.dumps(row, default=date.isoformat) + "\n" for row in rows)
+    else:
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=list(rows[0]), lineterminator="\n")
+        writer.writeheader()
+        writer.writerows(rows)
+        text = buffer.getvalue()
+    data = text.encode()
+    return [
+        data[offset : offset + _CHUNK_BYTES]
+        for offset in range(0, len(data), _CHUNK_BYTES)
+    ]
+
+
+async def _chunks(body: list[bytes]) -> AsyncIterator[bytes]:
+    for chunk in body:
+        yield chunk
+
+
+def _backend(
+    name: str, directory: str
+) -> tuple[TaskService, TaskRepository, SQLiteConnectionPool | None]:
+    if name == "sqlite":
+        pool = SQLiteConnectionPool(os.path.join(directory, "bench.sqlite3"))
+        tasks = SQLiteTaskRepository(pool)
+        retrospectives = SQLiteRetrospectiveRepository(pool)
+        service = TaskService(
+            tasks, retrospectives, SQLiteTransactionalStore(pool, tasks)
+        )
+        return service, tasks, pool
+
+    repository = (
+        InMemoryTaskRepository() if name == "memory" else CompactTaskRepository()
+    )
+    in_memory = InMemoryRetrospectiveRepository()
+    return (
+        TaskService(
+            repository, in_memory, InMemoryTransactionalStore(repository, in_memory)
+        ),
+        repository,
+        None,
+    )
+
+
+async def _sequential(sample: int) -> float:
+    """행마다 ``POST /tasks`` 를 보내는 이전 방식의 초당 행 수."""
+
+    from mypm.app import create_app
+
+    rows = _rows(sample)
+    transport = httpx.ASGITransport(app=create_app())
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://bench"
+    ) as client:
+        started = time.perf_counter()
+        for row in rows:
+            due_date = row["due_date"].isoformat() if row["due_date"] else None
+            payload = {
+                "title": row["title"],
+                "description": row["description"],
+                "due_date": due_date,
+            }
+            response = await client.post("/tasks/", json=payload)
+            response.raise_for_status()
+        return sample / (time.perf_counter() - started)
+
+
+async def _import(
+    service: TaskService,
+    body: list[bytes],
+    file_format: TransferFormat,
+    batch_size: int,
+) -> tuple[float, int]:
+    started = time.perf_counter()
+    async for progress in import_task_stream(
+        service, _chunks(body), file_format, batch_size
+    ):
+        pass
+    elapsed = time.perf_counter() - started
+    assert progress.failed == 0 and progress.error is None, progress
+    return progress.created / elapsed, progress.created
+
+
+async def _export(
+    service: TaskService, file_format: TransferFormat, batch_size: int
+) -> tuple[float, int]:
+    started = time.perf_counter()
+    total = 0
+    async for chunk in export_task_stream(service, file_format, batch_size):
+        total += len(chunk)
+    return time.perf_counter() - started, total
+
+
+async def _one_body(repository: TaskRepository) -> tuple[float, int]:
+    """이전 방식: 모든 Task 를 읽어 JSON 배열 한 본문으로 인코딩합니다 (조각 캐시
+    없음)."""
+
+    fragments = FragmentCache(compile_encoder(TaskResponseSchema), 0)
+    started = time.perf_counter()
+    body = fragments.encode_many(to_task_outputs(await repository.list_by_status()))
+    return time.perf_counter() - started, len(body)
+
+
+async def _peak_mib(run: Callable[[], Awaitable[object]]) -> float:
+    gc.collect()
+    tracemalloc.start()
+    try:
+        await run()
+        return tracemalloc.get_traced_memory()[1] / (1 << 20)
+    finally:
+        tracemalloc.stop()
+
+
+async def bench(
+    size: int, sample: int, batch_size: int, backends: list[str]
+) -> dict[str, float]:
+    results: dict[str, float] = {
+        "sequential_post_rows_per_s": await _sequential(sample)
+    }
+    rows = _rows(size)
+    bodies = {file_format: _body(rows, file_format) for file_format in TransferFormat}
+    del rows
+
+    for backend in backends:
+        for file_format in TransferFormat:
+            with tempfile.TemporaryDirectory() as directory:
+                service, repository, pool = _backend(backend, directory)
+                rate, created = await _import(
+                    service, bodies[file_format], file_format, batch_size
+                )
+                assert created == size
+                results[f"import_{backend}_{file_format}_rows_per_s"] = rate
+
+                elapsed, _ = await _export(service, file_format, batch_size)
+                results[f"export_{backend}_{file_format}_rows_per_s"] = size / elapsed
+                if file_format is TransferFormat.NDJSON:
+                    elapsed, _ = await _one_body(repository)
+                    results[f"one_body_{backend}_rows_per_s"] = size / elapsed
+                    if backend == backends[0]:
+                        results[f"export_{backend}_peak_mib"] = await _peak_mib(
+                            partial(_export, service, file_format, batch_size)
+                        )
+                        results[f"one_body_{backend}_peak_mib"] = await _peak_mib(
+                            partial(_one_body, repository)
+                        )
+
+                del service, repository
+                if pool is not None:
+                    pool.close()
+                gc.collect()
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--size", type=int, default=1_000_000)
+    parser.add_argument(
+        "--sample", type=int, default=5_000, help="sequential 에서 보낼 POST 수"
+    )
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument(
+        "--backends",
+        nargs="+",
+        choices=("memory", "compact", "sqlite"),
+        default=["memory", "compact", "sqlite"],
+    )
+    args = parser.parse_args()
+
+    for name, value in asyncio.run(
+        bench(args.size, args.sample, args.batch_size, args.backends)
+    ).items():
+        print(f"{name:<36} {value:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
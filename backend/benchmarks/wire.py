@@ -0,0 +1,87 @@
+"""응답 표현별 전송 크기와 서버 CPU.
+
+Task 목록 응답(JSON)을 각 표현(JSON/MessagePack x 무압축/gzip/zstd)으로 바꿀 때의 본문
+크기와 CPU 시간을 잽니다. 변환/압축한 본문은 버전이 바뀔 때까지 응답 캐시에 남으므로
+여기서 재는 비용은 쓰기 직후 첫 요청에서만 듭니다. ``msgpack``/``zstandard`` 가 없으면
+해당 표현은 건너뜁니다 (``pip install mypm[wire]``).
+
+사용법::
+
+    python -m benchmarks.wire --sizes 100 1000 10000 --repeat 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+
+from benchmarks.storage import make_tasks
+from mypm.application.tasks.dto import TaskOutput
+from mypm.presentation.api.encoding import FragmentCache, compile_encoder
+from mypm.presentation.api.schemas.task import TaskResponseSchema
+from mypm.presentation.api.wire import (
+    GZIP,
+    JSON,
+    MSGPACK,
+    ZSTD,
+    ResponseEncoder,
+    msgpack,
+    zstandard,
+)
+
+
+def _variants() -> list[tuple[str, str | None]]:
+    encodings = [None, GZIP] + ([ZSTD] if zstandard is not None else [])
+    media_types = [JSON] + ([MSGPACK] if msgpack is not None else [])
+    return [
+        (media_type, encoding) for media_type in media_types for encoding in encodings
+    ]
+
+
+async def bench(sizes: list[int], repeat: int) -> list[dict]:
+    # 압축 여부와 스레드 풀 사용을 크기와 무관하게 고정합니다.
+    encoder = ResponseEncoder(min_bytes=0, thread_bytes=1 << 62)
+    fragments = FragmentCache(compile_encoder(TaskResponseSchema), 0)
+    rows = []
+    for size in sizes:
+        body = fragments.encode_many(
+            TaskOutput.from_entity(task) for task in make_tasks(size)
+        )
+        for media_type, encoding in _variants():
+            encoded = b""
+            started = time.process_time()
+            for _ in range(repeat):
+                encoded = await encoder.encode(body, media_type, encoding)
+            cpu = (time.process_time() - started) / repeat
+            rows.append(
+                {
+                    "size": size,
+                    "format": media_type.removeprefix("application/")
+                    + (f"+{encoding}" if encoding else ""),
+                    "bytes": len(encoded),
+                    "ratio": len(encoded) / len(body),
+                    "cpu_ms": cpu * 1000,
+                }
+            )
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1_000, 10_000])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"{'tasks':>7} {'format':<14} {'KiB':>9} {'ratio':>6} {'cpu ms':>8}")
+    for row in asyncio.run(bench(args.sizes, args.repeat)):
+        print(
+            f"{row['size']:>7} {row['format']:<14} {row['bytes'] / 1024:>9.1f}"
+            f" {row['ratio']:>6.2f} {row['cpu_ms']:>8.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
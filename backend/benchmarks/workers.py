@@ -0,0 +1,311 @@
+"""멀티 워커 API 처리량 벤치마크.
+
+워커 수별로 스토어 서버와 ``uvicorn --workers N`` 을 자식 프로세스로 띄우고, 여러 HTTP
+클라이언트가 읽기 위주 혼합 부하(목록/검색/통계, 약 10% 상태 수정)를 보내 초당 요청 수를
+잽니다. 비교 기준(``local``)은 스토어 서버 없이 워커 하나가 저장소를 직접 소유하는
+구성입니다.
+
+측정하는 동안 프로세스별 CPU 시간(``/proc``)도 읽어 요청당 CPU 밀리초를 냅니다.
+
+- ``api ms``: uvicorn 워커 전체, ``store ms``: 스토어 서버, ``load ms``: 부하 생성기
+- ``ceiling``: 코어가 충분할 때의 상한. 워커 N 개가 ``N / api`` 만큼, 스토어 서버는 한
+  프로세스라 ``1 / store`` 만큼 처리하므로 둘 중 작은 값입니다.
+
+``req/s`` 는 실제 벽시계 측정값이라 워커 + 스토어 서버 + 부하 생성기 수만큼 코어가
+있어야 확장을 보여 줍니다. 코어가 모자라면 ``cores`` 열에 ``shared`` 로 표시하며, 이때
+``req/s`` 는 스토어 서버 왕복 비용만 드러내고 확장은 ``ceiling`` 으로만 읽습니다.
+
+사용법::
+
+    python -m benchmarks.workers --workers 1 2 4 8 --duration 10 --concurrency 64
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import os
+import random
+import resource
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Callable, Iterator
+
+import httpx
+
+from benchmarks.storage import STATUSES
+
+BACKENDS = ("memory", "compact", "sqlite")
+SEED_BATCH = 5000
+
+
+def _free_port() -> int:
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        return probe.getsockname()[1]
+
+
+def _spawn(args: list[str], env: dict[str, str]) -> subprocess.Popen:
+    return subprocess.Popen(
+        [sys.executable, *args],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+
+def _cpu_seconds(pid: int) -> float:
+    """프로세스와 그 자손이 지금까지 쓴 CPU 시간(초). ``/proc`` 가 없으면 NaN."""
+
+    # pid -> 부모 pid, 쓴 CPU 초
+    parents: dict[int, int] = {}
+    usage: dict[int, float] = {}
+    try:
+        entries = os.listdir("/proc")
+    except FileNotFoundError:
+        return float("nan")
+    ticks = os.sysconf("SC_CLK_TCK")
+    for entry in entries:
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat") as stat:
+                # 실행 파일 이름에 공백이 있을 수 있으므로 마지막 ")" 뒤를 나눕니다.
+                fields = stat.read().rpartition(")")[2].split()
+        except OSError:
+            continue
+        parents[int(entry)] = int(fields[1])
+        usage[int(entry)] = (int(fields[11]) + int(fields[12])) / ticks
+
+    tree = {pid}
+    while True:
+        children = {child for child, parent in parents.items() if parent in tree}
+        if children <= tree:
+            return sum(usage.get(member, 0.0) for member in tree)
+        tree |= children
+
+
+@contextlib.contextmanager
+def _deployment(
+    backend: str, workers: int | None, directory: str
+) -> Iterator[tuple[str, Callable[[], tuple[float, float]]]]:
+    """API 서버(와 필요하면 스토어 서버)를 띄우고 기본 URL 과 (API, 스토어 서버) CPU
+    시간을 읽는 함수를 넘깁니다. ``workers=None`` 은 기준 구성."""
+
+    env = dict(
+        os.environ,
+        PYTHONPATH=os.pathsep.join(sys.path),
+        MYPM_STORAGE_BACKEND=backend,
+        MYPM_SQLITE_PATH=os.path.join(directory, "bench.sqlite3"),
+        MYPM_STORE_SOCKET=os.path.join(directory, "store.sock"),
+    )
+    processes = []
+    try:
+        if workers is not None:
+            processes.append(_spawn(["-m", "mypm.main", "store-server"], env))
+            _wait(lambda: os.path.exists(env["MYPM_STORE_SOCKET"]), processes)
+            env["MYPM_STORAGE_BACKEND"] = "remote"
+
+        port = _free_port()
+        command = [
+            "-m",
+            "uvicorn",
+            "mypm.app:app",
+            "--port",
+            str(port),
+            "--log-level",
+            "warning",
+        ]
+        if workers is not None and workers > 1:
+            command += ["--workers", str(workers)]
+        processes.append(_spawn(command, env))
+        url = f"http://127.0.0.1:{port}"
+        _wait(lambda: _responds(url), processes)
+        api, store = processes[-1], processes[0] if workers is not None else None
+
+        def _cpu() -> tuple[float, float]:
+            return (
+                _cpu_seconds(api.pid),
+                _cpu_seconds(store.pid) if store is not None else 0.0,
+            )
+
+        yield url, _cpu
+    finally:
+        for process in reversed(processes):
+            process.terminate()
+            process.wait()
+
+
+def _responds(url: str) -> bool:
+    try:
+        return httpx.get(f"{url}/tasks/stats").status_code == 200
+    except httpx.TransportError:
+        return False
+
+
+def _wait(ready, processes: list[subprocess.Popen], timeout: float = 60.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not ready():
+        if (
+            any(process.poll() is not None for process in processes)
+            or time.monotonic() > deadline
+        ):
+            raise RuntimeError("Server failed to start")
+        time.sleep(0.1)
+
+
+async def _seed(client: httpx.AsyncClient, size: int, seed: int = 0) -> list[str]:
+    rng = random.Random(seed)
+    for start in range(0, size, SEED_BATCH):
+        items = [
+            {
+                "title": f"task {index}",
+                "description": f"description {index}",
+                "status": rng.choice(STATUSES).value,
+            }
+            for index in range(start, min(start + SEED_BATCH, size))
+        ]
+        response = await client.post("/tasks/batch", json={"items": items})
+        response.raise_for_status()
+    response = await client.get("/tasks/", params={"limit": 1000})
+    return [task["id"] for task in response.json()]
+
+
+def _own_cpu_seconds() -> float:
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    return usage.ru_utime + usage.ru_stime
+
+
+async def _load(
+    url: str,
+    cpu: Callable[[], tuple[float, float]],
+    size: int,
+    concurrency: int,
+    duration: float,
+    writes: float,
+) -> dict:
+    limits = httpx.Limits(
+        max_connections=concurrency, max_keepalive_connections=concurrency
+    )
+    async with httpx.AsyncClient(base_url=url, limits=limits, timeout=60.0) as client:
+        task_ids = await _seed(client, size)
+        latencies: list[float] = []
+        errors = 0
+        deadline = time.perf_counter() + duration
+
+        async def _client(seed: int) -> None:
+            nonlocal errors
+            rng = random.Random(seed)
+            while time.perf_counter() < deadline:
+                choice = rng.random()
+                started = time.perf_counter()
+                if choice < writes:
+                    response = await client.patch(
+                        f"/tasks/{rng.choice(task_ids)}",
+                        json={"status": rng.choice(STATUSES).value},
+                    )
+                elif choice < 0.55:
+                    response = await client.get(
+                        "/tasks/",
+                        params={
+                            "status_filter": rng.choice(STATUSES).value,
+                            "limit": 50,
+                        },
+                    )
+                elif choice < 0.8:
+                    response = await client.get(
+                        "/tasks/search", params={"q": f"task {rng.randrange(size)}"}
+                    )
+                else:
+                    response = await client.get("/tasks/stats")
+                latencies.append(time.perf_counter() - started)
+                errors += response.status_code >= 400
+
+        api_before, store_before = cpu()
+        load_before = _own_cpu_seconds()
+        started = time.perf_counter()
+        await asyncio.gather(*(_client(seed) for seed in range(concurrency)))
+        elapsed = time.perf_counter() - started
+        api_after, store_after = cpu()
+        load_seconds = _own_cpu_seconds() - load_before
+
+    latencies.sort()
+    requests = len(latencies)
+    return {
+        "req_s": requests / elapsed,
+        "api_ms": (api_after - api_before) * 1000 / requests,
+        "store_ms": (store_after - store_before) * 1000 / requests,
+        "load_ms": load_seconds * 1000 / requests,
+        "p50_ms": latencies[len(latencies) // 2] * 1000,
+        "p99_ms": latencies[int(len(latencies) * 0.99)] * 1000,
+        "errors": errors,
+    }
+
+
+def bench(backend: str, workers: int | None, args: argparse.Namespace) -> dict:
+    with (
+        tempfile.TemporaryDirectory() as directory,
+        _deployment(backend, workers, directory) as (url, cpu),
+    ):
+        row = asyncio.run(
+            _load(url, cpu, args.size, args.concurrency, args.duration, args.writes)
+        )
+    processes = workers or 1
+    limits = [processes * 1000 / row["api_ms"]]
+    if row["store_ms"] > 0:
+        limits.append(1000 / row["store_ms"])
+    row["ceiling"] = min(limits)
+    # 워커, 스토어 서버(있으면), 부하 생성기가 각자 코어를 가져야 벽시계 값이 확장을
+    # 보여 줍니다.
+    row["shared"] = processes + (workers is not None) + 1 > _cores()
+    return row
+
+
+def _cores() -> int:
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--backends", nargs="+", choices=BACKENDS, default=["memory"])
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--size", type=int, default=10_000, help="Task 수")
+    parser.add_argument(
+        "--concurrency", type=int, default=64, help="동시 HTTP 클라이언트 수"
+    )
+    parser.add_argument(
+        "--duration", type=float, default=10.0, help="구성별 측정 시간(초)"
+    )
+    parser.add_argument("--writes", type=float, default=0.1, help="상태 수정 요청 비율")
+    args = parser.parse_args()
+
+    print(f"cores={_cores()}")
+    print(
+        f"{'backend':>8} {'workers':>8} {'req/s':>9} {'p50 ms':>8} {'p99 ms':>8} "
+        f"{'api ms':>7} {'store ms':>8} {'load ms':>7} {'ceiling':>8} "
+        f"{'cores':>6} {'errors':>7}"
+    )
+    for backend in args.backends:
+        for workers in [None, *args.workers]:
+            row = bench(backend, workers, args)
+            label = "local" if workers is None else str(workers)
+            print(
+                f"{backend:>8} {label:>8} {row['req_s']:>9.0f} {row['p50_ms']:>8.2f} "
+                f"{row['p99_ms']:>8.2f} {row['api_ms']:>7.2f} "
+                f"{row['store_ms']:>8.2f} {row['load_ms']:>7.2f} "
+                f"{row['ceiling']:>8.0f} "
+                f"{'shared' if row['shared'] else 'own':>6} {row['errors']:>7}",
+                flush=True,
+            )
+
+
+if __name__ == "__main__":
+    main()
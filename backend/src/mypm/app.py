@@ -1,10 +1,41 @@
 """FastAPI 애플리케이션 팩토리."""
 
+import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
+from fastapi.middleware.cors import CORSMiddleware
 
 from mypm.core.config import get_settings
 from mypm.presentation import api_router
-from fastapi.middleware.cors import CORSMiddleware
+from mypm.presentation.api.dependencies import (
+    close_storage,
+    close_task_history,
+    get_idempotency_store,
+    get_metrics,
+    get_profiles,
+    load_task_history,
+)
+from mypm.presentation.api.idempotency import (
+    IDEMPOTENCY_KEY_HEADER,
+    REPLAYED_HEADER,
+    IdempotencyMiddleware,
+)
+from mypm.presentation.api.metrics import MetricsMiddleware
+from mypm.presentation.api.profiling import PROFILE_ID_HEADER, ProfilingMiddleware
+
+_logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def _lifespan(app: FastAPI) -> AsyncIterator[None]:
+    # 요청을 받기 전에 현재 Task 상태를 상태 전이 기록의 기준선으로 등록합니다.
+    await load_task_history()
+    yield
+    close_task_history()
+    # 저널의 남은 그룹 커밋과 백그라운드 스냅샷을 마치고 잠금을 풉니다.
+    await close_storage()
 
 
 def create_app() -> FastAPI:
@@ -16,18 +47,49 @@ def create_app() -> FastAPI:
         title=settings.app_name,
         version=settings.version,
         debug=settings.debug,
+        lifespan=_lifespan,
     )
 
+    # 멱등 키 저장소는 워커마다 따로이므로, 여러 워커가 상태를 공유하면 다른 워커로 간
+    # 재시도가 다시 실행됩니다. 그런 구성에서는 켜지 않습니다.
+    if settings.workers > 1 or settings.storage_backend == "remote":
+        _logger.warning(
+            "%s is ignored: stored responses are per worker process and the "
+            "workers share a store server",
+            IDEMPOTENCY_KEY_HEADER,
+        )
+    else:
+        # CORS 안쪽에 두어 재생한 응답에도 CORS 헤더가 붙게 합니다.
+        app.add_middleware(
+            IdempotencyMiddleware,
+            store=get_idempotency_store(),
+            max_body_bytes=settings.idempotency_max_body_bytes,
+        )
     app.add_middleware(
         CORSMiddleware,
         allow_origins=["*"],
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        expose_headers=["X-Next-Cursor", "ETag", PROFILE_ID_HEADER, REPLAYED_HEADER],
     )
 
     app.include_router(api_router)
 
+    # 꺼져 있으면 등록하지 않으므로 요청 경로에 비용이 없습니다.
+    profiles = get_profiles()
+    if profiles is not None:
+        app.add_middleware(
+            ProfilingMiddleware,
+            store=profiles,
+            sample_rate=settings.profiling_sample_rate,
+        )
+
+    # 가장 바깥에 두어 CORS 처리까지 포함한 전체 요청 시간을 잽니다.
+    metrics = get_metrics()
+    if metrics is not None:
+        app.add_middleware(MetricsMiddleware, registry=metrics)
+
     return app
 
 
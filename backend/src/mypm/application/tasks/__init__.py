@@ -1,7 +1,11 @@
 """Tasks 애플리케이션 레이어."""
 
-from mypm.application.tasks.services import RetrospectiveService, TaskService
-
-
-__all__ = ["TaskService", "RetrospectiveService"]
+from mypm.application.tasks.loader import TaskLoader
+from mypm.application.tasks.services import (
+    ChangeService,
+    RetrospectiveService,
+    TaskService,
+)
+
+__all__ = ["TaskService", "RetrospectiveService", "ChangeService", "TaskLoader"]
 
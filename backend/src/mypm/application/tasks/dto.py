@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from datetime import date
+from dataclasses import dataclass, field
+from datetime import date, datetime
 from typing import Iterable
 import uuid
 
+from mypm.domain.tasks.changes import Change, ChangeKind
 from mypm.domain.tasks.entities import Retrospective, Task, TaskStatus
+from mypm.domain.tasks.history import CycleTimeStats, DailyCount
+from mypm.domain.tasks.queries import TaskQueryPlan
+from mypm.domain.tasks.stats import TaskStats
 
 
 @dataclass(slots=True)
@@ -33,6 +37,8 @@ class TaskOutput:
     status: TaskStatus
     due_date: date | None
     retrospective_id: uuid.UUID | None
+    # 응답에는 포함하지 않고, 직렬화 조각 캐시의 무효화 기준으로 씁니다.
+    updated_at: datetime
 
     @classmethod
     def from_entity(cls, task: Task) -> "TaskOutput":
@@ -43,9 +49,135 @@ class TaskOutput:
             status=task.status,
             due_date=task.due_date,
             retrospective_id=task.retrospective_id,
+            updated_at=task.updated_at,
         )
 
 
+@dataclass(slots=True)
+class TaskBatchItemOutput:
+    """일괄 작업 항목별 결과. ``error`` 가 없으면 성공입니다."""
+
+    index: int
+    task: TaskOutput | None = None
+    error: str | None = None
+
+
+@dataclass(slots=True)
+class TaskImportInput:
+    """가져오기 한 행. 가져온 Task 는 새 ID 를 받으며 회고 연결은 가져오지 않습니다."""
+
+    title: str
+    description: str | None = None
+    status: TaskStatus = TaskStatus.TODO
+    due_date: date | None = None
+
+
+@dataclass(slots=True)
+class TaskImportProgress:
+    """가져오기 진행 상황. 수는 처음부터의 누계이고 ``errors`` 는 이번 묶음의 실패
+    행입니다.
+
+    ``error`` 는 더 읽을 수 없는 본문(너무 긴 줄, CSV 헤더 없음 등)의 이유이며, 그 전
+    묶음까지는 이미 추가된 상태입니다.
+    """
+
+    processed: int = 0
+    created: int = 0
+    failed: int = 0
+    errors: list[TaskBatchItemOutput] = field(default_factory=list)
+    done: bool = False
+    error: str | None = None
+
+
+@dataclass(slots=True)
+class TaskPageOutput:
+    items: list[TaskOutput]
+    next_cursor: str | None = None
+
+
+@dataclass(slots=True)
+class TaskQueryOutput:
+    items: list[TaskOutput]
+    next_cursor: str | None = None
+    # explain 을 요청한 경우에만 채웁니다.
+    plan: TaskQueryPlan | None = None
+
+
+@dataclass(slots=True)
+class TaskSearchHitOutput:
+    task: TaskOutput
+    score: float
+
+
+@dataclass(slots=True)
+class TaskSearchOutput:
+    items: list[TaskSearchHitOutput]
+    total: int
+
+
+@dataclass(slots=True)
+class TaskStatsOutput:
+    total: int
+    by_status: dict[TaskStatus, int]
+    completion_rate: float
+    overdue: int
+    due_today: int
+    due_this_week: int
+    due_later: int
+    no_due_date: int
+    attached_to_retrospective: int
+    retrospective_count: int
+
+    @classmethod
+    def from_stats(cls, stats: TaskStats) -> "TaskStatsOutput":
+        done = stats.by_status.get(TaskStatus.DONE, 0)
+        return cls(
+            total=stats.total,
+            by_status=dict(stats.by_status),
+            completion_rate=done / stats.total if stats.total else 0.0,
+            overdue=stats.overdue,
+            due_today=stats.due_today,
+            due_this_week=stats.due_this_week,
+            due_later=stats.due_later,
+            no_due_date=stats.no_due_date,
+            attached_to_retrospective=stats.attached_to_retrospective,
+            retrospective_count=stats.retrospective_count,
+        )
+
+
+@dataclass(slots=True)
+class TaskCycleTimeOutput:
+    """기간 안에 완료된 Task 의 사이클 타임(초). ``percentiles`` 는 백분위수 ->
+    초입니다."""
+
+    count: int
+    unmeasured: int
+    mean_seconds: float | None
+    percentiles: dict[int, float]
+
+    @classmethod
+    def from_stats(cls, stats: CycleTimeStats) -> "TaskCycleTimeOutput":
+        return cls(
+            count=stats.count,
+            unmeasured=stats.unmeasured,
+            mean_seconds=stats.mean.total_seconds() if stats.mean is not None else None,
+            percentiles={
+                percentile: value.total_seconds()
+                for percentile, value in stats.percentiles.items()
+            },
+        )
+
+
+@dataclass(slots=True)
+class TaskDailyCountOutput:
+    date: date
+    count: int
+
+    @classmethod
+    def from_counts(cls, counts: Iterable[DailyCount]) -> list["TaskDailyCountOutput"]:
+        return [cls(date=count.day, count=count.count) for count in counts]
+
+
 @dataclass(slots=True)
 class RetrospectiveCreateInput:
     title: str
@@ -60,6 +192,7 @@ class RetrospectiveOutput:
     summary: str | None
     date: date
     tasks: list[uuid.UUID]
+    updated_at: datetime
 
     @classmethod
     def from_entity(cls, retrospective: Retrospective) -> "RetrospectiveOutput":
@@ -69,9 +202,77 @@ class RetrospectiveOutput:
             summary=retrospective.summary,
             date=retrospective.date,
             tasks=list(retrospective.tasks),
+            updated_at=retrospective.updated_at,
+        )
+
+
+@dataclass(slots=True)
+class RetrospectiveDetailOutput:
+    """연결된 Task 를 펼친 회고. ``tasks`` 는 회고에 연결된 순서입니다."""
+
+    id: uuid.UUID
+    title: str
+    summary: str | None
+    date: date
+    tasks: list[TaskOutput]
+    updated_at: datetime
+
+
+@dataclass(slots=True)
+class RetrospectiveCalendarDayOutput:
+    """달력 하루치 집계. 그날 회고에 연결된 Task 수를 상태별로 담습니다."""
+
+    date: date
+    retrospectives: list[uuid.UUID]
+    task_count: int
+    status_counts: dict[TaskStatus, int]
+
+
+@dataclass(slots=True)
+class ChangeOutput:
+    """변경 한 건. 삭제가 아니면 변경 직후의 엔티티를 ``task`` 또는 ``retrospective`` 에
+    담습니다."""
+
+    sequence: int
+    kind: ChangeKind
+    id: uuid.UUID
+    deleted: bool
+    task: TaskOutput | None = None
+    retrospective: RetrospectiveOutput | None = None
+
+    @classmethod
+    def from_change(cls, change: Change) -> "ChangeOutput":
+        entity = change.entity
+        return cls(
+            sequence=change.sequence,
+            kind=change.kind,
+            id=change.entity_id,
+            deleted=entity is None,
+            task=TaskOutput.from_entity(entity) if isinstance(entity, Task) else None,
+            retrospective=(
+                RetrospectiveOutput.from_entity(entity)
+                if isinstance(entity, Retrospective)
+                else None
+            ),
         )
 
 
+@dataclass(slots=True)
+class ChangeSetOutput:
+    """``/changes`` 한 번의 응답.
+
+    ``cursor`` 는 다음 요청의 ``since`` 입니다. ``reset`` 이면 커서가 만료되었거나
+    없었으므로 ``changes`` 대신 ``tasks`` / ``retrospectives`` 에 전체 상태를 담습니다.
+    """
+
+    cursor: int
+    changes: list[ChangeOutput]
+    has_more: bool = False
+    reset: bool = False
+    tasks: list[TaskOutput] | None = None
+    retrospectives: list[RetrospectiveOutput] | None = None
+
+
 def to_task_outputs(tasks: Iterable[Task]) -> list[TaskOutput]:
     return [TaskOutput.from_entity(task) for task in tasks]
 
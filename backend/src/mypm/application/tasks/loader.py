@@ -0,0 +1,77 @@
+"""요청 단위 Task 일괄 로더."""
+
+from __future__ import annotations
+
+import asyncio
+import uuid
+from collections.abc import Iterable
+
+from mypm.domain.tasks.entities import Task
+from mypm.domain.tasks.repositories import TaskRepository
+
+
+class TaskLoader:
+    """같은 이벤트 루프 차례에 요청된 Task 를 모아 ``get_many`` 한 번으로 읽습니다.
+
+    ID 별 결과를 로더가 살아 있는 동안 기억하므로 같은 Task 를 여러 번 요청해도 한 번만
+    읽습니다. 캐시가 쓰기를 따라가지 않으므로 요청마다 새로 만들어 씁니다.
+    """
+
+    def __init__(self, repository: TaskRepository) -> None:
+        self._repository = repository
+        # ID -> 읽은 Task(없으면 None), 읽는 중이면 그 ID 가 든 배치
+        self._entries: dict[uuid.UUID, Task | asyncio.Future[None] | None] = {}
+        self._queue: list[uuid.UUID] = []
+        self._batch: asyncio.Future[None] | None = None
+        self._dispatching: asyncio.Task[None] | None = None
+
+    async def load(self, task_id: uuid.UUID) -> Task | None:
+        return (await self.load_many((task_id,)))[0]
+
+    async def load_many(self, task_ids: Iterable[uuid.UUID]) -> list[Task | None]:
+        """``task_ids`` 순서대로 반환합니다. 없는 Task 자리는 ``None`` 입니다."""
+
+        task_ids = list(task_ids)
+        entries = self._entries
+        waiting = set()
+        for task_id in task_ids:
+            entry = entries.get(task_id, _MISSING)
+            if entry is _MISSING:
+                entry = entries[task_id] = self._enqueue(task_id)
+            if isinstance(entry, asyncio.Future):
+                waiting.add(entry)
+
+        # ID 마다가 아니라 배치마다 기다립니다. 보통은 배치 하나입니다.
+        for batch in waiting:
+            await batch
+        return list(map(entries.get, task_ids))
+
+    def _enqueue(self, task_id: uuid.UUID) -> asyncio.Future[None]:
+        self._queue.append(task_id)
+        if self._batch is None:
+            loop = asyncio.get_running_loop()
+            self._batch = loop.create_future()
+            # 호출한 코루틴이 양보한 뒤에 실행되므로 그 사이의 요청이 한 배치로
+            # 모입니다.
+            self._dispatching = loop.create_task(self._dispatch(self._batch))
+        return self._batch
+
+    async def _dispatch(self, batch: asyncio.Future[None]) -> None:
+        task_ids, self._queue, self._batch = self._queue, [], None
+        try:
+            tasks = await self._repository.get_many(task_ids)
+        except Exception as exc:
+            # 실패한 ID 는 다음 요청에서 다시 읽습니다.
+            for task_id in task_ids:
+                del self._entries[task_id]
+            batch.set_exception(exc)
+            return
+
+        self._entries.update(zip(task_ids, map(tasks.get, task_ids)))
+        batch.set_result(None)
+
+
+_MISSING = object()
+
+
+__all__ = ["TaskLoader"]
@@ -0,0 +1,54 @@
+"""Task 목록 커서 인코딩."""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+import uuid
+from datetime import date, datetime
+
+from mypm.domain.tasks.entities import Task
+from mypm.domain.tasks.queries import TaskKeyset, TaskSortField
+
+
+def keyset_of(task: Task, order_by: TaskSortField) -> TaskKeyset:
+    return TaskKeyset(value=getattr(task, order_by.value), task_id=task.id)
+
+
+def encode_cursor(order_by: TaskSortField, descending: bool, keyset: TaskKeyset) -> str:
+    """정렬 조건과 마지막 위치를 불투명한 커서 문자열로 변환합니다."""
+
+    value = keyset.value.isoformat() if keyset.value is not None else None
+    payload = [order_by.value, int(descending), value, keyset.task_id.hex]
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str, order_by: TaskSortField, descending: bool) -> TaskKeyset:
+    """커서를 해석합니다. 형식이 잘못되었거나 정렬 조건이 다르면 ``ValueError``."""
+
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        field, cursor_descending, value, task_id = json.loads(
+            base64.urlsafe_b64decode(padded)
+        )
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError) as exc:
+        raise ValueError("Invalid cursor") from exc
+
+    if field != order_by.value or bool(cursor_descending) != descending:
+        raise ValueError("Cursor does not match the requested ordering")
+
+    try:
+        parsed: datetime | date | None = None
+        if value is not None:
+            if order_by is TaskSortField.DUE_DATE:
+                parsed = date.fromisoformat(value)
+            else:
+                parsed = datetime.fromisoformat(value)
+        return TaskKeyset(value=parsed, task_id=uuid.UUID(hex=task_id))
+    except (TypeError, ValueError) as exc:
+        raise ValueError("Invalid cursor") from exc
+
+
+__all__ = ["decode_cursor", "encode_cursor", "keyset_of"]
@@ -2,66 +2,441 @@
 
 from __future__ import annotations
 
+import heapq
 import uuid
-from datetime import date
+from collections.abc import AsyncIterator
+from datetime import date, datetime, timedelta
+from itertools import islice
 
 from mypm.application.tasks.dto import (
+    ChangeOutput,
+    ChangeSetOutput,
+    RetrospectiveCalendarDayOutput,
     RetrospectiveCreateInput,
+    RetrospectiveDetailOutput,
     RetrospectiveOutput,
+    TaskBatchItemOutput,
     TaskCreateInput,
+    TaskCycleTimeOutput,
+    TaskDailyCountOutput,
+    TaskImportInput,
     TaskOutput,
+    TaskPageOutput,
+    TaskQueryOutput,
+    TaskSearchHitOutput,
+    TaskSearchOutput,
+    TaskStatsOutput,
     TaskUpdateInput,
     to_task_outputs,
 )
-from mypm.domain.tasks.entities import Retrospective, Task
-from mypm.domain.tasks.repositories import RetrospectiveRepository, TaskRepository
+from mypm.application.tasks.loader import TaskLoader
+from mypm.application.tasks.pagination import decode_cursor, encode_cursor, keyset_of
+from mypm.application.tasks.unit_of_work import UnitOfWork
+from mypm.domain.tasks.entities import Retrospective, Task, TaskStatus
+from mypm.domain.tasks.errors import ConflictError, UnavailableError
+from mypm.domain.tasks.history import DEFAULT_PERCENTILES
+from mypm.domain.tasks.queries import TaskFilter, TaskSortField
+from mypm.domain.tasks.repositories import (
+    ChangeFeed,
+    RetrospectiveRepository,
+    TaskRepository,
+    TransactionalStore,
+    TransitionHistory,
+)
+from mypm.domain.tasks.stats import compute_task_stats, diff_task_stats
+
+
+# 마감 관련 조회(지연/임박)에서 대상으로 삼는 미완료 상태
+_OPEN_STATUSES = [status for status in TaskStatus if status is not TaskStatus.DONE]
+
+# 날짜 범위 조회(목록/달력) 한 번에 허용하는 최대 일 수
+MAX_DATE_RANGE_DAYS = 366
 
 
 class TaskService:
-    """Task 관련 애플리케이션 서비스."""
+    """Task 관련 애플리케이션 서비스.
 
-    def __init__(self, repository: TaskRepository, retrospective_repository: RetrospectiveRepository):
+    ``history`` 가 있으면 Task 를 추가/수정/삭제할 때마다 상태 전이를 기록하고 흐름
+    지표를 조회할 수 있습니다. 없으면 흐름 지표 조회는 ``UnavailableError`` 입니다.
+    """
+
+    def __init__(
+        self,
+        repository: TaskRepository,
+        retrospective_repository: RetrospectiveRepository,
+        store: TransactionalStore,
+        history: TransitionHistory | None = None,
+    ):
         self._repository = repository
         self._retrospective_repository = retrospective_repository
+        self._store = store
+        self._history = history
 
     async def create_task(self, data: TaskCreateInput) -> TaskOutput:
         task = Task(title=data.title, description=data.description, due_date=data.due_date)
 
         created = await self._repository.add(task)
+        if self._history is not None:
+            self._history.record([created])
         return TaskOutput.from_entity(created)
 
+    async def create_tasks(self, items: list[TaskCreateInput]) -> list[TaskOutput]:
+        tasks = [
+            Task(title=data.title, description=data.description, due_date=data.due_date)
+            for data in items
+        ]
+
+        created = await self._repository.add_many(tasks)
+        if self._history is not None:
+            self._history.record(created)
+        return to_task_outputs(created)
+
+    async def import_tasks(self, items: list[TaskImportInput]) -> int:
+        """가져온 행 묶음을 ``add_many`` 한 번으로 추가하고 추가한 수를 반환합니다."""
+
+        tasks = [
+            Task(
+                title=data.title,
+                description=data.description,
+                status=data.status,
+                due_date=data.due_date,
+            )
+            for data in items
+        ]
+
+        created = await self._repository.add_many(tasks)
+        if self._history is not None:
+            self._history.record(created)
+        return len(tasks)
+
+    async def export_tasks(self, batch_size: int) -> AsyncIterator[list[TaskOutput]]:
+        """모든 Task 를 생성 순으로 ``batch_size`` 개씩 반환합니다.
+
+        시작할 때 고정한 뷰(``pin``)를 키셋 페이지로 읽으므로 한 번에 한 묶음만 메모리에
+        올리고, 스냅샷을 지원하는 저장소에서는 도중의 쓰기가 결과에 섞이지 않습니다.
+        """
+
+        view = self._repository.pin()
+        order_by = TaskSortField.CREATED_AT
+        after = None
+        while True:
+            tasks = await view.list_page(
+                order_by=order_by, after=after, limit=batch_size
+            )
+            if tasks:
+                yield to_task_outputs(tasks)
+            if len(tasks) < batch_size:
+                return
+            after = keyset_of(tasks[-1], order_by)
+
     async def list_tasks(self, status: str | None = None) -> list[TaskOutput]:
         tasks = await self._repository.list_by_status(status)
         return to_task_outputs(tasks)
 
-    async def update_task(self, task_id: uuid.UUID, data: TaskUpdateInput) -> TaskOutput:
-        task = await self._repository.get(task_id)
-        if task is None:
-            raise ValueError("Task not found")
+    async def list_tasks_page(
+        self,
+        status: str | None = None,
+        order_by: TaskSortField = TaskSortField.CREATED_AT,
+        descending: bool = False,
+        limit: int | None = None,
+        cursor: str | None = None,
+    ) -> TaskPageOutput:
+        """정렬된 Task 목록의 한 페이지를 반환합니다.
+
+        잘못된 커서는 ``ValueError`` 를 발생시킵니다.
+        """
+
+        after = decode_cursor(cursor, order_by, descending) if cursor else None
+        # 다음 페이지 존재 여부를 알기 위해 하나 더 조회합니다.
+        fetch = limit + 1 if limit is not None else None
+        tasks = await self._repository.list_page(
+            status=status,
+            order_by=order_by,
+            descending=descending,
+            after=after,
+            limit=fetch,
+        )
+
+        next_cursor = None
+        if limit is not None and len(tasks) > limit:
+            tasks = tasks[:limit]
+            next_cursor = encode_cursor(
+                order_by, descending, keyset_of(tasks[-1], order_by)
+            )
+
+        return TaskPageOutput(items=to_task_outputs(tasks), next_cursor=next_cursor)
+
+    async def list_tasks_due(
+        self,
+        due_after: date | None = None,
+        due_before: date | None = None,
+        status: str | None = None,
+        limit: int | None = None,
+        cursor: str | None = None,
+    ) -> TaskPageOutput:
+        """마감일 범위(양 끝 제외)의 Task 를 마감일 순으로 페이지 단위 조회합니다."""
+
+        order_by = TaskSortField.DUE_DATE
+        after = decode_cursor(cursor, order_by, False) if cursor else None
+        fetch = limit + 1 if limit is not None else None
+        tasks = await self._repository.list_by_due_range(
+            due_after=due_after,
+            due_before=due_before,
+            status=status,
+            after=after,
+            limit=fetch,
+        )
+
+        next_cursor = None
+        if limit is not None and len(tasks) > limit:
+            tasks = tasks[:limit]
+            next_cursor = encode_cursor(order_by, False, keyset_of(tasks[-1], order_by))
+
+        return TaskPageOutput(items=to_task_outputs(tasks), next_cursor=next_cursor)
+
+    async def query_tasks(
+        self,
+        task_filter: TaskFilter,
+        order_by: TaskSortField = TaskSortField.CREATED_AT,
+        descending: bool = False,
+        limit: int | None = None,
+        cursor: str | None = None,
+        explain: bool = False,
+    ) -> TaskQueryOutput:
+        """복합 조건에 맞는 Task 를 정렬 순서대로 페이지 단위 조회합니다.
+
+        ``explain`` 이면 리포지토리가 고른 인덱스와 후보 수를 함께 반환합니다. 잘못된
+        커서는 ``ValueError`` 를 발생시킵니다.
+        """
+
+        after = decode_cursor(cursor, order_by, descending) if cursor else None
+        fetch = limit + 1 if limit is not None else None
+        result = await self._repository.query(
+            task_filter,
+            order_by=order_by,
+            descending=descending,
+            after=after,
+            limit=fetch,
+            explain=explain,
+        )
+
+        tasks = result.tasks
+        next_cursor = None
+        if limit is not None and len(tasks) > limit:
+            tasks = tasks[:limit]
+            next_cursor = encode_cursor(
+                order_by, descending, keyset_of(tasks[-1], order_by)
+            )
+
+        return TaskQueryOutput(
+            items=to_task_outputs(tasks), next_cursor=next_cursor, plan=result.plan
+        )
+
+    async def list_overdue(
+        self, today: date, limit: int | None = None
+    ) -> list[TaskOutput]:
+        """마감일이 ``today`` 이전인 미완료 Task 를 마감일 순으로 반환합니다."""
 
-        if data.title is not None:
-            task.title = data.title
-        if data.description is not None:
-            task.description = data.description
-        if data.status is not None:
-            task.status = data.status
-        if data.due_date is not None:
-            task.due_date = data.due_date
+        return await self._list_open_due(None, today, limit)
 
-        task.touch()
-        updated = await self._repository.update(task)
-        return TaskOutput.from_entity(updated)
+    async def list_upcoming(
+        self, today: date, days: int, limit: int | None = None
+    ) -> list[TaskOutput]:
+        """``today`` 부터 ``days`` 일 안에 마감되는 미완료 Task 를 반환합니다."""
+
+        return await self._list_open_due(
+            today - timedelta(days=1), today + timedelta(days=days), limit
+        )
+
+    async def _list_open_due(
+        self, due_after: date | None, due_before: date | None, limit: int | None
+    ) -> list[TaskOutput]:
+        # 완료 Task 를 건너뛰며 훑지 않도록 미완료 상태 버킷마다 범위 조회 후
+        # 병합합니다.
+        per_status = [
+            await self._repository.list_by_due_range(
+                due_after=due_after,
+                due_before=due_before,
+                status=status.value,
+                limit=limit,
+            )
+            for status in _OPEN_STATUSES
+        ]
+        merged = heapq.merge(*per_status, key=lambda task: (task.due_date, task.id.int))
+        return to_task_outputs(islice(merged, limit))
+
+    async def search_tasks(
+        self, query: str, limit: int = 20, offset: int = 0
+    ) -> TaskSearchOutput:
+        result = await self._repository.search(query, limit=limit, offset=offset)
+        return TaskSearchOutput(
+            items=[
+                TaskSearchHitOutput(
+                    task=TaskOutput.from_entity(hit.task), score=hit.score
+                )
+                for hit in result.hits
+            ],
+            total=result.total,
+        )
+
+    async def get_version(self, status: str | None = None) -> int:
+        return await self._repository.version(status)
+
+    async def get_stats(self, today: date) -> TaskStatsOutput:
+        return TaskStatsOutput.from_stats(await self._repository.stats(today))
+
+    async def check_stats(self, today: date) -> list[str]:
+        """모든 Task 로 통계를 다시 계산해 카운터와 다른 항목을 반환합니다.
+
+        전체 Task 를 읽으므로 테스트/벤치마크에서 카운터 드리프트를 확인할 때만
+        사용합니다.
+        """
+
+        expected = compute_task_stats(await self._repository.list_by_status(), today)
+        return diff_task_stats(expected, await self._repository.stats(today))
+
+    async def update_task(
+        self,
+        task_id: uuid.UUID,
+        data: TaskUpdateInput,
+        expected_version: datetime | None = None,
+    ) -> TaskOutput:
+        """Task 를 수정합니다.
+
+        ``expected_version`` 을 주면 현재 버전(``updated_at``)과 다를 때
+        ``ConflictError`` 를 발생시킵니다.
+        """
+
+        async with self._unit_of_work(task_ids=[task_id]) as uow:
+            task = await uow.get_task(task_id)
+            if task is None:
+                raise ValueError("Task not found")
+            if expected_version is not None and task.updated_at != expected_version:
+                raise ConflictError("Task version does not match")
+
+            _apply_update(task, data)
+            await uow.commit()
+            if self._history is not None and data.status is not None:
+                self._history.record([task])
+        return TaskOutput.from_entity(task)
+
+    async def update_tasks(
+        self, items: list[tuple[uuid.UUID, TaskUpdateInput]]
+    ) -> list[TaskBatchItemOutput]:
+        """여러 Task 를 한 번의 조회와 한 번의 커밋으로 수정합니다."""
+
+        task_ids = [task_id for task_id, _ in items]
+        async with self._unit_of_work(task_ids=task_ids) as uow:
+            found = await uow.get_tasks(task_ids)
+
+            applied: list[tuple[int, Task]] = []
+            results: list[TaskBatchItemOutput] = []
+            for index, (task_id, data) in enumerate(items):
+                task = found.get(task_id)
+                if task is None:
+                    results.append(
+                        TaskBatchItemOutput(index=index, error="Task not found")
+                    )
+                    continue
+
+                _apply_update(task, data)
+                applied.append((index, task))
+
+            await uow.commit()
+            if self._history is not None:
+                self._history.record(
+                    task
+                    for index, task in applied
+                    if items[index][1].status is not None
+                )
+
+        results.extend(
+            TaskBatchItemOutput(index=index, task=TaskOutput.from_entity(task))
+            for index, task in applied
+        )
+        results.sort(key=lambda result: result.index)
+        return results
 
     async def delete_task(self, task_id: uuid.UUID) -> None:
         await self._repository.delete(task_id)
+        if self._history is not None:
+            self._history.record_deletes([task_id], datetime.utcnow())
+
+    async def delete_tasks(
+        self, task_ids: list[uuid.UUID]
+    ) -> list[TaskBatchItemOutput]:
+        deleted = set(await self._repository.delete_many(task_ids))
+        if self._history is not None:
+            self._history.record_deletes(deleted, datetime.utcnow())
+        results = []
+        for index, task_id in enumerate(task_ids):
+            # 같은 ID 가 다시 나오면 이미 지워졌으므로 없는 Task 로 보고합니다.
+            if task_id in deleted:
+                deleted.remove(task_id)
+                results.append(TaskBatchItemOutput(index=index))
+            else:
+                results.append(TaskBatchItemOutput(index=index, error="Task not found"))
+        return results
+
+    async def load_history(self) -> None:
+        """전이 기록의 기준선으로 현재 Task 상태를 등록합니다. 기록을 시작하기 전에 한
+        번 부릅니다."""
+
+        if self._history is not None:
+            self._history.seed(await self._repository.list_by_status())
+
+    async def get_cycle_times(
+        self, start: date, end: date, percentiles: list[int] | None = None
+    ) -> TaskCycleTimeOutput:
+        _check_date_range(start, end)
+        percentiles = percentiles or list(DEFAULT_PERCENTILES)
+        if not all(0 < percentile <= 100 for percentile in percentiles):
+            raise ValueError("Percentiles must be between 1 and 100")
+        stats = await self._require_history().cycle_times(start, end, percentiles)
+        return TaskCycleTimeOutput.from_stats(stats)
+
+    async def get_throughput(
+        self, start: date, end: date
+    ) -> list[TaskDailyCountOutput]:
+        _check_date_range(start, end)
+        return TaskDailyCountOutput.from_counts(
+            await self._require_history().throughput(start, end)
+        )
+
+    async def get_burndown(self, start: date, end: date) -> list[TaskDailyCountOutput]:
+        _check_date_range(start, end)
+        return TaskDailyCountOutput.from_counts(
+            await self._require_history().burndown(start, end)
+        )
+
+    def _require_history(self) -> TransitionHistory:
+        if self._history is None:
+            raise UnavailableError(
+                "Flow analytics are not available with this storage backend"
+            )
+        return self._history
+
+    def _unit_of_work(self, *, task_ids: list[uuid.UUID]) -> UnitOfWork:
+        return UnitOfWork(
+            self._store,
+            self._repository,
+            self._retrospective_repository,
+            task_ids=task_ids,
+        )
 
 
 class RetrospectiveService:
     """Retrospective 관련 애플리케이션 서비스."""
 
-    def __init__(self, repository: RetrospectiveRepository, task_repository: TaskRepository):
+    def __init__(
+        self,
+        repository: RetrospectiveRepository,
+        task_repository: TaskRepository,
+        store: TransactionalStore,
+    ):
         self._repository = repository
         self._task_repository = task_repository
+        self._store = store
 
     async def create_retrospective(self, data: RetrospectiveCreateInput) -> RetrospectiveOutput:
         retrospective = Retrospective(
@@ -74,21 +449,226 @@ class RetrospectiveService:
         return RetrospectiveOutput.from_entity(created)
 
     async def attach_task(self, retrospective_id: uuid.UUID, task_id: uuid.UUID) -> RetrospectiveOutput:
+        """Task 를 회고에 연결합니다. 다른 회고에 연결되어 있었으면 그 회고에서 뺍니다.
+
+        두 엔티티(와 이전 회고)를 잠근 뒤 한 번에 커밋하므로 동시에 연결해도 양쪽이
+        어긋나지 않습니다.
+        """
+
+        while True:
+            # 잠글 대상(이전 회고)을 알기 위해 잠그기 전에 한 번 읽습니다.
+            current = await self._task_repository.get(task_id)
+            previous_id = current.retrospective_id if current is not None else None
+            retrospective_ids = (
+                [retrospective_id]
+                if previous_id is None
+                else [retrospective_id, previous_id]
+            )
+
+            async with UnitOfWork(
+                self._store,
+                self._task_repository,
+                self._repository,
+                task_ids=[task_id],
+                retrospective_ids=retrospective_ids,
+            ) as uow:
+                retrospective = await uow.get_retrospective(retrospective_id)
+                if retrospective is None:
+                    raise ValueError("Retrospective not found")
+
+                task = await uow.get_task(task_id)
+                if task is None:
+                    raise ValueError("Task not found")
+                if task.retrospective_id != previous_id:
+                    # 잠그기 전에 다른 회고로 옮겨졌으면 새 이전 회고를 잠그고 다시
+                    # 시도합니다.
+                    continue
+
+                if previous_id is not None and previous_id != retrospective.id:
+                    previous = await uow.get_retrospective(previous_id)
+                    if previous is not None:
+                        previous.remove_task(task.id)
+                retrospective.add_task(task.id)
+                task.attach_to_retrospective(retrospective.id)
+                await uow.commit()
+
+            return RetrospectiveOutput.from_entity(retrospective)
+
+    async def attach_tasks(
+        self, retrospective_id: uuid.UUID, task_ids: list[uuid.UUID]
+    ) -> RetrospectiveOutput:
+        """여러 Task 를 한 번에 회고에 연결합니다. ``attach_task`` 와 같지만 Task 를
+        한 번에 읽고 한 번 커밋합니다. 없는 Task 가 하나라도 있으면 아무것도 바꾸지
+        않습니다.
+        """
+
+        task_ids = list(dict.fromkeys(task_ids))
+        while True:
+            # 잠글 대상(이전 회고들)을 알기 위해 잠그기 전에 한 번 읽습니다.
+            current = await self._task_repository.get_many(task_ids)
+            previous_ids = {task.id: task.retrospective_id for task in current.values()}
+            retrospective_ids = list(
+                dict.fromkeys(
+                    [
+                        retrospective_id,
+                        *(
+                            previous
+                            for previous in previous_ids.values()
+                            if previous is not None
+                        ),
+                    ]
+                )
+            )
+
+            async with UnitOfWork(
+                self._store,
+                self._task_repository,
+                self._repository,
+                task_ids=task_ids,
+                retrospective_ids=retrospective_ids,
+            ) as uow:
+                retrospective = await uow.get_retrospective(retrospective_id)
+                if retrospective is None:
+                    raise ValueError("Retrospective not found")
+
+                tasks = await uow.get_tasks(task_ids)
+                if len(tasks) != len(task_ids):
+                    raise ValueError("Task not found")
+                if any(
+                    task.retrospective_id != previous_ids.get(task.id)
+                    for task in tasks.values()
+                ):
+                    # 잠그기 전에 다른 회고로 옮겨졌으면 새 이전 회고들을 잠그고 다시
+                    # 시도합니다.
+                    continue
+
+                moved: dict[uuid.UUID, list[uuid.UUID]] = {}
+                for task in tasks.values():
+                    if (
+                        task.retrospective_id is not None
+                        and task.retrospective_id != retrospective.id
+                    ):
+                        moved.setdefault(task.retrospective_id, []).append(task.id)
+                for previous_id, moved_ids in moved.items():
+                    previous = await uow.get_retrospective(previous_id)
+                    if previous is not None:
+                        previous.remove_tasks(moved_ids)
+
+                retrospective.add_tasks(task_ids)
+                for task in tasks.values():
+                    if task.retrospective_id != retrospective.id:
+                        task.attach_to_retrospective(retrospective.id)
+                await uow.commit()
+
+            return RetrospectiveOutput.from_entity(retrospective)
+
+    async def detach_tasks(
+        self, retrospective_id: uuid.UUID, task_ids: list[uuid.UUID]
+    ) -> RetrospectiveOutput:
+        """여러 Task 를 회고에서 한 번에 뺍니다. 이 회고에 연결되지 않은 ID 는
+        무시합니다."""
+
+        task_ids = list(dict.fromkeys(task_ids))
+        async with UnitOfWork(
+            self._store,
+            self._task_repository,
+            self._repository,
+            task_ids=task_ids,
+            retrospective_ids=[retrospective_id],
+        ) as uow:
+            retrospective = await uow.get_retrospective(retrospective_id)
+            if retrospective is None:
+                raise ValueError("Retrospective not found")
+
+            retrospective.remove_tasks(task_ids)
+            for task in (await uow.get_tasks(task_ids)).values():
+                if task.retrospective_id == retrospective.id:
+                    task.detach_from_retrospective()
+            await uow.commit()
+
+        return RetrospectiveOutput.from_entity(retrospective)
+
+    async def get_retrospective(
+        self, retrospective_id: uuid.UUID
+    ) -> RetrospectiveOutput | None:
         retrospective = await self._repository.get(retrospective_id)
         if retrospective is None:
-            raise ValueError("Retrospective not found")
+            return None
+
+        return RetrospectiveOutput.from_entity(retrospective)
+
+    async def get_retrospective_detail(
+        self, retrospective_id: uuid.UUID, loader: TaskLoader | None = None
+    ) -> RetrospectiveDetailOutput | None:
+        """연결된 Task 를 펼쳐 조회합니다. Task 는 ``get_many`` 한 번으로 읽습니다.
+
+        ``loader`` 를 넘기면 같은 요청의 다른 조회와 배치와 캐시를 함께 씁니다.
+        """
+
+        retrospective = await self._repository.get(retrospective_id)
+        if retrospective is None:
+            return None
 
-        task = await self._task_repository.get(task_id)
-        if task is None:
-            raise ValueError("Task not found")
+        if loader is None:
+            loader = TaskLoader(self._task_repository)
+        tasks = await loader.load_many(retrospective.tasks)
+        return RetrospectiveDetailOutput(
+            id=retrospective.id,
+            title=retrospective.title,
+            summary=retrospective.summary,
+            date=retrospective.date,
+            # 읽는 사이 삭제된 Task 는 뺍니다.
+            tasks=[TaskOutput.from_entity(task) for task in tasks if task is not None],
+            updated_at=retrospective.updated_at,
+        )
+
+    async def get_version(self) -> int:
+        return await self._repository.version()
+
+    async def get_calendar_version(self) -> int:
+        # 달력은 Task 상태에도 의존하므로 두 버전의 합을 씁니다. 둘 다 단조 증가합니다.
+        return await self._repository.version() + await self._task_repository.version()
+
+    async def list_by_date_range(
+        self, start: date, end: date
+    ) -> list[RetrospectiveOutput]:
+        _check_date_range(start, end)
+        retrospectives = await self._repository.list_by_date_range(start, end)
+        return [
+            RetrospectiveOutput.from_entity(retrospective)
+            for retrospective in retrospectives
+        ]
 
-        retrospective.add_task(task.id)
-        task.attach_to_retrospective(retrospective.id)
+    async def get_calendar(
+        self, start: date, end: date
+    ) -> list[RetrospectiveCalendarDayOutput]:
+        """회고가 있는 날짜마다 연결된 Task 수를 상태별로 집계합니다.
 
-        await self._task_repository.update(task)
-        updated = await self._repository.update(retrospective)
+        집계는 리포지토리가 유지하는 카운터에서 읽으므로 Task 를 다시 훑지 않습니다.
+        """
 
-        return RetrospectiveOutput.from_entity(updated)
+        _check_date_range(start, end)
+        retrospectives = await self._repository.list_by_date_range(start, end)
+        counts = await self._task_repository.count_by_retrospective(
+            [retrospective.id for retrospective in retrospectives]
+        )
+
+        days: dict[date, RetrospectiveCalendarDayOutput] = {}
+        for retrospective in retrospectives:
+            day = days.get(retrospective.date)
+            if day is None:
+                day = days[retrospective.date] = RetrospectiveCalendarDayOutput(
+                    date=retrospective.date,
+                    retrospectives=[],
+                    task_count=0,
+                    status_counts=dict.fromkeys(TaskStatus, 0),
+                )
+            day.retrospectives.append(retrospective.id)
+            for task_status, count in counts.get(retrospective.id, {}).items():
+                day.status_counts[task_status] += count
+                day.task_count += count
+
+        return list(days.values())
 
     async def get_summary(self, retrospective_date: date) -> RetrospectiveOutput | None:
         retrospective = await self._repository.get_by_date(retrospective_date)
@@ -98,3 +678,95 @@ class RetrospectiveService:
         return RetrospectiveOutput.from_entity(retrospective)
 
 
+class ChangeService:
+    """변경 피드 조회 서비스. 클라이언트는 목록을 다시 받는 대신 커서 이후의 변경만
+    받습니다."""
+
+    def __init__(
+        self,
+        feed: ChangeFeed,
+        task_repository: TaskRepository,
+        retrospective_repository: RetrospectiveRepository,
+    ):
+        self._feed = feed
+        self._task_repository = task_repository
+        self._retrospective_repository = retrospective_repository
+
+    async def get_changes(self, since: int | None, limit: int) -> ChangeSetOutput:
+        """``since`` 이후의 변경을 최대 ``limit`` 개 반환합니다.
+
+        ``since`` 가 없거나 이미 버려진 위치면 전체 상태(스냅샷)를 반환합니다.
+        """
+
+        if since is None:
+            return await self.get_snapshot()
+
+        result = await self.get_deltas(since, limit)
+        if result.reset:
+            return await self.get_snapshot()
+        return result
+
+    async def get_deltas(self, since: int, limit: int) -> ChangeSetOutput:
+        """``get_changes`` 와 같지만 만료된 커서에는 스냅샷 없이 ``reset`` 과 마지막
+        순번만 반환합니다."""
+
+        batch = await self._feed.since(since, limit)
+        if batch.expired:
+            return ChangeSetOutput(cursor=batch.latest, changes=[], reset=True)
+
+        cursor = batch.changes[-1].sequence if batch.changes else batch.latest
+        return ChangeSetOutput(
+            cursor=cursor,
+            changes=[ChangeOutput.from_change(change) for change in batch.changes],
+            has_more=cursor < batch.latest,
+        )
+
+    async def get_snapshot(self) -> ChangeSetOutput:
+        # 읽기 전의 순번을 커서로 주므로 읽는 동안 반영된 변경은 다음 요청에 한 번 더
+        # 옵니다. 변경은 엔티티 전체를 담으므로 다시 적용해도 결과가 같습니다.
+        latest = await self._feed.latest()
+        tasks = await self._task_repository.list_by_status()
+        retrospectives = await self._retrospective_repository.list_by_date_range(
+            date.min, date.max
+        )
+        return ChangeSetOutput(
+            cursor=latest,
+            changes=[],
+            reset=True,
+            tasks=to_task_outputs(tasks),
+            retrospectives=[
+                RetrospectiveOutput.from_entity(retrospective)
+                for retrospective in retrospectives
+            ],
+        )
+
+    async def get_latest(self) -> int:
+        return await self._feed.latest()
+
+    async def wait_for_changes(self, since: int, timeout: float) -> int:
+        """``since`` 이후 변경이 생기거나 ``timeout`` 초가 지나면 마지막 순번을
+        반환합니다."""
+
+        return await self._feed.wait(since, timeout)
+
+
+def _check_date_range(start: date, end: date) -> None:
+    if start > end:
+        raise ValueError("Start date must not be after end date")
+    if (end - start).days >= MAX_DATE_RANGE_DAYS:
+        raise ValueError(f"Date range must not exceed {MAX_DATE_RANGE_DAYS} days")
+
+
+def _apply_update(task: Task, data: TaskUpdateInput) -> None:
+    # 변경 메서드를 거쳐야 리포지토리가 바뀐 필드만 저장할 수 있습니다.
+    if data.title is not None:
+        task.rename(data.title)
+    if data.description is not None:
+        task.describe(data.description)
+    if data.status is not None:
+        task.set_status(data.status)
+    if data.due_date is not None:
+        task.reschedule(data.due_date)
+
+    task.touch()
+
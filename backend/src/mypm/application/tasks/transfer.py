@@ -0,0 +1,304 @@
+"""Task 가져오기/내보내기 스트림 (NDJSON, CSV).
+
+가져오기는 본문을 조각 단위로 받아 줄로 나누고, ``batch_size`` 행마다 검증해
+``TaskService.import_tasks`` 한 번으로 추가합니다. 다음 조각은 앞 묶음의 커밋이 끝난
+뒤에 읽으므로 저장소가 느리면 본문 읽기도 그만큼 늦어지고(역압), 메모리에는 한 묶음과
+아직 끝나지 않은 줄만 머무릅니다. 내보내기는 ``TaskService.export_tasks`` 의 묶음을
+하나씩 인코딩합니다.
+
+API 라우트와 ``mypm import`` / ``mypm export`` 명령이 함께 씁니다.
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+import json
+import operator
+from collections.abc import AsyncIterable, AsyncIterator, Mapping
+from datetime import date
+from enum import StrEnum
+from json.encoder import encode_basestring
+from typing import Any
+
+from mypm.application.tasks.dto import (
+    TaskBatchItemOutput,
+    TaskImportInput,
+    TaskImportProgress,
+    TaskOutput,
+)
+from mypm.application.tasks.services import TaskService
+from mypm.domain.tasks.entities import TaskStatus
+
+# 묶음 하나의 기본 행 수. 묶음마다 한 번 커밋하고 진행 상황을 한 번 보고합니다.
+DEFAULT_BATCH_SIZE = 1000
+# 이보다 긴 줄은 끝까지 버퍼에 모으지 않고 가져오기를 멈춥니다.
+MAX_LINE_BYTES = 1 << 20
+# 내보내는 필드. ``GET /tasks`` 항목과 같으며, 가져오기는 이 중 id / retrospective_id 를
+# 무시합니다.
+EXPORT_FIELDS = ("id", "title", "description", "status", "due_date", "retrospective_id")
+
+_STATUS_VALUES = ", ".join(status.value for status in TaskStatus)
+
+
+class TransferFormat(StrEnum):
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+    @property
+    def media_type(self) -> str:
+        return _MEDIA_TYPES[self]
+
+
+_MEDIA_TYPES = {
+    TransferFormat.NDJSON: "application/x-ndjson",
+    TransferFormat.CSV: "text/csv; charset=utf-8",
+}
+
+# 파싱한 행. 파싱하지 못한 행은 이유 문자열입니다.
+_Row = dict[str, Any] | str
+
+
+async def import_task_stream(
+    service: TaskService,
+    chunks: AsyncIterable[bytes],
+    file_format: TransferFormat,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> AsyncIterator[TaskImportProgress]:
+    """본문 조각을 ``batch_size`` 행씩 추가하며 묶음마다 진행 상황을 반환합니다.
+
+    행 위치(``errors`` 의 ``index``)는 0부터 센 데이터 행 순서입니다(CSV 헤더 제외).
+    마지막 진행 상황은 ``done`` 이며, 본문을 더 읽을 수 없어 멈췄으면 ``error`` 에
+    이유를 담습니다.
+    """
+
+    rows = (
+        _ndjson_rows(chunks)
+        if file_format is TransferFormat.NDJSON
+        else _csv_rows(chunks)
+    )
+    total = TaskImportProgress()
+    pending: list[_Row] = []
+    try:
+        async for parsed in rows:
+            pending.extend(parsed)
+            while len(pending) >= batch_size:
+                batch, pending = pending[:batch_size], pending[batch_size:]
+                yield await _import_batch(service, batch, total)
+        if pending:
+            yield await _import_batch(service, pending, total)
+    except ValueError as exc:
+        total.error = str(exc)
+
+    total.done = True
+    yield total
+
+
+async def export_task_stream(
+    service: TaskService,
+    file_format: TransferFormat,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> AsyncIterator[bytes]:
+    """모든 Task 를 생성 순으로 묶음마다 인코딩해 반환합니다."""
+
+    if file_format is TransferFormat.CSV:
+        yield (",".join(EXPORT_FIELDS) + "\n").encode()
+        encode = _encode_csv
+    else:
+        encode = _encode_ndjson
+
+    async for batch in service.export_tasks(batch_size):
+        yield encode(batch)
+
+
+def parse_task_row(row: Mapping[str, Any]) -> TaskImportInput:
+    """가져오기 한 행을 검증합니다.
+
+    잘못된 필드는 ``"필드: 이유"`` 를 ``"; "`` 로 이은 ``ValueError`` 입니다. CSV 의 빈
+    칸은 값이 없는 것으로 보고, 알 수 없는 필드는 무시합니다.
+    """
+
+    errors = []
+    title = row.get("title")
+    if not isinstance(title, str) or not title:
+        errors.append("title: must be a non-empty string")
+
+    description = row.get("description") or None
+    if description is not None and not isinstance(description, str):
+        errors.append("description: must be a string")
+
+    status = row.get("status") or TaskStatus.TODO
+    try:
+        status = TaskStatus(status)
+    except ValueError:
+        errors.append(f"status: must be one of {_STATUS_VALUES}")
+
+    due_date = row.get("due_date") or None
+    if due_date is not None:
+        try:
+            due_date = date.fromisoformat(due_date)
+        except (TypeError, ValueError):
+            errors.append("due_date: must be an ISO date (YYYY-MM-DD)")
+
+    if errors:
+        raise ValueError("; ".join(errors))
+    return TaskImportInput(
+        title=title, description=description, status=status, due_date=due_date
+    )
+
+
+async def _import_batch(
+    service: TaskService, rows: list[_Row], total: TaskImportProgress
+) -> TaskImportProgress:
+    items = []
+    errors = []
+    for index, row in enumerate(rows, start=total.processed):
+        if isinstance(row, str):
+            errors.append(TaskBatchItemOutput(index=index, error=row))
+            continue
+        try:
+            items.append(parse_task_row(row))
+        except ValueError as exc:
+            errors.append(TaskBatchItemOutput(index=index, error=str(exc)))
+
+    created = await service.import_tasks(items) if items else 0
+    total.processed += len(rows)
+    total.created += created
+    total.failed += len(errors)
+    return TaskImportProgress(
+        processed=total.processed,
+        created=total.created,
+        failed=total.failed,
+        errors=errors,
+    )
+
+
+async def _iter_lines(chunks: AsyncIterable[bytes]) -> AsyncIterator[list[bytes]]:
+    """조각마다 그 조각에서 끝난 줄 목록을 반환합니다. 줄바꿈 문자는 뺍니다."""
+
+    pending = b""
+    async for chunk in chunks:
+        lines = (pending + chunk if pending else chunk).split(b"\n")
+        pending = lines.pop()
+        if len(pending) > MAX_LINE_BYTES:
+            raise ValueError(f"Line longer than {MAX_LINE_BYTES} bytes")
+        if lines:
+            yield lines
+    if pending:
+        yield [pending]
+
+
+async def _ndjson_rows(chunks: AsyncIterable[bytes]) -> AsyncIterator[list[_Row]]:
+    loads = json.loads
+    async for lines in _iter_lines(chunks):
+        rows: list[_Row] = []
+        for line in lines:
+            if not line.strip():
+                continue
+            try:
+                row = loads(line)
+            except ValueError as exc:  # JSONDecodeError, UnicodeDecodeError
+                rows.append(f"invalid JSON: {exc}")
+                continue
+            rows.append(row if isinstance(row, dict) else "row must be a JSON object")
+        yield rows
+
+
+async def _csv_rows(chunks: AsyncIterable[bytes]) -> AsyncIterator[list[_Row]]:
+    """첫 레코드를 헤더로 읽고, 이후 레코드를 헤더 이름을 키로 하는 행으로 반환합니다.
+
+    따옴표 안의 줄바꿈은 레코드를 끝내지 않으므로, 따옴표 수가 홀수인 줄부터 다음 홀수
+    줄까지를 한 레코드로 모은 뒤 조각마다 ``csv.reader`` 한 번으로 파싱합니다.
+    """
+
+    header: list[str] | None = None
+    record: list[str] = []
+    quoted = False
+    async for lines in _iter_lines(chunks):
+        records = []
+        for raw in lines:
+            try:
+                line = raw.decode()
+            except UnicodeDecodeError as exc:
+                raise ValueError(f"CSV is not valid UTF-8: {exc}") from exc
+            if line.count('"') % 2:
+                quoted = not quoted
+            record.append(line)
+            if not quoted:
+                records.append("\n".join(record) if len(record) > 1 else line)
+                record = []
+
+        rows: list[_Row] = []
+        reader = csv.reader(records)
+        while True:
+            try:
+                fields = next(reader)
+            except StopIteration:
+                break
+            except csv.Error as exc:
+                rows.append(f"invalid CSV: {exc}")
+                continue
+            if not fields:
+                continue
+            if header is None:
+                header = [name.strip() for name in fields]
+                header[0] = header[0].removeprefix("\ufeff")
+                if "title" not in header:
+                    raise ValueError("CSV header must include a title column")
+                continue
+            if len(fields) != len(header):
+                rows.append(f"expected {len(header)} columns, got {len(fields)}")
+                continue
+            rows.append(dict(zip(header, fields)))
+        yield rows
+
+    if record:
+        yield ["unterminated quoted field"]
+
+
+_NDJSON_LINE = (
+    '{"id":"%s","title":%s,"description":%s,"status":"%s",'
+    '"due_date":%s,"retrospective_id":%s}\n'
+)
+
+
+def _quoted(value: object) -> str:
+    return "null" if value is None else f'"{value}"'
+
+
+def _encode_ndjson(batch: list[TaskOutput]) -> bytes:
+    text = encode_basestring
+    return "".join(
+        [
+            _NDJSON_LINE
+            % (
+                task.id,
+                text(task.title),
+                "null" if task.description is None else text(task.description),
+                task.status.value,
+                _quoted(task.due_date),
+                _quoted(task.retrospective_id),
+            )
+            for task in batch
+        ]
+    ).encode()
+
+
+_csv_fields = operator.attrgetter(*EXPORT_FIELDS)
+
+
+def _encode_csv(batch: list[TaskOutput]) -> bytes:
+    buffer = io.StringIO()
+    csv.writer(buffer, lineterminator="\n").writerows(map(_csv_fields, batch))
+    return buffer.getvalue().encode()
+
+
+__all__ = [
+    "DEFAULT_BATCH_SIZE",
+    "EXPORT_FIELDS",
+    "MAX_LINE_BYTES",
+    "TransferFormat",
+    "export_task_stream",
+    "import_task_stream",
+    "parse_task_row",
+]
@@ -0,0 +1,136 @@
+"""여러 엔티티 변경을 하나의 커밋으로 묶는 작업 단위."""
+
+from __future__ import annotations
+
+import copy
+import uuid
+from collections.abc import Iterable
+from types import TracebackType
+from typing import Self
+
+from mypm.domain.tasks.entities import Retrospective, Task
+from mypm.domain.tasks.repositories import (
+    RetrospectiveRepository,
+    TaskRepository,
+    TransactionalStore,
+)
+
+
+class UnitOfWork:
+    """한 요청 안의 Task/Retrospective 변경을 모아 한 번에 커밋합니다.
+
+    진입할 때 ``task_ids`` / ``retrospective_ids`` 의 잠금을 잡고, ``get_*`` 로 읽은
+    엔티티를 기억해 두었다가 ``commit()`` 에서 바뀐 엔티티만 저장소의 원자적 커밋으로
+    반영합니다. 커밋하지 않고 나가거나 커밋이 실패하면 읽은 엔티티의 변경을 되돌린 뒤
+    잠금을 풉니다. 잠그지 않은 엔티티는 읽을 수만 있습니다.
+
+    ``get_*`` 는 저장소가 돌려준 엔티티의 사본을 줍니다. 메모리 저장소는 저장된 객체를
+    그대로 돌려주므로, 사본을 바꾸면 커밋 전의 변경이 다른 읽기에 보이지 않고 커밋은
+    저장된 객체를 바꾸는 대신 새 객체로 교체합니다.
+
+    사용 예::
+
+        async with UnitOfWork(store, tasks, retrospectives, task_ids=[task_id]) as uow:
+            task = await uow.get_task(task_id)
+            task.mark_done()
+            await uow.commit()
+    """
+
+    def __init__(
+        self,
+        store: TransactionalStore,
+        task_repository: TaskRepository,
+        retrospective_repository: RetrospectiveRepository,
+        *,
+        task_ids: Iterable[uuid.UUID] = (),
+        retrospective_ids: Iterable[uuid.UUID] = (),
+    ) -> None:
+        self._store = store
+        self._task_repository = task_repository
+        self._retrospective_repository = retrospective_repository
+        self._locked = {*task_ids, *retrospective_ids}
+        self._lock = store.lock(self._locked)
+        self._tasks: dict[uuid.UUID, Task] = {}
+        self._retrospectives: dict[uuid.UUID, Retrospective] = {}
+        self._committed = False
+
+    async def __aenter__(self) -> Self:
+        await self._lock.__aenter__()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        try:
+            if not self._committed:
+                # 사본이라 저장소에는 영향이 없지만, 호출자가 들고 있는 객체를 저장된
+                # 값으로 되돌립니다.
+                for entity in (*self._tasks.values(), *self._retrospectives.values()):
+                    entity.discard_changes()
+        finally:
+            await self._lock.__aexit__(exc_type, exc, traceback)
+
+    async def get_task(self, task_id: uuid.UUID) -> Task | None:
+        task = self._tasks.get(task_id)
+        if task is None:
+            task = await self._task_repository.get(task_id)
+            if task is not None:
+                task = self._tasks[task_id] = copy.copy(task)
+        return task
+
+    async def get_tasks(self, task_ids: list[uuid.UUID]) -> dict[uuid.UUID, Task]:
+        """존재하는 Task 만 ID 를 키로 반환합니다."""
+
+        missing = [task_id for task_id in task_ids if task_id not in self._tasks]
+        if missing:
+            found = await self._task_repository.get_many(missing)
+            self._tasks.update(
+                (task_id, copy.copy(task)) for task_id, task in found.items()
+            )
+        return {
+            task_id: self._tasks[task_id]
+            for task_id in task_ids
+            if task_id in self._tasks
+        }
+
+    async def get_retrospective(
+        self, retrospective_id: uuid.UUID
+    ) -> Retrospective | None:
+        retrospective = self._retrospectives.get(retrospective_id)
+        if retrospective is None:
+            retrospective = await self._retrospective_repository.get(retrospective_id)
+            if retrospective is not None:
+                retrospective = self._retrospectives[retrospective_id] = copy.copy(
+                    retrospective
+                )
+        return retrospective
+
+    async def commit(self) -> None:
+        """바뀐 엔티티를 한 번에 저장합니다.
+
+        없는 엔티티는 ``ValueError``, 버전 충돌은 ``ConflictError`` 이며 이때는 아무것도
+        반영되지 않습니다.
+        """
+
+        if self._committed:
+            raise RuntimeError("Unit of work is already committed")
+
+        tasks = [task for task in self._tasks.values() if task.changes]
+        retrospectives = [
+            retrospective
+            for retrospective in self._retrospectives.values()
+            if retrospective.changes
+        ]
+        unlocked = [
+            entity.id
+            for entity in (*tasks, *retrospectives)
+            if entity.id not in self._locked
+        ]
+        if unlocked:
+            raise RuntimeError(f"Entity {unlocked[0]} was modified without a lock")
+
+        await self._store.commit(tasks, retrospectives)
+        self._committed = True
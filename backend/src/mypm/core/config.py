@@ -24,6 +24,59 @@ class Settings:
     host: str = os.getenv("MYPM_HOST", "0.0.0.0")
     port: int = int(os.getenv("MYPM_PORT", "8000"))
     reload: bool = _str_to_bool(os.getenv("MYPM_RELOAD"))
+    # 저장소 백엔드: "memory", "compact"(열 기반 메모리), "sqlite" 또는 "remote"(스토어
+    # 서버)
+    storage_backend: str = os.getenv("MYPM_STORAGE_BACKEND", "memory")
+    sqlite_path: str = os.getenv("MYPM_SQLITE_PATH", "mypm.sqlite3")
+    sqlite_pool_size: int = int(os.getenv("MYPM_SQLITE_POOL_SIZE", "4"))
+    # 지정하면 메모리 저장소의 변경을 저널/스냅샷으로 영속화합니다.
+    journal_dir: str | None = os.getenv("MYPM_JOURNAL_DIR") or None
+    journal_commit_interval_ms: float = float(
+        os.getenv("MYPM_JOURNAL_COMMIT_INTERVAL_MS", "2")
+    )
+    journal_snapshot_every: int = int(
+        os.getenv("MYPM_JOURNAL_SNAPSHOT_EVERY", "100000")
+    )
+    # "remote" 백엔드가 연결할 스토어 서버 소켓과 워커당 연결 수
+    store_socket: str = os.getenv("MYPM_STORE_SOCKET", "mypm-store.sock")
+    store_pool_size: int = int(os.getenv("MYPM_STORE_POOL_SIZE", "4"))
+    # 2 이상이면 스토어 서버를 띄우고 API 워커들이 상태를 공유합니다.
+    workers: int = int(os.getenv("MYPM_WORKERS", "1"))
+    # 변경 피드(/changes)가 보관하는 최근 변경 수. 더 오래된 커서는 전체 스냅샷을
+    # 받습니다.
+    change_log_capacity: int = int(os.getenv("MYPM_CHANGE_LOG_CAPACITY", "10000"))
+    response_cache_bytes: int = int(
+        os.getenv("MYPM_RESPONSE_CACHE_BYTES", str(32 * 1024 * 1024))
+    )
+    # 이보다 작은 응답은 압축하지 않고, 이보다 큰 응답은 스레드 풀에서 압축합니다.
+    compression_min_bytes: int = int(os.getenv("MYPM_COMPRESSION_MIN_BYTES", "1024"))
+    compression_thread_bytes: int = int(
+        os.getenv("MYPM_COMPRESSION_THREAD_BYTES", str(256 * 1024))
+    )
+    # 목록 응답 직렬화 시 엔티티별 JSON 조각을 캐시할 최대 개수 (0 이면 캐시하지 않음)
+    fragment_cache_entries: int = int(
+        os.getenv("MYPM_FRAGMENT_CACHE_ENTRIES", "100000")
+    )
+    # Idempotency-Key 로 저장한 POST 응답의 최대 크기 합과 보관 시간(초)
+    idempotency_cache_bytes: int = int(
+        os.getenv("MYPM_IDEMPOTENCY_CACHE_BYTES", str(16 * 1024 * 1024))
+    )
+    idempotency_ttl_seconds: float = float(
+        os.getenv("MYPM_IDEMPOTENCY_TTL_SECONDS", "86400")
+    )
+    # Idempotency-Key 가 있는 요청 본문의 최대 크기. 넘으면 413 입니다.
+    idempotency_max_body_bytes: int = int(
+        os.getenv("MYPM_IDEMPOTENCY_MAX_BODY_BYTES", str(1024 * 1024))
+    )
+    # 요청/리포지토리 지연을 모아 /metrics 로 내보냅니다.
+    metrics_enabled: bool = _str_to_bool(
+        os.getenv("MYPM_METRICS_ENABLED"), default=True
+    )
+    # 켜면 X-Profile 헤더가 있거나 표본으로 뽑힌 요청의 스택 프로파일을 /profiles 에
+    # 남깁니다.
+    profiling_enabled: bool = _str_to_bool(os.getenv("MYPM_PROFILING_ENABLED"))
+    profiling_sample_rate: float = float(os.getenv("MYPM_PROFILING_SAMPLE_RATE", "0"))
+    profiling_keep: int = int(os.getenv("MYPM_PROFILING_KEEP", "50"))
 
 
 @lru_cache
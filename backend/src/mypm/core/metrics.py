@@ -0,0 +1,166 @@
+"""프로세스 내 지표 수집과 Prometheus 텍스트 형식 출력.
+
+기록은 요청 경로에서 불리므로 라벨 튜플을 키로 한 dict 조회와 리스트 원소 증가만
+합니다. 누적 버킷 계산과 문자열 생성은 ``render`` 할 때만 합니다. 지표는 프로세스마다
+따로 모이므로 워커가 여러 개면 수집기가 워커별로 긁어야 합니다.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections.abc import Iterable
+
+# 초 단위 지연 버킷. 메모리 저장소 호출(수 마이크로초)부터 느린 HTTP 요청까지 덮습니다.
+DEFAULT_BUCKETS = (
+    0.00001,
+    0.000025,
+    0.00005,
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+)
+
+# 라벨 값은 출력할 때 ``str`` 로 바꾸므로 상태 코드 같은 정수를 그대로 넣어도 됩니다.
+LabelValues = tuple[object, ...]
+
+
+class Histogram:
+    """라벨 조합별 지연 분포.
+
+    버킷별 개수는 누적하지 않고 저장했다가 출력할 때 누적합니다.
+    """
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labels: Iterable[str],
+        buckets: Iterable[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labels = tuple(labels)
+        self._bounds = tuple(sorted(buckets))
+        # 라벨 값 -> [버킷별 개수..., +Inf 개수, 합계]. 기록 한 번에 dict 조회 한 번만
+        # 하도록 묶습니다.
+        self._series: dict[LabelValues, list] = {}
+
+    def observe(self, labels: LabelValues, seconds: float) -> None:
+        series = self._series.get(labels)
+        if series is None:
+            series = self._series[labels] = [0] * (len(self._bounds) + 1) + [0.0]
+        series[bisect_left(self._bounds, seconds)] += 1
+        series[-1] += seconds
+
+    def samples(self) -> Iterable[str]:
+        bounds = [_format_value(bound) for bound in self._bounds] + ["+Inf"]
+        for labels, series in sorted(self._series.items()):
+            prefix = _format_labels(self.labels, labels)
+            separator = "," if prefix else ""
+            cumulative = 0
+            for bound, count in zip(bounds, series):
+                cumulative += count
+                yield (
+                    f'{self.name}_bucket{{{prefix}{separator}le="{bound}"}} '
+                    f"{cumulative}"
+                )
+            yield f"{self.name}_sum{_braced(prefix)} {_format_value(series[-1])}"
+            yield f"{self.name}_count{_braced(prefix)} {cumulative}"
+
+
+class Gauge:
+    """라벨 조합별로 올리고 내리는 현재 값."""
+
+    kind = "gauge"
+
+    def __init__(
+        self, name: str, documentation: str, labels: Iterable[str] = ()
+    ) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labels = tuple(labels)
+        self._values: dict[LabelValues, float] = {}
+
+    def add(self, labels: LabelValues, amount: float) -> None:
+        self._values[labels] = self._values.get(labels, 0) + amount
+
+    def samples(self) -> Iterable[str]:
+        for labels, value in sorted(self._values.items()):
+            braced = _braced(_format_labels(self.labels, labels))
+            yield f"{self.name}{braced} {_format_value(value)}"
+
+
+class MetricsRegistry:
+    """이름으로 지표를 만들고 모아 Prometheus 텍스트 형식(0.0.4)으로 출력합니다."""
+
+    def __init__(self) -> None:
+        self._metrics: dict[str, Histogram | Gauge] = {}
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labels: Iterable[str],
+        buckets: Iterable[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self._register(Histogram(name, documentation, labels, buckets))
+
+    def gauge(self, name: str, documentation: str, labels: Iterable[str] = ()) -> Gauge:
+        return self._register(Gauge(name, documentation, labels))
+
+    def render(self) -> str:
+        lines = []
+        for metric in self._metrics.values():
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(metric.samples())
+        return "\n".join(lines) + "\n"
+
+    def _register[M: (Histogram, Gauge)](self, metric: M) -> M:
+        # 같은 지표를 다시 요청하면(앱을 여러 번 만드는 경우 등) 이미 모은 값을 이어서
+        # 씁니다.
+        existing = self._metrics.get(metric.name)
+        if existing is None:
+            self._metrics[metric.name] = metric
+            return metric
+        if type(existing) is not type(metric) or existing.labels != metric.labels:
+            raise ValueError(
+                f"Metric {metric.name} is already registered "
+                "with a different type or labels"
+            )
+        return existing
+
+
+def _format_labels(names: tuple[str, ...], values: LabelValues) -> str:
+    return ",".join(
+        f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)
+    )
+
+
+def _braced(labels: str) -> str:
+    return f"{{{labels}}}" if labels else ""
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+__all__ = ["DEFAULT_BUCKETS", "Gauge", "Histogram", "MetricsRegistry"]
@@ -0,0 +1,171 @@
+"""요청 하나의 호출 스택별 실행 시간을 모으는 프로파일러와 최근 프로파일 보관소.
+
+``sys.setprofile`` 로 함수 호출/반환 이벤트마다 직전 이벤트 이후 흐른 시간을 그때의
+스택에 더합니다. 코루틴은 재개될 때 호출, 대기할 때 반환 이벤트를 내고, 재개된 코루틴의
+``f_back`` 은 자신을 기다리는 코루틴이므로 스택은 ``await`` 체인을 그대로 따라갑니다.
+루트 프레임(요청을 감싼 코루틴) 아래에 있지 않은 프레임의 시간은 버리므로, 같은 이벤트
+루프에서 번갈아 실행되는 다른 요청과 대기 시간은 빠지고 이 요청이 CPU 를 쓴 시간만
+남습니다. 스레드 풀에서 실행되는 동기 함수와 별도 태스크로 띄운 코루틴은 포함되지
+않습니다.
+
+결과는 flamegraph.pl, speedscope 등이 읽는 collapsed-stack 형식(``a;b;c
+마이크로초``)입니다.
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+from collections import OrderedDict, defaultdict
+from dataclasses import dataclass
+from datetime import datetime
+from types import FrameType
+from typing import Any
+
+
+class StackProfiler:
+    """``root`` 프레임 아래에서 실행된 시간을 호출 스택별로 모읍니다.
+
+    프로파일 함수는 스레드마다 하나이므로 ``start`` 한 스레드에서 ``stop`` 해야 합니다.
+    """
+
+    def __init__(self, root: FrameType) -> None:
+        self._root = root
+        # 프레임 -> 루트부터의 스택 문자열 (루트 아래가 아니면 None). 프로파일하는
+        # 동안만 보관합니다.
+        self._keys: dict[FrameType, str | None] = {}
+        self._totals: defaultdict[str, int] = defaultdict(int)
+        self._current: str | None = None
+        self._last = 0
+        self._previous: Any = None
+
+    def start(self) -> None:
+        self._previous = sys.getprofile()
+        self._current = self._key(self._root)
+        self._last = time.perf_counter_ns()
+        sys.setprofile(self._event)
+
+    def stop(self) -> None:
+        sys.setprofile(self._previous)
+        self._record(time.perf_counter_ns())
+        self._keys.clear()
+
+    @property
+    def cpu_ns(self) -> int:
+        return sum(self._totals.values())
+
+    def collapsed(self) -> str:
+        """스택별 시간을 마이크로초 단위 collapsed-stack 줄로 반환합니다. 1마이크로초
+        미만은 뺍니다."""
+
+        lines = [
+            f"{stack} {nanoseconds // 1000}"
+            for stack, nanoseconds in sorted(self._totals.items())
+            if nanoseconds >= 1000
+        ]
+        return "\n".join(lines) + "\n" if lines else ""
+
+    def _event(self, frame: FrameType, event: str, arg: Any) -> None:
+        self._record(time.perf_counter_ns())
+        if event == "call":
+            self._current = self._key(frame)
+        elif event == "return":
+            self._current = (
+                self._key(frame.f_back) if frame.f_back is not None else None
+            )
+        elif event == "c_call":
+            key = self._key(frame)
+            self._current = None if key is None else f"{key};{_builtin_label(arg)}"
+        else:  # c_return, c_exception
+            self._current = self._key(frame)
+        self._last = time.perf_counter_ns()
+
+    def _record(self, now: int) -> None:
+        if self._current is not None:
+            self._totals[self._current] += now - self._last
+
+    def _key(self, frame: FrameType) -> str | None:
+        try:
+            return self._keys[frame]
+        except KeyError:
+            pass
+
+        # 루트나 이미 본 프레임이 나올 때까지 올라간 뒤 내려오며 채웁니다.
+        chain = []
+        current: FrameType | None = frame
+        while (
+            current is not None
+            and current not in self._keys
+            and current is not self._root
+        ):
+            chain.append(current)
+            current = current.f_back
+        if current is None:
+            key = None
+        elif current is self._root:
+            key = self._keys[current] = _frame_label(current)
+        else:
+            key = self._keys[current]
+
+        for pending in reversed(chain):
+            if key is not None:
+                key = f"{key};{_frame_label(pending)}"
+            self._keys[pending] = key
+        return key
+
+
+def _frame_label(frame: FrameType) -> str:
+    code = frame.f_code
+    module = frame.f_globals.get("__name__", "?")
+    return f"{module}.{code.co_qualname}:{code.co_firstlineno}".replace(";", ",")
+
+
+def _builtin_label(function: Any) -> str:
+    # 내장 메서드는 __module__ 이 없고 __qualname__ 이 이미 "str.join" 형태입니다.
+    module = getattr(function, "__module__", None)
+    name = getattr(function, "__qualname__", None) or getattr(
+        function, "__name__", repr(function)
+    )
+    return (f"{module}.{name}" if module else name).replace(";", ",")
+
+
+@dataclass(frozen=True, slots=True)
+class Profile:
+    id: str
+    method: str
+    path: str
+    route: str
+    status: int
+    started_at: datetime
+    wall_ms: float
+    cpu_ms: float
+    collapsed: str
+
+    @property
+    def stacks(self) -> int:
+        return self.collapsed.count("\n")
+
+
+class ProfileStore:
+    """최근 프로파일을 ``capacity`` 개까지 보관합니다. 넘치면 가장 오래된 것부터
+    버립니다."""
+
+    def __init__(self, capacity: int) -> None:
+        self._capacity = capacity
+        self._profiles: OrderedDict[str, Profile] = OrderedDict()
+
+    def add(self, profile: Profile) -> None:
+        self._profiles[profile.id] = profile
+        while len(self._profiles) > self._capacity:
+            self._profiles.popitem(last=False)
+
+    def get(self, profile_id: str) -> Profile | None:
+        return self._profiles.get(profile_id)
+
+    def recent(self) -> list[Profile]:
+        """최신순으로 반환합니다."""
+
+        return list(reversed(self._profiles.values()))
+
+
+__all__ = ["Profile", "ProfileStore", "StackProfiler"]
@@ -1,14 +1,58 @@
 """Tasks 도메인 패키지."""
 
-from mypm.domain.tasks.entities import Retrospective, Task, TaskStatus
-from mypm.domain.tasks.repositories import RetrospectiveRepository, TaskRepository
-
+from mypm.domain.tasks.changes import Change, ChangeBatch, ChangeKind
+from mypm.domain.tasks.entities import Retrospective, Task, TaskIdSet, TaskStatus
+from mypm.domain.tasks.errors import ConflictError, UnavailableError
+from mypm.domain.tasks.history import DEFAULT_PERCENTILES, CycleTimeStats, DailyCount
+from mypm.domain.tasks.queries import (
+    TaskFilter,
+    TaskKeyset,
+    TaskPlanStep,
+    TaskQueryPlan,
+    TaskQueryResult,
+    TaskSearchHit,
+    TaskSearchResult,
+    TaskSortField,
+    fold_text,
+)
+from mypm.domain.tasks.repositories import (
+    ChangeFeed,
+    RetrospectiveRepository,
+    TaskRepository,
+    TransactionalStore,
+    TransitionHistory,
+)
+from mypm.domain.tasks.stats import TaskStats, compute_task_stats, diff_task_stats
 
 __all__ = [
     "Task",
     "TaskStatus",
+    "TaskIdSet",
     "Retrospective",
+    "ConflictError",
+    "UnavailableError",
+    "Change",
+    "ChangeBatch",
+    "ChangeKind",
+    "TaskKeyset",
+    "TaskSearchHit",
+    "TaskSearchResult",
+    "TaskSortField",
+    "TaskFilter",
+    "TaskPlanStep",
+    "TaskQueryPlan",
+    "TaskQueryResult",
+    "fold_text",
+    "TaskStats",
+    "compute_task_stats",
+    "diff_task_stats",
+    "CycleTimeStats",
+    "DailyCount",
+    "DEFAULT_PERCENTILES",
     "TaskRepository",
     "RetrospectiveRepository",
+    "TransactionalStore",
+    "ChangeFeed",
+    "TransitionHistory",
 ]
 
@@ -0,0 +1,39 @@
+"""Tasks 도메인 변경 피드 모델."""
+
+from __future__ import annotations
+
+import uuid
+from dataclasses import dataclass
+from enum import StrEnum
+
+from mypm.domain.tasks.entities import Retrospective, Task
+
+
+class ChangeKind(StrEnum):
+    """변경된 엔티티 종류."""
+
+    TASK = "task"
+    RETROSPECTIVE = "retrospective"
+
+
+@dataclass(frozen=True, slots=True)
+class Change:
+    """변경 한 건. ``entity`` 는 기록 시점의 복사본이며 삭제면 ``None`` 입니다."""
+
+    sequence: int
+    kind: ChangeKind
+    entity_id: uuid.UUID
+    entity: Task | Retrospective | None
+
+
+@dataclass(frozen=True, slots=True)
+class ChangeBatch:
+    """``since`` 이후의 변경 목록.
+
+    ``expired`` 이면 요청한 위치 이후 기록 일부가 이미 버려졌으므로 ``changes`` 는 비어
+    있고, 호출자는 전체 상태를 다시 읽은 뒤 ``latest`` 부터 이어 받아야 합니다.
+    """
+
+    changes: list[Change]
+    latest: int
+    expired: bool = False
@@ -2,10 +2,16 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable, Iterator, Mapping, MutableSet
 from dataclasses import dataclass, field
-from datetime import datetime, date
+from datetime import datetime, date, timedelta
 import uuid
 from enum import StrEnum
+from typing import Any, Self
+
+
+# ``updated_at`` 은 엔티티 버전으로도 쓰이므로 ``touch`` 마다 최소 이만큼 증가시킵니다.
+_VERSION_STEP = timedelta(microseconds=1)
 
 
 class TaskStatus(StrEnum):
@@ -17,8 +23,127 @@ class TaskStatus(StrEnum):
     BLOCKED = "blocked"
 
 
+class TaskIdSet(MutableSet[uuid.UUID]):
+    """넣은 순서를 유지하는 Task ID 집합.
+
+    ``dict`` 키로 저장하므로 포함 검사, 추가, 제거가 모두 O(1) 이고 순회는 넣은
+    순서입니다. 같은 ``TaskIdSet`` 끼리는 순서까지 같아야 같고, 다른 집합과는 원소만
+    비교합니다.
+    """
+
+    __slots__ = ("_ids",)
+
+    def __init__(self, ids: Iterable[uuid.UUID] = ()) -> None:
+        self._ids: dict[uuid.UUID, None] = dict.fromkeys(ids)
+
+    def __contains__(self, task_id: object) -> bool:
+        return task_id in self._ids
+
+    def __iter__(self) -> Iterator[uuid.UUID]:
+        return iter(self._ids)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, TaskIdSet):
+            return len(self._ids) == len(other._ids) and list(self._ids) == list(
+                other._ids
+            )
+        return super().__eq__(other)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self._ids)!r})"
+
+    def add(self, task_id: uuid.UUID) -> None:
+        self._ids[task_id] = None
+
+    def discard(self, task_id: uuid.UUID) -> None:
+        self._ids.pop(task_id, None)
+
+    def copy(self) -> TaskIdSet:
+        clone = TaskIdSet()
+        clone._ids = self._ids.copy()
+        return clone
+
+    def reset(self, ids: Iterable[uuid.UUID]) -> None:
+        """내용을 ``ids`` 로 바꿉니다. 같은 객체를 참조하는 쪽도 바뀐 값을 봅니다."""
+
+        self._ids = dict.fromkeys(ids)
+
+
+class _ChangeTracking:
+    """변경 메서드를 거친 필드와 바뀌기 전 값을 기록합니다.
+
+    리포지토리는 ``changes`` 로 바뀐 필드만 저장/재인덱싱하고 저장 후
+    ``clear_changes()`` 를 호출합니다. 필드에 직접 대입하면 기록되지 않으므로 저장소에서
+    읽은 엔티티는 메서드로만 변경합니다.
+
+    ``updated_at`` 은 낙관적 동시성 검사용 버전을 겸합니다. 리포지토리는 읽은 시점의 값
+    (``previous("updated_at")``)이 저장된 값과 다르면 쓰기를 거부합니다.
+    """
+
+    __slots__ = ()
+
+    _changes: dict[str, Any]
+
+    @property
+    def changes(self) -> Mapping[str, Any]:
+        """마지막 ``clear_changes()`` 이후 바뀐 필드 -> 바뀌기 전 값."""
+
+        return self._changes
+
+    def previous(self, name: str) -> Any:
+        """마지막으로 저장된 시점의 필드 값."""
+
+        changes = self._changes
+        return changes[name] if name in changes else getattr(self, name)
+
+    def clear_changes(self) -> None:
+        self._changes.clear()
+
+    def restore_changes(self, changes: Mapping[str, Any]) -> None:
+        """직렬화했던 변경 기록(``changes``)을 되살립니다. 프로세스 간 전송 후
+        사용합니다."""
+
+        self._changes.update(changes)
+
+    def discard_changes(self) -> None:
+        """기록된 변경을 되돌려 마지막으로 저장된 값으로 복원합니다."""
+
+        for name, value in self._changes.items():
+            current = getattr(self, name)
+            if isinstance(current, TaskIdSet):
+                current.reset(value)
+            elif isinstance(current, list):
+                current[:] = value
+            else:
+                setattr(self, name, value)
+        self._changes.clear()
+
+    def __copy__(self) -> Self:
+        # 얕은 복사본이 변경 기록을 공유하지 않도록 기록만 따로 복사합니다.
+        clone = object.__new__(type(self))
+        for name in type(self).__slots__:
+            object.__setattr__(clone, name, getattr(self, name))
+        clone._changes = dict(self._changes)
+        return clone
+
+    def _set(self, name: str, value: Any) -> None:
+        changes = self._changes
+        if name in changes:
+            # 저장된 값으로 되돌리면 더는 바뀐 필드가 아닙니다.
+            if changes[name] == value:
+                del changes[name]
+        elif getattr(self, name) != value:
+            changes[name] = getattr(self, name)
+        setattr(self, name, value)
+
+
 @dataclass(slots=True, kw_only=True)
-class Task:
+class Task(_ChangeTracking):
     """Task 엔티티."""
 
     title: str
@@ -29,50 +154,124 @@ class Task:
     id: uuid.UUID = field(default_factory=uuid.uuid4)
     created_at: datetime = field(default_factory=datetime.utcnow)
     updated_at: datetime = field(default_factory=datetime.utcnow)
+    _changes: dict[str, Any] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    def rename(self, title: str) -> None:
+        self._set("title", title)
+
+    def describe(self, description: str | None) -> None:
+        self._set("description", description)
+
+    def set_status(self, status: TaskStatus) -> None:
+        self._set("status", status)
+
+    def reschedule(self, due_date: date | None) -> None:
+        self._set("due_date", due_date)
 
     def mark_in_progress(self) -> None:
-        self.status = TaskStatus.IN_PROGRESS
+        self._set("status", TaskStatus.IN_PROGRESS)
         self.touch()
 
     def mark_done(self) -> None:
-        self.status = TaskStatus.DONE
+        self._set("status", TaskStatus.DONE)
         self.touch()
 
     def mark_blocked(self) -> None:
-        self.status = TaskStatus.BLOCKED
+        self._set("status", TaskStatus.BLOCKED)
         self.touch()
 
     def attach_to_retrospective(self, retrospective_id: uuid.UUID) -> None:
-        self.retrospective_id = retrospective_id
+        self._set("retrospective_id", retrospective_id)
+        self.touch()
+
+    def detach_from_retrospective(self) -> None:
+        self._set("retrospective_id", None)
         self.touch()
 
     def touch(self) -> None:
-        self.updated_at = datetime.utcnow()
+        # 시계가 같거나 뒤로 가도 버전(``updated_at``)은 항상 증가합니다.
+        self._set("updated_at", max(datetime.utcnow(), self.updated_at + _VERSION_STEP))
 
 
 @dataclass(slots=True, kw_only=True)
-class Retrospective:
-    """매일 회고 엔티티."""
+class Retrospective(_ChangeTracking):
+    """매일 회고 엔티티.
+
+    ``tasks`` 는 ``add_task(s)`` / ``remove_task(s)`` 로만 바꿉니다. 처음 바뀔 때 이전
+    목록을 튜플로 기록하고, 이후 변경은 기록 없이 O(1) 입니다.
+    """
 
     title: str
     summary: str | None = None
     date: date = field(default_factory=date.today)
-    tasks: list[uuid.UUID] = field(default_factory=list)
+    tasks: TaskIdSet = field(default_factory=TaskIdSet)
     id: uuid.UUID = field(default_factory=uuid.uuid4)
     created_at: datetime = field(default_factory=datetime.utcnow)
     updated_at: datetime = field(default_factory=datetime.utcnow)
+    _changes: dict[str, Any] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        # 저장소와 직렬화 계층은 목록으로 넘기기도 합니다.
+        if not isinstance(self.tasks, TaskIdSet):
+            self.tasks = TaskIdSet(self.tasks)
+
+    def rename(self, title: str) -> None:
+        self._set("title", title)
+
+    def summarize(self, summary: str | None) -> None:
+        self._set("summary", summary)
+
+    def reschedule(self, retrospective_date: date) -> None:
+        self._set("date", retrospective_date)
 
     def add_task(self, task_id: uuid.UUID) -> None:
-        if task_id not in self.tasks:
-            self.tasks.append(task_id)
-            self.touch()
+        self.add_tasks((task_id,))
 
     def remove_task(self, task_id: uuid.UUID) -> None:
-        if task_id in self.tasks:
-            self.tasks.remove(task_id)
+        self.remove_tasks((task_id,))
+
+    def add_tasks(self, task_ids: Iterable[uuid.UUID]) -> list[uuid.UUID]:
+        """없던 Task 를 순서대로 추가하고 실제로 추가된 ID 를 반환합니다."""
+
+        added = [
+            task_id for task_id in dict.fromkeys(task_ids) if task_id not in self.tasks
+        ]
+        if added:
+            self._record_tasks()
+            for task_id in added:
+                self.tasks.add(task_id)
+            self.touch()
+        return added
+
+    def remove_tasks(self, task_ids: Iterable[uuid.UUID]) -> list[uuid.UUID]:
+        """연결된 Task 를 빼고 실제로 빠진 ID 를 반환합니다."""
+
+        removed = [
+            task_id for task_id in dict.fromkeys(task_ids) if task_id in self.tasks
+        ]
+        if removed:
+            self._record_tasks()
+            for task_id in removed:
+                self.tasks.discard(task_id)
             self.touch()
+        return removed
+
+    def __copy__(self) -> Self:
+        # 복사본이 Task ID 집합을 공유하지 않도록 집합도 복사합니다.
+        clone = _ChangeTracking.__copy__(self)
+        clone.tasks = self.tasks.copy()
+        return clone
+
+    def _record_tasks(self) -> None:
+        if "tasks" not in self._changes:
+            self._changes["tasks"] = tuple(self.tasks)
 
     def touch(self) -> None:
-        self.updated_at = datetime.utcnow()
+        # 시계가 같거나 뒤로 가도 버전(``updated_at``)은 항상 증가합니다.
+        self._set("updated_at", max(datetime.utcnow(), self.updated_at + _VERSION_STEP))
 
 
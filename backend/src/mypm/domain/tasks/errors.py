@@ -0,0 +1,14 @@
+"""Tasks 도메인 오류."""
+
+from __future__ import annotations
+
+
+class ConflictError(ValueError):
+    """읽은 뒤 다른 쓰기가 먼저 반영되어 낙관적 버전 검사에 실패했습니다.
+
+    기존 호출자가 ``ValueError`` 로 함께 처리할 수 있도록 ``ValueError`` 를 상속합니다.
+    """
+
+
+class UnavailableError(RuntimeError):
+    """현재 저장소 구성에서는 제공하지 않는 기능입니다."""
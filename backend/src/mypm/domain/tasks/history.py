@@ -0,0 +1,33 @@
+"""Tasks 상태 전이 기록과 흐름 지표 모델."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+
+# 사이클 타임 응답에 기본으로 담는 백분위수
+DEFAULT_PERCENTILES = (50, 85, 95)
+
+
+@dataclass(frozen=True, slots=True)
+class CycleTimeStats:
+    """기간 안에 완료된 Task 의 사이클 타임(처음 진행 중이 된 때부터 완료까지).
+
+    진행 중이 된 시점을 기록하지 못한 완료(진행 중을 거치지 않았거나 기록 전에 시작한
+    Task)는 ``count`` 에 넣지 않고 ``unmeasured`` 로 셉니다. ``percentiles`` 는 백분위수
+    -> 값이며 nearest-rank 방식입니다.
+    """
+
+    count: int
+    unmeasured: int = 0
+    mean: timedelta | None = None
+    percentiles: dict[int, timedelta] = field(default_factory=dict)
+
+
+@dataclass(frozen=True, slots=True)
+class DailyCount:
+    """날짜별 값 하나. 처리량은 그날 완료된 수, 번다운은 그날이 끝날 때 남은 미완료
+    수입니다."""
+
+    day: date
+    count: int
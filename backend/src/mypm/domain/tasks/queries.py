@@ -0,0 +1,181 @@
+"""Tasks 도메인 조회 모델."""
+
+from __future__ import annotations
+
+import unicodedata
+import uuid
+from dataclasses import dataclass
+from datetime import date, datetime
+from enum import StrEnum
+
+from mypm.domain.tasks.entities import Task, TaskStatus
+
+
+class TaskSortField(StrEnum):
+    """Task 목록 정렬 기준."""
+
+    CREATED_AT = "created_at"
+    DUE_DATE = "due_date"
+    UPDATED_AT = "updated_at"
+
+
+@dataclass(frozen=True, slots=True)
+class TaskKeyset:
+    """키셋 페이지네이션 위치 (정렬 값, Task ID)."""
+
+    value: datetime | date | None
+    task_id: uuid.UUID
+
+
+@dataclass(frozen=True, slots=True)
+class TaskSearchHit:
+    """검색 결과 항목과 관련도 점수."""
+
+    task: Task
+    score: float
+
+
+@dataclass(frozen=True, slots=True)
+class TaskSearchResult:
+    """관련도 순으로 정렬된 검색 결과 한 페이지와 전체 일치 건수."""
+
+    hits: list[TaskSearchHit]
+    total: int
+
+
+def fold_text(text: str) -> str:
+    """접두어 비교용 정규화 (NFKC 정규화와 대소문자 통합)."""
+
+    return unicodedata.normalize("NFKC", text).casefold()
+
+
+@dataclass(frozen=True, slots=True)
+class TaskFilter:
+    """Task 조회 조건. 주어진 조건을 모두 만족하는 Task 만 고릅니다.
+
+    범위 조건은 모두 양 끝을 제외합니다(``due_after < due_date < due_before``). 마감일
+    조건이 있으면 마감일이 없는 Task 는 제외합니다. ``title_prefix`` 는 만들 때
+    ``fold_text`` 로 정규화하고, 같은 방식으로 정규화한 제목의 접두어와 비교합니다.
+    """
+
+    statuses: frozenset[TaskStatus] | None = None
+    due_after: date | None = None
+    due_before: date | None = None
+    retrospective_id: uuid.UUID | None = None
+    created_after: datetime | None = None
+    created_before: datetime | None = None
+    updated_after: datetime | None = None
+    updated_before: datetime | None = None
+    title_prefix: str | None = None
+
+    def __post_init__(self) -> None:
+        if self.statuses is not None and not isinstance(self.statuses, frozenset):
+            object.__setattr__(self, "statuses", frozenset(self.statuses))
+        if self.title_prefix:
+            object.__setattr__(self, "title_prefix", fold_text(self.title_prefix))
+
+    def conditions(self) -> list[str]:
+        """주어진 조건의 이름. 플래너와 ``TaskQueryPlan`` 이 같은 이름을 씁니다."""
+
+        names = []
+        if self.statuses is not None:
+            names.append("status")
+        if self.due_after is not None or self.due_before is not None:
+            names.append("due_date")
+        if self.retrospective_id is not None:
+            names.append("retrospective_id")
+        if self.created_after is not None or self.created_before is not None:
+            names.append("created_at")
+        if self.updated_after is not None or self.updated_before is not None:
+            names.append("updated_at")
+        if self.title_prefix:
+            names.append("title_prefix")
+        return names
+
+    def cache_key(self) -> tuple:
+        """프로세스와 관계없이 같은 조건이면 같은 값(과 ``repr``)인 키. 상태 집합의
+        순서는 해시 시드에 따라 달라지므로 정렬한 값으로, 날짜와 ID 는 문자열로
+        담습니다."""
+
+        return (
+            tuple(sorted(status.value for status in self.statuses))
+            if self.statuses is not None
+            else None,
+            *(
+                None if value is None else str(value)
+                for value in (
+                    self.due_after,
+                    self.due_before,
+                    self.retrospective_id,
+                    self.created_after,
+                    self.created_before,
+                    self.updated_after,
+                    self.updated_before,
+                )
+            ),
+            self.title_prefix,
+        )
+
+    def matches(self, task: Task) -> bool:
+        if self.statuses is not None and task.status not in self.statuses:
+            return False
+        if self.due_after is not None or self.due_before is not None:
+            if task.due_date is None or not _between(
+                task.due_date, self.due_after, self.due_before
+            ):
+                return False
+        if (
+            self.retrospective_id is not None
+            and task.retrospective_id != self.retrospective_id
+        ):
+            return False
+        if not _between(task.created_at, self.created_after, self.created_before):
+            return False
+        if not _between(task.updated_at, self.updated_after, self.updated_before):
+            return False
+        if self.title_prefix and not fold_text(task.title).startswith(
+            self.title_prefix
+        ):
+            return False
+        return True
+
+
+def _between[ValueT: (date, datetime)](
+    value: ValueT, after: ValueT | None, before: ValueT | None
+) -> bool:
+    return (after is None or value > after) and (before is None or value < before)
+
+
+@dataclass(frozen=True, slots=True)
+class TaskPlanStep:
+    """후보를 좁힌 인덱스 한 단계."""
+
+    index: str
+    # 인덱스가 알려준 후보 수. 알 수 없으면 None 입니다.
+    estimated: int | None
+    # 이 단계까지 교집합한 후보 수
+    candidates: int
+
+
+@dataclass(frozen=True, slots=True)
+class TaskQueryPlan:
+    """``TaskRepository.query`` 의 실행 계획과 결과 건수.
+
+    ``steps`` 는 적용 순서대로이며, ``residual`` 은 인덱스 없이 후보에서 직접 검사한
+    조건입니다. ``scanned`` 는 조건을 검사한 후보 수(백엔드가 알 수 없으면 None),
+    ``matched`` 는 페이지로 자르기 전 일치 건수입니다. 정렬 인덱스를 훑다가 ``limit`` 을
+    채워 멈춘 경우에는 그때까지 찾은 수입니다.
+    """
+
+    steps: list[TaskPlanStep]
+    residual: list[str]
+    scanned: int | None
+    matched: int
+    # 백엔드별 부가 정보 (예: SQLite 의 EXPLAIN QUERY PLAN)
+    detail: str | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class TaskQueryResult:
+    tasks: list[Task]
+    plan: TaskQueryPlan | None = None
@@ -4,9 +4,21 @@ from __future__ import annotations
 
 import uuid
 from abc import ABC, abstractmethod
-from datetime import date
+from collections.abc import Iterable
+from contextlib import AbstractAsyncContextManager
+from datetime import date, datetime
 
-from mypm.domain.tasks.entities import Retrospective, Task
+from mypm.domain.tasks.changes import ChangeBatch
+from mypm.domain.tasks.entities import Retrospective, Task, TaskStatus
+from mypm.domain.tasks.history import CycleTimeStats, DailyCount
+from mypm.domain.tasks.queries import (
+    TaskFilter,
+    TaskKeyset,
+    TaskQueryResult,
+    TaskSearchResult,
+    TaskSortField,
+)
+from mypm.domain.tasks.stats import TaskStats
 
 
 class TaskRepository(ABC):
@@ -16,22 +28,135 @@ class TaskRepository(ABC):
     async def add(self, task: Task) -> Task:
         raise NotImplementedError
 
+    @abstractmethod
+    async def add_many(self, tasks: list[Task]) -> list[Task]:
+        """여러 Task 를 한 번의 인덱스 갱신(영속 저장소는 한 번의 커밋)으로
+        추가합니다."""
+        raise NotImplementedError
+
     @abstractmethod
     async def get(self, task_id: uuid.UUID) -> Task | None:
         raise NotImplementedError
 
+    @abstractmethod
+    async def get_many(self, task_ids: list[uuid.UUID]) -> dict[uuid.UUID, Task]:
+        """존재하는 Task 만 ID 를 키로 반환합니다."""
+        raise NotImplementedError
+
     @abstractmethod
     async def list_by_status(self, status: str | None = None) -> list[Task]:
         raise NotImplementedError
 
+    @abstractmethod
+    async def list_page(
+        self,
+        *,
+        status: str | None = None,
+        order_by: TaskSortField = TaskSortField.CREATED_AT,
+        descending: bool = False,
+        after: TaskKeyset | None = None,
+        limit: int | None = None,
+    ) -> list[Task]:
+        """정렬 기준에 따라 ``after`` 다음 위치부터 최대 ``limit`` 개를 반환합니다.
+
+        같은 정렬 값은 Task ID로 순서를 고정하며, ``due_date`` 가 없는 Task는
+        오름차순 기준으로 가장 뒤에 위치합니다.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def list_by_due_range(
+        self,
+        *,
+        due_after: date | None = None,
+        due_before: date | None = None,
+        status: str | None = None,
+        after: TaskKeyset | None = None,
+        limit: int | None = None,
+    ) -> list[Task]:
+        """``due_after < due_date < due_before`` 인 Task 를 마감일 오름차순으로
+        반환합니다.
+
+        마감일이 없는 Task 는 제외하며, ``after`` 는 마감일 기준 키셋 위치입니다.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def query(
+        self,
+        task_filter: TaskFilter,
+        *,
+        order_by: TaskSortField = TaskSortField.CREATED_AT,
+        descending: bool = False,
+        after: TaskKeyset | None = None,
+        limit: int | None = None,
+        explain: bool = False,
+    ) -> TaskQueryResult:
+        """``task_filter`` 의 모든 조건을 만족하는 Task 를 ``list_page`` 와 같은 순서로
+        반환합니다.
+
+        ``explain`` 이면 어떤 인덱스로 후보를 얼마나 좁혔는지(``plan``)를 함께
+        반환합니다.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def search(
+        self, query: str, *, limit: int = 20, offset: int = 0
+    ) -> TaskSearchResult:
+        """제목과 설명에 질의의 모든 토큰을 포함하는 Task 를 관련도 순으로
+        반환합니다."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def count_by_retrospective(
+        self, retrospective_ids: list[uuid.UUID]
+    ) -> dict[uuid.UUID, dict[TaskStatus, int]]:
+        """Retrospective 별로 연결된 Task 수를 상태별로 반환합니다. 연결된 Task 가
+        없으면 생략합니다."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def stats(self, today: date) -> TaskStats:
+        """쓰기마다 갱신되는 카운터에서 통계를 읽습니다. Task 를 훑지 않습니다."""
+        raise NotImplementedError
+
     @abstractmethod
     async def update(self, task: Task) -> Task:
         raise NotImplementedError
 
+    @abstractmethod
+    async def update_many(self, tasks: list[Task]) -> list[Task]:
+        """여러 Task 를 한 번에 갱신합니다. 하나라도 없으면 아무것도 바꾸지 않고
+        ``ValueError``."""
+        raise NotImplementedError
+
     @abstractmethod
     async def delete(self, task_id: uuid.UUID) -> None:
         raise NotImplementedError
 
+    @abstractmethod
+    async def delete_many(self, task_ids: list[uuid.UUID]) -> list[uuid.UUID]:
+        """여러 Task 를 삭제하고 실제로 삭제된 ID 목록을 반환합니다."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def version(self, status: str | None = None) -> int:
+        """전체(``None``) 또는 상태 버킷의 버전을 반환합니다.
+
+        버킷에 속한 Task 가 추가/수정/삭제되거나 버킷을 드나들 때마다 단조 증가합니다.
+        """
+        raise NotImplementedError
+
+    def pin(self) -> TaskRepository:
+        """지금 상태에 고정된 읽기 전용 뷰를 반환합니다.
+
+        여러 번에 걸친 읽기(페이지 순회, 내보내기 등)가 중간의 쓰기와 섞이지 않은 한
+        시점의 상태를 보게 합니다. 스냅샷을 지원하지 않는 저장소는 자기 자신을 반환하며,
+        이때는 호출마다 최신 상태를 읽습니다.
+        """
+        return self
+
 
 class RetrospectiveRepository(ABC):
     """Retrospective 리포지토리 인터페이스."""
@@ -48,8 +173,118 @@ class RetrospectiveRepository(ABC):
     async def get(self, retrospective_id: uuid.UUID) -> Retrospective | None:
         raise NotImplementedError
 
+    @abstractmethod
+    async def list_by_date_range(self, start: date, end: date) -> list[Retrospective]:
+        """``start`` 부터 ``end`` 까지(양 끝 포함) 의 Retrospective 를 날짜순으로
+        반환합니다."""
+        raise NotImplementedError
+
     @abstractmethod
     async def update(self, retrospective: Retrospective) -> Retrospective:
         raise NotImplementedError
 
+    @abstractmethod
+    async def version(self) -> int:
+        """Retrospective 가 추가/수정될 때마다 단조 증가하는 버전을 반환합니다."""
+        raise NotImplementedError
+
+    def pin(self) -> RetrospectiveRepository:
+        """지금 상태에 고정된 읽기 전용 뷰. ``TaskRepository.pin`` 과 같습니다."""
+        return self
+
+
+class TransactionalStore(ABC):
+    """여러 Task/Retrospective 쓰기를 하나의 원자적 커밋으로 묶는 저장소 인터페이스."""
+
+    @abstractmethod
+    def lock(
+        self, entity_ids: Iterable[uuid.UUID]
+    ) -> AbstractAsyncContextManager[None]:
+        """주어진 엔티티들의 쓰기 잠금을 잡습니다. 겹치지 않는 엔티티끼리는 기다리지
+        않습니다."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def commit(
+        self, tasks: list[Task], retrospectives: list[Retrospective]
+    ) -> None:
+        """모든 쓰기를 반영하거나 하나도 반영하지 않습니다.
+
+        없는 엔티티가 있으면 ``ValueError``, 읽은 뒤 다른 쓰기가 먼저 반영된 엔티티가
+        있으면 ``ConflictError`` 를 냅니다.
+        """
+        raise NotImplementedError
+
+    async def close(self) -> None:
+        """저장소에 쓰던 자원을 놓습니다. 기본 구현은 아무것도 하지 않습니다."""
+
+
+class ChangeFeed(ABC):
+    """Task/Retrospective 쓰기를 순번과 함께 보관하는 변경 피드 인터페이스.
+
+    순번은 기록마다 1씩 증가합니다. 최근 기록만 보관하므로 오래된 위치는 만료됩니다.
+    """
+
+    @abstractmethod
+    async def since(self, sequence: int, limit: int) -> ChangeBatch:
+        """``sequence`` 다음 변경부터 최대 ``limit`` 개를 순번 순으로 반환합니다."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def latest(self) -> int:
+        """마지막으로 기록된 순번을 반환합니다."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def wait(self, sequence: int, timeout: float) -> int:
+        """마지막 순번이 ``sequence`` 보다 커지거나 ``timeout`` 초가 지날 때까지
+        기다린 뒤 마지막 순번을 반환합니다."""
+        raise NotImplementedError
+
+
+class TransitionHistory(ABC):
+    """Task 상태 전이를 추가만 하는 기록과 그 위의 흐름 지표(사이클 타임, 처리량,
+    번다운).
+
+    서비스는 쓰기가 반영된 직후 양보(await) 없이 ``record*`` 를 호출합니다. 기록 시각은
+    되돌아가지 않도록 앞 기록보다 이르면 앞 기록의 시각으로 맞춥니다. 날짜 구간은 UTC
+    기준이며 양 끝을 포함합니다.
+    """
+
+    @abstractmethod
+    def seed(self, tasks: Iterable[Task]) -> None:
+        """기록을 시작하기 전의 Task 상태를 전이 없이 기준선으로 등록합니다."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def record(self, tasks: Iterable[Task]) -> None:
+        """각 Task 의 현재 상태로의 전이를 ``updated_at`` 시각에 기록합니다.
+
+        처음 보는 Task 는 생성으로, 기록된 상태와 같은 Task 는 전이 없음으로 봅니다.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def record_deletes(self, task_ids: Iterable[uuid.UUID], at: datetime) -> None:
+        """삭제를 상태 없음으로의 전이로 기록합니다."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def cycle_times(
+        self, start: date, end: date, percentiles: Iterable[int]
+    ) -> CycleTimeStats:
+        """기간 안에 완료된 Task 의 사이클 타임 분포를 반환합니다."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def throughput(self, start: date, end: date) -> list[DailyCount]:
+        """날짜별 완료 전이 수를 반환합니다."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def burndown(self, start: date, end: date) -> list[DailyCount]:
+        """날짜별로 그날이 끝날 때 남아 있는 미완료 Task 수를 반환합니다."""
+        raise NotImplementedError
 
+    def close(self) -> None:
+        """기록에 쓰던 자원을 놓습니다. 기본 구현은 아무것도 하지 않습니다."""
@@ -0,0 +1,89 @@
+"""Tasks 통계 조회 모델."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import date, timedelta
+
+from mypm.domain.tasks.entities import Task, TaskStatus
+
+# "이번 주" 마감 구간의 길이 (기준일 다음 날부터)
+UPCOMING_DAYS = 7
+
+
+@dataclass(frozen=True, slots=True)
+class TaskStats:
+    """Task 통계.
+
+    마감 구간 값은 완료되지 않은 Task 만 셉니다.
+    """
+
+    total: int
+    by_status: dict[TaskStatus, int]
+    overdue: int = 0
+    due_today: int = 0
+    due_this_week: int = 0
+    due_later: int = 0
+    no_due_date: int = 0
+    attached_to_retrospective: int = 0
+    # Task 가 하나 이상 연결된 Retrospective 수
+    retrospective_count: int = 0
+
+
+def due_bucket_bounds(today: date) -> tuple[date, date]:
+    """(오늘, 이번 주 마지막 날) 을 반환합니다. 구간은 ``< 오늘``, ``= 오늘``, ``<=
+    마지막 날``, 그 이후입니다."""
+
+    return today, today + timedelta(days=UPCOMING_DAYS)
+
+
+def compute_task_stats(tasks: Iterable[Task], today: date) -> TaskStats:
+    """모든 Task 를 훑어 통계를 처음부터 계산합니다. 카운터 검증용입니다."""
+
+    _, week_end = due_bucket_bounds(today)
+    by_status = dict.fromkeys(TaskStatus, 0)
+    due = dict.fromkeys(
+        ("overdue", "due_today", "due_this_week", "due_later", "no_due_date"), 0
+    )
+    retrospectives = set()
+    total = attached = 0
+
+    for task in tasks:
+        total += 1
+        by_status[task.status] += 1
+        if task.retrospective_id is not None:
+            attached += 1
+            retrospectives.add(task.retrospective_id)
+        if task.status is TaskStatus.DONE:
+            continue
+
+        if task.due_date is None:
+            due["no_due_date"] += 1
+        elif task.due_date < today:
+            due["overdue"] += 1
+        elif task.due_date == today:
+            due["due_today"] += 1
+        elif task.due_date <= week_end:
+            due["due_this_week"] += 1
+        else:
+            due["due_later"] += 1
+
+    return TaskStats(
+        total=total,
+        by_status=by_status,
+        attached_to_retrospective=attached,
+        retrospective_count=len(retrospectives),
+        **due,
+    )
+
+
+def diff_task_stats(expected: TaskStats, actual: TaskStats) -> list[str]:
+    """두 통계에서 값이 다른 항목을 ``"이름: 기대값 != 실제값"`` 형태로 반환합니다."""
+
+    differences = []
+    for name in TaskStats.__slots__:
+        expected_value, actual_value = getattr(expected, name), getattr(actual, name)
+        if expected_value != actual_value:
+            differences.append(f"{name}: {expected_value!r} != {actual_value!r}")
+    return differences
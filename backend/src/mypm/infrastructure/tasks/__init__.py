@@ -1,7 +1,63 @@
 """Tasks 인프라 레이어."""
 
-from mypm.infrastructure.tasks.memory.repositories import InMemoryRetrospectiveRepository, InMemoryTaskRepository
-
-
-__all__ = ["InMemoryTaskRepository", "InMemoryRetrospectiveRepository"]
+from mypm.infrastructure.tasks.changes import ChangeLog
+from mypm.infrastructure.tasks.compact.repositories import CompactTaskRepository
+from mypm.infrastructure.tasks.factory import (
+    build_history,
+    build_repositories,
+    close_repositories,
+)
+from mypm.infrastructure.tasks.history import TransitionLog
+from mypm.infrastructure.tasks.instrumented import (
+    InstrumentedRetrospectiveRepository,
+    InstrumentedTaskRepository,
+    repository_histogram,
+)
+from mypm.infrastructure.tasks.memory.journal import Journal
+from mypm.infrastructure.tasks.memory.repositories import (
+    InMemoryRetrospectiveRepository,
+    InMemoryTaskRepository,
+    InMemoryTransactionalStore,
+    open_journaled_repositories,
+)
+from mypm.infrastructure.tasks.remote.client import (
+    RemoteChangeFeed,
+    RemoteRetrospectiveRepository,
+    RemoteTaskRepository,
+    RemoteTransactionalStore,
+    StoreClient,
+)
+from mypm.infrastructure.tasks.remote.server import StoreServer
+from mypm.infrastructure.tasks.sqlite.connection import SQLiteConnectionPool
+from mypm.infrastructure.tasks.sqlite.repositories import (
+    SQLiteRetrospectiveRepository,
+    SQLiteTaskRepository,
+    SQLiteTransactionalStore,
+)
 
+__all__ = [
+    "ChangeLog",
+    "CompactTaskRepository",
+    "InMemoryTaskRepository",
+    "InMemoryRetrospectiveRepository",
+    "InMemoryTransactionalStore",
+    "Journal",
+    "open_journaled_repositories",
+    "RemoteTaskRepository",
+    "RemoteRetrospectiveRepository",
+    "RemoteTransactionalStore",
+    "RemoteChangeFeed",
+    "StoreClient",
+    "StoreServer",
+    "SQLiteConnectionPool",
+    "SQLiteTaskRepository",
+    "SQLiteRetrospectiveRepository",
+    "SQLiteTransactionalStore",
+    "InstrumentedTaskRepository",
+    "InstrumentedRetrospectiveRepository",
+    "repository_histogram",
+    "build_repositories",
+    "build_history",
+    "close_repositories",
+    "TransitionLog",
+]
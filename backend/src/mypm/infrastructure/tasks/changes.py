@@ -0,0 +1,109 @@
+"""메모리 기반 변경 피드."""
+
+from __future__ import annotations
+
+import asyncio
+import copy
+import time
+import uuid
+from collections import deque
+from collections.abc import Iterable
+from contextlib import suppress
+from itertools import islice
+
+from mypm.domain.tasks.changes import Change, ChangeBatch, ChangeKind
+from mypm.domain.tasks.entities import Retrospective, Task
+from mypm.domain.tasks.repositories import ChangeFeed
+
+
+class ChangeLog(ChangeFeed):
+    """최근 ``capacity`` 개의 변경을 순번과 함께 보관하는 링 버퍼.
+
+    리포지토리는 쓰기를 반영한 직후 양보(await) 없이 ``record_*`` 를 호출합니다. 기록은
+    엔티티의 복사본을 담으므로 저장된 객체가 나중에 바뀌어도 기록은 그대로입니다.
+
+    순번은 재시작 후 이전 커서와 겹치지 않도록 현재 시각(마이크로초)에서 시작합니다.
+    나노초를 쓰지 않는 것은 JavaScript 숫자(2^53)로 정확히 읽을 수 있게 하기
+    위해서입니다. 버퍼에서 밀려난 위치나 이 프로세스가 발급하지 않은 위치는 만료로
+    응답합니다.
+    """
+
+    def __init__(self, capacity: int = 10_000) -> None:
+        self._entries: deque[Change] = deque(maxlen=capacity)
+        self._latest = time.time_ns() // 1000
+        self._waiters: set[asyncio.Future[None]] = set()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def record_tasks(self, tasks: Iterable[Task]) -> None:
+        self._record(ChangeKind.TASK, [(task.id, _snapshot(task)) for task in tasks])
+
+    def record_task_deletes(self, task_ids: Iterable[uuid.UUID]) -> None:
+        self._record(ChangeKind.TASK, [(task_id, None) for task_id in task_ids])
+
+    def record_retrospectives(self, retrospectives: Iterable[Retrospective]) -> None:
+        self._record(
+            ChangeKind.RETROSPECTIVE,
+            [
+                (retrospective.id, _snapshot(retrospective))
+                for retrospective in retrospectives
+            ],
+        )
+
+    async def since(self, sequence: int, limit: int) -> ChangeBatch:
+        latest = self._latest
+        lag = latest - sequence
+        if lag < 0 or lag > len(self._entries):
+            return ChangeBatch(changes=[], latest=latest, expired=True)
+
+        # 대부분의 커서는 최신 위치 근처이므로 뒤에서부터 밀린 만큼만 훑습니다.
+        changes = list(islice(reversed(self._entries), lag))
+        changes.reverse()
+        return ChangeBatch(changes=changes[:limit], latest=latest)
+
+    async def latest(self) -> int:
+        return self._latest
+
+    async def wait(self, sequence: int, timeout: float) -> int:
+        if self._latest > sequence:
+            return self._latest
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.add(waiter)
+        try:
+            with suppress(TimeoutError):
+                await asyncio.wait_for(waiter, timeout)
+        finally:
+            self._waiters.discard(waiter)
+        return self._latest
+
+    def _record(
+        self,
+        kind: ChangeKind,
+        entries: list[tuple[uuid.UUID, Task | Retrospective | None]],
+    ) -> None:
+        if not entries:
+            return
+
+        sequence = self._latest
+        for entity_id, entity in entries:
+            sequence += 1
+            self._entries.append(
+                Change(sequence=sequence, kind=kind, entity_id=entity_id, entity=entity)
+            )
+        self._latest = sequence
+
+        waiters, self._waiters = self._waiters, set()
+        for waiter in waiters:
+            if not waiter.done():
+                waiter.set_result(None)
+
+
+def _snapshot[EntityT: (Task, Retrospective)](entity: EntityT) -> EntityT:
+    clone = copy.copy(entity)
+    clone.clear_changes()
+    return clone
+
+
+__all__ = ["ChangeLog"]
@@ -0,0 +1,317 @@
+"""열 기반 Task 저장소용 자료구조.
+
+모든 구조는 파이썬 객체 대신 ``array`` / ``bytearray`` 에 고정 폭 값을 담아,
+항목당 메모리를 포인터와 객체 헤더가 아니라 실제 값 크기에 가깝게 유지합니다.
+"""
+
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterator
+
+# (정렬 값, ID 상위 64비트, ID 하위 64비트)
+RowKey = tuple[int, int, int]
+
+_EMPTY = -1
+_TOMBSTONE = -2
+
+
+class StringArena:
+    """UTF-8 문자열을 하나의 ``bytearray`` 에 이어 붙여 저장합니다.
+
+    핸들은 ``오프셋 << 24 | 길이`` 형태의 64비트 정수이며 ``None`` 은 ``NONE`` 입니다.
+    교체/삭제된 문자열은 쓰레기로 집계했다가 ``compact`` 로 한 번에 회수합니다.
+    """
+
+    NONE = (1 << 64) - 1
+    EMPTY = 0
+    _LENGTH_BITS = 24
+    _MAX_LENGTH = (1 << _LENGTH_BITS) - 1
+
+    def __init__(self) -> None:
+        self._data = bytearray()
+        self.garbage = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def store(self, text: str | None) -> int:
+        if text is None:
+            return self.NONE
+        if not text:
+            return self.EMPTY
+
+        encoded = text.encode()
+        if len(encoded) > self._MAX_LENGTH:
+            raise ValueError("String too long")
+
+        offset = len(self._data)
+        self._data += encoded
+        return offset << self._LENGTH_BITS | len(encoded)
+
+    def get(self, handle: int) -> str | None:
+        if handle == self.NONE:
+            return None
+
+        offset, length = handle >> self._LENGTH_BITS, handle & self._MAX_LENGTH
+        return self._data[offset : offset + length].decode()
+
+    def release(self, handle: int) -> None:
+        if handle != self.NONE:
+            self.garbage += handle & self._MAX_LENGTH
+
+    def compact(self, columns: list[array]) -> None:
+        """``columns`` 의 핸들이 가리키는 문자열만 새 버퍼로 옮기고 핸들을 고쳐
+        씁니다."""
+
+        data = self._data
+        compacted = bytearray()
+        none, bits, mask = self.NONE, self._LENGTH_BITS, self._MAX_LENGTH
+        for column in columns:
+            for position, handle in enumerate(column):
+                if handle == none or handle == 0:
+                    continue
+                offset, length = handle >> bits, handle & mask
+                column[position] = len(compacted) << bits | length
+                compacted += data[offset : offset + length]
+
+        self._data = compacted
+        self.garbage = 0
+
+
+class RowTable:
+    """128비트 ID -> 행 번호 개방 주소(선형 탐사) 해시 테이블.
+
+    슬롯에는 행 번호만 저장하고 ID 비교는 열 배열에서 읽습니다. UUID4 의 하위 비트는
+    충분히 무작위라 별도 해시 함수 없이 그대로 씁니다.
+    """
+
+    _LOAD_FACTOR = 0.6
+
+    def __init__(self, ids_high: array, ids_low: array, capacity: int = 1024) -> None:
+        self._ids_high = ids_high
+        self._ids_low = ids_low
+        size = 1 << max(capacity - 1, 1).bit_length()
+        self._slots = array("q", [_EMPTY]) * size
+        self._mask = size - 1
+        self._used = 0
+        self._filled = 0  # 사용 중 + 묘비
+
+    def __len__(self) -> int:
+        return self._used
+
+    def get(self, high: int, low: int) -> int:
+        """행 번호를, 없으면 -1 을 반환합니다."""
+
+        slots, mask = self._slots, self._mask
+        ids_high, ids_low = self._ids_high, self._ids_low
+        position = (low ^ high) & mask
+        while True:
+            row = slots[position]
+            if row == _EMPTY:
+                return -1
+            if row >= 0 and ids_low[row] == low and ids_high[row] == high:
+                return row
+            position = (position + 1) & mask
+
+    def insert(self, high: int, low: int, row: int) -> None:
+        """``row`` 의 ID 가 이미 열 배열에 기록되어 있어야 합니다."""
+
+        if (self._filled + 1) > len(self._slots) * self._LOAD_FACTOR:
+            self._resize(
+                max(len(self._slots), int((self._used + 1) / self._LOAD_FACTOR * 2))
+            )
+
+        slots, mask = self._slots, self._mask
+        position = (low ^ high) & mask
+        while slots[position] >= 0:
+            position = (position + 1) & mask
+        if slots[position] == _EMPTY:
+            self._filled += 1
+        slots[position] = row
+        self._used += 1
+
+    def remove(self, high: int, low: int) -> None:
+        slots, mask = self._slots, self._mask
+        ids_high, ids_low = self._ids_high, self._ids_low
+        position = (low ^ high) & mask
+        while True:
+            row = slots[position]
+            if row == _EMPTY:
+                return
+            if row >= 0 and ids_low[row] == low and ids_high[row] == high:
+                slots[position] = _TOMBSTONE
+                self._used -= 1
+                return
+            position = (position + 1) & mask
+
+    def _resize(self, capacity: int) -> None:
+        rows = [row for row in self._slots if row >= 0]
+        size = 1 << (capacity - 1).bit_length()
+        self._slots = array("q", [_EMPTY]) * size
+        self._mask = size - 1
+        self._used = self._filled = 0
+        ids_high, ids_low = self._ids_high, self._ids_low
+        for row in rows:
+            self.insert(ids_high[row], ids_low[row], row)
+
+
+class SortedRowIndex:
+    """(정렬 값, ID) 순으로 행 번호를 유지하는 청크 정렬 인덱스.
+
+    청크마다 정렬 값 배열(int64)과 행 번호 배열(uint32)을 나란히 두어 항목당 12바이트만
+    씁니다. 청크 선택은 청크별 최대 키 목록에서, 청크 안의 위치는 정렬 값 배열에서 이진
+    탐색하고 같은 값끼리는 ID 열을 읽어 순서를 정합니다.
+    """
+
+    def __init__(self, ids_high: array, ids_low: array, chunk_size: int = 512) -> None:
+        self._ids_high = ids_high
+        self._ids_low = ids_low
+        self._chunk_size = chunk_size
+        self._values: list[array] = []
+        self._rows: list[array] = []
+        self._maxes: list[RowKey] = []
+        self._length = 0
+
+    def __len__(self) -> int:
+        return self._length
+
+    def key(self, value: int, row: int) -> RowKey:
+        return (value, self._ids_high[row], self._ids_low[row])
+
+    def insert(self, value: int, row: int) -> None:
+        key = self.key(value, row)
+        if not self._values:
+            self._values.append(array("q", [value]))
+            self._rows.append(array("I", [row]))
+            self._maxes.append(key)
+            self._length = 1
+            return
+
+        chunk = bisect_left(self._maxes, key)
+        if chunk == len(self._maxes):
+            chunk -= 1
+            self._maxes[chunk] = key
+        position = self._position(chunk, key, right=False)
+        self._values[chunk].insert(position, value)
+        self._rows[chunk].insert(position, row)
+        self._length += 1
+
+        if len(self._values[chunk]) > self._chunk_size * 2:
+            self._split(chunk)
+
+    def remove(self, value: int, row: int) -> None:
+        key = self.key(value, row)
+        chunk = bisect_left(self._maxes, key)
+        if chunk == len(self._maxes):
+            return
+
+        position = self._position(chunk, key, right=False)
+        values, rows = self._values[chunk], self._rows[chunk]
+        if position == len(rows) or rows[position] != row:
+            return
+
+        del values[position]
+        del rows[position]
+        self._length -= 1
+        if not rows:
+            del self._values[chunk], self._rows[chunk], self._maxes[chunk]
+        elif position == len(rows):
+            self._maxes[chunk] = self.key(values[-1], rows[-1])
+
+    def iter_from(
+        self, after: RowKey | None = None, *, descending: bool = False
+    ) -> Iterator[tuple[int, int]]:
+        """``after`` 를 제외한 다음 위치부터 (정렬 값, 행 번호) 를 순회합니다."""
+
+        if descending:
+            if after is None:
+                chunk = len(self._values) - 1
+                position = len(self._values[chunk]) if chunk >= 0 else 0
+            else:
+                chunk = bisect_left(self._maxes, after)
+                if chunk == len(self._maxes):
+                    chunk -= 1
+                    position = len(self._values[chunk]) if chunk >= 0 else 0
+                else:
+                    position = self._position(chunk, after, right=False)
+            return self._iter_backward(chunk, position - 1)
+
+        if after is None:
+            return self._iter_forward(0, 0)
+        chunk = bisect_right(self._maxes, after)
+        position = (
+            self._position(chunk, after, right=True) if chunk < len(self._maxes) else 0
+        )
+        return self._iter_forward(chunk, position)
+
+    def iter_range(
+        self, low: int, high: int, after: RowKey | None = None
+    ) -> Iterator[tuple[int, int]]:
+        """정렬 값이 ``low`` 이상 ``high`` 이하인 (정렬 값, 행 번호) 를 오름차순으로
+        순회합니다."""
+
+        start = (low - 1, (1 << 64), 0)
+        if after is not None and after > start:
+            start = after
+        for value, row in self.iter_from(start):
+            if value > high:
+                return
+            yield value, row
+
+    def count_range(self, low: int, high: int) -> int:
+        """정렬 값이 ``low`` 이상 ``high`` 이하인 항목 수."""
+
+        return self._rank(high + 1) - self._rank(low)
+
+    def _rank(self, value: int) -> int:
+        # 정렬 값이 ``value`` 보다 작은 항목 수
+        chunk = bisect_left(self._maxes, (value,))
+        before = sum(map(len, self._rows[:chunk]))
+        if chunk < len(self._values):
+            before += bisect_left(self._values[chunk], value)
+        return before
+
+    def _position(self, chunk: int, key: RowKey, *, right: bool) -> int:
+        values, rows = self._values[chunk], self._rows[chunk]
+        value, identity = key[0], key[1:]
+        low = bisect_left(values, value)
+        high = bisect_right(values, value, low)
+        ids_high, ids_low = self._ids_high, self._ids_low
+        while low < high:
+            middle = (low + high) // 2
+            row = rows[middle]
+            current = (ids_high[row], ids_low[row])
+            if current < identity or (right and current == identity):
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def _split(self, chunk: int) -> None:
+        values, rows = self._values[chunk], self._rows[chunk]
+        half = len(values) // 2
+        self._values[chunk : chunk + 1] = [values[:half], values[half:]]
+        self._rows[chunk : chunk + 1] = [rows[:half], rows[half:]]
+        self._maxes.insert(chunk, self.key(values[half - 1], rows[half - 1]))
+
+    def _iter_forward(self, chunk: int, position: int) -> Iterator[tuple[int, int]]:
+        while chunk < len(self._values):
+            values, rows = self._values[chunk], self._rows[chunk]
+            for index in range(position, len(rows)):
+                yield values[index], rows[index]
+            chunk += 1
+            position = 0
+
+    def _iter_backward(self, chunk: int, position: int) -> Iterator[tuple[int, int]]:
+        while chunk >= 0:
+            values, rows = self._values[chunk], self._rows[chunk]
+            for index in range(position, -1, -1):
+                yield values[index], rows[index]
+            chunk -= 1
+            if chunk >= 0:
+                position = len(self._rows[chunk]) - 1
+
+
+__all__ = ["RowKey", "RowTable", "SortedRowIndex", "StringArena"]
@@ -0,0 +1,817 @@
+"""열 기반 메모리 Task 리포지토리 구현."""
+
+from __future__ import annotations
+
+import heapq
+import time
+import uuid
+from array import array
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from datetime import date, datetime, timedelta
+from itertools import islice
+
+from mypm.domain.tasks.entities import Task, TaskStatus
+from mypm.domain.tasks.errors import ConflictError
+from mypm.domain.tasks.queries import (
+    TaskFilter,
+    TaskKeyset,
+    TaskPlanStep,
+    TaskQueryPlan,
+    TaskQueryResult,
+    TaskSearchHit,
+    TaskSearchResult,
+    TaskSortField,
+    fold_text,
+)
+from mypm.domain.tasks.repositories import TaskRepository
+from mypm.domain.tasks.stats import TaskStats, due_bucket_bounds
+from mypm.infrastructure.tasks.changes import ChangeLog
+from mypm.infrastructure.tasks.compact.columns import (
+    RowKey,
+    RowTable,
+    SortedRowIndex,
+    StringArena,
+)
+from mypm.infrastructure.tasks.indexes import due_rank_bounds, rank_bounds, sort_rank
+from mypm.infrastructure.tasks.planner import AccessPath, select
+from mypm.infrastructure.tasks.search import TaskSearchIndex
+
+_STATUSES = list(TaskStatus)
+_STATUS_CODES = {status: code for code, status in enumerate(_STATUSES)}
+_DELETED = 255
+_NO_DUE = 0
+_NO_RETROSPECTIVE = -1
+_NULL_RANK = sort_rank(None)
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+_MASK_64 = (1 << 64) - 1
+
+_new_object = object.__new__
+_set_attribute = object.__setattr__
+
+
+def _uuid(value: int) -> uuid.UUID:
+    # 행을 Task 로 만들 때마다 호출되므로 UUID.__init__ 의 인자 검증을 건너뜁니다.
+    result = _new_object(uuid.UUID)
+    _set_attribute(result, "int", value)
+    _set_attribute(result, "is_safe", uuid.SafeUUID.unknown)
+    return result
+
+
+class CompactTaskRepository(TaskRepository):
+    """Task 를 열 단위 배열에 저장하는 메모리 저장소.
+
+    ID 는 상/하위 64비트 정수 배열, 상태는 바이트, 시각은 epoch 마이크로초 int64,
+    문자열은 하나의 UTF-8 버퍼에 담고 ``Task`` 객체는 조회할 때만 만듭니다. 삭제된
+    행은 재사용 목록에 넣어 다음 추가 때 채웁니다.
+
+    반환하는 ``Task`` 는 매번 새로 만든 사본이므로 변경 후 ``update`` 해야 반영됩니다.
+    ``update`` 는 변경 기록(``Task.changes``)에 있는 열과 인덱스만 고쳐 씁니다.
+    검색 색인은 첫 검색 때 만들어지며 그 뒤로는 쓰기마다 갱신됩니다. ``changes`` 를
+    주면 반영한 쓰기를 변경 피드에 남깁니다.
+    """
+
+    def __init__(self, changes: ChangeLog | None = None) -> None:
+        self._changes = changes
+        self._ids_high = array("Q")
+        self._ids_low = array("Q")
+        self._statuses = bytearray()
+        self._created_at = array("q")
+        self._updated_at = array("q")
+        self._due_dates = array("i")
+        self._retrospectives = array("i")
+        self._titles = array("Q")
+        self._descriptions = array("Q")
+        self._strings = StringArena()
+        self._free_rows: list[int] = []
+
+        self._rows = RowTable(self._ids_high, self._ids_low)
+        # (정렬 기준, 상태) 별 인덱스. 상태 없는 조회는 상태별 인덱스를 병합합니다.
+        self._sorted = {
+            (field, status): SortedRowIndex(self._ids_high, self._ids_low)
+            for field in TaskSortField
+            for status in _STATUSES
+        }
+
+        # Retrospective ID 는 번호로 바꿔 행에는 int32 하나만 둡니다.
+        self._retrospective_ids: list[uuid.UUID] = []
+        self._retrospective_numbers: dict[uuid.UUID, int] = {}
+        self._retrospective_counts: dict[int, array] = {}
+        # Retrospective 번호 -> 연결된 행. 카운터와 함께 바뀝니다.
+        self._retrospective_rows: dict[int, set[int]] = {}
+        self._attached = 0
+
+        self._sequence = time.time_ns()
+        self._versions: dict[TaskStatus | None, int] = dict.fromkeys(
+            [None, *TaskStatus], self._sequence
+        )
+        self._search: TaskSearchIndex | None = None
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    @property
+    def arena_bytes(self) -> int:
+        return len(self._strings)
+
+    async def add(self, task: Task) -> Task:
+        await self.add_many([task])
+        return task
+
+    async def add_many(self, tasks: list[Task]) -> list[Task]:
+        statuses = set()
+        for task in tasks:
+            row = self._find(task.id)
+            if row >= 0:
+                self._remove_row(row)
+            self._insert_row(task)
+            statuses.add(task.status)
+
+        if self._search is not None:
+            for task in tasks:
+                self._search.index(task)
+        for task in tasks:
+            task.clear_changes()
+        self._bump(statuses)
+        if self._changes is not None:
+            self._changes.record_tasks(tasks)
+        return tasks
+
+    async def get(self, task_id: uuid.UUID) -> Task | None:
+        row = self._find(task_id)
+        return self._materialize(row) if row >= 0 else None
+
+    async def get_many(self, task_ids: list[uuid.UUID]) -> dict[uuid.UUID, Task]:
+        found = {}
+        for task_id in task_ids:
+            row = self._find(task_id)
+            if row >= 0:
+                found[task_id] = self._materialize(row)
+        return found
+
+    async def list_by_status(self, status: str | None = None) -> list[Task]:
+        if status is None:
+            deleted = _DELETED
+            return [
+                self._materialize(row)
+                for row, code in enumerate(self._statuses)
+                if code != deleted
+            ]
+
+        try:
+            code = _STATUS_CODES[TaskStatus(status)]
+        except ValueError:
+            return []
+
+        return [
+            self._materialize(row)
+            for row, current in enumerate(self._statuses)
+            if current == code
+        ]
+
+    async def list_page(
+        self,
+        *,
+        status: str | None = None,
+        order_by: TaskSortField = TaskSortField.CREATED_AT,
+        descending: bool = False,
+        after: TaskKeyset | None = None,
+        limit: int | None = None,
+    ) -> list[Task]:
+        statuses = _parse_statuses(status)
+        if statuses is None:
+            return []
+
+        after_key = _keyset_key(after) if after is not None else None
+        iterators = []
+        for item in statuses:
+            index = self._sorted[(order_by, item)]
+            iterators.append(
+                _keyed(index, index.iter_from(after_key, descending=descending))
+            )
+        return self._collect(iterators, descending, limit)
+
+    async def list_by_due_range(
+        self,
+        *,
+        due_after: date | None = None,
+        due_before: date | None = None,
+        status: str | None = None,
+        after: TaskKeyset | None = None,
+        limit: int | None = None,
+    ) -> list[Task]:
+        statuses = _parse_statuses(status)
+        if statuses is None:
+            return []
+
+        low, high = due_rank_bounds(due_after, due_before)
+        after_key = _keyset_key(after) if after is not None else None
+        iterators = []
+        for item in statuses:
+            index = self._sorted[(TaskSortField.DUE_DATE, item)]
+            iterators.append(_keyed(index, index.iter_range(low, high, after_key)))
+        return self._collect(iterators, False, limit)
+
+    async def query(
+        self,
+        task_filter: TaskFilter,
+        *,
+        order_by: TaskSortField = TaskSortField.CREATED_AT,
+        descending: bool = False,
+        after: TaskKeyset | None = None,
+        limit: int | None = None,
+        explain: bool = False,
+    ) -> TaskQueryResult:
+        conditions = task_filter.conditions()
+        statuses = [
+            status
+            for status in _STATUSES
+            if task_filter.statuses is None or status in task_filter.statuses
+        ]
+        # 후보 검사는 행의 열 값만 읽고, Task 는 반환할 페이지만 만듭니다.
+        matches = self._row_filter(task_filter)
+        after_key = _keyset_key(after) if after is not None else None
+        selection = select(
+            self._access_paths(task_filter, statuses),
+            conditions,
+            len(self._rows),
+            limit,
+        )
+
+        if selection.candidates is None:
+            iterators = []
+            for status in statuses:
+                index = self._sorted[(order_by, status)]
+                iterators.append(
+                    _keyed(index, index.iter_from(after_key, descending=descending))
+                )
+            merged = (
+                iterators[0]
+                if len(iterators) == 1
+                else heapq.merge(*iterators, reverse=descending)
+            )
+            rows, scanned = [], 0
+            for _, row in merged:
+                scanned += 1
+                if matches(row):
+                    rows.append(row)
+                    if limit is not None and len(rows) >= limit:
+                        break
+            name = (
+                order_by.value
+                if task_filter.statuses is None
+                else f"status+{order_by.value}"
+            )
+            estimated = sum(
+                len(self._sorted[(order_by, status)]) for status in statuses
+            )
+            steps = [TaskPlanStep(index=name, estimated=estimated, candidates=scanned)]
+            residual = [condition for condition in conditions if condition != "status"]
+            matched = len(rows)
+        else:
+            candidates = selection.candidates
+            scanned = len(candidates)
+            if selection.residual:
+                candidates = [row for row in candidates if matches(row)]
+            matched = len(candidates)
+            rows = self._order_rows(candidates, order_by, descending, after_key, limit)
+            steps, residual = selection.steps, selection.residual
+
+        plan = None
+        if explain:
+            plan = TaskQueryPlan(
+                steps=steps, residual=residual, scanned=scanned, matched=matched
+            )
+        return TaskQueryResult(
+            tasks=[self._materialize(row) for row in rows], plan=plan
+        )
+
+    def _access_paths(
+        self, task_filter: TaskFilter, statuses: list[TaskStatus]
+    ) -> list[AccessPath[int]]:
+        """상태별 정렬 인덱스와 Retrospective 별 행 집합으로 만들 수 있는 경로. 제목
+        조건은 열에서 검사합니다."""
+
+        paths: list[AccessPath[int]] = []
+        if task_filter.statuses is not None:
+            indexes = [
+                self._sorted[(TaskSortField.CREATED_AT, status)] for status in statuses
+            ]
+            paths.append(
+                AccessPath(
+                    index="status",
+                    covers=frozenset({"status"}),
+                    estimate=sum(map(len, indexes)),
+                    fetch=lambda: {
+                        row for index in indexes for _, row in index.iter_from()
+                    },
+                )
+            )
+
+        if task_filter.retrospective_id is not None:
+            number = self._retrospective_numbers.get(task_filter.retrospective_id)
+            attached = self._retrospective_rows.get(number, frozenset())
+            paths.append(
+                AccessPath(
+                    index="retrospective_id",
+                    covers=frozenset({"retrospective_id"}),
+                    estimate=len(attached),
+                    fetch=lambda: attached,
+                )
+            )
+
+        ranges = (
+            (TaskSortField.DUE_DATE, task_filter.due_after, task_filter.due_before),
+            (
+                TaskSortField.CREATED_AT,
+                task_filter.created_after,
+                task_filter.created_before,
+            ),
+            (
+                TaskSortField.UPDATED_AT,
+                task_filter.updated_after,
+                task_filter.updated_before,
+            ),
+        )
+        for field, low_value, high_value in ranges:
+            if low_value is None and high_value is None:
+                continue
+            # 상태별 인덱스를 합쳐 읽으므로 상태 조건이 있으면 (상태, 값) 복합 인덱스가
+            # 됩니다.
+            low, high = rank_bounds(low_value, high_value)
+            indexes = [self._sorted[(field, status)] for status in statuses]
+            composite = task_filter.statuses is not None
+            paths.append(
+                AccessPath(
+                    index=f"status+{field.value}" if composite else field.value,
+                    covers=frozenset(
+                        {field.value, "status"} if composite else {field.value}
+                    ),
+                    estimate=sum(index.count_range(low, high) for index in indexes),
+                    fetch=lambda indexes=indexes, low=low, high=high: {
+                        row
+                        for index in indexes
+                        for _, row in index.iter_range(low, high)
+                    },
+                )
+            )
+        return paths
+
+    def _row_filter(self, task_filter: TaskFilter) -> Callable[[int], bool]:
+        """``task_filter.matches`` 와 같은 검사를 행의 열 값으로 합니다."""
+
+        checks: list[Callable[[int], bool]] = []
+        if task_filter.statuses is not None:
+            codes = bytes(
+                sorted(_STATUS_CODES[status] for status in task_filter.statuses)
+            )
+            statuses = self._statuses
+            checks.append(lambda row: statuses[row] in codes)
+
+        if task_filter.due_after is not None or task_filter.due_before is not None:
+            due_low, due_high = due_rank_bounds(
+                task_filter.due_after, task_filter.due_before
+            )
+            due_dates = self._due_dates
+            checks.append(
+                lambda row: (
+                    due_dates[row] != _NO_DUE and due_low <= due_dates[row] <= due_high
+                )
+            )
+
+        if task_filter.retrospective_id is not None:
+            number = self._retrospective_numbers.get(
+                task_filter.retrospective_id, _NO_RETROSPECTIVE - 1
+            )
+            retrospectives = self._retrospectives
+            checks.append(lambda row: retrospectives[row] == number)
+
+        for column, low_value, high_value in (
+            (self._created_at, task_filter.created_after, task_filter.created_before),
+            (self._updated_at, task_filter.updated_after, task_filter.updated_before),
+        ):
+            if low_value is not None or high_value is not None:
+                low, high = rank_bounds(low_value, high_value)
+                checks.append(
+                    lambda row, column=column, low=low, high=high: (
+                        low <= column[row] <= high
+                    )
+                )
+
+        if task_filter.title_prefix:
+            prefix, titles, strings = (
+                task_filter.title_prefix,
+                self._titles,
+                self._strings,
+            )
+            checks.append(
+                lambda row: fold_text(strings.get(titles[row])).startswith(prefix)
+            )
+
+        return lambda row: all(check(row) for check in checks)
+
+    def _order_rows(
+        self,
+        rows: Iterable[int],
+        order_by: TaskSortField,
+        descending: bool,
+        after: RowKey | None,
+        limit: int | None,
+    ) -> list[int]:
+        """후보 행을 정렬 키 순서로 정렬해 ``after`` 다음부터 ``limit`` 개를
+        반환합니다."""
+
+        column = {
+            TaskSortField.CREATED_AT: self._created_at,
+            TaskSortField.UPDATED_AT: self._updated_at,
+            TaskSortField.DUE_DATE: self._due_dates,
+        }[order_by]
+        ids_high, ids_low = self._ids_high, self._ids_low
+        no_due = order_by is TaskSortField.DUE_DATE
+        keyed = []
+        for row in rows:
+            value = column[row]
+            if no_due and value == _NO_DUE:
+                value = _NULL_RANK
+            key = (value, ids_high[row], ids_low[row])
+            if after is None or (key < after if descending else key > after):
+                keyed.append((key, row))
+
+        if limit is None:
+            keyed.sort(reverse=descending)
+        elif descending:
+            keyed = heapq.nlargest(limit, keyed)
+        else:
+            keyed = heapq.nsmallest(limit, keyed)
+        return [row for _, row in keyed]
+
+    async def search(
+        self, query: str, *, limit: int = 20, offset: int = 0
+    ) -> TaskSearchResult:
+        if self._search is None:
+            index = TaskSearchIndex()
+            for task in await self.list_by_status():
+                index.index(task)
+            self._search = index
+
+        hits, total = self._search.search(query, limit=limit, offset=offset)
+        tasks = await self.get_many([task_id for task_id, _ in hits])
+        return TaskSearchResult(
+            hits=[
+                TaskSearchHit(task=tasks[task_id], score=score)
+                for task_id, score in hits
+            ],
+            total=total,
+        )
+
+    async def count_by_retrospective(
+        self, retrospective_ids: list[uuid.UUID]
+    ) -> dict[uuid.UUID, dict[TaskStatus, int]]:
+        counts = {}
+        for retrospective_id in retrospective_ids:
+            number = self._retrospective_numbers.get(retrospective_id)
+            per_status = (
+                self._retrospective_counts.get(number) if number is not None else None
+            )
+            if per_status is not None:
+                counts[retrospective_id] = {
+                    _STATUSES[code]: count
+                    for code, count in enumerate(per_status)
+                    if count
+                }
+        return counts
+
+    async def stats(self, today: date) -> TaskStats:
+        _, week_end = due_bucket_bounds(today)
+        today_rank, week_rank = sort_rank(today), sort_rank(week_end)
+        due = dict.fromkeys(
+            ("overdue", "due_today", "due_this_week", "due_later", "no_due_date"), 0
+        )
+        for status in _STATUSES:
+            if status is TaskStatus.DONE:
+                continue
+            index = self._sorted[(TaskSortField.DUE_DATE, status)]
+            due["overdue"] += index.count_range(0, today_rank - 1)
+            due["due_today"] += index.count_range(today_rank, today_rank)
+            due["due_this_week"] += index.count_range(today_rank + 1, week_rank)
+            due["due_later"] += index.count_range(week_rank + 1, _NULL_RANK - 1)
+            due["no_due_date"] += index.count_range(_NULL_RANK, _NULL_RANK)
+
+        by_status = {
+            status: len(self._sorted[(TaskSortField.CREATED_AT, status)])
+            for status in _STATUSES
+        }
+        return TaskStats(
+            total=len(self._rows),
+            by_status=by_status,
+            attached_to_retrospective=self._attached,
+            retrospective_count=len(self._retrospective_counts),
+            **due,
+        )
+
+    async def update(self, task: Task) -> Task:
+        await self.update_many([task])
+        return task
+
+    async def update_many(self, tasks: list[Task]) -> list[Task]:
+        self.apply_updates(self.prepare_updates(tasks))
+        return tasks
+
+    def prepare_updates(self, tasks: list[Task]) -> list[tuple[int, Task]]:
+        """``update_many`` 의 검증 단계. 반영할 (행, Task) 쌍을 반환합니다.
+
+        없는 Task 는 ``ValueError``, 읽은 뒤 다른 쓰기가 먼저 반영된 Task 는
+        ``ConflictError`` 입니다. 상태는 바꾸지 않습니다.
+        """
+
+        latest = {task.id: task for task in tasks}
+        rows = [self._find(task_id) for task_id in latest]
+        if any(row < 0 for row in rows):
+            raise ValueError("Task not found")
+
+        # 반환하는 Task 는 사본이므로 변경 기록이 있으면 읽은 시점의 버전과 비교합니다.
+        for row, task in zip(rows, latest.values()):
+            if task.changes and self._updated_at[row] != sort_rank(
+                task.previous("updated_at")
+            ):
+                raise ConflictError("Task was modified concurrently")
+        return list(zip(rows, latest.values()))
+
+    def apply_updates(self, plan: list[tuple[int, Task]]) -> None:
+        """``prepare_updates`` 결과를 반영합니다."""
+
+        statuses = set()
+        for row, task in plan:
+            statuses.add(_STATUSES[self._statuses[row]])
+            changes = task.changes
+            if changes:
+                self._patch_row(row, task, changes)
+            else:
+                # 변경 기록이 없는 객체(저장소 밖에서 만든 Task 등)는 행 전체를 다시
+                # 씁니다.
+                self._unindex_row(row)
+                self._write_row(row, task)
+                self._index_row(row)
+            statuses.add(task.status)
+
+            if self._search is not None and (
+                not changes or "title" in changes or "description" in changes
+            ):
+                self._search.index(task)
+            task.clear_changes()
+
+        if plan:
+            self._bump(statuses)
+            if self._changes is not None:
+                self._changes.record_tasks(task for _, task in plan)
+        self._maybe_compact()
+
+    async def delete(self, task_id: uuid.UUID) -> None:
+        await self.delete_many([task_id])
+
+    async def delete_many(self, task_ids: list[uuid.UUID]) -> list[uuid.UUID]:
+        deleted = []
+        statuses = set()
+        for task_id in dict.fromkeys(task_ids):
+            row = self._find(task_id)
+            if row < 0:
+                continue
+            statuses.add(_STATUSES[self._statuses[row]])
+            self._remove_row(row)
+            deleted.append(task_id)
+            if self._search is not None:
+                self._search.remove(task_id)
+
+        if deleted:
+            self._bump(statuses)
+            self._maybe_compact()
+            if self._changes is not None:
+                self._changes.record_task_deletes(deleted)
+        return deleted
+
+    async def version(self, status: str | None = None) -> int:
+        if status is None:
+            return self._versions.get(None, 0)
+
+        try:
+            return self._versions.get(TaskStatus(status), 0)
+        except ValueError:
+            return 0
+
+    def _bump(self, statuses: set[TaskStatus]) -> None:
+        self._sequence += 1
+        self._versions[None] = self._sequence
+        for status in statuses:
+            self._versions[status] = self._sequence
+
+    def _collect(
+        self,
+        iterators: list[Iterator[tuple[RowKey, int]]],
+        descending: bool,
+        limit: int | None,
+    ) -> list[Task]:
+        merged = (
+            iterators[0]
+            if len(iterators) == 1
+            else heapq.merge(*iterators, reverse=descending)
+        )
+        if limit is not None:
+            merged = islice(merged, limit)
+        return [self._materialize(row) for _, row in merged]
+
+    def _find(self, task_id: uuid.UUID) -> int:
+        value = task_id.int
+        return self._rows.get(value >> 64, value & _MASK_64)
+
+    def _insert_row(self, task: Task) -> None:
+        value = task.id.int
+        if self._free_rows:
+            row = self._free_rows.pop()
+            self._ids_high[row], self._ids_low[row] = value >> 64, value & _MASK_64
+        else:
+            row = len(self._statuses)
+            self._ids_high.append(value >> 64)
+            self._ids_low.append(value & _MASK_64)
+            self._statuses.append(_DELETED)
+            self._created_at.append(0)
+            self._updated_at.append(0)
+            self._due_dates.append(_NO_DUE)
+            self._retrospectives.append(_NO_RETROSPECTIVE)
+            self._titles.append(StringArena.NONE)
+            self._descriptions.append(StringArena.NONE)
+
+        self._write_row(row, task)
+        self._rows.insert(value >> 64, value & _MASK_64, row)
+        self._index_row(row)
+
+    def _remove_row(self, row: int) -> None:
+        self._unindex_row(row)
+        self._rows.remove(self._ids_high[row], self._ids_low[row])
+        self._strings.release(self._titles[row])
+        self._strings.release(self._descriptions[row])
+        self._titles[row] = self._descriptions[row] = StringArena.NONE
+        self._statuses[row] = _DELETED
+        self._free_rows.append(row)
+
+    def _write_row(self, row: int, task: Task) -> None:
+        strings = self._strings
+        if self._statuses[row] != _DELETED:
+            strings.release(self._titles[row])
+            strings.release(self._descriptions[row])
+
+        self._statuses[row] = _STATUS_CODES[task.status]
+        self._created_at[row] = sort_rank(task.created_at)
+        self._updated_at[row] = sort_rank(task.updated_at)
+        self._due_dates[row] = (
+            task.due_date.toordinal() if task.due_date is not None else _NO_DUE
+        )
+        self._retrospectives[row] = self._retrospective_number(task.retrospective_id)
+        self._titles[row] = strings.store(task.title)
+        self._descriptions[row] = strings.store(task.description)
+
+    def _patch_row(self, row: int, task: Task, changes: Mapping[str, object]) -> None:
+        """바뀐 필드의 열만 쓰고, 그 열이나 상태에 걸린 인덱스 항목만 옮깁니다."""
+
+        old_code, code = self._statuses[row], _STATUS_CODES[task.status]
+        moved = [
+            field
+            for field in TaskSortField
+            if old_code != code or field.value in changes
+        ]
+        old_values = self._sort_values(row)
+        for field in moved:
+            self._sorted[(field, _STATUSES[old_code])].remove(old_values[field], row)
+        if old_code != code or "retrospective_id" in changes:
+            self._uncount_row(row)
+
+        self._statuses[row] = code
+        if "updated_at" in changes:
+            self._updated_at[row] = sort_rank(task.updated_at)
+        if "due_date" in changes:
+            self._due_dates[row] = (
+                task.due_date.toordinal() if task.due_date is not None else _NO_DUE
+            )
+        if "retrospective_id" in changes:
+            self._retrospectives[row] = self._retrospective_number(
+                task.retrospective_id
+            )
+        if "title" in changes:
+            self._strings.release(self._titles[row])
+            self._titles[row] = self._strings.store(task.title)
+        if "description" in changes:
+            self._strings.release(self._descriptions[row])
+            self._descriptions[row] = self._strings.store(task.description)
+
+        values = self._sort_values(row)
+        for field in moved:
+            self._sorted[(field, task.status)].insert(values[field], row)
+        if old_code != code or "retrospective_id" in changes:
+            self._count_row(row)
+
+    def _index_row(self, row: int) -> None:
+        status = _STATUSES[self._statuses[row]]
+        for field, value in self._sort_values(row).items():
+            self._sorted[(field, status)].insert(value, row)
+        self._count_row(row)
+
+    def _unindex_row(self, row: int) -> None:
+        status = _STATUSES[self._statuses[row]]
+        for field, value in self._sort_values(row).items():
+            self._sorted[(field, status)].remove(value, row)
+        self._uncount_row(row)
+
+    def _count_row(self, row: int) -> None:
+        number = self._retrospectives[row]
+        if number != _NO_RETROSPECTIVE:
+            counts = self._retrospective_counts.get(number)
+            if counts is None:
+                counts = self._retrospective_counts[number] = array(
+                    "i", [0] * len(_STATUSES)
+                )
+            counts[self._statuses[row]] += 1
+            self._retrospective_rows.setdefault(number, set()).add(row)
+            self._attached += 1
+
+    def _uncount_row(self, row: int) -> None:
+        number = self._retrospectives[row]
+        if number != _NO_RETROSPECTIVE:
+            counts = self._retrospective_counts[number]
+            counts[self._statuses[row]] -= 1
+            if not any(counts):
+                del self._retrospective_counts[number]
+            rows = self._retrospective_rows[number]
+            rows.discard(row)
+            if not rows:
+                del self._retrospective_rows[number]
+            self._attached -= 1
+
+    def _sort_values(self, row: int) -> dict[TaskSortField, int]:
+        due = self._due_dates[row]
+        return {
+            TaskSortField.CREATED_AT: self._created_at[row],
+            TaskSortField.UPDATED_AT: self._updated_at[row],
+            TaskSortField.DUE_DATE: due if due != _NO_DUE else _NULL_RANK,
+        }
+
+    def _retrospective_number(self, retrospective_id: uuid.UUID | None) -> int:
+        if retrospective_id is None:
+            return _NO_RETROSPECTIVE
+
+        number = self._retrospective_numbers.get(retrospective_id)
+        if number is None:
+            number = self._retrospective_numbers[retrospective_id] = len(
+                self._retrospective_ids
+            )
+            self._retrospective_ids.append(retrospective_id)
+        return number
+
+    def _materialize(self, row: int) -> Task:
+        strings = self._strings
+        due = self._due_dates[row]
+        retrospective = self._retrospectives[row]
+        return Task(
+            id=_uuid(self._ids_high[row] << 64 | self._ids_low[row]),
+            title=strings.get(self._titles[row]),
+            description=strings.get(self._descriptions[row]),
+            status=_STATUSES[self._statuses[row]],
+            due_date=date.fromordinal(due) if due != _NO_DUE else None,
+            retrospective_id=(
+                self._retrospective_ids[retrospective]
+                if retrospective != _NO_RETROSPECTIVE
+                else None
+            ),
+            created_at=_EPOCH + _MICROSECOND * self._created_at[row],
+            updated_at=_EPOCH + _MICROSECOND * self._updated_at[row],
+        )
+
+    def _maybe_compact(self) -> None:
+        # 회수할 문자열이 살아 있는 문자열보다 많아지면 버퍼를 다시 씁니다.
+        strings = self._strings
+        if strings.garbage > (1 << 20) and strings.garbage * 2 > len(strings):
+            strings.compact([self._titles, self._descriptions])
+
+
+def _parse_statuses(status: str | None) -> list[TaskStatus] | None:
+    if status is None:
+        return _STATUSES
+
+    try:
+        return [TaskStatus(status)]
+    except ValueError:
+        return None
+
+
+def _keyed(
+    index: SortedRowIndex, entries: Iterator[tuple[int, int]]
+) -> Iterator[tuple[RowKey, int]]:
+    # 상태별 인덱스를 병합할 수 있도록 (정렬 값, ID) 키를 붙입니다.
+    for value, row in entries:
+        yield index.key(value, row), row
+
+
+def _keyset_key(keyset: TaskKeyset) -> RowKey:
+    value = keyset.task_id.int
+    return (sort_rank(keyset.value), value >> 64, value & _MASK_64)
+
+
+__all__ = ["CompactTaskRepository"]
@@ -0,0 +1,131 @@
+"""설정에 맞는 저장소 구성."""
+
+from __future__ import annotations
+
+import os
+
+from mypm.core.config import Settings
+from mypm.domain.tasks.repositories import (
+    ChangeFeed,
+    RetrospectiveRepository,
+    TaskRepository,
+    TransactionalStore,
+    TransitionHistory,
+)
+from mypm.infrastructure.tasks.changes import ChangeLog
+from mypm.infrastructure.tasks.compact.repositories import CompactTaskRepository
+from mypm.infrastructure.tasks.history import TransitionLog
+from mypm.infrastructure.tasks.memory.journal import Journal
+from mypm.infrastructure.tasks.memory.repositories import (
+    InMemoryRetrospectiveRepository,
+    InMemoryTaskRepository,
+    InMemoryTransactionalStore,
+    open_journaled_repositories,
+)
+from mypm.infrastructure.tasks.remote.client import (
+    RemoteChangeFeed,
+    RemoteRetrospectiveRepository,
+    RemoteTaskRepository,
+    RemoteTransactionalStore,
+    StoreClient,
+)
+from mypm.infrastructure.tasks.sqlite.connection import SQLiteConnectionPool
+from mypm.infrastructure.tasks.sqlite.repositories import (
+    SQLiteRetrospectiveRepository,
+    SQLiteTaskRepository,
+    SQLiteTransactionalStore,
+)
+
+
+def build_repositories(
+    settings: Settings,
+) -> tuple[TaskRepository, RetrospectiveRepository, TransactionalStore, ChangeFeed]:
+    """설정된 저장소 백엔드에 맞는 리포지토리, 트랜잭션 저장소와 변경 피드를 생성합니다.
+
+    ``"remote"`` 는 ``store_socket`` 의 스토어 서버에 연결하는 클라이언트를 만듭니다.
+    """
+
+    if settings.storage_backend == "remote":
+        client = StoreClient(settings.store_socket, pool_size=settings.store_pool_size)
+        return (
+            RemoteTaskRepository(client),
+            RemoteRetrospectiveRepository(client),
+            RemoteTransactionalStore(client),
+            RemoteChangeFeed(client),
+        )
+
+    changes = ChangeLog(settings.change_log_capacity)
+
+    if settings.storage_backend == "memory":
+        if settings.journal_dir is None:
+            tasks = InMemoryTaskRepository(changes=changes)
+            retrospectives = InMemoryRetrospectiveRepository(changes=changes)
+            return (
+                tasks,
+                retrospectives,
+                InMemoryTransactionalStore(tasks, retrospectives),
+                changes,
+            )
+
+        journal = Journal(
+            settings.journal_dir,
+            commit_interval=settings.journal_commit_interval_ms / 1000,
+            snapshot_every=settings.journal_snapshot_every,
+        )
+        tasks, retrospectives = open_journaled_repositories(journal, changes)
+        return (
+            tasks,
+            retrospectives,
+            InMemoryTransactionalStore(tasks, retrospectives, journal),
+            changes,
+        )
+
+    if settings.storage_backend == "compact":
+        compact = CompactTaskRepository(changes=changes)
+        retrospectives = InMemoryRetrospectiveRepository(changes=changes)
+        return (
+            compact,
+            retrospectives,
+            InMemoryTransactionalStore(compact, retrospectives),
+            changes,
+        )
+
+    if settings.storage_backend == "sqlite":
+        pool = SQLiteConnectionPool(
+            settings.sqlite_path, size=settings.sqlite_pool_size
+        )
+        sqlite_tasks = SQLiteTaskRepository(pool, changes)
+        return (
+            sqlite_tasks,
+            SQLiteRetrospectiveRepository(pool, changes),
+            SQLiteTransactionalStore(pool, sqlite_tasks, changes),
+            changes,
+        )
+
+    raise ValueError(f"Unknown storage backend: {settings.storage_backend}")
+
+
+async def close_repositories(store: TransactionalStore) -> None:
+    """``build_repositories`` 가 연 저장소를 닫습니다. 저널은 남은 쓰기를 디스크에
+    내린 뒤 잠금을 풀어 다른 프로세스가 열 수 있게 됩니다."""
+
+    await store.close()
+
+
+def build_history(settings: Settings) -> TransitionHistory | None:
+    """저장소 백엔드에 맞는 상태 전이 기록을 생성합니다.
+
+    영속 저장소(저널, SQLite)는 저장소 옆 파일에 전이를 남겨 재시작해도 이어서
+    기록합니다. ``"remote"`` 는 워커마다 다른 쓰기만 보게 되므로 만들지 않습니다.
+    """
+
+    if settings.storage_backend == "remote":
+        return None
+    if settings.storage_backend == "memory" and settings.journal_dir is not None:
+        return TransitionLog(os.path.join(settings.journal_dir, "transitions"))
+    if settings.storage_backend == "sqlite" and settings.sqlite_path != ":memory:":
+        return TransitionLog(f"{settings.sqlite_path}-transitions")
+    return TransitionLog()
+
+
+__all__ = ["build_history", "build_repositories", "close_repositories"]
@@ -0,0 +1,378 @@
+"""메모리 기반 Task 상태 전이 기록.
+
+전이 한 건은 고정 폭 열(``array``) 여러 개의 같은 위치에 담깁니다. 시각 열은 줄어들지
+않으므로 날짜 구간은 이분 탐색으로 위치 구간이 되고, 지표는 그 구간의 열 조각을
+``array.count`` / ``sorted`` / ``sum`` 같은 C 수준 연산으로 한 번에 집계합니다. 전이마다
+파이썬 객체를 만들거나 훑지 않으므로 전이가 수백만 건이어도 구간 크기에 비례하는 메모리
+복사 정도만 듭니다.
+
+``directory`` 를 주면 두 파일에 기록을 남깁니다 (리틀 엔디언, 8바이트 매직 뒤 고정 폭
+행)::
+
+    tasks.bin       = (<16바이트 Task id> <u8 상태> <i64 시작 시각>)*    Task 번호 순서
+    transitions.bin = (<u32 Task 번호> <u8 이전 상태> <u8 새 상태> <i64 시각>
+                       <i64 사이클> <i32 미완료 수>)*
+
+``transitions.bin`` 은 메모리 열과 같은 값을 덧붙이기만 하고, ``tasks.bin`` 은 Task 별
+현재 상태를 제자리에서 고칩니다. 열 때는 행을 재생하지 않고 필드의 바이트마다 건너뛰기
+슬라이스 한 번으로 열을 옮기므로, 전이 수백만 건도 파이썬 반복 없이 읽습니다. 끝에
+잘린 행은 쓰다가 멈춘 것이므로 잘라 냅니다.
+"""
+
+from __future__ import annotations
+
+import math
+import os
+import struct
+import sys
+import uuid
+from array import array
+from bisect import bisect_left
+from collections.abc import Iterable
+from datetime import date, datetime, time, timedelta
+from typing import BinaryIO
+
+from mypm.domain.tasks.entities import Task, TaskStatus
+from mypm.domain.tasks.history import CycleTimeStats, DailyCount
+from mypm.domain.tasks.repositories import TransitionHistory
+
+_CODES = {status: code for code, status in enumerate(TaskStatus)}
+# 생성 전과 삭제 뒤의 상태
+_NO_STATUS = 255
+_IN_PROGRESS = _CODES[TaskStatus.IN_PROGRESS]
+_DONE = _CODES[TaskStatus.DONE]
+# 상태 코드 -> 미완료(번다운에 남는 Task)면 1
+_IS_OPEN = bytes(1 if code not in (_DONE, _NO_STATUS) else 0 for code in range(256))
+
+# 사이클 타임 열에서 완료 전이가 아닌 위치와 시작을 기록하지 못한 완료
+_NOT_DONE = -1
+_NO_START = -2
+_NOT_STARTED = -1
+
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+_MAGIC = b"MYPMHST1"
+# Task id, 현재 상태, 시작 시각
+_TASK_ROW = struct.Struct("<16sBq")
+# 전이 행의 (열 속성, 형식 문자). 파일의 필드 순서입니다.
+_ROW_FIELDS = (
+    ("_task", "I"),
+    ("_from", "B"),
+    ("_to", "B"),
+    ("_at", "q"),
+    ("_cycle", "q"),
+    ("_open", "i"),
+)
+_ROW = struct.Struct("<" + "".join(code for _, code in _ROW_FIELDS))
+
+_new_object = object.__new__
+_set_attribute = object.__setattr__
+
+
+def _uuid(raw: bytes) -> uuid.UUID:
+    # 열 때 Task 마다 호출되므로 UUID.__init__ 의 인자 검증을 건너뜁니다.
+    value = _new_object(uuid.UUID)
+    _set_attribute(value, "int", int.from_bytes(raw))
+    _set_attribute(value, "is_safe", uuid.SafeUUID.unknown)
+    return value
+
+
+def _micros(moment: datetime) -> int:
+    """UTC 기준(naive) 시각을 에포크부터의 마이크로초로 바꿉니다."""
+
+    return (moment - _EPOCH) // _MICROSECOND
+
+
+class TransitionLog(TransitionHistory):
+    """Task 상태 전이를 열 배열에 추가만 하는 기록.
+
+    Task 는 처음 볼 때 순서대로 번호(``I``)를 받고, 전이 한 건은 다음 열의 한
+    위치입니다.
+
+    - ``task`` (``I``), ``from`` / ``to`` (``B``, 상태 코드), ``at`` (``q``, 마이크로초)
+    - ``cycle`` (``q``): 완료 전이면 처음 진행 중이 된 때부터의 마이크로초
+    - ``open`` (``i``): 이 전이 직후의 미완료 Task 수
+
+    파생 열은 기록할 때 Task 별 현재 상태와 시작 시각(번호로 찾는 ``array``)으로 O(1) 에
+    계산해 두므로, 조회는 Task 단위로 전이를 이어 붙이지 않습니다. 진행 중에서 막힘이나
+    할 일로 돌아가도 사이클은 이어지고, 완료나 삭제에서 끝납니다. 다시 연 Task 는 새
+    사이클을 시작합니다.
+
+    ``directory`` 가 없으면 프로세스 안에만 있으므로 재시작하면 ``seed`` 로 현재
+    상태부터 다시 쌓습니다. 있으면 그 디렉터리의 파일에서 이어서 기록합니다. 호출마다
+    파일에 쓰므로 프로세스가 죽어도 남지만 ``fsync`` 는 하지 않습니다. 전이 한 건은
+    메모리와 파일 모두 26바이트이며 버리지 않습니다.
+    """
+
+    def __init__(self, directory: str | None = None) -> None:
+        self._ids: dict[uuid.UUID, int] = {}
+        self._status = array("B")
+        self._started = array("q")
+        self._task = array("I")
+        self._from = array("B")
+        self._to = array("B")
+        self._at = array("q")
+        self._cycle = array("q")
+        self._open = array("i")
+        self._open_now = 0
+        self._seed_open = 0
+        self._last_at = -(1 << 63)
+        # 파일에 남길 때만 씁니다: Task 번호 -> id 바이트, 파일에 아직 쓰지 않은 Task
+        # 번호와 전이 행
+        self._id_bytes: list[bytes] = []
+        self._dirty: set[int] | None = None
+        self._rows: list[bytes] = []
+        self._files: tuple[BinaryIO, BinaryIO] | None = None
+        if directory is not None:
+            self._load(directory)
+            self._dirty = set()
+
+    def __len__(self) -> int:
+        return len(self._task)
+
+    def seed(self, tasks: Iterable[Task]) -> None:
+        dirty = self._dirty
+        for task in tasks:
+            index = self._index(task.id)
+            code = _CODES[task.status]
+            before = self._status[index]
+            if before != code:
+                self._open_now += _IS_OPEN[code] - _IS_OPEN[before]
+                self._status[index] = code
+                if dirty is not None:
+                    dirty.add(index)
+        if not self._task:
+            self._seed_open = self._open_now
+        self._flush()
+
+    def record(self, tasks: Iterable[Task]) -> None:
+        for task in tasks:
+            self._append(
+                self._index(task.id), _CODES[task.status], _micros(task.updated_at)
+            )
+        self._flush()
+
+    def record_deletes(self, task_ids: Iterable[uuid.UUID], at: datetime) -> None:
+        moment = _micros(at)
+        for task_id in task_ids:
+            index = self._ids.get(task_id)
+            if index is not None:
+                self._append(index, _NO_STATUS, moment)
+        self._flush()
+
+    def close(self) -> None:
+        if self._files is not None:
+            for file in self._files:
+                file.close()
+            self._files = self._dirty = None
+
+    async def cycle_times(
+        self, start: date, end: date, percentiles: Iterable[int]
+    ) -> CycleTimeStats:
+        lo, hi = self._position(start), self._position(end + timedelta(days=1))
+        cycles = self._cycle[lo:hi]
+        unmeasured = cycles.count(_NO_START)
+        measured = sorted(filter(_NOT_DONE.__lt__, cycles))
+        count = len(measured)
+        if not count:
+            return CycleTimeStats(count=0, unmeasured=unmeasured)
+
+        return CycleTimeStats(
+            count=count,
+            unmeasured=unmeasured,
+            mean=timedelta(microseconds=sum(measured) / count),
+            percentiles={
+                percentile: timedelta(
+                    microseconds=measured[
+                        max(math.ceil(percentile * count / 100), 1) - 1
+                    ]
+                )
+                for percentile in percentiles
+            },
+        )
+
+    async def throughput(self, start: date, end: date) -> list[DailyCount]:
+        days, cuts = self._days(start, end)
+        done = self._to[cuts[0] : cuts[-1]]
+        base = cuts[0]
+        return [
+            DailyCount(day=day, count=done[lo - base : hi - base].count(_DONE))
+            for day, lo, hi in zip(days, cuts, cuts[1:])
+        ]
+
+    async def burndown(self, start: date, end: date) -> list[DailyCount]:
+        days, cuts = self._days(start, end)
+        remaining = self._open
+        return [
+            DailyCount(day=day, count=remaining[hi - 1] if hi else self._seed_open)
+            for day, hi in zip(days, cuts[1:])
+        ]
+
+    def _index(self, task_id: uuid.UUID) -> int:
+        index = self._ids.get(task_id)
+        if index is None:
+            index = self._ids[task_id] = len(self._status)
+            self._status.append(_NO_STATUS)
+            self._started.append(_NOT_STARTED)
+            if self._dirty is not None:
+                self._id_bytes.append(task_id.bytes)
+                self._dirty.add(index)
+        return index
+
+    def _load(self, directory: str) -> None:
+        """파일의 기록을 열로 옮기고 이어서 쓸 수 있게 엽니다."""
+
+        os.makedirs(directory, exist_ok=True)
+        tasks_file, tasks = _open_rows(
+            os.path.join(directory, "tasks.bin"), _TASK_ROW.size
+        )
+        try:
+            rows_file, rows = _open_rows(
+                os.path.join(directory, "transitions.bin"), _ROW.size
+            )
+        except BaseException:
+            tasks_file.close()
+            raise
+        self._files = tasks_file, rows_file
+        try:
+            self._restore(tasks, rows)
+        except BaseException:
+            self.close()
+            raise
+
+    def _restore(self, tasks: bytes, rows: bytes) -> None:
+        size = _TASK_ROW.size
+        self._id_bytes = [
+            tasks[offset : offset + 16] for offset in range(0, len(tasks), size)
+        ]
+        self._ids = {_uuid(raw): index for index, raw in enumerate(self._id_bytes)}
+        self._status = _column(tasks, size, 16, "B")
+        self._started = _column(tasks, size, 17, "q")
+
+        offset = 0
+        for name, code in _ROW_FIELDS:
+            setattr(self, name, _column(rows, _ROW.size, offset, code))
+            offset += struct.calcsize(code)
+        if self._task and max(self._task) >= len(self._id_bytes):
+            raise ValueError("Transition history refers to unknown tasks")
+
+        # 미완료 수는 열 때 상태 열에서 다시 세고, 기준선은 첫 전이 직전의 값입니다.
+        self._open_now = self._status.tobytes().translate(_IS_OPEN).count(1)
+        if self._task:
+            self._seed_open = self._open[0] - (
+                _IS_OPEN[self._to[0]] - _IS_OPEN[self._from[0]]
+            )
+            self._last_at = self._at[-1]
+        else:
+            self._seed_open = self._open_now
+
+    def _flush(self) -> None:
+        """바뀐 Task 행을 먼저 쓰고 전이 행을 덧붙입니다. 전이 행이 가리키는 Task 는
+        항상 파일에 먼저 있습니다. 연속한 Task 번호는 한 번에 씁니다."""
+
+        if self._files is None or not self._dirty:
+            return
+        tasks_file, rows_file = self._files
+        indexes = sorted(self._dirty)
+        self._dirty.clear()
+        start = 0
+        for end in range(1, len(indexes) + 1):
+            if end < len(indexes) and indexes[end] == indexes[end - 1] + 1:
+                continue
+            tasks_file.seek(len(_MAGIC) + indexes[start] * _TASK_ROW.size)
+            tasks_file.write(
+                b"".join(
+                    _TASK_ROW.pack(
+                        self._id_bytes[index], self._status[index], self._started[index]
+                    )
+                    for index in indexes[start:end]
+                )
+            )
+            start = end
+        if self._rows:
+            rows_file.write(b"".join(self._rows))
+            self._rows.clear()
+
+    def _append(self, index: int, code: int, moment: int) -> None:
+        before = self._status[index]
+        if before == code:
+            return
+
+        moment = self._last_at = max(moment, self._last_at)
+        started = self._started[index]
+        cycle = _NOT_DONE
+        if code == _IN_PROGRESS and started == _NOT_STARTED:
+            self._started[index] = moment
+        elif code == _DONE or code == _NO_STATUS:
+            if code == _DONE:
+                cycle = _NO_START if started == _NOT_STARTED else moment - started
+            self._started[index] = _NOT_STARTED
+
+        self._open_now += _IS_OPEN[code] - _IS_OPEN[before]
+        self._status[index] = code
+        self._task.append(index)
+        self._from.append(before)
+        self._to.append(code)
+        self._at.append(moment)
+        self._cycle.append(cycle)
+        self._open.append(self._open_now)
+        if self._dirty is not None:
+            self._dirty.add(index)
+            self._rows.append(
+                _ROW.pack(index, before, code, moment, cycle, self._open_now)
+            )
+
+    def _position(self, day: date) -> int:
+        """``day`` 0시(UTC) 이후 첫 전이의 위치."""
+
+        return bisect_left(self._at, _micros(datetime.combine(day, time.min)))
+
+    def _days(self, start: date, end: date) -> tuple[list[date], list[int]]:
+        """구간의 날짜 목록과 각 날짜의 시작 위치, 마지막 날 다음 날의 시작 위치."""
+
+        days = [
+            start + timedelta(days=offset) for offset in range((end - start).days + 1)
+        ]
+        cuts = [self._position(day) for day in days]
+        cuts.append(self._position(end + timedelta(days=1)))
+        return days, cuts
+
+
+def _open_rows(path: str, size: int) -> tuple[BinaryIO, bytes]:
+    """버퍼 없이 읽기/쓰기로 열고 매직 뒤의 온전한 행을 읽습니다. 끝에 잘린 행은 잘라
+    내고 파일 끝에서 돌려줍니다."""
+
+    file = open(os.open(path, os.O_RDWR | os.O_CREAT, 0o644), "r+b", buffering=0)
+    try:
+        data = file.read()
+        if not data:
+            file.write(_MAGIC)
+            data = _MAGIC
+        elif not data.startswith(_MAGIC):
+            raise ValueError(f"Not a transition history file: {path}")
+        end = len(data) - (len(data) - len(_MAGIC)) % size
+        if end != len(data):
+            file.truncate(end)
+        file.seek(end)
+    except BaseException:
+        file.close()
+        raise
+    return file, data[len(_MAGIC) : end]
+
+
+def _column(rows: bytes, size: int, offset: int, code: str) -> array:
+    """``size`` 바이트 행들에서 ``offset`` 의 필드 하나를 열로 옮깁니다."""
+
+    column = array(code)
+    width = column.itemsize
+    packed = bytearray(len(rows) // size * width)
+    for byte in range(width):
+        packed[byte::width] = rows[offset + byte :: size]
+    column.frombytes(packed)
+    if sys.byteorder == "big":
+        column.byteswap()
+    return column
+
+
+__all__ = ["TransitionLog"]
@@ -0,0 +1,364 @@
+"""Task 리포지토리 보조 인덱스."""
+
+from __future__ import annotations
+
+import sys
+import uuid
+from bisect import bisect_left, bisect_right, insort
+from collections.abc import Iterable, Iterator
+from datetime import date, datetime, timedelta
+from itertools import accumulate
+from typing import Self
+
+from mypm.domain.tasks.entities import Task
+from mypm.domain.tasks.queries import TaskKeyset, TaskSortField, fold_text
+
+# (정렬 값 정수, Task ID 정수, Task ID). 비교가 datetime/UUID 의 파이썬 레벨 비교 대신
+# 정수 비교에서 끝나도록 값을 정수로 바꿉니다.
+SortKey = tuple[int, int, uuid.UUID]
+# (정규화한 문자열, Task ID 정수, Task ID). 접두어 조회용입니다.
+TextKey = tuple[str, int, uuid.UUID]
+
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+# 값이 없는 키는 오름차순 기준 가장 뒤에 위치합니다.
+_NULL_RANK = 1 << 62
+
+
+def sort_rank(value: datetime | date | None) -> int:
+    if value is None:
+        return _NULL_RANK
+    if isinstance(value, datetime):
+        return (value - _EPOCH) // _MICROSECOND
+
+    return value.toordinal()
+
+
+def make_sort_key(value: datetime | date | None, task_id: uuid.UUID) -> SortKey:
+    return (sort_rank(value), task_id.int, task_id)
+
+
+def rank_bounds(
+    after: datetime | date | None, before: datetime | date | None
+) -> tuple[int, int]:
+    """``after < 값 < before`` 에 해당하는 포함 범위 (하한, 상한) 정렬 값.
+
+    값이 없는 키는 항상 범위 밖입니다.
+    """
+
+    low = sort_rank(after) + 1 if after is not None else 0
+    high = sort_rank(before) - 1 if before is not None else _NULL_RANK - 1
+    return low, high
+
+
+def due_rank_bounds(due_after: date | None, due_before: date | None) -> tuple[int, int]:
+    """``due_after < due_date < due_before`` 에 해당하는 포함 범위 (하한, 상한) 정렬 값.
+
+    마감일이 없는 Task 는 항상 범위 밖입니다.
+    """
+
+    return rank_bounds(due_after, due_before)
+
+
+def task_sort_key(task: Task, field: TaskSortField) -> SortKey:
+    return make_sort_key(getattr(task, field.value), task.id)
+
+
+def keyset_sort_key(keyset: TaskKeyset) -> SortKey:
+    return make_sort_key(keyset.value, keyset.task_id)
+
+
+def title_key(task: Task) -> TextKey:
+    return (fold_text(task.title), task.id.int, task.id)
+
+
+# 일괄 작업의 키가 이보다 적으면 키마다 ``insort`` / ``del`` 로 처리합니다.
+_SPLICE_MIN = 8
+# 한 조각에 들어갈 새 키가 조각 크기의 이 분의 1 보다 적으면 키마다 ``insort`` 로
+# 넣고, 많으면 이어 붙여 정렬합니다.
+_MERGE_RATIO = 8
+# 조각의 기준 크기. 조각이 두 배를 넘으면 이 크기로 나눕니다.
+_CHUNK_SIZE = 512
+
+# (조각 번호, 조각 안 위치). 끝은 (조각 수, 0) 입니다.
+_Position = tuple[int, int]
+
+
+class SortedKeyIndex:
+    """정렬된 키 목록을 조각(chunk) 리스트로 나눠 유지하는 인덱스.
+
+    조각마다 마지막 키를 ``_maxes`` 에 두고 조각을 이진 탐색으로 찾은 뒤 조각 안에서
+    다시 이진 탐색합니다. 삽입/삭제는 조각 하나 안의 리스트 이동이고, 범위 조회는
+    O(log n + k) 입니다.
+
+    ``copy()`` 는 조각 목록만 복사하고 조각은 공유합니다(O(n / 조각 크기)). 양쪽 모두
+    공유 중인 조각은 처음 바꿀 때 복사하므로, 고정된 뷰가 있어도 쓰기는 건드린 조각만
+    복사합니다.
+    """
+
+    __slots__ = ("_chunks", "_maxes", "_owned", "_offsets", "_len")
+
+    def __init__(self, keys: Iterable[SortKey] = ()) -> None:
+        ordered = sorted(keys)
+        self._chunks: list[list[SortKey]] = _split(ordered)
+        self._maxes: list[SortKey] = [chunk[-1] for chunk in self._chunks]
+        # 조각별로 이 인덱스만 갖고 있으면 True. None 이면 복사한 적이 없어 모두 제
+        # 것입니다.
+        self._owned: list[bool] | None = None
+        # 조각별 시작 위치(마지막은 전체 길이). 바꿀 때 버리고 셀 때 다시 만듭니다.
+        self._offsets: list[int] | None = None
+        self._len = len(ordered)
+
+    def __len__(self) -> int:
+        return self._len
+
+    def copy(self) -> Self:
+        clone = object.__new__(type(self))
+        clone._chunks = self._chunks.copy()
+        clone._maxes = self._maxes.copy()
+        clone._offsets = self._offsets
+        clone._len = self._len
+        clone._owned = [False] * len(self._chunks)
+        self._owned = [False] * len(self._chunks)
+        return clone
+
+    def insert(self, key: SortKey) -> None:
+        if not self._chunks:
+            self._replace(0, 0, [[key]])
+            self._len = 1
+            return
+
+        position = min(bisect_left(self._maxes, key), len(self._maxes) - 1)
+        chunk = self._writable(position)
+        insort(chunk, key)
+        self._len += 1
+        if len(chunk) > 2 * _CHUNK_SIZE:
+            self._replace(position, position + 1, _split(chunk))
+        else:
+            self._maxes[position] = chunk[-1]
+
+    def remove(self, key: SortKey) -> None:
+        position = bisect_left(self._maxes, key)
+        if position < len(self._maxes):
+            self._discard(position, [key])
+
+    def insert_many(self, keys: list[SortKey]) -> None:
+        """여러 키를 한 번에 삽입합니다.
+
+        새 키를 정렬해 들어갈 조각별로 나누고, 조각마다 기존 키와 이어 붙여 정렬(정렬된
+        두 구간의 병합)한 뒤 너무 커진 조각을 나눕니다. 비교는 O(k log n) 번이고 복사는
+        건드린 조각만큼이며, 모든 키가 끝에 붙는 경우(생성 시각 등)는 O(k) 입니다.
+        """
+
+        if len(keys) < _SPLICE_MIN:
+            for key in keys:
+                self.insert(key)
+            return
+
+        added = sorted(keys)
+        # 뒤쪽 조각부터 바꿔야 앞쪽 조각 번호가 그대로입니다.
+        for position, start, end in reversed(self._group(added, tail=True)):
+            group = added[start:end]
+            if position == len(self._chunks):
+                merged = group
+                stop = position
+            elif len(group) * _MERGE_RATIO < len(self._chunks[position]):
+                merged = self._writable(position)
+                for key in group:
+                    insort(merged, key)
+                stop = position + 1
+            else:
+                merged = self._chunks[position] + group
+                merged.sort()
+                stop = position + 1
+            if len(merged) > 2 * _CHUNK_SIZE or stop == position:
+                self._replace(position, stop, _split(merged))
+            else:
+                self._replace(position, stop, [merged])
+        self._len += len(added)
+
+    def remove_many(self, keys: list[SortKey]) -> None:
+        """여러 키를 한 번에 삭제합니다. 조각별로 나눠 조각마다 한 번만 복사합니다."""
+
+        removed = sorted(keys)
+        for position, start, end in reversed(self._group(removed, tail=False)):
+            self._discard(position, removed[start:end])
+
+    def iter_range(
+        self, low: int, high: int, after: SortKey | None = None
+    ) -> Iterator[SortKey]:
+        """정렬 값이 ``low`` 이상 ``high`` 이하인 키를 오름차순으로 순회합니다. O(log n
+        + k)."""
+
+        start = self._locate((low,))
+        if after is not None:
+            start = max(start, self._locate(after, right=True))
+        return self._iter_between(start, self._locate((high + 1,)))
+
+    def count_range(self, low: int, high: int) -> int:
+        """정렬 값이 ``low`` 이상 ``high`` 이하인 키의 수. O(log n) 이며, 바뀐 뒤 처음
+        셀 때만 조각 수만큼 더 듭니다."""
+
+        return self._count_between(self._locate((low,)), self._locate((high + 1,)))
+
+    def iter_from(
+        self, after: SortKey | None = None, *, descending: bool = False
+    ) -> Iterator[SortKey]:
+        """``after`` 를 제외한 다음 위치부터 키를 순회합니다."""
+
+        end = (len(self._chunks), 0)
+        if descending:
+            return self._iter_reversed(end if after is None else self._locate(after))
+
+        start = (0, 0) if after is None else self._locate(after, right=True)
+        return self._iter_between(start, end)
+
+    def _locate(self, key: tuple, *, right: bool = False) -> _Position:
+        """``bisect_left`` (``right`` 면 ``bisect_right``) 위치를 조각 좌표로
+        반환합니다."""
+
+        find = bisect_right if right else bisect_left
+        position = find(self._maxes, key)
+        if position == len(self._chunks):
+            return position, 0
+        return position, find(self._chunks[position], key)
+
+    def _iter_between(self, start: _Position, end: _Position) -> Iterator[SortKey]:
+        if start >= end:
+            return
+        (first, offset), (last, stop) = start, end
+        chunks = self._chunks
+        if first == last:
+            yield from chunks[first][offset:stop]
+            return
+
+        yield from chunks[first][offset:]
+        for position in range(first + 1, last):
+            yield from chunks[position]
+        if stop:
+            yield from chunks[last][:stop]
+
+    def _iter_reversed(self, end: _Position) -> Iterator[SortKey]:
+        last, stop = end
+        chunks = self._chunks
+        if stop:
+            yield from reversed(chunks[last][:stop])
+        for position in range(last - 1, -1, -1):
+            yield from reversed(chunks[position])
+
+    def _count_between(self, start: _Position, end: _Position) -> int:
+        if start >= end:
+            return 0
+        (first, offset), (last, stop) = start, end
+        offsets = self._offsets
+        if offsets is None:
+            offsets = self._offsets = [0, *accumulate(map(len, self._chunks))]
+        return offsets[last] + stop - offsets[first] - offset
+
+    def _group(self, keys: list[SortKey], *, tail: bool) -> list[tuple[int, int, int]]:
+        """정렬된 ``keys`` 를 (조각 번호, 시작, 끝) 구간으로 나눕니다.
+
+        마지막 조각의 최댓값보다 큰 키는 ``tail`` 이면 마지막 조각(조각이 없으면 새 조각
+        번호 0)에 넣고, 아니면 버립니다.
+        """
+
+        maxes = self._maxes
+        groups = []
+        start = 0
+        while start < len(keys):
+            position = bisect_left(maxes, keys[start])
+            if position >= len(maxes) - 1:
+                if position == len(maxes) and not tail:
+                    break
+                position = max(len(maxes) - 1, 0)
+                end = len(keys) if tail else bisect_right(keys, maxes[position], start)
+            else:
+                end = bisect_right(keys, maxes[position], start)
+            groups.append((position, start, end))
+            start = end
+        return groups
+
+    def _discard(self, position: int, keys: list[SortKey]) -> None:
+        """조각 ``position`` 에서 ``keys`` 중 있는 것을 지웁니다."""
+
+        chunk = self._chunks[position]
+        # 같은 키가 여러 번 와도 한 번만 지웁니다.
+        indexes = dict.fromkeys(
+            index
+            for key in keys
+            if (index := bisect_left(chunk, key)) < len(chunk) and chunk[index] == key
+        )
+        if not indexes:
+            return
+
+        chunk = self._writable(position)
+        for index in reversed(indexes):
+            del chunk[index]
+        self._len -= len(indexes)
+        if chunk:
+            self._maxes[position] = chunk[-1]
+        else:
+            self._replace(position, position + 1, [])
+
+    def _writable(self, position: int) -> list[SortKey]:
+        """조각 ``position`` 을 바꿀 수 있게 반환합니다. 공유 중이면 복사합니다."""
+
+        self._offsets = None
+        chunk = self._chunks[position]
+        owned = self._owned
+        if owned is not None and not owned[position]:
+            chunk = self._chunks[position] = chunk.copy()
+            owned[position] = True
+        return chunk
+
+    def _replace(self, start: int, stop: int, chunks: list[list[SortKey]]) -> None:
+        """조각 ``start:stop`` 을 새로 만든 ``chunks`` 로 바꿉니다."""
+
+        self._offsets = None
+        self._chunks[start:stop] = chunks
+        self._maxes[start:stop] = [chunk[-1] for chunk in chunks]
+        if self._owned is not None:
+            self._owned[start:stop] = [True] * len(chunks)
+
+
+def _split(keys: list[SortKey]) -> list[list[SortKey]]:
+    if len(keys) <= 2 * _CHUNK_SIZE:
+        return [keys] if keys else []
+    return [
+        keys[start : start + _CHUNK_SIZE] for start in range(0, len(keys), _CHUNK_SIZE)
+    ]
+
+
+class PrefixIndex(SortedKeyIndex):
+    """정규화한 문자열 키(``TextKey``)의 정렬 인덱스. 접두어가 같은 키는 한 구간에
+    모입니다."""
+
+    __slots__ = ()
+
+    def iter_prefix(self, prefix: str) -> Iterator[TextKey]:
+        """``prefix`` 로 시작하는 키를 순회합니다. O(log n + k)."""
+
+        return self._iter_between(*self._prefix_bounds(prefix))
+
+    def count_prefix(self, prefix: str) -> int:
+        return self._count_between(*self._prefix_bounds(prefix))
+
+    def _prefix_bounds(self, prefix: str) -> tuple[_Position, _Position]:
+        # U+10FFFF 는 비문자(noncharacter)라 제목에 나오지 않으므로 접두어 구간의
+        # 상한으로 씁니다.
+        return self._locate((prefix,)), self._locate((prefix + chr(sys.maxunicode),))
+
+
+__all__ = [
+    "PrefixIndex",
+    "SortKey",
+    "SortedKeyIndex",
+    "TextKey",
+    "due_rank_bounds",
+    "keyset_sort_key",
+    "make_sort_key",
+    "rank_bounds",
+    "sort_rank",
+    "task_sort_key",
+    "title_key",
+]
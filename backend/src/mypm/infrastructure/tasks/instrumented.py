@@ -0,0 +1,195 @@
+"""호출마다 지연을 기록하는 리포지토리 래퍼."""
+
+from __future__ import annotations
+
+import time
+import uuid
+from datetime import date
+from typing import Any
+
+from mypm.core.metrics import Histogram, MetricsRegistry
+from mypm.domain.tasks.entities import Retrospective, Task, TaskStatus
+from mypm.domain.tasks.queries import (
+    TaskFilter,
+    TaskKeyset,
+    TaskQueryResult,
+    TaskSearchResult,
+    TaskSortField,
+)
+from mypm.domain.tasks.repositories import RetrospectiveRepository, TaskRepository
+from mypm.domain.tasks.stats import TaskStats
+
+
+def repository_histogram(registry: MetricsRegistry) -> Histogram:
+    return registry.histogram(
+        "mypm_repository_call_duration_seconds",
+        "Latency of repository method calls.",
+        ("repository", "method", "outcome"),
+    )
+
+
+class _Timed:
+    """감싼 리포지토리 메서드를 호출하고 (리포지토리, 메서드, 결과) 라벨로 지연을
+    기록합니다."""
+
+    _repository = ""
+
+    def __init__(self, inner: Any, histogram: Histogram) -> None:
+        self._inner = inner
+        self._histogram = histogram
+
+    async def _call(self, method: str, *args: Any, **kwargs: Any) -> Any:
+        started = time.perf_counter()
+        outcome = "error"
+        try:
+            result = await getattr(self._inner, method)(*args, **kwargs)
+            outcome = "ok"
+            return result
+        finally:
+            self._histogram.observe(
+                (self._repository, method, outcome), time.perf_counter() - started
+            )
+
+
+class InstrumentedTaskRepository(_Timed, TaskRepository):
+    _repository = "tasks"
+
+    def __init__(self, inner: TaskRepository, histogram: Histogram) -> None:
+        super().__init__(inner, histogram)
+
+    def pin(self) -> TaskRepository:
+        return InstrumentedTaskRepository(self._inner.pin(), self._histogram)
+
+    async def add(self, task: Task) -> Task:
+        return await self._call("add", task)
+
+    async def add_many(self, tasks: list[Task]) -> list[Task]:
+        return await self._call("add_many", tasks)
+
+    async def get(self, task_id: uuid.UUID) -> Task | None:
+        return await self._call("get", task_id)
+
+    async def get_many(self, task_ids: list[uuid.UUID]) -> dict[uuid.UUID, Task]:
+        return await self._call("get_many", task_ids)
+
+    async def list_by_status(self, status: str | None = None) -> list[Task]:
+        return await self._call("list_by_status", status)
+
+    async def list_page(
+        self,
+        *,
+        status: str | None = None,
+        order_by: TaskSortField = TaskSortField.CREATED_AT,
+        descending: bool = False,
+        after: TaskKeyset | None = None,
+        limit: int | None = None,
+    ) -> list[Task]:
+        return await self._call(
+            "list_page",
+            status=status,
+            order_by=order_by,
+            descending=descending,
+            after=after,
+            limit=limit,
+        )
+
+    async def list_by_due_range(
+        self,
+        *,
+        due_after: date | None = None,
+        due_before: date | None = None,
+        status: str | None = None,
+        after: TaskKeyset | None = None,
+        limit: int | None = None,
+    ) -> list[Task]:
+        return await self._call(
+            "list_by_due_range",
+            due_after=due_after,
+            due_before=due_before,
+            status=status,
+            after=after,
+            limit=limit,
+        )
+
+    async def query(
+        self,
+        task_filter: TaskFilter,
+        *,
+        order_by: TaskSortField = TaskSortField.CREATED_AT,
+        descending: bool = False,
+        after: TaskKeyset | None = None,
+        limit: int | None = None,
+        explain: bool = False,
+    ) -> TaskQueryResult:
+        return await self._call(
+            "query",
+            task_filter,
+            order_by=order_by,
+            descending=descending,
+            after=after,
+            limit=limit,
+            explain=explain,
+        )
+
+    async def search(
+        self, query: str, *, limit: int = 20, offset: int = 0
+    ) -> TaskSearchResult:
+        return await self._call("search", query, limit=limit, offset=offset)
+
+    async def count_by_retrospective(
+        self, retrospective_ids: list[uuid.UUID]
+    ) -> dict[uuid.UUID, dict[TaskStatus, int]]:
+        return await self._call("count_by_retrospective", retrospective_ids)
+
+    async def stats(self, today: date) -> TaskStats:
+        return await self._call("stats", today)
+
+    async def update(self, task: Task) -> Task:
+        return await self._call("update", task)
+
+    async def update_many(self, tasks: list[Task]) -> list[Task]:
+        return await self._call("update_many", tasks)
+
+    async def delete(self, task_id: uuid.UUID) -> None:
+        return await self._call("delete", task_id)
+
+    async def delete_many(self, task_ids: list[uuid.UUID]) -> list[uuid.UUID]:
+        return await self._call("delete_many", task_ids)
+
+    async def version(self, status: str | None = None) -> int:
+        return await self._call("version", status)
+
+
+class InstrumentedRetrospectiveRepository(_Timed, RetrospectiveRepository):
+    _repository = "retrospectives"
+
+    def __init__(self, inner: RetrospectiveRepository, histogram: Histogram) -> None:
+        super().__init__(inner, histogram)
+
+    def pin(self) -> RetrospectiveRepository:
+        return InstrumentedRetrospectiveRepository(self._inner.pin(), self._histogram)
+
+    async def add(self, retrospective: Retrospective) -> Retrospective:
+        return await self._call("add", retrospective)
+
+    async def get_by_date(self, retrospective_date: date) -> Retrospective | None:
+        return await self._call("get_by_date", retrospective_date)
+
+    async def get(self, retrospective_id: uuid.UUID) -> Retrospective | None:
+        return await self._call("get", retrospective_id)
+
+    async def list_by_date_range(self, start: date, end: date) -> list[Retrospective]:
+        return await self._call("list_by_date_range", start, end)
+
+    async def update(self, retrospective: Retrospective) -> Retrospective:
+        return await self._call("update", retrospective)
+
+    async def version(self) -> int:
+        return await self._call("version")
+
+
+__all__ = [
+    "InstrumentedRetrospectiveRepository",
+    "InstrumentedTaskRepository",
+    "repository_histogram",
+]
@@ -0,0 +1,605 @@
+"""메모리 리포지토리용 추가 전용 저널과 스냅샷.
+
+레코드 형식 (리틀 엔디언)::
+
+    frame   = <u32 payload 길이> <u32 crc32(payload)> payload
+    payload = <u8 op> body
+    batch   = <u8 OP_BATCH> (<u32 길이> payload)*
+
+저널 세그먼트(``journal-NNNNNNNN.log``)와 스냅샷(``snapshot-NNNNNNNN.bin``)은 같은
+프레임 형식을 사용합니다. 스냅샷 N 은 세그먼트 N 이 시작되기 직전의 전체 상태이며,
+복구 시 가장 최근 스냅샷을 mmap 으로 읽은 뒤 N 이상의 세그먼트를 순서대로 재생합니다.
+배치 레코드는 여러 payload 를 하나의 프레임(하나의 crc)에 담으므로 전부 재생되거나
+전혀 재생되지 않습니다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import fcntl
+import mmap
+import os
+import struct
+import uuid
+import zlib
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta
+
+from mypm.domain.tasks.entities import Retrospective, Task, TaskStatus
+
+OP_PUT_TASK = 1
+OP_DELETE_TASK = 2
+OP_PUT_RETROSPECTIVE = 3
+OP_PATCH_TASK = 4
+OP_BATCH = 5
+
+_JOURNAL_MAGIC = b"MYPMJNL1"
+# 한 프로세스만 저널을 열도록 ``recover`` 가 배타 잠금을 잡는 파일
+_LOCK_NAME = "journal.lock"
+_SNAPSHOT_MAGIC = b"MYPMSNP1"
+
+_FRAME = struct.Struct("<II")
+_OP = struct.Struct("<B")
+# id, 상태, 생성/수정 시각(µs), 마감일 서수(0=없음), 회고 연결 여부, 회고 id
+_TASK = struct.Struct("<16sBqqiB16s")
+# id, 바뀐 필드 비트마스크. 뒤에 _PATCH_FIELDS 순서대로 바뀐 필드 값만 이어집니다.
+_PATCH = struct.Struct("<16sB")
+_PATCH_FIELDS = (
+    "status",
+    "due_date",
+    "retrospective_id",
+    "updated_at",
+    "title",
+    "description",
+)
+_STATUS = struct.Struct("<B")
+_ORDINAL = struct.Struct("<i")
+_MICROS = struct.Struct("<q")
+# id, 일자 서수, 생성/수정 시각(µs), 연결된 Task 수
+_RETROSPECTIVE = struct.Struct("<16siqqI")
+_LENGTH = struct.Struct("<i")
+_BATCH_LENGTH = struct.Struct("<I")
+
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+_NO_UUID = bytes(16)
+
+_STATUS_CODES = {status: code for code, status in enumerate(TaskStatus)}
+_STATUSES = list(TaskStatus)
+
+_new_object = object.__new__
+_set_attribute = object.__setattr__
+
+
+def _uuid(raw: bytes | memoryview) -> uuid.UUID:
+    # 복구 시 수백만 번 호출되므로 UUID.__init__ 의 인자 검증을 건너뜁니다.
+    value = _new_object(uuid.UUID)
+    _set_attribute(value, "int", int.from_bytes(raw))
+    _set_attribute(value, "is_safe", uuid.SafeUUID.unknown)
+    return value
+
+
+def _micros(value: datetime) -> int:
+    return (value - _EPOCH) // _MICROSECOND
+
+
+def _datetime(value: int) -> datetime:
+    return _EPOCH + timedelta(microseconds=value)
+
+
+def _pack_text(value: str | None) -> bytes:
+    if value is None:
+        return _LENGTH.pack(-1)
+
+    encoded = value.encode()
+    return _LENGTH.pack(len(encoded)) + encoded
+
+
+def _unpack_text(buffer: bytes | memoryview, offset: int) -> tuple[str | None, int]:
+    (length,) = _LENGTH.unpack_from(buffer, offset)
+    offset += _LENGTH.size
+    if length < 0:
+        return None, offset
+
+    return bytes(buffer[offset : offset + length]).decode(), offset + length
+
+
+def encode_task(task: Task) -> bytes:
+    retrospective_id = task.retrospective_id
+    return b"".join(
+        (
+            _OP.pack(OP_PUT_TASK),
+            _TASK.pack(
+                task.id.bytes,
+                _STATUS_CODES[task.status],
+                _micros(task.created_at),
+                _micros(task.updated_at),
+                task.due_date.toordinal() if task.due_date is not None else 0,
+                retrospective_id is not None,
+                retrospective_id.bytes if retrospective_id is not None else _NO_UUID,
+            ),
+            _pack_text(task.title),
+            _pack_text(task.description),
+        )
+    )
+
+
+def encode_task_changes(task: Task) -> bytes:
+    """``task.changes`` 에 기록된 필드의 현재 값만 담은 부분 갱신 레코드."""
+
+    changes = task.changes
+    mask = 0
+    parts = []
+    for bit, name in enumerate(_PATCH_FIELDS):
+        if name not in changes:
+            continue
+        mask |= 1 << bit
+        value = getattr(task, name)
+        if name == "status":
+            parts.append(_STATUS.pack(_STATUS_CODES[value]))
+        elif name == "due_date":
+            parts.append(_ORDINAL.pack(value.toordinal() if value is not None else 0))
+        elif name == "retrospective_id":
+            parts.append(value.bytes if value is not None else _NO_UUID)
+        elif name == "updated_at":
+            parts.append(_MICROS.pack(_micros(value)))
+        else:
+            parts.append(_pack_text(value))
+
+    return _OP.pack(OP_PATCH_TASK) + _PATCH.pack(task.id.bytes, mask) + b"".join(parts)
+
+
+def encode_task_delete(task_id: uuid.UUID) -> bytes:
+    return _OP.pack(OP_DELETE_TASK) + task_id.bytes
+
+
+def encode_retrospective(retrospective: Retrospective) -> bytes:
+    return b"".join(
+        (
+            _OP.pack(OP_PUT_RETROSPECTIVE),
+            _RETROSPECTIVE.pack(
+                retrospective.id.bytes,
+                retrospective.date.toordinal(),
+                _micros(retrospective.created_at),
+                _micros(retrospective.updated_at),
+                len(retrospective.tasks),
+            ),
+            b"".join(task_id.bytes for task_id in retrospective.tasks),
+            _pack_text(retrospective.title),
+            _pack_text(retrospective.summary),
+        )
+    )
+
+
+def encode_batch(payloads: list[bytes]) -> bytes:
+    """여러 payload 를 복구 시 전부 또는 전혀 재생되지 않는 하나의 레코드로 묶습니다."""
+
+    return _OP.pack(OP_BATCH) + b"".join(
+        _BATCH_LENGTH.pack(len(payload)) + payload for payload in payloads
+    )
+
+
+def _iter_batch(body: memoryview) -> Iterator[tuple[int, memoryview]]:
+    offset = 0
+    while offset < len(body):
+        (length,) = _BATCH_LENGTH.unpack_from(body, offset)
+        offset += _BATCH_LENGTH.size
+        yield body[offset], body[offset + _OP.size : offset + length]
+        offset += length
+
+
+def _decode_task(buffer: memoryview, offset: int) -> Task:
+    task_id, status, created_at, updated_at, due, has_retro, retro_id = (
+        _TASK.unpack_from(buffer, offset)
+    )
+    title, offset = _unpack_text(buffer, offset + _TASK.size)
+    description, _ = _unpack_text(buffer, offset)
+    return Task(
+        id=_uuid(task_id),
+        title=title or "",
+        description=description,
+        status=_STATUSES[status],
+        due_date=date.fromordinal(due) if due else None,
+        retrospective_id=_uuid(retro_id) if has_retro else None,
+        created_at=_datetime(created_at),
+        updated_at=_datetime(updated_at),
+    )
+
+
+def _apply_task_patch(task: Task, buffer: memoryview) -> None:
+    # 복구 중에는 변경 기록이 필요 없으므로 필드에 바로 대입합니다.
+    _, mask = _PATCH.unpack_from(buffer, 0)
+    offset = _PATCH.size
+    if mask & 1:
+        task.status = _STATUSES[buffer[offset]]
+        offset += _STATUS.size
+    if mask & 2:
+        (due,) = _ORDINAL.unpack_from(buffer, offset)
+        task.due_date = date.fromordinal(due) if due else None
+        offset += _ORDINAL.size
+    if mask & 4:
+        raw = bytes(buffer[offset : offset + 16])
+        task.retrospective_id = _uuid(raw) if raw != _NO_UUID else None
+        offset += 16
+    if mask & 8:
+        (updated_at,) = _MICROS.unpack_from(buffer, offset)
+        task.updated_at = _datetime(updated_at)
+        offset += _MICROS.size
+    if mask & 16:
+        title, offset = _unpack_text(buffer, offset)
+        task.title = title or ""
+    if mask & 32:
+        task.description, offset = _unpack_text(buffer, offset)
+
+
+def _decode_retrospective(buffer: memoryview, offset: int) -> Retrospective:
+    retro_id, ordinal, created_at, updated_at, count = _RETROSPECTIVE.unpack_from(
+        buffer, offset
+    )
+    offset += _RETROSPECTIVE.size
+    tasks = [
+        _uuid(buffer[offset + 16 * i : offset + 16 * (i + 1)]) for i in range(count)
+    ]
+    title, offset = _unpack_text(buffer, offset + 16 * count)
+    summary, _ = _unpack_text(buffer, offset)
+    return Retrospective(
+        id=_uuid(retro_id),
+        title=title or "",
+        summary=summary,
+        date=date.fromordinal(ordinal),
+        tasks=tasks,
+        created_at=_datetime(created_at),
+        updated_at=_datetime(updated_at),
+    )
+
+
+def _frame(payload: bytes) -> bytes:
+    return _FRAME.pack(len(payload), zlib.crc32(payload)) + payload
+
+
+def _iter_payloads(
+    buffer: memoryview, magic: bytes
+) -> Iterator[tuple[int, memoryview]]:
+    """(op, body) 를 순회합니다. 잘리거나 손상된 꼬리 레코드에서 멈춥니다."""
+
+    if bytes(buffer[: len(magic)]) != magic:
+        return
+
+    offset = len(magic)
+    end = len(buffer)
+    while offset + _FRAME.size <= end:
+        length, checksum = _FRAME.unpack_from(buffer, offset)
+        start = offset + _FRAME.size
+        if length < _OP.size or start + length > end:
+            return
+
+        payload = buffer[start : start + length]
+        if zlib.crc32(payload) != checksum:
+            return
+
+        yield payload[0], payload[_OP.size :]
+        offset = start + length
+
+
+class RecoveredState:
+    """복구된 엔티티 모음."""
+
+    __slots__ = ("tasks", "retrospectives")
+
+    def __init__(self) -> None:
+        self.tasks: dict[uuid.UUID, Task] = {}
+        self.retrospectives: dict[uuid.UUID, Retrospective] = {}
+
+    def apply(self, op: int, body: memoryview) -> None:
+        if op == OP_PUT_TASK:
+            task = _decode_task(body, 0)
+            self.tasks[task.id] = task
+        elif op == OP_PATCH_TASK:
+            task = self.tasks.get(_uuid(body[:16]))
+            if task is not None:
+                _apply_task_patch(task, body)
+        elif op == OP_DELETE_TASK:
+            self.tasks.pop(_uuid(body[:16]), None)
+        elif op == OP_PUT_RETROSPECTIVE:
+            retrospective = _decode_retrospective(body, 0)
+            self.retrospectives[retrospective.id] = retrospective
+        elif op == OP_BATCH:
+            for inner_op, inner_body in _iter_batch(body):
+                self.apply(inner_op, inner_body)
+
+
+SnapshotSource = Callable[[], tuple[list[Task], list[Retrospective]]]
+
+
+class Journal:
+    """그룹 커밋 방식의 추가 전용 저널.
+
+    ``append`` 는 레코드를 버퍼에 쌓기만 하고, ``commit`` 을 기다리는 모든 호출자는
+    ``commit_interval`` 동안 모인 레코드와 함께 한 번의 write + fsync 로 영속화됩니다.
+    레코드가 ``snapshot_every`` 개 쌓이면 새 세그먼트로 전환하고 백그라운드에서
+    스냅샷을 기록한 뒤 오래된 파일을 정리합니다.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        *,
+        commit_interval: float = 0.002,
+        snapshot_every: int = 100_000,
+        fsync: bool = True,
+    ) -> None:
+        self._directory = directory
+        self._commit_interval = commit_interval
+        self._snapshot_every = snapshot_every
+        self._fsync = fsync
+        # 파일 I/O 순서를 보장하기 위해 단일 스레드에서만 수행합니다.
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="mypm-journal"
+        )
+        self._buffer = bytearray()
+        self._batch: list[bytes] | None = None
+        self._flush_future: asyncio.Future[None] | None = None
+        self._snapshot_task: asyncio.Task[None] | None = None
+        self._snapshot_source: SnapshotSource | None = None
+        self._records_since_snapshot = 0
+        self._segment = 0
+        self._file = None
+        self._lock_fd: int | None = None
+
+        os.makedirs(directory, exist_ok=True)
+
+    def recover(self) -> RecoveredState:
+        """최신 스냅샷과 이후 세그먼트를 재생해 상태를 복원하고 새 세그먼트를 엽니다.
+
+        디렉터리의 잠금 파일에 배타 잠금을 잡고 ``close`` 할 때까지 쥡니다. 다른
+        프로세스(실행 중인 서버, ``mypm import`` 등)가 이미 열었으면 기다리지 않고
+        ``RuntimeError`` 를 냅니다.
+        """
+
+        self._acquire_lock()
+        try:
+            state = RecoveredState()
+            snapshots = self._numbered("snapshot-", ".bin")
+            base = snapshots[-1] if snapshots else 0
+            if snapshots:
+                self._replay(self._path("snapshot", base), _SNAPSHOT_MAGIC, state)
+
+            segments = [
+                number
+                for number in self._numbered("journal-", ".log")
+                if number >= base
+            ]
+            for number in segments:
+                self._replay(self._path("journal", number), _JOURNAL_MAGIC, state)
+
+            self._segment = max([base, *segments]) + 1
+            self._file = self._open_segment(self._segment)
+        except BaseException:
+            self._release_lock()
+            raise
+        return state
+
+    def set_snapshot_source(self, source: SnapshotSource) -> None:
+        self._snapshot_source = source
+
+    def append(self, payload: bytes) -> None:
+        if self._batch is not None:
+            self._batch.append(payload)
+            return
+
+        self._buffer += _frame(payload)
+        self._records_since_snapshot += 1
+
+    @contextmanager
+    def atomic(self) -> Iterator[None]:
+        """블록 안에서 추가한 레코드를 하나의 배치 레코드로 묶습니다.
+
+        블록이 예외로 끝나면 모은 레코드를 버립니다. 커밋은 하지 않습니다.
+        """
+
+        if self._batch is not None:
+            raise RuntimeError("Journal batch is already open")
+
+        batch: list[bytes] = []
+        self._batch = batch
+        try:
+            yield
+        finally:
+            self._batch = None
+
+        if len(batch) == 1:
+            self.append(batch[0])
+        elif batch:
+            self.append(encode_batch(batch))
+
+    async def commit(self) -> None:
+        """지금까지 추가된 레코드가 디스크에 기록될 때까지 기다립니다."""
+
+        if self._flush_future is None:
+            if not self._buffer:
+                return
+
+            loop = asyncio.get_running_loop()
+            self._flush_future = loop.create_future()
+            loop.call_later(self._commit_interval, self._start_flush)
+
+        await asyncio.shield(self._flush_future)
+
+        if (
+            self._records_since_snapshot >= self._snapshot_every
+            and self._snapshot_source is not None
+            and self._snapshot_task is None
+        ):
+            self._snapshot_task = asyncio.get_running_loop().create_task(
+                self.snapshot()
+            )
+
+    async def snapshot(self) -> None:
+        """새 세그먼트로 전환하고 현재 상태를 스냅샷으로 기록합니다."""
+
+        if self._snapshot_source is None:
+            raise RuntimeError("Snapshot source is not configured")
+
+        loop = asyncio.get_running_loop()
+        try:
+            buffered = bytes(self._buffer)
+            self._buffer.clear()
+            self._records_since_snapshot = 0
+            tasks, retrospectives = self._snapshot_source()
+            self._segment += 1
+            await loop.run_in_executor(
+                self._executor,
+                self._rotate_and_snapshot,
+                buffered,
+                self._segment,
+                tasks,
+                retrospectives,
+            )
+        finally:
+            self._snapshot_task = None
+
+    async def aclose(self) -> None:
+        """예약된 그룹 커밋과 백그라운드 스냅샷이 끝나기를 기다린 뒤 닫습니다."""
+
+        try:
+            while self._flush_future is not None or self._snapshot_task is not None:
+                if self._snapshot_task is not None:
+                    await self._snapshot_task
+                else:
+                    await asyncio.shield(self._flush_future)
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        if self._file is None:
+            return
+
+        self._executor.submit(self._write, bytes(self._buffer)).result()
+        self._buffer.clear()
+        self._executor.shutdown(wait=True)
+        self._file.close()
+        self._file = None
+        self._release_lock()
+
+    def _acquire_lock(self) -> None:
+        fd = os.open(os.path.join(self._directory, _LOCK_NAME), os.O_RDWR | os.O_CREAT)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            os.close(fd)
+            raise RuntimeError(
+                f"Journal {self._directory} is in use by another process"
+            ) from None
+        self._lock_fd = fd
+
+    def _release_lock(self) -> None:
+        if self._lock_fd is not None:
+            # 파일을 닫으면 잠금도 풀립니다.
+            os.close(self._lock_fd)
+            self._lock_fd = None
+
+    def _start_flush(self) -> None:
+        future = self._flush_future
+        self._flush_future = None
+        data = bytes(self._buffer)
+        self._buffer.clear()
+
+        def _done(result: asyncio.Future[None]) -> None:
+            if future is None or future.done():
+                return
+            if result.exception() is not None:
+                future.set_exception(result.exception())
+            else:
+                future.set_result(None)
+
+        flushed = asyncio.wrap_future(self._executor.submit(self._write, data))
+        flushed.add_done_callback(_done)
+
+    def _write(self, data: bytes) -> None:
+        if data:
+            self._file.write(data)
+        self._file.flush()
+        if self._fsync:
+            os.fsync(self._file.fileno())
+
+    def _rotate_and_snapshot(
+        self,
+        buffered: bytes,
+        segment: int,
+        tasks: Iterable[Task],
+        retrospectives: Iterable[Retrospective],
+    ) -> None:
+        self._write(buffered)
+        self._file.close()
+        self._file = self._open_segment(segment)
+
+        final_path = self._path("snapshot", segment)
+        temporary_path = final_path + ".tmp"
+        with open(temporary_path, "wb") as snapshot:
+            snapshot.write(_SNAPSHOT_MAGIC)
+            chunk: list[bytes] = []
+            for task in tasks:
+                chunk.append(_frame(encode_task(task)))
+                if len(chunk) >= 4096:
+                    snapshot.write(b"".join(chunk))
+                    chunk.clear()
+            for retrospective in retrospectives:
+                chunk.append(_frame(encode_retrospective(retrospective)))
+            snapshot.write(b"".join(chunk))
+            snapshot.flush()
+            os.fsync(snapshot.fileno())
+        os.replace(temporary_path, final_path)
+
+        # 새 스냅샷이 덮는 이전 스냅샷과 세그먼트를 정리합니다.
+        for number in self._numbered("snapshot-", ".bin"):
+            if number < segment:
+                os.remove(self._path("snapshot", number))
+        for number in self._numbered("journal-", ".log"):
+            if number < segment:
+                os.remove(self._path("journal", number))
+
+    def _replay(self, path: str, magic: bytes, state: RecoveredState) -> None:
+        with open(path, "rb") as file:
+            if os.fstat(file.fileno()).st_size == 0:
+                return
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                buffer = memoryview(mapped)
+                try:
+                    for op, body in _iter_payloads(buffer, magic):
+                        state.apply(op, body)
+                        body.release()
+                finally:
+                    buffer.release()
+
+    def _open_segment(self, number: int):
+        file = open(self._path("journal", number), "ab")
+        if file.tell() == 0:
+            file.write(_JOURNAL_MAGIC)
+            file.flush()
+        return file
+
+    def _path(self, prefix: str, number: int) -> str:
+        extension = "bin" if prefix == "snapshot" else "log"
+        return os.path.join(self._directory, f"{prefix}-{number:08d}.{extension}")
+
+    def _numbered(self, prefix: str, suffix: str) -> list[int]:
+        numbers = []
+        for name in os.listdir(self._directory):
+            if name.startswith(prefix) and name.endswith(suffix):
+                try:
+                    numbers.append(int(name[len(prefix) : -len(suffix)]))
+                except ValueError:
+                    continue
+        return sorted(numbers)
+
+
+__all__ = [
+    "Journal",
+    "RecoveredState",
+    "encode_retrospective",
+    "encode_task",
+    "encode_task_changes",
+    "encode_task_delete",
+]
@@ -2,29 +2,286 @@
 
 from __future__ import annotations
 
+import heapq
+import time
 import uuid
-from collections import defaultdict
+import weakref
+from collections import Counter, defaultdict
+from collections.abc import Iterable, Iterator
+from contextlib import AbstractAsyncContextManager, nullcontext
 from datetime import date
+from itertools import islice
+from typing import TYPE_CHECKING
 
 from mypm.domain.tasks.entities import Retrospective, Task, TaskStatus
-from mypm.domain.tasks.repositories import RetrospectiveRepository, TaskRepository
+from mypm.domain.tasks.errors import ConflictError
+from mypm.domain.tasks.queries import (
+    TaskFilter,
+    TaskKeyset,
+    TaskPlanStep,
+    TaskQueryPlan,
+    TaskQueryResult,
+    TaskSearchHit,
+    TaskSearchResult,
+    TaskSortField,
+    fold_text,
+)
+from mypm.domain.tasks.repositories import (
+    RetrospectiveRepository,
+    TaskRepository,
+    TransactionalStore,
+)
+from mypm.domain.tasks.stats import TaskStats, due_bucket_bounds
+from mypm.infrastructure.tasks.changes import ChangeLog
+from mypm.infrastructure.tasks.indexes import (
+    PrefixIndex,
+    SortedKeyIndex,
+    SortKey,
+    TextKey,
+    due_rank_bounds,
+    keyset_sort_key,
+    make_sort_key,
+    rank_bounds,
+    sort_rank,
+    task_sort_key,
+    title_key,
+)
+from mypm.infrastructure.tasks.locks import EntityLocks
+from mypm.infrastructure.tasks.memory.journal import (
+    Journal,
+    encode_retrospective,
+    encode_task,
+    encode_task_changes,
+    encode_task_delete,
+)
+from mypm.infrastructure.tasks.planner import AccessPath, select
+from mypm.infrastructure.tasks.search import TaskSearchIndex
+
+if TYPE_CHECKING:
+    from mypm.infrastructure.tasks.compact.repositories import CompactTaskRepository
+
+
+class _PinnedTasks:
+    """고정 시점의 Task 맵.
+
+    리포지토리의 dict 를 복사하지 않고 그대로 읽습니다. 리포지토리는 Task 를 추가하거나
+    바꾸거나 지우기 전에 ``preserve`` 를 부르고, 뷰는 그때 남긴 값(고정 시점에 없었으면
+    None)을 먼저 찾습니다. 쓰기는 고정된 뷰 수만큼 기록을 남기고, 뷰의 읽기는 고정 뒤
+    바뀐 Task 를 한 번 더 찾습니다. 남긴 값은 UUID 해시(파이썬 코드) 대신 정수로
+    찾습니다.
+    """
+
+    __slots__ = ("_live", "_before", "_len", "__weakref__")
+
+    def __init__(self, live: dict[uuid.UUID, Task]) -> None:
+        self._live = live
+        self._before: dict[int, Task | None] = {}
+        self._len = len(live)
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __contains__(self, task_id: uuid.UUID) -> bool:
+        return self.get(task_id) is not None
+
+    def __getitem__(self, task_id: uuid.UUID) -> Task:
+        before = self._before
+        if before and (number := task_id.int) in before:
+            task = before[number]
+            if task is None:
+                raise KeyError(task_id)
+            return task
+        return self._live[task_id]
+
+    def get(self, task_id: uuid.UUID) -> Task | None:
+        before = self._before
+        if before and (number := task_id.int) in before:
+            return before[number]
+        return self._live.get(task_id)
+
+    def values(self) -> list[Task]:
+        before = self._before
+        return [
+            *(
+                task
+                for task_id, task in self._live.items()
+                if task_id.int not in before
+            ),
+            *(task for task in before.values() if task is not None),
+        ]
+
+    def preserve(self, task_ids: Iterable[uuid.UUID]) -> None:
+        """``task_ids`` 를 바꾸기 전에 호출합니다. 처음 바뀌는 Task 의 지금 값을
+        남깁니다."""
+
+        before, live = self._before, self._live
+        for task_id in task_ids:
+            if (number := task_id.int) not in before:
+                before[number] = live.get(task_id)
 
 
 class InMemoryTaskRepository(TaskRepository):
-    """메모리 기반 Task 저장소."""
+    """메모리 기반 Task 저장소.
 
-    def __init__(self) -> None:
+    ``journal`` 을 주면 모든 쓰기를 적용 전에 저널에 기록하고 그룹 커밋이 끝난 뒤
+    반환합니다. ``changes`` 를 주면 반영한 쓰기를 변경 피드에 남깁니다.
+
+    저장된 Task 는 읽기에 그대로 돌려주고, 쓰기는 객체를 교체합니다. 돌려받은 Task 를
+    제자리에서 바꾸지 말고 사본을 바꿔 ``update`` 합니다(``UnitOfWork`` 가 그렇게
+    합니다). ``pin()`` 은 인덱스를 포함한 현재 상태를 O(1) 로 고정하며, 고정 뒤의
+    쓰기는 건드리는 부분만 복사합니다(copy-on-write).
+
+    - 정렬/제목 인덱스: 조각 목록만 복사하고 바꾸는 조각을 복사합니다.
+      (O(n / 조각 크기))
+    - Retrospective 별 카운터와 Task 집합: 바깥 사전만 복사하고 바꾸는 Retrospective
+      의 항목을 복사합니다. (O(Retrospective 수))
+    - Task 맵: 복사하지 않고, 뷰마다 고정 뒤 바뀐 Task 의 이전 값을 남깁니다.
+    """
+
+    def __init__(
+        self, journal: Journal | None = None, changes: ChangeLog | None = None
+    ) -> None:
+        self._journal = journal
+        self._changes = changes
         self._tasks: dict[uuid.UUID, Task] = {}
-        self._by_status: dict[TaskStatus, set[uuid.UUID]] = defaultdict(set)
+        # (정렬 기준, 상태 또는 전체) 별 정렬 인덱스. 상태별 인덱스가 상태별 Task
+        # 집합을 겸합니다.
+        self._sorted: dict[tuple[TaskSortField, TaskStatus | None], SortedKeyIndex] = (
+            defaultdict(SortedKeyIndex)
+        )
+        # Retrospective 별 상태 카운터와 연결된 Task. 인덱스 갱신과 함께 바뀌며 빈
+        # 항목은 지웁니다.
+        self._retrospective_counts: dict[uuid.UUID, Counter[TaskStatus]] = defaultdict(
+            Counter
+        )
+        self._by_retrospective: dict[uuid.UUID, set[uuid.UUID]] = defaultdict(set)
+        # 정규화한 제목의 접두어 인덱스
+        self._titles = PrefixIndex()
+        self._attached = 0
+        # 재시작 후에도 이전 버전과 겹치지 않도록 현재 시각에서 시작합니다.
+        self._sequence = time.time_ns()
+        self._versions: dict[TaskStatus | None, int] = dict.fromkeys(
+            [None, *TaskStatus], self._sequence
+        )
+        self._search = TaskSearchIndex()
+        # 고정된 뷰와 구조를 공유하는 중이면 True. 다음 쓰기가 복사합니다.
+        self._shared = False
+        # 공유를 끝낸 뒤 이 리포지토리가 복사해 가진 Retrospective 항목. None 이면
+        # 모두 제 것입니다.
+        self._owned_retrospectives: set[uuid.UUID] | None = None
+        # 살아 있는 고정 뷰의 Task 맵
+        self._pins: weakref.WeakSet[_PinnedTasks] = weakref.WeakSet()
+        self._read_only = False
+
+    def pin(self) -> InMemoryTaskRepository:
+        """지금 상태에 고정된 읽기 전용 뷰. 만드는 비용은 O(1) 입니다.
+
+        검색 색인은 복사하지 않고 공유하므로 뷰의 검색은 최신 색인으로 찾은 뒤 뷰에 있는
+        Task 만 돌려줍니다.
+        """
+
+        if self._read_only:
+            return self
+
+        view = object.__new__(type(self))
+        view.__dict__.update(self.__dict__)
+        view._journal = view._changes = None
+        view._read_only = True
+        view._tasks = pinned = _PinnedTasks(self._tasks)
+        view._pins = weakref.WeakSet()
+        self._pins.add(pinned)
+        self._shared = True
+        return view
+
+    def _own(self) -> None:
+        """쓰기 전에 호출합니다. 고정된 뷰와 공유 중인 인덱스의 바깥 구조를 복사합니다.
+        안쪽 조각과 항목은 처음 바꿀 때 복사합니다."""
+
+        if self._read_only:
+            raise RuntimeError("Pinned repository view is read-only")
+        if not self._shared:
+            return
+
+        self._sorted = defaultdict(
+            SortedKeyIndex, {key: index.copy() for key, index in self._sorted.items()}
+        )
+        self._titles = self._titles.copy()
+        self._retrospective_counts = defaultdict(Counter, self._retrospective_counts)
+        self._by_retrospective = defaultdict(set, self._by_retrospective)
+        self._owned_retrospectives = set()
+        self._versions = dict(self._versions)
+        self._shared = False
+
+    def _own_retrospective(self, retrospective_id: uuid.UUID) -> None:
+        """Retrospective 항목을 바꾸기 전에 호출합니다. 공유 중이면 복사합니다."""
+
+        owned = self._owned_retrospectives
+        if owned is None or retrospective_id in owned:
+            return
+
+        owned.add(retrospective_id)
+        counts = self._retrospective_counts.get(retrospective_id)
+        if counts is not None:
+            self._retrospective_counts[retrospective_id] = Counter(counts)
+        members = self._by_retrospective.get(retrospective_id)
+        if members is not None:
+            self._by_retrospective[retrospective_id] = set(members)
+
+    def _preserve(self, task_ids: Iterable[uuid.UUID]) -> None:
+        """Task 맵을 바꾸기 전에 호출합니다. 고정된 뷰마다 지금 값을 남깁니다."""
+
+        if self._pins:
+            task_ids = list(task_ids)
+            for pinned in self._pins:
+                pinned.preserve(task_ids)
 
     async def add(self, task: Task) -> Task:
-        self._tasks[task.id] = task
-        self._by_status[task.status].add(task.id)
+        await self.add_many([task])
         return task
 
+    async def add_many(self, tasks: list[Task]) -> list[Task]:
+        if self._journal is not None:
+            for task in tasks:
+                self._journal.append(encode_task(task))
+
+        self._store(tasks)
+        if self._changes is not None:
+            self._changes.record_tasks(tasks)
+
+        if self._journal is not None:
+            await self._journal.commit()
+        return tasks
+
+    def load(self, tasks: Iterable[Task]) -> None:
+        """저널 기록 없이 Task 를 적재합니다. 복구 시 사용합니다."""
+
+        self._store(list(tasks))
+
+    def snapshot(self) -> list[Task]:
+        return list(self._tasks.values())
+
+    def _store(self, tasks: list[Task]) -> None:
+        self._own()
+        replaced = [self._tasks[task.id] for task in tasks if task.id in self._tasks]
+        if replaced:
+            self._unindex_many(replaced)
+
+        self._preserve(task.id for task in tasks)
+        for task in tasks:
+            self._tasks[task.id] = task
+            task.clear_changes()
+        self._index_many(tasks)
+
     async def get(self, task_id: uuid.UUID) -> Task | None:
         return self._tasks.get(task_id)
 
+    async def get_many(self, task_ids: list[uuid.UUID]) -> dict[uuid.UUID, Task]:
+        # UUID 해시는 파이썬 코드로 계산되므로 ID 마다 한 번만 찾습니다.
+        found = map(self._tasks.get, task_ids)
+        return {
+            task_id: task for task_id, task in zip(task_ids, found) if task is not None
+        }
+
     async def list_by_status(self, status: str | None = None) -> list[Task]:
         if status is None:
             return list(self._tasks.values())
@@ -34,41 +291,585 @@ class InMemoryTaskRepository(TaskRepository):
         except ValueError:
             return []
 
-        return [self._tasks[task_id] for task_id in self._by_status.get(status_enum, set())]
+        index = self._sorted.get((TaskSortField.CREATED_AT, status_enum))
+        if index is None:
+            return []
+        return [self._tasks[key[2]] for key in index.iter_from()]
+
+    async def list_page(
+        self,
+        *,
+        status: str | None = None,
+        order_by: TaskSortField = TaskSortField.CREATED_AT,
+        descending: bool = False,
+        after: TaskKeyset | None = None,
+        limit: int | None = None,
+    ) -> list[Task]:
+        status_enum: TaskStatus | None = None
+        if status is not None:
+            try:
+                status_enum = TaskStatus(status)
+            except ValueError:
+                return []
+
+        index = self._sorted.get((order_by, status_enum))
+        if index is None:
+            return []
+
+        after_key = keyset_sort_key(after) if after is not None else None
+        keys = index.iter_from(after_key, descending=descending)
+        if limit is not None:
+            keys = islice(keys, limit)
+
+        return [self._tasks[key[2]] for key in keys]
+
+    async def list_by_due_range(
+        self,
+        *,
+        due_after: date | None = None,
+        due_before: date | None = None,
+        status: str | None = None,
+        after: TaskKeyset | None = None,
+        limit: int | None = None,
+    ) -> list[Task]:
+        status_enum: TaskStatus | None = None
+        if status is not None:
+            try:
+                status_enum = TaskStatus(status)
+            except ValueError:
+                return []
+
+        index = self._sorted.get((TaskSortField.DUE_DATE, status_enum))
+        if index is None:
+            return []
+
+        low, high = due_rank_bounds(due_after, due_before)
+        after_key = keyset_sort_key(after) if after is not None else None
+        keys: Iterator[SortKey] = index.iter_range(low, high, after_key)
+        if limit is not None:
+            keys = islice(keys, limit)
+
+        return [self._tasks[key[2]] for key in keys]
+
+    async def query(
+        self,
+        task_filter: TaskFilter,
+        *,
+        order_by: TaskSortField = TaskSortField.CREATED_AT,
+        descending: bool = False,
+        after: TaskKeyset | None = None,
+        limit: int | None = None,
+        explain: bool = False,
+    ) -> TaskQueryResult:
+        conditions = task_filter.conditions()
+        selection = select(
+            self._access_paths(task_filter), conditions, len(self._tasks), limit
+        )
+        after_key = keyset_sort_key(after) if after is not None else None
+
+        if selection.candidates is None:
+            # 조건이 흔하면 정렬 인덱스를 순서대로 훑으며 검사하고 limit 을 채우면
+            # 멈춥니다.
+            statuses = task_filter.statuses
+            status = (
+                next(iter(statuses))
+                if statuses is not None and len(statuses) == 1
+                else None
+            )
+            index = self._sorted.get((order_by, status)) or SortedKeyIndex()
+            tasks, scanned = [], 0
+            for key in index.iter_from(after_key, descending=descending):
+                task = self._tasks[key[2]]
+                scanned += 1
+                if task_filter.matches(task):
+                    tasks.append(task)
+                    if limit is not None and len(tasks) >= limit:
+                        break
+            name = order_by.value if status is None else f"status+{order_by.value}"
+            steps = [TaskPlanStep(index=name, estimated=len(index), candidates=scanned)]
+            residual = [
+                condition
+                for condition in conditions
+                if status is None or condition != "status"
+            ]
+            matched = len(tasks)
+        else:
+            stored = self._tasks
+            found = [stored[task_id] for task_id in selection.candidates]
+            scanned = len(found)
+            if selection.residual:
+                found = [task for task in found if task_filter.matches(task)]
+            matched = len(found)
+            tasks = _order(found, order_by, descending, after_key, limit)
+            steps, residual = selection.steps, selection.residual
+
+        plan = None
+        if explain:
+            plan = TaskQueryPlan(
+                steps=steps, residual=residual, scanned=scanned, matched=matched
+            )
+        return TaskQueryResult(tasks=tasks, plan=plan)
+
+    def _access_paths(self, task_filter: TaskFilter) -> list[AccessPath[uuid.UUID]]:
+        """필터 조건마다 쓸 수 있는 인덱스와 후보 수. 후보 수는 모두 정확한 값입니다."""
+
+        paths: list[AccessPath[uuid.UUID]] = []
+        statuses = task_filter.statuses
+        if statuses is not None:
+            members = [
+                index
+                for status in statuses
+                if (index := self._sorted.get((TaskSortField.CREATED_AT, status)))
+                is not None
+            ]
+            paths.append(
+                AccessPath(
+                    index="status",
+                    covers=frozenset({"status"}),
+                    estimate=sum(map(len, members)),
+                    fetch=lambda: {
+                        key[2] for index in members for key in index.iter_from()
+                    },
+                )
+            )
+
+        if task_filter.retrospective_id is not None:
+            attached = self._by_retrospective.get(
+                task_filter.retrospective_id, frozenset()
+            )
+            paths.append(
+                AccessPath(
+                    index="retrospective_id",
+                    covers=frozenset({"retrospective_id"}),
+                    estimate=len(attached),
+                    fetch=lambda: attached,
+                )
+            )
+
+        prefix = task_filter.title_prefix
+        if prefix:
+            paths.append(
+                AccessPath(
+                    index="title_prefix",
+                    covers=frozenset({"title_prefix"}),
+                    estimate=self._titles.count_prefix(prefix),
+                    fetch=lambda: {key[2] for key in self._titles.iter_prefix(prefix)},
+                )
+            )
+
+        ranges = (
+            (TaskSortField.DUE_DATE, task_filter.due_after, task_filter.due_before),
+            (
+                TaskSortField.CREATED_AT,
+                task_filter.created_after,
+                task_filter.created_before,
+            ),
+            (
+                TaskSortField.UPDATED_AT,
+                task_filter.updated_after,
+                task_filter.updated_before,
+            ),
+        )
+        for field, low_value, high_value in ranges:
+            if low_value is None and high_value is None:
+                continue
+            low, high = rank_bounds(low_value, high_value)
+            paths.append(self._range_path(field, low, high, None))
+            if statuses is not None:
+                # 상태별 정렬 인덱스는 (상태, 값) 복합 인덱스입니다.
+                paths.append(self._range_path(field, low, high, statuses))
+        return paths
+
+    def _range_path(
+        self,
+        field: TaskSortField,
+        low: int,
+        high: int,
+        statuses: frozenset[TaskStatus] | None,
+    ) -> AccessPath[uuid.UUID]:
+        keys = [None] if statuses is None else list(statuses)
+        indexes = [
+            index
+            for key in keys
+            if (index := self._sorted.get((field, key))) is not None
+        ]
+        return AccessPath(
+            index=field.value if statuses is None else f"status+{field.value}",
+            covers=frozenset(
+                {field.value} if statuses is None else {field.value, "status"}
+            ),
+            estimate=sum(index.count_range(low, high) for index in indexes),
+            fetch=lambda: {
+                key[2] for index in indexes for key in index.iter_range(low, high)
+            },
+        )
+
+    async def search(
+        self, query: str, *, limit: int = 20, offset: int = 0
+    ) -> TaskSearchResult:
+        hits, total = self._search.search(query, limit=limit, offset=offset)
+        return TaskSearchResult(
+            hits=[
+                TaskSearchHit(task=task, score=score)
+                for task_id, score in hits
+                if (task := self._tasks.get(task_id)) is not None
+            ],
+            total=total,
+        )
+
+    async def count_by_retrospective(
+        self, retrospective_ids: list[uuid.UUID]
+    ) -> dict[uuid.UUID, dict[TaskStatus, int]]:
+        counts = self._retrospective_counts
+        return {
+            retrospective_id: {
+                status: count
+                for status, count in counts[retrospective_id].items()
+                if count
+            }
+            for retrospective_id in retrospective_ids
+            if retrospective_id in counts
+        }
+
+    async def stats(self, today: date) -> TaskStats:
+        # 상태별 수는 집합 크기, 마감 구간은 미완료 상태별 마감일 인덱스의 이진 탐색으로
+        # 얻습니다.
+        _, week_end = due_bucket_bounds(today)
+        today_rank, week_rank, null_rank = (
+            sort_rank(today),
+            sort_rank(week_end),
+            sort_rank(None),
+        )
+        due = dict.fromkeys(
+            ("overdue", "due_today", "due_this_week", "due_later", "no_due_date"), 0
+        )
+        for status in TaskStatus:
+            index = self._sorted.get((TaskSortField.DUE_DATE, status))
+            if status is TaskStatus.DONE or index is None:
+                continue
+            due["overdue"] += index.count_range(0, today_rank - 1)
+            due["due_today"] += index.count_range(today_rank, today_rank)
+            due["due_this_week"] += index.count_range(today_rank + 1, week_rank)
+            due["due_later"] += index.count_range(week_rank + 1, null_rank - 1)
+            due["no_due_date"] += index.count_range(null_rank, null_rank)
+
+        return TaskStats(
+            total=len(self._tasks),
+            by_status={
+                status: len(self._sorted.get((TaskSortField.CREATED_AT, status)) or ())
+                for status in TaskStatus
+            },
+            attached_to_retrospective=self._attached,
+            retrospective_count=len(self._retrospective_counts),
+            **due,
+        )
 
     async def update(self, task: Task) -> Task:
-        if task.id not in self._tasks:
+        await self.update_many([task])
+        return task
+
+    async def update_many(self, tasks: list[Task]) -> list[Task]:
+        changed = self.prepare_updates(tasks)
+        self.apply_updates(changed)
+
+        if self._journal is not None and changed:
+            await self._journal.commit()
+        return tasks
+
+    def prepare_updates(self, tasks: list[Task]) -> list[tuple[Task, Task]]:
+        """``update_many`` 의 검증 단계. 반영할 (저장된 Task, 새 Task) 쌍을 반환합니다.
+
+        없는 Task 가 있으면 ``ValueError``, 읽은 뒤 다른 쓰기가 먼저 반영된 Task 가
+        있으면 ``ConflictError`` 를 냅니다. 상태를 바꾸지 않으므로 여러 저장소를 모두
+        검증한 뒤 ``apply_updates`` 로 한꺼번에 반영할 수 있습니다.
+        """
+
+        if any(task.id not in self._tasks for task in tasks):
             raise ValueError("Task not found")
 
-        # 상태가 바뀌었다면 인덱스 업데이트
-        for status, task_ids in self._by_status.items():
-            if task.id in task_ids and status != task.status:
-                task_ids.remove(task.id)
-        self._by_status[task.status].add(task.id)
+        # 같은 Task 가 여러 번 들어오면 마지막 값만 반영합니다. 저장된 객체를 제자리에서
+        # 바꾼 경우 바뀐 필드만, 다른 객체로 교체한 경우 모든 필드를 반영합니다.
+        changed = [
+            (stored, task)
+            for task in {task.id: task for task in tasks}.values()
+            if (stored := self._tasks[task.id]) is not task or task.changes
+        ]
+        # 변경 기록이 있는 사본은 읽은 시점의 버전이 저장된 버전과 같아야 합니다.
+        for stored, task in changed:
+            if (
+                stored is not task
+                and task.changes
+                and stored.previous("updated_at") != task.previous("updated_at")
+            ):
+                raise ConflictError("Task was modified concurrently")
+        return changed
 
-        self._tasks[task.id] = task
-        return task
+    def apply_updates(self, changed: list[tuple[Task, Task]]) -> None:
+        """``prepare_updates`` 결과를 양보 없이 반영합니다. 저널은 커밋하지 않습니다."""
+
+        self._own()
+        if self._journal is not None:
+            for _, task in changed:
+                self._journal.append(
+                    encode_task_changes(task) if task.changes else encode_task(task)
+                )
+
+        self._reindex_many(changed)
+        if self._changes is not None:
+            self._changes.record_tasks(task for _, task in changed)
 
     async def delete(self, task_id: uuid.UUID) -> None:
-        task = self._tasks.pop(task_id, None)
-        if task is None:
-            return
+        await self.delete_many([task_id])
+
+    async def delete_many(self, task_ids: list[uuid.UUID]) -> list[uuid.UUID]:
+        self._own()
+        deleted = [
+            task_id for task_id in dict.fromkeys(task_ids) if task_id in self._tasks
+        ]
+        if self._journal is not None:
+            for task_id in deleted:
+                self._journal.append(encode_task_delete(task_id))
+
+        self._unindex_many([self._tasks[task_id] for task_id in deleted])
+        self._preserve(deleted)
+        for task_id in deleted:
+            del self._tasks[task_id]
+            self._search.remove(task_id)
+        if self._changes is not None:
+            self._changes.record_task_deletes(deleted)
+
+        if self._journal is not None and deleted:
+            await self._journal.commit()
+        return deleted
+
+    async def version(self, status: str | None = None) -> int:
+        if status is None:
+            return self._versions.get(None, 0)
+
+        try:
+            return self._versions.get(TaskStatus(status), 0)
+        except ValueError:
+            return 0
+
+    def _bump(self, statuses: set[TaskStatus]) -> None:
+        self._sequence += 1
+        self._versions[None] = self._sequence
+        for status in statuses:
+            self._versions[status] = self._sequence
+
+    def _index_many(self, tasks: list[Task]) -> None:
+        pending: dict[tuple[TaskSortField, TaskStatus | None], list[SortKey]] = (
+            defaultdict(list)
+        )
+        titles: list[TextKey] = []
+        for task in tasks:
+            for field in TaskSortField:
+                key = task_sort_key(task, field)
+                pending[(field, None)].append(key)
+                pending[(field, task.status)].append(key)
+            self._count(task.id, task.retrospective_id, task.status)
+            titles.append(title_key(task))
+            self._search.index(task)
 
-        self._by_status[task.status].discard(task_id)
+        for index_key, keys in pending.items():
+            self._sorted[index_key].insert_many(keys)
+        self._titles.insert_many(titles)
+        self._bump({task.status for task in tasks})
+
+    def _unindex_many(self, tasks: list[Task]) -> None:
+        # 인덱스에는 마지막으로 저장된 값이 들어 있으므로 변경 전 값(``previous``)으로
+        # 찾습니다.
+        pending: dict[tuple[TaskSortField, TaskStatus | None], list[SortKey]] = (
+            defaultdict(list)
+        )
+        titles: list[TextKey] = []
+        statuses: set[TaskStatus] = set()
+        for task in tasks:
+            status = task.previous("status")
+            self._uncount(task.id, task.previous("retrospective_id"), status)
+            for field in TaskSortField:
+                key = make_sort_key(task.previous(field.value), task.id)
+                pending[(field, None)].append(key)
+                pending[(field, status)].append(key)
+            titles.append((fold_text(task.previous("title")), task.id.int, task.id))
+            statuses.add(status)
+
+        for index_key, keys in pending.items():
+            self._sorted[index_key].remove_many(keys)
+        self._titles.remove_many(titles)
+        if statuses:
+            self._bump(statuses)
+
+    def _reindex_many(self, changes: list[tuple[Task, Task]]) -> None:
+        """(저장된 Task, 새 Task) 쌍에서 바뀐 필드에 해당하는 인덱스 항목만 옮깁니다."""
+
+        removed: dict[tuple[TaskSortField, TaskStatus | None], list[SortKey]] = (
+            defaultdict(list)
+        )
+        inserted: dict[tuple[TaskSortField, TaskStatus | None], list[SortKey]] = (
+            defaultdict(list)
+        )
+        statuses: set[TaskStatus] = set()
+        self._preserve(task.id for _, task in changes)
+        for stored, task in changes:
+            old_status, status = stored.previous("status"), task.status
+            for field in TaskSortField:
+                old_value, value = (
+                    stored.previous(field.value),
+                    getattr(task, field.value),
+                )
+                if old_value == value and old_status == status:
+                    continue
+                old_key, key = (
+                    make_sort_key(old_value, task.id),
+                    make_sort_key(value, task.id),
+                )
+                if old_key != key:
+                    removed[(field, None)].append(old_key)
+                    inserted[(field, None)].append(key)
+                removed[(field, old_status)].append(old_key)
+                inserted[(field, status)].append(key)
+
+            old_retrospective_id, retrospective_id = (
+                stored.previous("retrospective_id"),
+                task.retrospective_id,
+            )
+            if old_status != status or old_retrospective_id != retrospective_id:
+                self._uncount(task.id, old_retrospective_id, old_status)
+                self._count(task.id, retrospective_id, status)
+            old_title = stored.previous("title")
+            if old_title != task.title:
+                self._titles.remove((fold_text(old_title), task.id.int, task.id))
+                self._titles.insert(title_key(task))
+            if (
+                old_title != task.title
+                or stored.previous("description") != task.description
+            ):
+                self._search.index(task)
+
+            statuses.update((old_status, status))
+            stored.clear_changes()
+            task.clear_changes()
+            self._tasks[task.id] = task
+
+        for index_key, keys in removed.items():
+            self._sorted[index_key].remove_many(keys)
+        for index_key, keys in inserted.items():
+            self._sorted[index_key].insert_many(keys)
+        if changes:
+            self._bump(statuses)
+
+    def _count(
+        self, task_id: uuid.UUID, retrospective_id: uuid.UUID | None, status: TaskStatus
+    ) -> None:
+        if retrospective_id is not None:
+            self._own_retrospective(retrospective_id)
+            self._retrospective_counts[retrospective_id][status] += 1
+            self._by_retrospective[retrospective_id].add(task_id)
+            self._attached += 1
+
+    def _uncount(
+        self, task_id: uuid.UUID, retrospective_id: uuid.UUID | None, status: TaskStatus
+    ) -> None:
+        if retrospective_id is not None:
+            self._own_retrospective(retrospective_id)
+            counts = self._retrospective_counts[retrospective_id]
+            counts[status] -= 1
+            if not +counts:
+                del self._retrospective_counts[retrospective_id]
+            members = self._by_retrospective[retrospective_id]
+            members.discard(task_id)
+            if not members:
+                del self._by_retrospective[retrospective_id]
+            self._attached -= 1
+
+
+def _order(
+    tasks: list[Task],
+    order_by: TaskSortField,
+    descending: bool,
+    after: SortKey | None,
+    limit: int | None,
+) -> list[Task]:
+    """후보 Task 를 정렬 키 순서로 정렬해 ``after`` 다음부터 ``limit`` 개를
+    반환합니다."""
+
+    keyed = [(task_sort_key(task, order_by), task) for task in tasks]
+    if after is not None:
+        keyed = [
+            item
+            for item in keyed
+            if (item[0] < after if descending else item[0] > after)
+        ]
+    # 정렬 키에 Task ID 가 들어 있어 키가 겹치지 않으므로 Task 끼리는 비교하지 않습니다.
+    if limit is None:
+        keyed.sort(reverse=descending)
+    elif descending:
+        keyed = heapq.nlargest(limit, keyed)
+    else:
+        keyed = heapq.nsmallest(limit, keyed)
+    return [task for _, task in keyed]
 
 
 class InMemoryRetrospectiveRepository(RetrospectiveRepository):
     """메모리 기반 Retrospective 저장소."""
 
-    def __init__(self) -> None:
+    def __init__(
+        self, journal: Journal | None = None, changes: ChangeLog | None = None
+    ) -> None:
+        self._journal = journal
+        self._changes = changes
         self._retrospectives: dict[uuid.UUID, Retrospective] = {}
         self._by_date: dict[date, uuid.UUID] = {}
+        # (날짜, ID) 순 정렬 인덱스
+        self._sorted = SortedKeyIndex()
+        self._version = time.time_ns()
+        self._shared = False
+        self._read_only = False
+
+    def pin(self) -> InMemoryRetrospectiveRepository:
+        """지금 상태에 고정된 읽기 전용 뷰. ``InMemoryTaskRepository.pin`` 과
+        같습니다."""
+
+        view = object.__new__(type(self))
+        view.__dict__.update(self.__dict__)
+        view._journal = view._changes = None
+        view._read_only = True
+        self._shared = True
+        return view
+
+    def _own(self) -> None:
+        if self._read_only:
+            raise RuntimeError("Pinned repository view is read-only")
+        if self._shared:
+            self._retrospectives = dict(self._retrospectives)
+            self._by_date = dict(self._by_date)
+            self._sorted = self._sorted.copy()
+            self._shared = False
 
     async def add(self, retrospective: Retrospective) -> Retrospective:
-        self._retrospectives[retrospective.id] = retrospective
-        self._by_date[retrospective.date] = retrospective.id
+        if self._journal is not None:
+            self._journal.append(encode_retrospective(retrospective))
+
+        self._store(retrospective)
+        self._version += 1
+        if self._changes is not None:
+            self._changes.record_retrospectives([retrospective])
+
+        if self._journal is not None:
+            await self._journal.commit()
         return retrospective
 
+    def load(self, retrospectives: Iterable[Retrospective]) -> None:
+        """저널 기록 없이 Retrospective 를 적재합니다. 복구 시 사용합니다."""
+
+        for retrospective in retrospectives:
+            self._store(retrospective)
+        self._version += 1
+
+    def snapshot(self) -> list[Retrospective]:
+        return list(self._retrospectives.values())
+
     async def get_by_date(self, retrospective_date: date) -> Retrospective | None:
         retrospective_id = self._by_date.get(retrospective_date)
         if retrospective_id is None:
@@ -79,12 +880,137 @@ class InMemoryRetrospectiveRepository(RetrospectiveRepository):
     async def get(self, retrospective_id: uuid.UUID) -> Retrospective | None:
         return self._retrospectives.get(retrospective_id)
 
+    async def list_by_date_range(self, start: date, end: date) -> list[Retrospective]:
+        keys = self._sorted.iter_range(start.toordinal(), end.toordinal())
+        return [self._retrospectives[key[2]] for key in keys]
+
     async def update(self, retrospective: Retrospective) -> Retrospective:
-        if retrospective.id not in self._retrospectives:
+        self.check_update(retrospective)
+        self.apply_update(retrospective)
+
+        if self._journal is not None:
+            await self._journal.commit()
+        return retrospective
+
+    def check_update(self, retrospective: Retrospective) -> None:
+        """``update`` 의 검증 단계. 없으면 ``ValueError``, 버전이 다르면
+        ``ConflictError``."""
+
+        stored = self._retrospectives.get(retrospective.id)
+        if stored is None:
             raise ValueError("Retrospective not found")
+        if (
+            stored is not retrospective
+            and retrospective.changes
+            and stored.previous("updated_at") != retrospective.previous("updated_at")
+        ):
+            raise ConflictError("Retrospective was modified concurrently")
+
+    def apply_update(self, retrospective: Retrospective) -> None:
+        """``check_update`` 를 통과한 Retrospective 를 반영합니다. 저널은 커밋하지
+        않습니다."""
+
+        if self._journal is not None:
+            self._journal.append(encode_retrospective(retrospective))
+
+        self._store(retrospective)
+        self._version += 1
+        if self._changes is not None:
+            self._changes.record_retrospectives([retrospective])
+
+    async def version(self) -> int:
+        return self._version
+
+    def _store(self, retrospective: Retrospective) -> None:
+        self._own()
+        stored = self._retrospectives.get(retrospective.id)
+        if stored is None:
+            self._sorted.insert(make_sort_key(retrospective.date, retrospective.id))
+        else:
+            # 날짜가 바뀐 경우에만 정렬 인덱스를 옮깁니다.
+            previous_date = stored.previous("date")
+            if previous_date != retrospective.date:
+                self._sorted.remove(make_sort_key(previous_date, retrospective.id))
+                self._sorted.insert(make_sort_key(retrospective.date, retrospective.id))
+                if self._by_date.get(previous_date) == retrospective.id:
+                    del self._by_date[previous_date]
+            stored.clear_changes()
 
+        retrospective.clear_changes()
         self._retrospectives[retrospective.id] = retrospective
         self._by_date[retrospective.date] = retrospective.id
-        return retrospective
+
+
+class InMemoryTransactionalStore(TransactionalStore):
+    """메모리 리포지토리 쌍의 쓰기를 원자적으로 반영합니다.
+
+    모든 쓰기를 먼저 검증한 뒤 중간에 양보(await) 없이 반영하므로 다른 코루틴은 일부만
+    반영된 상태를 보지 못합니다. 저널이 있으면 모든 레코드를 하나의 배치 레코드로 묶어
+    한 번의 그룹 커밋으로 내보냅니다.
+    """
+
+    def __init__(
+        self,
+        tasks: InMemoryTaskRepository | CompactTaskRepository,
+        retrospectives: InMemoryRetrospectiveRepository,
+        journal: Journal | None = None,
+    ) -> None:
+        self._tasks = tasks
+        self._retrospectives = retrospectives
+        self._journal = journal
+        self._locks = EntityLocks()
+
+    def lock(
+        self, entity_ids: Iterable[uuid.UUID]
+    ) -> AbstractAsyncContextManager[None]:
+        return self._locks.acquire(entity_ids)
+
+    async def commit(
+        self, tasks: list[Task], retrospectives: list[Retrospective]
+    ) -> None:
+        plan = self._tasks.prepare_updates(tasks)
+        latest = list(
+            {
+                retrospective.id: retrospective for retrospective in retrospectives
+            }.values()
+        )
+        for retrospective in latest:
+            self._retrospectives.check_update(retrospective)
+
+        with self._journal.atomic() if self._journal is not None else nullcontext():
+            self._tasks.apply_updates(plan)
+            for retrospective in latest:
+                self._retrospectives.apply_update(retrospective)
+
+        if self._journal is not None and (plan or latest):
+            await self._journal.commit()
+
+    async def close(self) -> None:
+        """저널이 있으면 남은 그룹 커밋과 스냅샷을 마치고 닫습니다."""
+
+        if self._journal is not None:
+            await self._journal.aclose()
+
+
+def open_journaled_repositories(
+    journal: Journal,
+    changes: ChangeLog | None = None,
+) -> tuple[InMemoryTaskRepository, InMemoryRetrospectiveRepository]:
+    """저널에서 상태를 복구한 메모리 리포지토리 쌍을 생성합니다. 복구한 상태는 변경
+    피드에 남기지 않습니다."""
+
+    state = journal.recover()
+
+    task_repository = InMemoryTaskRepository(journal=journal, changes=changes)
+    task_repository.load(state.tasks.values())
+    retrospective_repository = InMemoryRetrospectiveRepository(
+        journal=journal, changes=changes
+    )
+    retrospective_repository.load(state.retrospectives.values())
+
+    journal.set_snapshot_source(
+        lambda: (task_repository.snapshot(), retrospective_repository.snapshot())
+    )
+    return task_repository, retrospective_repository
 
 
@@ -0,0 +1,85 @@
+"""``TaskRepository.query`` 의 인덱스 선택.
+
+리포지토리는 필터 조건마다 쓸 수 있는 인덱스(``AccessPath``)를 후보 수와 함께 넘기고,
+플래너는 후보가 가장 적은 인덱스부터 ID 집합을 꺼내 교집합합니다. 다음 인덱스의 후보가
+지금까지 좁힌 후보보다 훨씬 많으면 집합을 만들지 않고 그 조건은 엔티티에서 직접
+검사합니다(잔여 조건). 엔티티는 교집합이 끝난 뒤에만 읽습니다.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from mypm.domain.tasks.queries import TaskPlanStep
+
+# 다음 인덱스의 후보가 현재 후보의 이 배수보다 많으면 교집합하지 않고 잔여 조건으로
+# 검사합니다.
+INTERSECT_RATIO = 4
+
+
+@dataclass(frozen=True, slots=True)
+class AccessPath[KeyT]:
+    """조건 ``covers`` 를 모두 만족하는 후보를 ``fetch()`` 로 꺼내는 인덱스.
+
+    ``estimate`` 는 ``fetch()`` 가 돌려줄 후보 수(또는 그 상한)이며, 세는 비용이 꺼내는
+    비용보다 훨씬 작아야 합니다. ``fetch()`` 가 돌려준 집합은 바꾸지 않습니다.
+    """
+
+    index: str
+    covers: frozenset[str]
+    estimate: int
+    fetch: Callable[[], set[KeyT] | frozenset[KeyT]]
+
+
+@dataclass(frozen=True, slots=True)
+class Selection[KeyT]:
+    """후보 집합(``None`` 이면 정렬 순서대로 훑기)과 적용한 단계, 잔여 조건."""
+
+    candidates: set[KeyT] | frozenset[KeyT] | None
+    steps: list[TaskPlanStep]
+    residual: list[str]
+
+
+def select[KeyT](
+    paths: list[AccessPath[KeyT]], conditions: list[str], total: int, limit: int | None
+) -> Selection[KeyT]:
+    """후보가 적은 인덱스부터 교집합해 후보 집합을 만듭니다.
+
+    ``limit`` 이 있고 조건이 충분히 흔하면 인덱스를 쓰지 않고 정렬 인덱스를 순서대로
+    훑으며 검사하는 편이 쌉니다. 조건이 서로 독립이라고 보면 훑기는 약
+    ``limit * total / 후보 수`` 행을 보고, 인덱스는 후보 수만큼 읽은 뒤 정렬합니다.
+    """
+
+    # 후보 수가 같으면 더 많은 조건을 처리하는 인덱스를 먼저 씁니다.
+    paths = sorted(paths, key=lambda path: (path.estimate, -len(path.covers)))
+    if not paths or (limit is not None and limit * total < paths[0].estimate**2):
+        return Selection(candidates=None, steps=[], residual=list(conditions))
+
+    candidates: set[KeyT] | frozenset[KeyT] | None = None
+    covered: set[str] = set()
+    steps: list[TaskPlanStep] = []
+    for path in paths:
+        if path.covers <= covered:
+            continue
+        if candidates is not None and (
+            not candidates or path.estimate > len(candidates) * INTERSECT_RATIO
+        ):
+            break
+
+        # 집합 교집합은 작은 쪽을 순회합니다. 인덱스가 가진 집합을 바꾸지 않도록 새
+        # 집합을 만듭니다.
+        fetched = path.fetch()
+        candidates = fetched if candidates is None else candidates & fetched
+        covered |= path.covers
+        steps.append(
+            TaskPlanStep(
+                index=path.index, estimated=path.estimate, candidates=len(candidates)
+            )
+        )
+
+    residual = [condition for condition in conditions if condition not in covered]
+    return Selection(candidates=candidates, steps=steps, residual=residual)
+
+
+__all__ = ["INTERSECT_RATIO", "AccessPath", "Selection", "select"]
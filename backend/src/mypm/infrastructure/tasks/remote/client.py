@@ -0,0 +1,383 @@
+"""스토어 서버를 사용하는 리포지토리 클라이언트."""
+
+from __future__ import annotations
+
+import asyncio
+import uuid
+from collections.abc import AsyncIterator, Iterable
+from contextlib import asynccontextmanager, suppress
+from datetime import date
+from typing import Any
+
+from mypm.domain.tasks.changes import ChangeBatch
+from mypm.domain.tasks.entities import Retrospective, Task, TaskStatus
+from mypm.domain.tasks.errors import ConflictError
+from mypm.domain.tasks.queries import (
+    TaskFilter,
+    TaskKeyset,
+    TaskQueryResult,
+    TaskSearchResult,
+    TaskSortField,
+)
+from mypm.domain.tasks.repositories import (
+    ChangeFeed,
+    RetrospectiveRepository,
+    TaskRepository,
+    TransactionalStore,
+)
+from mypm.domain.tasks.stats import TaskStats
+from mypm.infrastructure.tasks.remote.protocol import (
+    FRAME_LENGTH,
+    OP_CODES,
+    STATUS_CONFLICT,
+    STATUS_OK,
+    STATUS_VALUE_ERROR,
+    decode_message,
+    encode_request,
+)
+
+# 쓰기 버퍼가 이보다 커지면 다음 요청을 보내기 전에 소켓이 비워지기를 기다립니다.
+_HIGH_WATER = 1 << 20
+
+
+class _Connection:
+    """하나의 소켓 연결. 응답을 기다리지 않고 요청을 이어 보내고 요청 id 로 짝을
+    맞춥니다."""
+
+    def __init__(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        self._writer = writer
+        self._pending: dict[int, asyncio.Future[tuple[int, Any]]] = {}
+        self._next_id = 0
+        self.closed = False
+        self._reader = asyncio.create_task(self._read(reader))
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._pending)
+
+    async def call(self, op: int, args: tuple, kwargs: dict[str, Any]) -> Any:
+        future = asyncio.get_running_loop().create_future()
+        request_id = self.send(op, args, kwargs)
+        self._pending[request_id] = future
+        if self._writer.transport.get_write_buffer_size() > _HIGH_WATER:
+            await self._writer.drain()
+        status, value = await future
+        if status == STATUS_OK:
+            return value
+        if status == STATUS_CONFLICT:
+            raise ConflictError(value)
+        if status == STATUS_VALUE_ERROR:
+            raise ValueError(value)
+        raise RuntimeError(f"Store server error: {value}")
+
+    def send(self, op: int, args: tuple, kwargs: dict[str, Any]) -> int:
+        """요청을 보내고 요청 id 를 반환합니다. 응답은 ``call`` 로 보낸 요청만
+        받습니다."""
+
+        if self.closed:
+            raise ConnectionError("Store connection is closed")
+        self._next_id = request_id = (self._next_id + 1) & 0xFFFFFFFF
+        self._writer.write(encode_request(request_id, op, args, kwargs))
+        return request_id
+
+    def close(self) -> None:
+        self._reader.cancel()
+
+    async def _read(self, reader: asyncio.StreamReader) -> None:
+        try:
+            while True:
+                (length,) = FRAME_LENGTH.unpack(
+                    await reader.readexactly(FRAME_LENGTH.size)
+                )
+                request_id, status, value = decode_message(
+                    await reader.readexactly(length)
+                )
+                future = self._pending.pop(request_id, None)
+                if future is not None and not future.done():
+                    future.set_result((status, value))
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            self.closed = True
+            self._writer.close()
+            for future in self._pending.values():
+                if not future.done():
+                    future.set_exception(
+                        ConnectionError("Store server closed the connection")
+                    )
+            self._pending.clear()
+
+
+class StoreClient:
+    """스토어 서버 연결 풀.
+
+    연결은 처음 필요할 때 최대 ``pool_size`` 개까지 열고, 요청마다 대기 중인 요청이 가장
+    적은 연결을 고릅니다. 연결은 이벤트 루프에 묶이므로 루프가 바뀌면 새로 엽니다.
+    """
+
+    def __init__(self, path: str, pool_size: int = 4) -> None:
+        self._path = path
+        self._pool_size = pool_size
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._connections: list[_Connection] = []
+        self._opening: asyncio.Lock | None = None
+
+    async def call(self, target: str, name: str, *args: Any, **kwargs: Any) -> Any:
+        connection = await self.connection()
+        return await connection.call(OP_CODES[(target, name)], args, kwargs)
+
+    async def connection(self) -> _Connection:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop, self._connections, self._opening = loop, [], asyncio.Lock()
+
+        connections = self._connections = [
+            connection for connection in self._connections if not connection.closed
+        ]
+        best = min(
+            connections, key=lambda connection: connection.in_flight, default=None
+        )
+        if best is not None and (
+            not best.in_flight or len(connections) >= self._pool_size
+        ):
+            return best
+
+        async with self._opening:
+            if len(self._connections) >= self._pool_size:
+                return min(
+                    self._connections, key=lambda connection: connection.in_flight
+                )
+            reader, writer = await asyncio.open_unix_connection(self._path)
+            connection = _Connection(reader, writer)
+            self._connections.append(connection)
+            return connection
+
+    def close(self) -> None:
+        for connection in self._connections:
+            connection.close()
+        self._connections = []
+
+
+class RemoteTaskRepository(TaskRepository):
+    """스토어 서버의 Task 리포지토리를 호출합니다.
+
+    반환되는 Task 는 서버 상태의 복사본입니다. 쓰기는 변경 기록과 함께 보내므로 서버가
+    버전을 검사하며, 성공하면 넘긴 Task 의 변경 기록을 지우고 그대로 반환합니다.
+    """
+
+    def __init__(self, client: StoreClient) -> None:
+        self._client = client
+
+    async def add(self, task: Task) -> Task:
+        await self._client.call("tasks", "add", task)
+        task.clear_changes()
+        return task
+
+    async def add_many(self, tasks: list[Task]) -> list[Task]:
+        await self._client.call("tasks", "add_many", tasks)
+        for task in tasks:
+            task.clear_changes()
+        return tasks
+
+    async def get(self, task_id: uuid.UUID) -> Task | None:
+        return await self._client.call("tasks", "get", task_id)
+
+    async def get_many(self, task_ids: list[uuid.UUID]) -> dict[uuid.UUID, Task]:
+        return await self._client.call("tasks", "get_many", task_ids)
+
+    async def list_by_status(self, status: str | None = None) -> list[Task]:
+        return await self._client.call("tasks", "list_by_status", status)
+
+    async def list_page(
+        self,
+        *,
+        status: str | None = None,
+        order_by: TaskSortField = TaskSortField.CREATED_AT,
+        descending: bool = False,
+        after: TaskKeyset | None = None,
+        limit: int | None = None,
+    ) -> list[Task]:
+        return await self._client.call(
+            "tasks",
+            "list_page",
+            status=status,
+            order_by=order_by,
+            descending=descending,
+            after=after,
+            limit=limit,
+        )
+
+    async def list_by_due_range(
+        self,
+        *,
+        due_after: date | None = None,
+        due_before: date | None = None,
+        status: str | None = None,
+        after: TaskKeyset | None = None,
+        limit: int | None = None,
+    ) -> list[Task]:
+        return await self._client.call(
+            "tasks",
+            "list_by_due_range",
+            due_after=due_after,
+            due_before=due_before,
+            status=status,
+            after=after,
+            limit=limit,
+        )
+
+    async def query(
+        self,
+        task_filter: TaskFilter,
+        *,
+        order_by: TaskSortField = TaskSortField.CREATED_AT,
+        descending: bool = False,
+        after: TaskKeyset | None = None,
+        limit: int | None = None,
+        explain: bool = False,
+    ) -> TaskQueryResult:
+        return await self._client.call(
+            "tasks",
+            "query",
+            task_filter,
+            order_by=order_by,
+            descending=descending,
+            after=after,
+            limit=limit,
+            explain=explain,
+        )
+
+    async def search(
+        self, query: str, *, limit: int = 20, offset: int = 0
+    ) -> TaskSearchResult:
+        return await self._client.call(
+            "tasks", "search", query, limit=limit, offset=offset
+        )
+
+    async def count_by_retrospective(
+        self, retrospective_ids: list[uuid.UUID]
+    ) -> dict[uuid.UUID, dict[TaskStatus, int]]:
+        return await self._client.call(
+            "tasks", "count_by_retrospective", retrospective_ids
+        )
+
+    async def stats(self, today: date) -> TaskStats:
+        return await self._client.call("tasks", "stats", today)
+
+    async def update(self, task: Task) -> Task:
+        await self._client.call("tasks", "update", task)
+        task.clear_changes()
+        return task
+
+    async def update_many(self, tasks: list[Task]) -> list[Task]:
+        await self._client.call("tasks", "update_many", tasks)
+        for task in tasks:
+            task.clear_changes()
+        return tasks
+
+    async def delete(self, task_id: uuid.UUID) -> None:
+        await self._client.call("tasks", "delete", task_id)
+
+    async def delete_many(self, task_ids: list[uuid.UUID]) -> list[uuid.UUID]:
+        return await self._client.call("tasks", "delete_many", task_ids)
+
+    async def version(self, status: str | None = None) -> int:
+        return await self._client.call("tasks", "version", status)
+
+
+class RemoteRetrospectiveRepository(RetrospectiveRepository):
+    """스토어 서버의 Retrospective 리포지토리를 호출합니다."""
+
+    def __init__(self, client: StoreClient) -> None:
+        self._client = client
+
+    async def add(self, retrospective: Retrospective) -> Retrospective:
+        await self._client.call("retrospectives", "add", retrospective)
+        retrospective.clear_changes()
+        return retrospective
+
+    async def get_by_date(self, retrospective_date: date) -> Retrospective | None:
+        return await self._client.call(
+            "retrospectives", "get_by_date", retrospective_date
+        )
+
+    async def get(self, retrospective_id: uuid.UUID) -> Retrospective | None:
+        return await self._client.call("retrospectives", "get", retrospective_id)
+
+    async def list_by_date_range(self, start: date, end: date) -> list[Retrospective]:
+        return await self._client.call(
+            "retrospectives", "list_by_date_range", start, end
+        )
+
+    async def update(self, retrospective: Retrospective) -> Retrospective:
+        await self._client.call("retrospectives", "update", retrospective)
+        retrospective.clear_changes()
+        return retrospective
+
+    async def version(self) -> int:
+        return await self._client.call("retrospectives", "version")
+
+
+class RemoteTransactionalStore(TransactionalStore):
+    """스토어 서버의 잠금과 원자적 커밋을 사용합니다.
+
+    잠금은 서버가 임대(lease) 로 쥐고 있으므로 여러 워커 프로세스 사이에서도 유효합니다.
+    잠금/해제 요청은 같은 연결로 보내 서버가 보낸 순서대로 처리하게 하며, 연결이 끊기면
+    서버가 그 연결의 잠금을 모두 풉니다.
+    """
+
+    def __init__(self, client: StoreClient) -> None:
+        self._client = client
+
+    @asynccontextmanager
+    async def lock(self, entity_ids: Iterable[uuid.UUID]) -> AsyncIterator[None]:
+        connection = await self._client.connection()
+        lease = uuid.uuid4()
+        try:
+            await connection.call(
+                OP_CODES[("store", "lock")], (lease, list(entity_ids)), {}
+            )
+            yield
+        finally:
+            # 응답을 기다리지 않습니다. 취소된 요청에서도 해제 요청은 반드시 나갑니다.
+            with suppress(ConnectionError):
+                connection.send(OP_CODES[("store", "unlock")], (lease,), {})
+
+    async def commit(
+        self, tasks: list[Task], retrospectives: list[Retrospective]
+    ) -> None:
+        await self._client.call("store", "commit", tasks, retrospectives)
+        for entity in (*tasks, *retrospectives):
+            entity.clear_changes()
+
+    async def close(self) -> None:
+        self._client.close()
+
+
+class RemoteChangeFeed(ChangeFeed):
+    """스토어 서버의 변경 피드를 읽습니다. 모든 워커가 같은 순번을 봅니다."""
+
+    def __init__(self, client: StoreClient) -> None:
+        self._client = client
+
+    async def since(self, sequence: int, limit: int) -> ChangeBatch:
+        return await self._client.call("changes", "since", sequence, limit)
+
+    async def latest(self) -> int:
+        return await self._client.call("changes", "latest")
+
+    async def wait(self, sequence: int, timeout: float) -> int:
+        # 서버가 ``timeout`` 동안 응답을 붙잡고 있으므로 그동안 연결 하나에 요청이 걸려
+        # 있습니다.
+        return await self._client.call("changes", "wait", sequence, timeout)
+
+
+__all__ = [
+    "RemoteChangeFeed",
+    "RemoteRetrospectiveRepository",
+    "RemoteTaskRepository",
+    "RemoteTransactionalStore",
+    "StoreClient",
+]
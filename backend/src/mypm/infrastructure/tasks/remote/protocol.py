@@ -0,0 +1,343 @@
+"""스토어 서버 바이너리 프로토콜.
+
+프레임 (리틀 엔디언)::
+
+    request  = <u32 길이> <u32 요청 id> <u8 op>     value
+    response = <u32 길이> <u32 요청 id> <u8 상태>   value
+
+길이는 길이 필드 뒤의 바이트 수입니다. 요청 값은 ``[위치 인자 목록, 키워드 인자 사전]``,
+응답 값은 반환값 또는 오류 메시지입니다. 한 연결에서 응답을 기다리지 않고 여러 요청을
+보낼 수 있고(파이프라이닝) 응답은 끝난 순서대로 오므로 요청 id 로 짝을 맞춥니다.
+
+값은 1바이트 태그 뒤에 내용이 이어지는 자기 기술 형식입니다. ``Task`` /
+``Retrospective`` 는 변경 기록(``changes``)까지 함께 보내므로 서버는 클라이언트가 읽은
+버전으로 낙관적 버전 검사를 할 수 있습니다.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import struct
+import uuid
+from datetime import date, datetime, timedelta
+from typing import Any
+
+from mypm.domain.tasks.changes import Change, ChangeBatch, ChangeKind
+from mypm.domain.tasks.entities import Retrospective, Task, TaskIdSet, TaskStatus
+from mypm.domain.tasks.queries import (
+    TaskFilter,
+    TaskKeyset,
+    TaskPlanStep,
+    TaskQueryPlan,
+    TaskQueryResult,
+    TaskSearchHit,
+    TaskSearchResult,
+    TaskSortField,
+)
+from mypm.domain.tasks.stats import TaskStats
+
+FRAME_LENGTH = struct.Struct("<I")
+# 요청 id, op(요청) 또는 상태(응답)
+MESSAGE_HEADER = struct.Struct("<IB")
+
+STATUS_OK = 0
+STATUS_VALUE_ERROR = 1
+STATUS_CONFLICT = 2
+STATUS_ERROR = 3
+
+# op 번호 -> (대상, 메서드). 서버는 이 표에 있는 메서드만 호출합니다.
+OPERATIONS: tuple[tuple[str, str], ...] = (
+    ("tasks", "add"),
+    ("tasks", "add_many"),
+    ("tasks", "get"),
+    ("tasks", "get_many"),
+    ("tasks", "list_by_status"),
+    ("tasks", "list_page"),
+    ("tasks", "list_by_due_range"),
+    ("tasks", "query"),
+    ("tasks", "search"),
+    ("tasks", "count_by_retrospective"),
+    ("tasks", "stats"),
+    ("tasks", "update"),
+    ("tasks", "update_many"),
+    ("tasks", "delete"),
+    ("tasks", "delete_many"),
+    ("tasks", "version"),
+    ("retrospectives", "add"),
+    ("retrospectives", "get_by_date"),
+    ("retrospectives", "get"),
+    ("retrospectives", "list_by_date_range"),
+    ("retrospectives", "update"),
+    ("retrospectives", "version"),
+    ("store", "commit"),
+    ("store", "lock"),
+    ("store", "unlock"),
+    ("changes", "since"),
+    ("changes", "latest"),
+    ("changes", "wait"),
+)
+OP_CODES = {operation: code for code, operation in enumerate(OPERATIONS)}
+
+# 인자로 받은 엔티티를 그대로 돌려주는 쓰기 메서드. 응답에는 결과를 싣지 않습니다.
+WRITE_OPERATIONS = frozenset(
+    OP_CODES[operation]
+    for operation in (
+        ("tasks", "add"),
+        ("tasks", "add_many"),
+        ("tasks", "update"),
+        ("tasks", "update_many"),
+        ("retrospectives", "add"),
+        ("retrospectives", "update"),
+    )
+)
+
+_NONE, _TRUE, _FALSE, _INT, _FLOAT, _STR, _LIST, _DICT = range(8)
+_UUID, _DATE, _DATETIME, _TASK, _RETROSPECTIVE, _ENUM, _RECORD = range(8, 15)
+
+_ENUMS = (TaskStatus, TaskSortField, ChangeKind)
+_ENUM_CODES = {enum: code for code, enum in enumerate(_ENUMS)}
+_RECORDS = (
+    TaskKeyset,
+    TaskSearchHit,
+    TaskSearchResult,
+    TaskStats,
+    Change,
+    ChangeBatch,
+    TaskFilter,
+    TaskPlanStep,
+    TaskQueryPlan,
+    TaskQueryResult,
+)
+_RECORD_CODES = {record: code for code, record in enumerate(_RECORDS)}
+_RECORD_FIELDS = [
+    tuple(field.name for field in dataclasses.fields(record)) for record in _RECORDS
+]
+
+_U32 = struct.Struct("<I")
+_I32 = struct.Struct("<i")
+_I64 = struct.Struct("<q")
+_F64 = struct.Struct("<d")
+
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+_new_object = object.__new__
+_set_attribute = object.__setattr__
+
+
+def encode_request(
+    request_id: int, op: int, args: tuple, kwargs: dict[str, Any]
+) -> bytes:
+    return _frame(request_id, op, [list(args), kwargs])
+
+
+def encode_response(request_id: int, status: int, value: Any) -> bytes:
+    return _frame(request_id, status, value)
+
+
+def _frame(request_id: int, code: int, value: Any) -> bytes:
+    out = bytearray(FRAME_LENGTH.size + MESSAGE_HEADER.size)
+    _encode(value, out)
+    FRAME_LENGTH.pack_into(out, 0, len(out) - FRAME_LENGTH.size)
+    MESSAGE_HEADER.pack_into(out, FRAME_LENGTH.size, request_id, code)
+    return bytes(out)
+
+
+def decode_message(frame: bytes) -> tuple[int, int, Any]:
+    """길이 필드를 뺀 프레임을 (요청 id, op 또는 상태, 값) 으로 풉니다."""
+
+    request_id, code = MESSAGE_HEADER.unpack_from(frame)
+    value, _ = _decode(memoryview(frame), MESSAGE_HEADER.size)
+    return request_id, code, value
+
+
+def _encode(value: Any, out: bytearray) -> None:
+    kind = type(value)
+    if value is None:
+        out.append(_NONE)
+    elif kind is bool:
+        out.append(_TRUE if value else _FALSE)
+    elif kind is int:
+        out.append(_INT)
+        out += _I64.pack(value)
+    elif kind is float:
+        out.append(_FLOAT)
+        out += _F64.pack(value)
+    elif kind is str:
+        encoded = value.encode()
+        out.append(_STR)
+        out += _U32.pack(len(encoded))
+        out += encoded
+    elif kind is uuid.UUID:
+        out.append(_UUID)
+        out += value.bytes
+    elif kind is datetime:
+        out.append(_DATETIME)
+        out += _I64.pack((value - _EPOCH) // _MICROSECOND)
+    elif kind is date:
+        out.append(_DATE)
+        out += _I32.pack(value.toordinal())
+    elif kind in _ENUM_CODES:
+        out.append(_ENUM)
+        out.append(_ENUM_CODES[kind])
+        _encode(value.value, out)
+    elif kind is Task:
+        out.append(_TASK)
+        for item in (
+            value.id,
+            value.title,
+            value.description,
+            value.status,
+            value.due_date,
+            value.retrospective_id,
+            value.created_at,
+            value.updated_at,
+            dict(value.changes),
+        ):
+            _encode(item, out)
+    elif kind is Retrospective:
+        out.append(_RETROSPECTIVE)
+        for item in (
+            value.id,
+            value.title,
+            value.summary,
+            value.date,
+            value.tasks,
+            value.created_at,
+            value.updated_at,
+            dict(value.changes),
+        ):
+            _encode(item, out)
+    elif kind in _RECORD_CODES:
+        code = _RECORD_CODES[kind]
+        out.append(_RECORD)
+        out.append(code)
+        for name in _RECORD_FIELDS[code]:
+            _encode(getattr(value, name), out)
+    elif isinstance(value, dict):
+        out.append(_DICT)
+        out += _U32.pack(len(value))
+        for key, item in value.items():
+            _encode(key, out)
+            _encode(item, out)
+    elif isinstance(value, (list, tuple, set, frozenset, TaskIdSet)):
+        out.append(_LIST)
+        out += _U32.pack(len(value))
+        for item in value:
+            _encode(item, out)
+    else:
+        raise TypeError(f"Cannot encode {kind.__name__}")
+
+
+def _decode(buffer: memoryview, offset: int) -> tuple[Any, int]:
+    tag = buffer[offset]
+    offset += 1
+    if tag == _NONE:
+        return None, offset
+    if tag == _TRUE:
+        return True, offset
+    if tag == _FALSE:
+        return False, offset
+    if tag == _INT:
+        return _I64.unpack_from(buffer, offset)[0], offset + 8
+    if tag == _FLOAT:
+        return _F64.unpack_from(buffer, offset)[0], offset + 8
+    if tag == _STR:
+        (length,) = _U32.unpack_from(buffer, offset)
+        offset += 4
+        return str(buffer[offset : offset + length], "utf-8"), offset + length
+    if tag == _UUID:
+        value = _new_object(uuid.UUID)
+        _set_attribute(value, "int", int.from_bytes(buffer[offset : offset + 16]))
+        _set_attribute(value, "is_safe", uuid.SafeUUID.unknown)
+        return value, offset + 16
+    if tag == _DATETIME:
+        return _EPOCH + _MICROSECOND * _I64.unpack_from(buffer, offset)[0], offset + 8
+    if tag == _DATE:
+        return date.fromordinal(_I32.unpack_from(buffer, offset)[0]), offset + 4
+    if tag == _ENUM:
+        enum = _ENUMS[buffer[offset]]
+        value, offset = _decode(buffer, offset + 1)
+        return enum(value), offset
+    if tag == _LIST:
+        (count,) = _U32.unpack_from(buffer, offset)
+        offset += 4
+        items = []
+        for _ in range(count):
+            item, offset = _decode(buffer, offset)
+            items.append(item)
+        return items, offset
+    if tag == _DICT:
+        (count,) = _U32.unpack_from(buffer, offset)
+        offset += 4
+        mapping = {}
+        for _ in range(count):
+            key, offset = _decode(buffer, offset)
+            mapping[key], offset = _decode(buffer, offset)
+        return mapping, offset
+    if tag == _TASK:
+        fields = []
+        for _ in range(9):
+            item, offset = _decode(buffer, offset)
+            fields.append(item)
+        (
+            task_id,
+            title,
+            description,
+            status,
+            due_date,
+            retrospective_id,
+            created_at,
+            updated_at,
+            changes,
+        ) = fields
+        task = Task(
+            id=task_id,
+            title=title,
+            description=description,
+            status=status,
+            due_date=due_date,
+            retrospective_id=retrospective_id,
+            created_at=created_at,
+            updated_at=updated_at,
+        )
+        task.restore_changes(changes)
+        return task, offset
+    if tag == _RETROSPECTIVE:
+        fields = []
+        for _ in range(8):
+            item, offset = _decode(buffer, offset)
+            fields.append(item)
+        (
+            retrospective_id,
+            title,
+            summary,
+            retrospective_date,
+            tasks,
+            created_at,
+            updated_at,
+            changes,
+        ) = fields
+        retrospective = Retrospective(
+            id=retrospective_id,
+            title=title,
+            summary=summary,
+            date=retrospective_date,
+            tasks=tasks,
+            created_at=created_at,
+            updated_at=updated_at,
+        )
+        if "tasks" in changes:
+            # 도메인은 이전 회고 목록을 튜플로 기록합니다.
+            changes["tasks"] = tuple(changes["tasks"])
+        retrospective.restore_changes(changes)
+        return retrospective, offset
+    if tag == _RECORD:
+        code = buffer[offset]
+        offset += 1
+        values = []
+        for _ in _RECORD_FIELDS[code]:
+            item, offset = _decode(buffer, offset)
+            values.append(item)
+        return _RECORDS[code](*values), offset
+    raise ValueError(f"Unknown value tag: {tag}")
@@ -0,0 +1,156 @@
+"""리포지토리를 Unix 도메인 소켓으로 제공하는 스토어 서버."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import os
+import uuid
+from typing import Any
+
+from mypm.domain.tasks.errors import ConflictError
+from mypm.domain.tasks.repositories import (
+    ChangeFeed,
+    RetrospectiveRepository,
+    TaskRepository,
+    TransactionalStore,
+)
+from mypm.infrastructure.tasks.remote.protocol import (
+    FRAME_LENGTH,
+    OP_CODES,
+    OPERATIONS,
+    STATUS_CONFLICT,
+    STATUS_ERROR,
+    STATUS_OK,
+    STATUS_VALUE_ERROR,
+    WRITE_OPERATIONS,
+    decode_message,
+    encode_response,
+)
+
+_OP_LOCK = OP_CODES[("store", "lock")]
+_OP_UNLOCK = OP_CODES[("store", "unlock")]
+_LEASE_OPERATIONS = frozenset({("store", "lock"), ("store", "unlock")})
+# 쓰기 버퍼가 이보다 커지면 응답을 보내기 전에 소켓이 비워지기를 기다립니다.
+_HIGH_WATER = 1 << 20
+
+
+class StoreServer:
+    """한 프로세스가 리포지토리를 소유하고 여러 API 워커에 제공합니다.
+
+    연결마다 요청을 읽는 즉시 별도 태스크로 실행하므로 한 연결에 파이프라이닝된 요청이
+    서로를 기다리지 않습니다. 잠금 요청은 ``store.lock`` 을 잡은 채 임대(lease) 로
+    유지하다가 해제 요청이나 연결 종료 때 풉니다.
+    """
+
+    def __init__(
+        self,
+        tasks: TaskRepository,
+        retrospectives: RetrospectiveRepository,
+        store: TransactionalStore,
+        changes: ChangeFeed,
+    ) -> None:
+        self._store = store
+        targets: dict[str, Any] = {
+            "tasks": tasks,
+            "retrospectives": retrospectives,
+            "store": store,
+            "changes": changes,
+        }
+        self._handlers = [
+            getattr(targets[target], name)
+            if (target, name) not in _LEASE_OPERATIONS
+            else None
+            for target, name in OPERATIONS
+        ]
+        # 임대 id -> 잠금을 쥐고 있는 태스크
+        self._leases: dict[uuid.UUID, asyncio.Task[None]] = {}
+
+    async def start(self, path: str) -> asyncio.Server:
+        """``path`` 에 소켓을 열고 서버를 반환합니다. 남아 있던 소켓 파일은 지웁니다."""
+
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(path)
+        return await asyncio.start_unix_server(self._serve_connection, path)
+
+    async def _serve_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        leases: set[uuid.UUID] = set()
+        running: set[asyncio.Task[None]] = set()
+        try:
+            while True:
+                (length,) = FRAME_LENGTH.unpack(
+                    await reader.readexactly(FRAME_LENGTH.size)
+                )
+                frame = await reader.readexactly(length)
+                task = asyncio.create_task(self._dispatch(writer, frame, leases))
+                running.add(task)
+                task.add_done_callback(running.discard)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            # 연결이 끊긴 클라이언트의 잠금은 모두 풉니다.
+            for lease in list(leases):
+                self._release(lease)
+            writer.close()
+
+    async def _dispatch(
+        self, writer: asyncio.StreamWriter, frame: bytes, leases: set[uuid.UUID]
+    ) -> None:
+        request_id, op, (args, kwargs) = decode_message(frame)
+        try:
+            if op == _OP_LOCK:
+                result = await self._acquire(*args, leases=leases)
+            elif op == _OP_UNLOCK:
+                result = self._release(*args)
+                leases.discard(args[0])
+            else:
+                result = await self._handlers[op](*args, **kwargs)
+                if op in WRITE_OPERATIONS:
+                    result = None
+            response = encode_response(request_id, STATUS_OK, result)
+        except ConflictError as exc:
+            response = encode_response(request_id, STATUS_CONFLICT, str(exc))
+        except ValueError as exc:
+            response = encode_response(request_id, STATUS_VALUE_ERROR, str(exc))
+        except Exception as exc:
+            # 서버는 계속 동작하고 오류는 호출한 워커에 전달합니다.
+            response = encode_response(
+                request_id, STATUS_ERROR, f"{type(exc).__name__}: {exc}"
+            )
+
+        if writer.is_closing():
+            return
+        writer.write(response)
+        if writer.transport.get_write_buffer_size() > _HIGH_WATER:
+            with contextlib.suppress(ConnectionError):
+                await writer.drain()
+
+    async def _acquire(
+        self, lease: uuid.UUID, entity_ids: list[uuid.UUID], *, leases: set[uuid.UUID]
+    ) -> None:
+        acquired = asyncio.Event()
+
+        async def _hold() -> None:
+            async with self._store.lock(entity_ids):
+                acquired.set()
+                await asyncio.Event().wait()
+
+        holder = asyncio.create_task(_hold())
+        self._leases[lease] = holder
+        leases.add(lease)
+        waiter = asyncio.create_task(acquired.wait())
+        # 잠금을 얻기 전에 해제 요청이 오면(클라이언트 취소) holder 가 먼저 끝납니다.
+        await asyncio.wait((holder, waiter), return_when=asyncio.FIRST_COMPLETED)
+        waiter.cancel()
+        if not acquired.is_set():
+            raise ValueError("Lock was released before it was acquired")
+
+    def _release(self, lease: uuid.UUID) -> None:
+        holder = self._leases.pop(lease, None)
+        if holder is not None:
+            holder.cancel()
+
+
+__all__ = ["StoreServer"]
@@ -0,0 +1,210 @@
+"""Task 제목/설명 전문 검색 역색인."""
+
+from __future__ import annotations
+
+import math
+import re
+import unicodedata
+import uuid
+from collections import Counter
+from itertools import islice, product, repeat
+
+from mypm.domain.tasks.entities import Task
+
+# 한글(자모/음절), 가나, 한자 범위. 띄어쓰기만으로 단어를 나눌 수 없으므로 n-gram 으로
+# 색인합니다.
+_CJK_RANGES = (
+    "\u1100-\u11ff\u3130-\u318f\uac00-\ud7a3\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff"
+)
+_TOKEN_PATTERN = re.compile(f"([{_CJK_RANGES}]+)|([^\\W_{_CJK_RANGES}]+)")
+
+# 제목에 나온 토큰은 설명보다 높게 평가합니다.
+_TITLE_WEIGHT = 2.0
+_DESCRIPTION_WEIGHT = 1.0
+# BM25 의 단어 빈도 포화 계수
+_SATURATION = 1.2
+
+
+def tokenize(text: str | None) -> list[str]:
+    """NFKC 정규화와 대소문자 통합 후 토큰으로 나눕니다.
+
+    한중일 문자열은 1-gram 과 2-gram 으로, 그 밖의 문자열은 단어 단위로 분리합니다.
+    """
+
+    if not text:
+        return []
+
+    normalized = unicodedata.normalize("NFKC", text).casefold()
+    tokens: list[str] = []
+    for cjk, word in _TOKEN_PATTERN.findall(normalized):
+        if word:
+            tokens.append(word)
+            continue
+
+        tokens.extend(cjk)
+        tokens.extend(cjk[index : index + 2] for index in range(len(cjk) - 1))
+    return tokens
+
+
+def query_tokens(query: str) -> list[str]:
+    """질의 토큰. 2-gram 이 있는 한중일 구간은 1-gram 을 생략해 후보를 좁힙니다."""
+
+    if not query:
+        return []
+
+    normalized = unicodedata.normalize("NFKC", query).casefold()
+    tokens: list[str] = []
+    for cjk, word in _TOKEN_PATTERN.findall(normalized):
+        if word:
+            tokens.append(word)
+        elif len(cjk) == 1:
+            tokens.append(cjk)
+        else:
+            tokens.extend(cjk[index : index + 2] for index in range(len(cjk) - 1))
+    return list(dict.fromkeys(tokens))
+
+
+def _document_weights(task: Task) -> dict[str, float]:
+    counts: Counter[str] = Counter()
+    for token in tokenize(task.title):
+        counts[token] += _TITLE_WEIGHT
+    for token in tokenize(task.description):
+        counts[token] += _DESCRIPTION_WEIGHT
+    return {token: count / (count + _SATURATION) for token, count in counts.items()}
+
+
+class TaskSearchIndex:
+    """증분 갱신되는 역색인.
+
+    토큰마다 문서 번호 집합(교집합/건수용)과, 같은 가중치끼리 묶은 집합(순위용)을
+    유지합니다. 문서 번호는 작은 정수라 해시 비용이 UUID 보다 훨씬 작습니다.
+
+    가중치는 단어 빈도에서 나온 이산 값이라 토큰별 가중치 종류가 몇 개뿐입니다.
+    그래서 상위 결과는 (토큰별 가중치 조합) 을 점수 내림차순으로 돌며 해당 묶음들의
+    교집합에서 필요한 만큼만 꺼내 구하고, 후보 전체에 점수를 매기지 않습니다.
+    """
+
+    def __init__(self) -> None:
+        self._postings: dict[str, set[int]] = {}
+        self._buckets: dict[str, dict[float, set[int]]] = {}
+        self._documents: dict[int, dict[str, float]] = {}
+        self._doc_numbers: dict[uuid.UUID, int] = {}
+        self._task_ids: dict[int, uuid.UUID] = {}
+        self._next_number = 0
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    def index(self, task: Task) -> None:
+        """Task 를 추가하거나, 이미 있으면 바뀐 토큰만 갱신합니다."""
+
+        weights = _document_weights(task)
+        number = self._doc_numbers.get(task.id)
+        if number is None:
+            number = self._next_number
+            self._next_number += 1
+            self._doc_numbers[task.id] = number
+            self._task_ids[number] = task.id
+            previous: dict[str, float] = {}
+        else:
+            previous = self._documents[number]
+            if previous == weights:
+                return
+
+        for token, weight in previous.items():
+            if weights.get(token) != weight:
+                self._unpost(token, weight, number, keep_posting=token in weights)
+        for token, weight in weights.items():
+            if previous.get(token) != weight:
+                self._postings.setdefault(token, set()).add(number)
+                self._buckets.setdefault(token, {}).setdefault(weight, set()).add(
+                    number
+                )
+        self._documents[number] = weights
+
+    def remove(self, task_id: uuid.UUID) -> None:
+        number = self._doc_numbers.pop(task_id, None)
+        if number is None:
+            return
+
+        del self._task_ids[number]
+        for token, weight in self._documents.pop(number).items():
+            self._unpost(token, weight, number, keep_posting=False)
+
+    def search(
+        self, query: str, *, limit: int, offset: int = 0
+    ) -> tuple[list[tuple[uuid.UUID, float]], int]:
+        """(Task ID, 점수) 목록과 전체 일치 건수를 반환합니다."""
+
+        tokens = query_tokens(query)
+        if not tokens or any(token not in self._postings for token in tokens):
+            return [], 0
+
+        tokens.sort(key=lambda token: len(self._postings[token]))
+        if len(tokens) == 1:
+            total = len(self._postings[tokens[0]])
+        else:
+            candidates = self._postings[tokens[0]] & self._postings[tokens[1]]
+            for token in tokens[2:]:
+                candidates &= self._postings[token]
+            total = len(candidates)
+        if total == 0:
+            return [], 0
+
+        total_documents = len(self._documents)
+        idfs = [
+            math.log(1 + total_documents / len(self._postings[token]))
+            for token in tokens
+        ]
+        buckets = [self._buckets[token] for token in tokens]
+        combinations = sorted(
+            (
+                (
+                    sum(idf * weight for idf, weight in zip(idfs, combination)),
+                    combination,
+                )
+                for combination in product(
+                    *(sorted(bucket, reverse=True) for bucket in buckets)
+                )
+            ),
+            reverse=True,
+        )
+
+        wanted = offset + limit
+        selected: list[tuple[int, float]] = []
+        for score, combination in combinations:
+            members = [bucket[weight] for bucket, weight in zip(buckets, combination)]
+            members.sort(key=len)
+            matched = members[0]
+            for other in members[1:]:
+                matched = matched & other
+                if not matched:
+                    break
+            selected.extend(zip(islice(matched, wanted - len(selected)), repeat(score)))
+            if len(selected) >= wanted:
+                break
+
+        task_ids = self._task_ids
+        hits = [(task_ids[number], score) for number, score in selected[offset:wanted]]
+        return hits, total
+
+    def _unpost(
+        self, token: str, weight: float, number: int, *, keep_posting: bool
+    ) -> None:
+        buckets = self._buckets[token]
+        bucket = buckets[weight]
+        bucket.discard(number)
+        if not bucket:
+            del buckets[weight]
+
+        if keep_posting:
+            return
+
+        posting = self._postings[token]
+        posting.discard(number)
+        if not posting:
+            del self._postings[token]
+            del self._buckets[token]
+
+
+__all__ = ["TaskSearchIndex", "query_tokens", "tokenize"]
@@ -0,0 +1,245 @@
+"""SQLite 커넥션 풀."""
+
+from __future__ import annotations
+
+import asyncio
+import sqlite3
+import threading
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import TypeVar
+
+from mypm.domain.tasks.queries import fold_text
+
+T = TypeVar("T")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    id BLOB PRIMARY KEY,
+    title TEXT NOT NULL,
+    description TEXT,
+    status TEXT NOT NULL,
+    due_date TEXT,
+    -- 정렬용 마감일 키. 마감일이 없으면 '~' 로 저장해 오름차순 마지막에 둡니다.
+    due_key TEXT NOT NULL,
+    retrospective_id BLOB,
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_tasks_status ON tasks (status, created_at, id);
+CREATE INDEX IF NOT EXISTS idx_tasks_status_updated_at
+    ON tasks (status, updated_at, id);
+CREATE INDEX IF NOT EXISTS idx_tasks_status_due_date ON tasks (status, due_key, id);
+CREATE INDEX IF NOT EXISTS idx_tasks_created_at ON tasks (created_at, id);
+CREATE INDEX IF NOT EXISTS idx_tasks_updated_at ON tasks (updated_at, id);
+CREATE INDEX IF NOT EXISTS idx_tasks_due_date ON tasks (due_key, id);
+CREATE INDEX IF NOT EXISTS idx_tasks_retrospective_id ON tasks (retrospective_id);
+
+CREATE TABLE IF NOT EXISTS retrospectives (
+    id BLOB PRIMARY KEY,
+    title TEXT NOT NULL,
+    summary TEXT,
+    date TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_retrospectives_date ON retrospectives (date, updated_at);
+
+-- 컬렉션/상태 버킷별 변경 버전 ("tasks", "tasks:<status>", "retrospectives")
+CREATE TABLE IF NOT EXISTS versions (
+    name TEXT PRIMARY KEY,
+    version INTEGER NOT NULL
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS retrospective_tasks (
+    retrospective_id BLOB NOT NULL,
+    task_id BLOB NOT NULL,
+    position INTEGER NOT NULL,
+    PRIMARY KEY (retrospective_id, task_id)
+) WITHOUT ROWID;
+
+-- Retrospective 별 상태 카운터. tasks 트리거가 행 단위로 증감합니다.
+CREATE TABLE IF NOT EXISTS retrospective_task_counts (
+    retrospective_id BLOB NOT NULL,
+    status TEXT NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (retrospective_id, status)
+) WITHOUT ROWID;
+
+CREATE TRIGGER IF NOT EXISTS trg_tasks_count_insert AFTER INSERT ON tasks
+WHEN NEW.retrospective_id IS NOT NULL
+BEGIN
+    INSERT INTO retrospective_task_counts (retrospective_id, status, count)
+    VALUES (NEW.retrospective_id, NEW.status, 1)
+    ON CONFLICT (retrospective_id, status) DO UPDATE SET count = count + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_tasks_count_delete AFTER DELETE ON tasks
+WHEN OLD.retrospective_id IS NOT NULL
+BEGIN
+    UPDATE retrospective_task_counts SET count = count - 1
+    WHERE retrospective_id = OLD.retrospective_id AND status = OLD.status;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_tasks_count_update
+AFTER UPDATE OF status, retrospective_id ON tasks
+WHEN OLD.status IS NOT NEW.status OR OLD.retrospective_id IS NOT NEW.retrospective_id
+BEGIN
+    UPDATE retrospective_task_counts SET count = count - 1
+    WHERE retrospective_id = OLD.retrospective_id AND status = OLD.status;
+    INSERT INTO retrospective_task_counts (retrospective_id, status, count)
+    SELECT NEW.retrospective_id, NEW.status, 1 WHERE NEW.retrospective_id IS NOT NULL
+    ON CONFLICT (retrospective_id, status) DO UPDATE SET count = count + 1;
+END;
+
+-- (상태, 마감일 키) 별 Task 수.
+-- 통계의 상태/마감 구간 집계를 날짜 수 만큼의 행으로 줄입니다.
+CREATE TABLE IF NOT EXISTS task_due_counts (
+    status TEXT NOT NULL,
+    due_key TEXT NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (status, due_key)
+) WITHOUT ROWID;
+
+CREATE TRIGGER IF NOT EXISTS trg_tasks_due_count_insert AFTER INSERT ON tasks
+BEGIN
+    INSERT INTO task_due_counts (status, due_key, count)
+    VALUES (NEW.status, NEW.due_key, 1)
+    ON CONFLICT (status, due_key) DO UPDATE SET count = count + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_tasks_due_count_delete AFTER DELETE ON tasks
+BEGIN
+    UPDATE task_due_counts SET count = count - 1
+    WHERE status = OLD.status AND due_key = OLD.due_key;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_tasks_due_count_update
+AFTER UPDATE OF status, due_key ON tasks
+WHEN OLD.status IS NOT NEW.status OR OLD.due_key IS NOT NEW.due_key
+BEGIN
+    UPDATE task_due_counts SET count = count - 1
+    WHERE status = OLD.status AND due_key = OLD.due_key;
+    INSERT INTO task_due_counts (status, due_key, count)
+    VALUES (NEW.status, NEW.due_key, 1)
+    ON CONFLICT (status, due_key) DO UPDATE SET count = count + 1;
+END;
+"""
+
+# 카운터 테이블이 없던 기존 DB 를 열 때 한 번만 현재 Task 로부터 채웁니다.
+_COUNTER_BACKFILLS = {
+    "retrospective_task_counts": """
+        INSERT INTO retrospective_task_counts (retrospective_id, status, count)
+        SELECT retrospective_id, status, COUNT(*) FROM tasks
+        WHERE retrospective_id IS NOT NULL
+        GROUP BY retrospective_id, status
+    """,
+    "task_due_counts": """
+        INSERT INTO task_due_counts (status, due_key, count)
+        SELECT status, due_key, COUNT(*) FROM tasks GROUP BY status, due_key
+    """,
+}
+
+
+class SQLiteConnectionPool:
+    """스레드별 커넥션을 가진 고정 크기 SQLite 풀.
+
+    모든 블로킹 호출은 풀 크기만큼의 워커 스레드에서 실행되므로 이벤트 루프를
+    막지 않으며, 각 워커는 WAL 모드로 열린 자신의 커넥션을 재사용합니다.
+    """
+
+    def __init__(
+        self, path: str, size: int = 4, *, busy_timeout_ms: int = 5000
+    ) -> None:
+        if size < 1:
+            raise ValueError("Pool size must be positive")
+
+        self._path = path
+        self._busy_timeout_ms = busy_timeout_ms
+        self._local = threading.local()
+        self._connections: list[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(
+            max_workers=size, thread_name_prefix="mypm-sqlite"
+        )
+
+        # 스키마는 생성 시점에 한 번만 적용합니다.
+        with self._lock:
+            connection = self._connect()
+        existing = {
+            name
+            for (name,) in connection.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'table'"
+            )
+        }
+        connection.executescript(_SCHEMA)
+        for table, backfill in _COUNTER_BACKFILLS.items():
+            if table not in existing:
+                connection.execute(backfill)
+
+    async def run(self, func: Callable[[sqlite3.Connection], T]) -> T:
+        """워커 스레드에서 ``func(connection)`` 을 실행합니다."""
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self._call, func)
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=True)
+        with self._lock:
+            for connection in self._connections:
+                connection.close()
+            self._connections.clear()
+
+    def _call(self, func: Callable[[sqlite3.Connection], T]) -> T:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            with self._lock:
+                connection = self._connect()
+            self._local.connection = connection
+
+        return func(connection)
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(
+            self._path,
+            isolation_level=None,
+            check_same_thread=False,
+            cached_statements=256,
+        )
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.execute(f"PRAGMA busy_timeout={int(self._busy_timeout_ms)}")
+        connection.execute("PRAGMA foreign_keys=OFF")
+        # 제목 접두어 조회가 도메인과 같은 정규화를 쓰도록 등록합니다.
+        connection.create_function("fold_text", 1, fold_text, deterministic=True)
+        self._connections.append(connection)
+        return connection
+
+
+@contextmanager
+def transaction(connection: sqlite3.Connection) -> Iterator[sqlite3.Connection]:
+    """쓰기 트랜잭션을 열고 성공 시 커밋, 실패 시 롤백합니다."""
+
+    connection.execute("BEGIN IMMEDIATE")
+    try:
+        yield connection
+    except BaseException:
+        connection.execute("ROLLBACK")
+        raise
+    connection.execute("COMMIT")
+
+
+@contextmanager
+def read_transaction(connection: sqlite3.Connection) -> Iterator[sqlite3.Connection]:
+    """읽기 트랜잭션을 엽니다. 블록 안의 조회는 모두 첫 조회 시점의 같은 스냅샷을
+    봅니다."""
+
+    connection.execute("BEGIN")
+    try:
+        yield connection
+    finally:
+        connection.execute("COMMIT")
+
+
+__all__ = ["SQLiteConnectionPool", "read_transaction", "transaction"]
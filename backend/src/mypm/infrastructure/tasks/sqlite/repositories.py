@@ -0,0 +1,1114 @@
+"""SQLite 기반 Tasks 리포지토리 구현."""
+
+from __future__ import annotations
+
+import asyncio
+import sqlite3
+import time
+import uuid
+from collections import defaultdict
+from collections.abc import Callable, Iterable
+from contextlib import AbstractAsyncContextManager
+from dataclasses import dataclass
+from datetime import date, datetime
+from functools import cache
+
+from mypm.domain.tasks.entities import Retrospective, Task, TaskStatus
+from mypm.domain.tasks.errors import ConflictError
+from mypm.domain.tasks.queries import (
+    TaskFilter,
+    TaskKeyset,
+    TaskPlanStep,
+    TaskQueryPlan,
+    TaskQueryResult,
+    TaskSearchHit,
+    TaskSearchResult,
+    TaskSortField,
+)
+from mypm.domain.tasks.repositories import (
+    RetrospectiveRepository,
+    TaskRepository,
+    TransactionalStore,
+)
+from mypm.domain.tasks.stats import TaskStats, due_bucket_bounds
+from mypm.infrastructure.tasks.changes import ChangeLog
+from mypm.infrastructure.tasks.locks import EntityLocks
+from mypm.infrastructure.tasks.search import TaskSearchIndex
+from mypm.infrastructure.tasks.sqlite.connection import (
+    SQLiteConnectionPool,
+    read_transaction,
+    transaction,
+)
+
+_TASK_COLUMNS = (
+    "id, title, description, status, due_date, retrospective_id, created_at, updated_at"
+)
+
+_INSERT_TASK = (
+    f"INSERT INTO tasks ({_TASK_COLUMNS}, due_key) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)"
+)
+_SELECT_TASK = f"SELECT {_TASK_COLUMNS} FROM tasks WHERE id = ?"
+_SELECT_ALL_TASKS = f"SELECT {_TASK_COLUMNS} FROM tasks ORDER BY created_at, id"
+_SELECT_TASKS_BY_STATUS = (
+    f"SELECT {_TASK_COLUMNS} FROM tasks WHERE status = ? ORDER BY created_at, id"
+)
+_UPDATE_TASK = (
+    "UPDATE tasks SET title = ?, description = ?, status = ?, due_date = ?, "
+    "retrospective_id = ?, created_at = ?, updated_at = ?, due_key = ? WHERE id = ?"
+)
+_DELETE_TASK = "DELETE FROM tasks WHERE id = ?"
+
+# 변경 추적 필드 -> 부분 갱신 때 쓰는 열. 마감일은 정렬 키 열을 함께 씁니다.
+_TASK_FIELD_COLUMNS = {
+    "title": ("title",),
+    "description": ("description",),
+    "status": ("status",),
+    "due_date": ("due_date", "due_key"),
+    "retrospective_id": ("retrospective_id",),
+    "updated_at": ("updated_at",),
+}
+
+# 카운터 테이블만 읽습니다. 행 수는 Task 수가 아니라 (상태, 마감일) 조합 수에
+# 비례합니다.
+_SELECT_DUE_COUNTS = """
+SELECT status,
+    SUM(count),
+    SUM(CASE WHEN due_key < :today THEN count ELSE 0 END),
+    SUM(CASE WHEN due_key = :today THEN count ELSE 0 END),
+    SUM(CASE WHEN due_key > :today AND due_key <= :week_end THEN count ELSE 0 END),
+    SUM(CASE WHEN due_key > :week_end AND due_key <> :no_due THEN count ELSE 0 END),
+    SUM(CASE WHEN due_key = :no_due THEN count ELSE 0 END)
+FROM task_due_counts WHERE count > 0 GROUP BY status
+"""
+_SELECT_ATTACHED_COUNTS = (
+    "SELECT COALESCE(SUM(count), 0), COUNT(DISTINCT retrospective_id) "
+    "FROM retrospective_task_counts WHERE count > 0"
+)
+
+_SELECT_TASK_STATUS = "SELECT status FROM tasks WHERE id = ?"
+_SELECT_VERSION = "SELECT version FROM versions WHERE name = ?"
+# 새 버전 행은 현재 시각에서 시작해 DB 파일을 다시 만들어도 이전 버전과 겹치지 않게
+# 합니다.
+_BUMP_VERSION = (
+    "INSERT INTO versions (name, version) VALUES (?, ?) "
+    "ON CONFLICT (name) DO UPDATE SET version = version + 1"
+)
+_TASKS_VERSION = "tasks"
+_RETROSPECTIVES_VERSION = "retrospectives"
+
+# SQLite 바인딩 변수 한도를 넘지 않도록 IN 조회를 나눠 실행합니다.
+_IN_CHUNK_SIZE = 500
+
+_RETROSPECTIVE_COLUMNS = "id, title, summary, date, created_at, updated_at"
+_INSERT_RETROSPECTIVE = (
+    f"INSERT INTO retrospectives ({_RETROSPECTIVE_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?)"
+)
+_SELECT_RETROSPECTIVE = (
+    f"SELECT {_RETROSPECTIVE_COLUMNS} FROM retrospectives WHERE id = ?"
+)
+_SELECT_RETROSPECTIVE_BY_DATE = (
+    f"SELECT {_RETROSPECTIVE_COLUMNS} FROM retrospectives WHERE date = ? "
+    "ORDER BY updated_at DESC LIMIT 1"
+)
+_SELECT_RETROSPECTIVES_BY_DATE_RANGE = (
+    f"SELECT {_RETROSPECTIVE_COLUMNS} FROM retrospectives WHERE date BETWEEN ? AND ? "
+    "ORDER BY date, id"
+)
+_UPDATE_RETROSPECTIVE = (
+    "UPDATE retrospectives SET title = ?, summary = ?, date = ?, created_at = ?, "
+    "updated_at = ? WHERE id = ?"
+)
+_RETROSPECTIVE_FIELDS = ("title", "summary", "date", "updated_at")
+_SELECT_RETROSPECTIVE_EXISTS = "SELECT 1 FROM retrospectives WHERE id = ?"
+_SELECT_RETROSPECTIVE_TASKS = (
+    "SELECT task_id FROM retrospective_tasks WHERE retrospective_id = ? "
+    "ORDER BY position"
+)
+_SELECT_RETROSPECTIVE_COUNTS = (
+    "SELECT status, count FROM retrospective_task_counts "
+    "WHERE retrospective_id = ? AND count > 0"
+)
+_DELETE_RETROSPECTIVE_TASKS = (
+    "DELETE FROM retrospective_tasks WHERE retrospective_id = ?"
+)
+_INSERT_RETROSPECTIVE_TASK = (
+    "INSERT INTO retrospective_tasks (retrospective_id, task_id, position) "
+    "VALUES (?, ?, ?)"
+)
+_DELETE_RETROSPECTIVE_TASK = (
+    "DELETE FROM retrospective_tasks WHERE retrospective_id = ? AND task_id = ?"
+)
+_APPEND_RETROSPECTIVE_TASK = (
+    "INSERT INTO retrospective_tasks (retrospective_id, task_id, position) "
+    "SELECT ?, ?, COALESCE(MAX(position), -1) + 1 "
+    "FROM retrospective_tasks WHERE retrospective_id = ?"
+)
+
+_SORT_COLUMNS = {
+    TaskSortField.CREATED_AT: "created_at",
+    TaskSortField.UPDATED_AT: "updated_at",
+    TaskSortField.DUE_DATE: "due_key",
+}
+# ISO 날짜의 어떤 문자보다도 뒤에 정렬되는 값
+_NO_DUE_KEY = "~"
+
+
+def _encode_datetime(value: datetime) -> str:
+    # 사전순 정렬이 시간순과 일치하도록 자릿수를 고정합니다.
+    return value.isoformat(timespec="microseconds")
+
+
+def _encode_date(value: date | None) -> str | None:
+    return value.isoformat() if value is not None else None
+
+
+def _due_key(value: date | None) -> str:
+    return value.isoformat() if value is not None else _NO_DUE_KEY
+
+
+def _encode_uuid(value: uuid.UUID | None) -> bytes | None:
+    return value.bytes if value is not None else None
+
+
+def _task_row(task: Task) -> tuple:
+    return (
+        task.id.bytes,
+        task.title,
+        task.description,
+        task.status.value,
+        _encode_date(task.due_date),
+        _encode_uuid(task.retrospective_id),
+        _encode_datetime(task.created_at),
+        _encode_datetime(task.updated_at),
+        _due_key(task.due_date),
+    )
+
+
+@cache
+def _update_task_query(fields: tuple[str, ...]) -> str:
+    # 읽은 시점의 버전(updated_at)이 그대로일 때만 씁니다.
+    assignments = ", ".join(
+        f"{column} = ?" for field in fields for column in _TASK_FIELD_COLUMNS[field]
+    )
+    return f"UPDATE tasks SET {assignments} WHERE id = ? AND updated_at = ?"
+
+
+def _task_update(task: Task) -> tuple[str, tuple]:
+    """``task.changes`` 에 기록된 필드의 열만 쓰는 UPDATE 문과 파라미터.
+
+    바뀐 필드가 없으면(저장소 밖에서 만든 객체 등) 버전 검사 없이 모든 열을 씁니다.
+    """
+
+    changes = task.changes
+    if not changes:
+        row = _task_row(task)
+        return _UPDATE_TASK, row[1:] + row[:1]
+
+    fields = tuple(field for field in _TASK_FIELD_COLUMNS if field in changes)
+    params: list = []
+    for field in fields:
+        if field == "status":
+            params.append(task.status.value)
+        elif field == "due_date":
+            params += (_encode_date(task.due_date), _due_key(task.due_date))
+        elif field == "retrospective_id":
+            params.append(_encode_uuid(task.retrospective_id))
+        elif field == "updated_at":
+            params.append(_encode_datetime(task.updated_at))
+        else:
+            params.append(getattr(task, field))
+    params += (task.id.bytes, _encode_datetime(task.previous("updated_at")))
+    return _update_task_query(fields), tuple(params)
+
+
+@dataclass(slots=True)
+class _TaskUpdates:
+    """한 트랜잭션에서 실행할 Task UPDATE 문 묶음."""
+
+    tasks: list[Task]
+    # UPDATE 문 -> 파라미터 목록. 바뀐 열 조합별로 executemany 합니다.
+    writes: dict[str, list[tuple]]
+    # 변경 기록이 없어 이전 상태를 기존 행에서 읽어야 하는 Task ID
+    untracked: list[bytes]
+    statuses: set[str]
+
+
+def _plan_task_updates(tasks: Iterable[Task]) -> _TaskUpdates:
+    # 이전 상태는 변경 기록에서 읽으므로 변경 기록이 없는 Task 만 기존 행에서
+    # 조회합니다.
+    latest = list({task.id: task for task in tasks}.values())
+    updates = _TaskUpdates(
+        tasks=latest, writes=defaultdict(list), untracked=[], statuses=set()
+    )
+    for task in latest:
+        query, params = _task_update(task)
+        updates.writes[query].append(params)
+        if task.changes:
+            updates.statuses.add(task.previous("status").value)
+        else:
+            updates.untracked.append(task.id.bytes)
+        updates.statuses.add(task.status.value)
+    return updates
+
+
+def _write_task_updates(connection: sqlite3.Connection, updates: _TaskUpdates) -> None:
+    """트랜잭션 안에서 호출합니다. 없는 Task 는 ``ValueError``, 버전이 다르면
+    ``ConflictError``."""
+
+    if not updates.tasks:
+        return
+
+    existing = (
+        _select_existing(connection, "status", updates.untracked)
+        if updates.untracked
+        else []
+    )
+    updated = sum(
+        connection.executemany(query, rows).rowcount
+        for query, rows in updates.writes.items()
+    )
+    if updated != len(updates.tasks):
+        ids = [task.id.bytes for task in updates.tasks]
+        if len(_select_existing(connection, "id", ids)) != len(ids):
+            raise ValueError("Task not found")
+        raise ConflictError("Task was modified concurrently")
+    _bump_task_versions(connection, updates.statuses | {row[0] for row in existing})
+
+
+def _task_from_row(row: tuple) -> Task:
+    (
+        task_id,
+        title,
+        description,
+        status,
+        due_date,
+        retrospective_id,
+        created_at,
+        updated_at,
+    ) = row
+    return Task(
+        id=uuid.UUID(bytes=task_id),
+        title=title,
+        description=description,
+        status=TaskStatus(status),
+        due_date=date.fromisoformat(due_date) if due_date is not None else None,
+        retrospective_id=uuid.UUID(bytes=retrospective_id)
+        if retrospective_id is not None
+        else None,
+        created_at=datetime.fromisoformat(created_at),
+        updated_at=datetime.fromisoformat(updated_at),
+    )
+
+
+def _select_existing(
+    connection: sqlite3.Connection, columns: str, ids: list[bytes]
+) -> list[tuple]:
+    rows: list[tuple] = []
+    for start in range(0, len(ids), _IN_CHUNK_SIZE):
+        chunk = ids[start : start + _IN_CHUNK_SIZE]
+        placeholders = ", ".join("?" * len(chunk))
+        rows.extend(
+            connection.execute(
+                f"SELECT {columns} FROM tasks WHERE id IN ({placeholders})", chunk
+            )
+        )
+    return rows
+
+
+def _bump_task_versions(connection: sqlite3.Connection, statuses: set[str]) -> None:
+    names = [
+        _TASKS_VERSION,
+        *(f"{_TASKS_VERSION}:{status}" for status in sorted(statuses)),
+    ]
+    seed = time.time_ns()
+    connection.executemany(_BUMP_VERSION, [(name, seed) for name in names])
+
+
+def _read_version(connection: sqlite3.Connection, name: str) -> int:
+    row = connection.execute(_SELECT_VERSION, (name,)).fetchone()
+    return row[0] if row is not None else 0
+
+
+def _build_page_query(
+    order_by: TaskSortField, descending: bool, with_status: bool, with_after: bool
+) -> str:
+    column = _SORT_COLUMNS[order_by]
+    direction = " DESC" if descending else ""
+
+    conditions = []
+    if with_status:
+        conditions.append("status = ?")
+    if with_after:
+        operator = "<" if descending else ">"
+        conditions.append(f"({column}, id) {operator} (?, ?)")
+
+    where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+    order = f"{column}{direction}, id{direction}"
+    return f"SELECT {_TASK_COLUMNS} FROM tasks{where} ORDER BY {order} LIMIT ?"
+
+
+# 쿼리 문자열을 미리 만들어 두어 커넥션의 prepared statement 캐시를 재사용합니다.
+_PAGE_QUERIES = {
+    (order_by, descending, with_status, with_after): _build_page_query(
+        order_by, descending, with_status, with_after
+    )
+    for order_by in TaskSortField
+    for descending in (False, True)
+    for with_status in (False, True)
+    for with_after in (False, True)
+}
+
+
+def _build_due_range_query(with_status: bool, with_after: bool) -> str:
+    conditions = ["due_key > ?", "due_key < ?"]
+    if with_status:
+        conditions.append("status = ?")
+    if with_after:
+        conditions.append("(due_key, id) > (?, ?)")
+
+    return (
+        f"SELECT {_TASK_COLUMNS} FROM tasks WHERE {' AND '.join(conditions)} "
+        "ORDER BY due_key, id LIMIT ?"
+    )
+
+
+_DUE_RANGE_QUERIES = {
+    (with_status, with_after): _build_due_range_query(with_status, with_after)
+    for with_status in (False, True)
+    for with_after in (False, True)
+}
+
+
+# 조건 이름 -> 열. EXPLAIN QUERY PLAN 에서 인덱스가 처리한 조건을 알아낼 때 씁니다.
+_FILTER_COLUMNS = {
+    "status": "status",
+    "due_date": "due_key",
+    "retrospective_id": "retrospective_id",
+    "created_at": "created_at",
+    "updated_at": "updated_at",
+}
+
+
+def _filter_clause(task_filter: TaskFilter) -> tuple[list[str], list]:
+    """``task_filter`` 의 WHERE 조건과 파라미터. 범위는 모두 양 끝을 제외합니다."""
+
+    conditions: list[str] = []
+    params: list = []
+    if task_filter.statuses is not None:
+        statuses = sorted(status.value for status in task_filter.statuses)
+        conditions.append(f"status IN ({', '.join('?' * len(statuses))})")
+        params.extend(statuses)
+    if task_filter.due_after is not None or task_filter.due_before is not None:
+        # 빈 문자열은 모든 날짜보다 앞서고, _NO_DUE_KEY 보다 작으면 마감일이 있는 Task
+        # 입니다.
+        conditions.append("due_key > ? AND due_key < ?")
+        params.append(_encode_date(task_filter.due_after) or "")
+        params.append(_encode_date(task_filter.due_before) or _NO_DUE_KEY)
+    if task_filter.retrospective_id is not None:
+        conditions.append("retrospective_id = ?")
+        params.append(task_filter.retrospective_id.bytes)
+    for column, after, before in (
+        ("created_at", task_filter.created_after, task_filter.created_before),
+        ("updated_at", task_filter.updated_after, task_filter.updated_before),
+    ):
+        if after is not None:
+            conditions.append(f"{column} > ?")
+            params.append(_encode_datetime(after))
+        if before is not None:
+            conditions.append(f"{column} < ?")
+            params.append(_encode_datetime(before))
+    if task_filter.title_prefix:
+        # 커넥션에 등록한 fold_text 로 정규화해 비교하므로 인덱스는 쓰지 않습니다.
+        conditions.append("substr(fold_text(title), 1, ?) = ?")
+        params.extend((len(task_filter.title_prefix), task_filter.title_prefix))
+    return conditions, params
+
+
+def _parse_query_plan(
+    rows: list[tuple], conditions: list[str], matched: int
+) -> tuple[list[TaskPlanStep], list[str]]:
+    """EXPLAIN QUERY PLAN 의 SEARCH/SCAN 줄을 단계로 바꾸고 인덱스가 처리하지 않은
+    조건을 돌려줍니다.
+
+    SQLite 는 단계별 후보 수를 알려주지 않으므로 ``estimated`` 는 None, ``candidates``
+    는 최종 일치 건수입니다.
+    """
+
+    steps: list[TaskPlanStep] = []
+    covered: set[str] = set()
+    for *_, detail in rows:
+        if not detail.startswith(("SEARCH", "SCAN")):
+            continue
+        _, _, used = detail.partition(" INDEX ")
+        index, _, constraint = used.partition(" (")
+        steps.append(
+            TaskPlanStep(index=index or "tasks", estimated=None, candidates=matched)
+        )
+        covered.update(
+            condition
+            for condition, column in _FILTER_COLUMNS.items()
+            if column in constraint
+        )
+    return steps, [condition for condition in conditions if condition not in covered]
+
+
+def _keyset_params(keyset: TaskKeyset) -> list:
+    value = keyset.value
+    if isinstance(value, datetime):
+        encoded = _encode_datetime(value)
+    else:
+        encoded = _due_key(value)
+    return [encoded, keyset.task_id.bytes]
+
+
+class SQLiteTaskRepository(TaskRepository):
+    """SQLite 기반 Task 저장소.
+
+    전문 검색 색인은 첫 검색 때 전체 행을 읽어 프로세스 메모리에 만들고, 이후에는 이
+    리포지토리를 거치는 쓰기마다 증분 갱신합니다. 변경 피드(``changes``)도 이
+    리포지토리를 거친 쓰기만 기록하므로 같은 파일에 직접 쓴 변경은 피드에 나타나지
+    않습니다.
+    """
+
+    def __init__(
+        self, pool: SQLiteConnectionPool, changes: ChangeLog | None = None
+    ) -> None:
+        self._pool = pool
+        self._changes = changes
+        self._search: TaskSearchIndex | None = None
+        self._search_lock = asyncio.Lock()
+        # 색인을 만드는 동안 끝난 쓰기는 모아 두었다가 완성 후 재적용합니다.
+        self._search_pending: list[Callable[[TaskSearchIndex], None]] | None = None
+
+    async def add(self, task: Task) -> Task:
+        row = _task_row(task)
+
+        def _add(connection: sqlite3.Connection) -> None:
+            with transaction(connection):
+                connection.execute(_INSERT_TASK, row)
+                _bump_task_versions(connection, {task.status.value})
+
+        await self._pool.run(_add)
+        task.clear_changes()
+        self._after_write(lambda index: index.index(task))
+        if self._changes is not None:
+            self._changes.record_tasks([task])
+        return task
+
+    async def add_many(self, tasks: list[Task]) -> list[Task]:
+        rows = [_task_row(task) for task in tasks]
+
+        def _add_many(connection: sqlite3.Connection) -> None:
+            with transaction(connection):
+                connection.executemany(_INSERT_TASK, rows)
+                _bump_task_versions(connection, {task.status.value for task in tasks})
+
+        await self._pool.run(_add_many)
+        for task in tasks:
+            task.clear_changes()
+        self._after_write(lambda index: _index_all(index, tasks))
+        if self._changes is not None:
+            self._changes.record_tasks(tasks)
+        return tasks
+
+    async def get(self, task_id: uuid.UUID) -> Task | None:
+        def _get(connection: sqlite3.Connection) -> tuple | None:
+            return connection.execute(_SELECT_TASK, (task_id.bytes,)).fetchone()
+
+        row = await self._pool.run(_get)
+        return _task_from_row(row) if row is not None else None
+
+    async def get_many(self, task_ids: list[uuid.UUID]) -> dict[uuid.UUID, Task]:
+        ids = [task_id.bytes for task_id in dict.fromkeys(task_ids)]
+
+        def _get_many(connection: sqlite3.Connection) -> list[tuple]:
+            return _select_existing(connection, _TASK_COLUMNS, ids)
+
+        rows = await self._pool.run(_get_many)
+        tasks = (_task_from_row(row) for row in rows)
+        return {task.id: task for task in tasks}
+
+    async def list_by_status(self, status: str | None = None) -> list[Task]:
+        if status is not None:
+            try:
+                status = TaskStatus(status).value
+            except ValueError:
+                return []
+
+        def _list(connection: sqlite3.Connection) -> list[tuple]:
+            if status is None:
+                return connection.execute(_SELECT_ALL_TASKS).fetchall()
+            return connection.execute(_SELECT_TASKS_BY_STATUS, (status,)).fetchall()
+
+        rows = await self._pool.run(_list)
+        return [_task_from_row(row) for row in rows]
+
+    async def list_page(
+        self,
+        *,
+        status: str | None = None,
+        order_by: TaskSortField = TaskSortField.CREATED_AT,
+        descending: bool = False,
+        after: TaskKeyset | None = None,
+        limit: int | None = None,
+    ) -> list[Task]:
+        params: list = []
+        if status is not None:
+            try:
+                params.append(TaskStatus(status).value)
+            except ValueError:
+                return []
+        if after is not None:
+            params.extend(_keyset_params(after))
+        params.append(limit if limit is not None else -1)
+
+        query = _PAGE_QUERIES[
+            (order_by, descending, status is not None, after is not None)
+        ]
+
+        def _list(connection: sqlite3.Connection) -> list[tuple]:
+            return connection.execute(query, params).fetchall()
+
+        rows = await self._pool.run(_list)
+        return [_task_from_row(row) for row in rows]
+
+    async def list_by_due_range(
+        self,
+        *,
+        due_after: date | None = None,
+        due_before: date | None = None,
+        status: str | None = None,
+        after: TaskKeyset | None = None,
+        limit: int | None = None,
+    ) -> list[Task]:
+        # 빈 문자열은 모든 날짜보다 앞서고, _NO_DUE_KEY 보다 작으면 마감일이 있는 Task
+        # 입니다.
+        params: list = [
+            due_after.isoformat() if due_after is not None else "",
+            due_before.isoformat() if due_before is not None else _NO_DUE_KEY,
+        ]
+        if status is not None:
+            try:
+                params.append(TaskStatus(status).value)
+            except ValueError:
+                return []
+        if after is not None:
+            params.extend(_keyset_params(after))
+        params.append(limit if limit is not None else -1)
+
+        query = _DUE_RANGE_QUERIES[(status is not None, after is not None)]
+
+        def _list(connection: sqlite3.Connection) -> list[tuple]:
+            return connection.execute(query, params).fetchall()
+
+        rows = await self._pool.run(_list)
+        return [_task_from_row(row) for row in rows]
+
+    async def query(
+        self,
+        task_filter: TaskFilter,
+        *,
+        order_by: TaskSortField = TaskSortField.CREATED_AT,
+        descending: bool = False,
+        after: TaskKeyset | None = None,
+        limit: int | None = None,
+        explain: bool = False,
+    ) -> TaskQueryResult:
+        # 인덱스 선택은 SQLite 플래너에 맡깁니다. explain 이면 그 계획을 그대로
+        # 보고합니다.
+        conditions, params = _filter_clause(task_filter)
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+        column = _SORT_COLUMNS[order_by]
+        direction = " DESC" if descending else ""
+        page_conditions, page_params = list(conditions), list(params)
+        if after is not None:
+            page_conditions.append(
+                f"({column}, id) {'<' if descending else '>'} (?, ?)"
+            )
+            page_params.extend(_keyset_params(after))
+        page_where = (
+            f" WHERE {' AND '.join(page_conditions)}" if page_conditions else ""
+        )
+        query = (
+            f"SELECT {_TASK_COLUMNS} FROM tasks{page_where} "
+            f"ORDER BY {column}{direction}, id{direction} LIMIT ?"
+        )
+        page_params.append(limit if limit is not None else -1)
+
+        def _query(
+            connection: sqlite3.Connection,
+        ) -> tuple[list[tuple], TaskQueryPlan | None]:
+            rows = connection.execute(query, page_params).fetchall()
+            if not explain:
+                return rows, None
+
+            plan_rows = connection.execute(
+                f"EXPLAIN QUERY PLAN {query}", page_params
+            ).fetchall()
+            (matched,) = connection.execute(
+                f"SELECT COUNT(*) FROM tasks{where}", params
+            ).fetchone()
+            steps, residual = _parse_query_plan(
+                plan_rows, task_filter.conditions(), matched
+            )
+            detail = "\n".join(row[-1] for row in plan_rows)
+            plan = TaskQueryPlan(
+                steps=steps,
+                residual=residual,
+                scanned=None,
+                matched=matched,
+                detail=detail,
+            )
+            return rows, plan
+
+        rows, plan = await self._pool.run(_query)
+        return TaskQueryResult(tasks=[_task_from_row(row) for row in rows], plan=plan)
+
+    async def count_by_retrospective(
+        self, retrospective_ids: list[uuid.UUID]
+    ) -> dict[uuid.UUID, dict[TaskStatus, int]]:
+        def _count(
+            connection: sqlite3.Connection,
+        ) -> dict[uuid.UUID, dict[TaskStatus, int]]:
+            counts: dict[uuid.UUID, dict[TaskStatus, int]] = {}
+            for retrospective_id in dict.fromkeys(retrospective_ids):
+                rows = connection.execute(
+                    _SELECT_RETROSPECTIVE_COUNTS, (retrospective_id.bytes,)
+                )
+                statuses = {TaskStatus(status): count for status, count in rows}
+                if statuses:
+                    counts[retrospective_id] = statuses
+            return counts
+
+        return await self._pool.run(_count)
+
+    async def stats(self, today: date) -> TaskStats:
+        _, week_end = due_bucket_bounds(today)
+        params = {
+            "today": today.isoformat(),
+            "week_end": week_end.isoformat(),
+            "no_due": _NO_DUE_KEY,
+        }
+
+        def _stats(connection: sqlite3.Connection) -> TaskStats:
+            by_status = dict.fromkeys(TaskStatus, 0)
+            due = [0] * 5
+            # 두 집계가 서로 다른 쓰기 사이를 보지 않도록 한 스냅샷에서 읽습니다.
+            with read_transaction(connection):
+                for status, count, *buckets in connection.execute(
+                    _SELECT_DUE_COUNTS, params
+                ):
+                    by_status[TaskStatus(status)] = count
+                    if status != TaskStatus.DONE.value:
+                        due = [total + value for total, value in zip(due, buckets)]
+                attached, retrospective_count = connection.execute(
+                    _SELECT_ATTACHED_COUNTS
+                ).fetchone()
+
+            overdue, due_today, due_this_week, due_later, no_due_date = due
+            return TaskStats(
+                total=sum(by_status.values()),
+                by_status=by_status,
+                overdue=overdue,
+                due_today=due_today,
+                due_this_week=due_this_week,
+                due_later=due_later,
+                no_due_date=no_due_date,
+                attached_to_retrospective=attached,
+                retrospective_count=retrospective_count,
+            )
+
+        return await self._pool.run(_stats)
+
+    async def update(self, task: Task) -> Task:
+        await self.update_many([task])
+        return task
+
+    async def update_many(self, tasks: list[Task]) -> list[Task]:
+        updates = _plan_task_updates(tasks)
+
+        def _update_many(connection: sqlite3.Connection) -> None:
+            with transaction(connection):
+                _write_task_updates(connection, updates)
+
+        await self._pool.run(_update_many)
+        self._finish_updates(updates.tasks)
+        return tasks
+
+    def _finish_updates(self, tasks: list[Task]) -> None:
+        reindexed = [
+            task
+            for task in tasks
+            if not task.changes
+            or "title" in task.changes
+            or "description" in task.changes
+        ]
+        for task in tasks:
+            task.clear_changes()
+        if reindexed:
+            self._after_write(lambda index: _index_all(index, reindexed))
+        if self._changes is not None:
+            self._changes.record_tasks(tasks)
+
+    async def delete(self, task_id: uuid.UUID) -> None:
+        def _delete(connection: sqlite3.Connection) -> bool:
+            with transaction(connection):
+                previous = connection.execute(
+                    _SELECT_TASK_STATUS, (task_id.bytes,)
+                ).fetchone()
+                if previous is not None:
+                    connection.execute(_DELETE_TASK, (task_id.bytes,))
+                    _bump_task_versions(connection, {previous[0]})
+            return previous is not None
+
+        deleted = await self._pool.run(_delete)
+        self._after_write(lambda index: index.remove(task_id))
+        if deleted and self._changes is not None:
+            self._changes.record_task_deletes([task_id])
+
+    async def delete_many(self, task_ids: list[uuid.UUID]) -> list[uuid.UUID]:
+        ids = [task_id.bytes for task_id in dict.fromkeys(task_ids)]
+
+        def _delete_many(connection: sqlite3.Connection) -> set[bytes]:
+            with transaction(connection):
+                rows = _select_existing(connection, "id, status", ids)
+                existing = {row[0] for row in rows}
+                connection.executemany(
+                    _DELETE_TASK, [(task_id,) for task_id in existing]
+                )
+                if rows:
+                    _bump_task_versions(connection, {row[1] for row in rows})
+            return existing
+
+        existing = await self._pool.run(_delete_many)
+        deleted = [uuid.UUID(bytes=task_id) for task_id in ids if task_id in existing]
+        self._after_write(lambda index: _remove_all(index, deleted))
+        if self._changes is not None:
+            self._changes.record_task_deletes(deleted)
+        return deleted
+
+    async def search(
+        self, query: str, *, limit: int = 20, offset: int = 0
+    ) -> TaskSearchResult:
+        index = await self._search_index()
+        hits, total = index.search(query, limit=limit, offset=offset)
+        tasks = await self.get_many([task_id for task_id, _ in hits])
+        return TaskSearchResult(
+            hits=[
+                TaskSearchHit(task=tasks[task_id], score=score)
+                for task_id, score in hits
+                if task_id in tasks
+            ],
+            total=total,
+        )
+
+    async def _search_index(self) -> TaskSearchIndex:
+        if self._search is not None:
+            return self._search
+
+        async with self._search_lock:
+            if self._search is None:
+                self._search_pending = []
+
+                def _build(connection: sqlite3.Connection) -> TaskSearchIndex:
+                    index = TaskSearchIndex()
+                    for row in connection.execute(f"SELECT {_TASK_COLUMNS} FROM tasks"):
+                        index.index(_task_from_row(row))
+                    return index
+
+                index = await self._pool.run(_build)
+                for apply in self._search_pending:
+                    apply(index)
+                self._search_pending = None
+                self._search = index
+        return self._search
+
+    def _after_write(self, apply: Callable[[TaskSearchIndex], None]) -> None:
+        if self._search is not None:
+            apply(self._search)
+        elif self._search_pending is not None:
+            self._search_pending.append(apply)
+
+    async def version(self, status: str | None = None) -> int:
+        name = _TASKS_VERSION
+        if status is not None:
+            try:
+                name = f"{_TASKS_VERSION}:{TaskStatus(status).value}"
+            except ValueError:
+                return 0
+
+        return await self._pool.run(lambda connection: _read_version(connection, name))
+
+
+def _index_all(index: TaskSearchIndex, tasks: Iterable[Task]) -> None:
+    for task in tasks:
+        index.index(task)
+
+
+def _remove_all(index: TaskSearchIndex, task_ids: Iterable[uuid.UUID]) -> None:
+    for task_id in task_ids:
+        index.remove(task_id)
+
+
+def _retrospective_row(retrospective: Retrospective) -> tuple:
+    return (
+        retrospective.id.bytes,
+        retrospective.title,
+        retrospective.summary,
+        retrospective.date.isoformat(),
+        _encode_datetime(retrospective.created_at),
+        _encode_datetime(retrospective.updated_at),
+    )
+
+
+def _write_retrospective_tasks(
+    connection: sqlite3.Connection, retrospective: Retrospective
+) -> None:
+    retrospective_id = retrospective.id.bytes
+    connection.execute(_DELETE_RETROSPECTIVE_TASKS, (retrospective_id,))
+    connection.executemany(
+        _INSERT_RETROSPECTIVE_TASK,
+        [
+            (retrospective_id, task_id.bytes, position)
+            for position, task_id in enumerate(retrospective.tasks)
+        ],
+    )
+
+
+def _write_retrospective_changes(
+    connection: sqlite3.Connection, retrospective: Retrospective
+) -> int:
+    """바뀐 열과 연결 Task 의 추가/제거분만 씁니다. 갱신된 행 수를 반환합니다.
+
+    읽은 시점의 버전(``updated_at``)이 그대로일 때만 씁니다.
+    """
+
+    changes = retrospective.changes
+    retrospective_id = retrospective.id.bytes
+    fields = [field for field in _RETROSPECTIVE_FIELDS if field in changes]
+    params: list = []
+    for field in fields:
+        value = getattr(retrospective, field)
+        if field == "date":
+            value = value.isoformat()
+        elif field == "updated_at":
+            value = _encode_datetime(value)
+        params.append(value)
+    params += (retrospective_id, _encode_datetime(retrospective.previous("updated_at")))
+
+    # 바뀐 열이 없어도 행 존재 여부와 버전을 확인하기 위해 실행합니다.
+    assignments = ", ".join(f"{field} = ?" for field in fields) or "id = id"
+    updated = connection.execute(
+        f"UPDATE retrospectives SET {assignments} WHERE id = ? AND updated_at = ?",
+        params,
+    ).rowcount
+    if not updated or "tasks" not in changes:
+        return updated
+
+    previous, current = changes["tasks"], retrospective.tasks
+    previous_ids, current_ids = set(previous), set(current)
+    # 남은 Task 의 순서가 바뀌었으면(제거 후 다시 추가 등) 목록 전체를 다시 씁니다.
+    if [task_id for task_id in previous if task_id in current_ids] != [
+        task_id for task_id in current if task_id in previous_ids
+    ]:
+        _write_retrospective_tasks(connection, retrospective)
+        return updated
+
+    connection.executemany(
+        _DELETE_RETROSPECTIVE_TASK,
+        [
+            (retrospective_id, task_id.bytes)
+            for task_id in previous
+            if task_id not in current_ids
+        ],
+    )
+    connection.executemany(
+        _APPEND_RETROSPECTIVE_TASK,
+        [
+            (retrospective_id, task_id.bytes, retrospective_id)
+            for task_id in current
+            if task_id not in previous_ids
+        ],
+    )
+    return updated
+
+
+def _write_retrospective(
+    connection: sqlite3.Connection, retrospective: Retrospective
+) -> None:
+    """트랜잭션 안에서 호출합니다. 없으면 ``ValueError``, 버전이 다르면
+    ``ConflictError``."""
+
+    if retrospective.changes:
+        updated = _write_retrospective_changes(connection, retrospective)
+    else:
+        row = _retrospective_row(retrospective)
+        updated = connection.execute(_UPDATE_RETROSPECTIVE, row[1:] + row[:1]).rowcount
+        if updated:
+            _write_retrospective_tasks(connection, retrospective)
+
+    if not updated:
+        exists = connection.execute(
+            _SELECT_RETROSPECTIVE_EXISTS, (retrospective.id.bytes,)
+        ).fetchone()
+        if exists is None:
+            raise ValueError("Retrospective not found")
+        raise ConflictError("Retrospective was modified concurrently")
+
+
+def _load_retrospective(
+    connection: sqlite3.Connection, row: tuple | None
+) -> Retrospective | None:
+    if row is None:
+        return None
+
+    retrospective_id, title, summary, retro_date, created_at, updated_at = row
+    task_rows = connection.execute(
+        _SELECT_RETROSPECTIVE_TASKS, (retrospective_id,)
+    ).fetchall()
+    return Retrospective(
+        id=uuid.UUID(bytes=retrospective_id),
+        title=title,
+        summary=summary,
+        date=date.fromisoformat(retro_date),
+        tasks=[uuid.UUID(bytes=task_id) for (task_id,) in task_rows],
+        created_at=datetime.fromisoformat(created_at),
+        updated_at=datetime.fromisoformat(updated_at),
+    )
+
+
+class SQLiteRetrospectiveRepository(RetrospectiveRepository):
+    """SQLite 기반 Retrospective 저장소."""
+
+    def __init__(
+        self, pool: SQLiteConnectionPool, changes: ChangeLog | None = None
+    ) -> None:
+        self._pool = pool
+        self._changes = changes
+
+    async def add(self, retrospective: Retrospective) -> Retrospective:
+        row = _retrospective_row(retrospective)
+
+        def _add(connection: sqlite3.Connection) -> None:
+            with transaction(connection):
+                connection.execute(_INSERT_RETROSPECTIVE, row)
+                _write_retrospective_tasks(connection, retrospective)
+                connection.execute(
+                    _BUMP_VERSION, (_RETROSPECTIVES_VERSION, time.time_ns())
+                )
+
+        await self._pool.run(_add)
+        retrospective.clear_changes()
+        if self._changes is not None:
+            self._changes.record_retrospectives([retrospective])
+        return retrospective
+
+    async def get_by_date(self, retrospective_date: date) -> Retrospective | None:
+        def _get(connection: sqlite3.Connection) -> Retrospective | None:
+            row = connection.execute(
+                _SELECT_RETROSPECTIVE_BY_DATE, (retrospective_date.isoformat(),)
+            ).fetchone()
+            return _load_retrospective(connection, row)
+
+        return await self._pool.run(_get)
+
+    async def get(self, retrospective_id: uuid.UUID) -> Retrospective | None:
+        def _get(connection: sqlite3.Connection) -> Retrospective | None:
+            row = connection.execute(
+                _SELECT_RETROSPECTIVE, (retrospective_id.bytes,)
+            ).fetchone()
+            return _load_retrospective(connection, row)
+
+        return await self._pool.run(_get)
+
+    async def list_by_date_range(self, start: date, end: date) -> list[Retrospective]:
+        def _list(connection: sqlite3.Connection) -> list[Retrospective]:
+            rows = connection.execute(
+                _SELECT_RETROSPECTIVES_BY_DATE_RANGE,
+                (start.isoformat(), end.isoformat()),
+            ).fetchall()
+            return [_load_retrospective(connection, row) for row in rows]
+
+        return await self._pool.run(_list)
+
+    async def update(self, retrospective: Retrospective) -> Retrospective:
+        def _update(connection: sqlite3.Connection) -> None:
+            with transaction(connection):
+                _write_retrospective(connection, retrospective)
+                connection.execute(
+                    _BUMP_VERSION, (_RETROSPECTIVES_VERSION, time.time_ns())
+                )
+
+        await self._pool.run(_update)
+        retrospective.clear_changes()
+        if self._changes is not None:
+            self._changes.record_retrospectives([retrospective])
+        return retrospective
+
+    async def version(self) -> int:
+        return await self._pool.run(
+            lambda connection: _read_version(connection, _RETROSPECTIVES_VERSION)
+        )
+
+
+class SQLiteTransactionalStore(TransactionalStore):
+    """Task/Retrospective 쓰기를 하나의 SQLite 트랜잭션으로 반영합니다.
+
+    잠금은 이 프로세스 안의 코루틴끼리만 직렬화합니다. 다른 프로세스가 같은 파일에 쓴
+    변경은 ``updated_at`` 버전 검사가 ``ConflictError`` 로 막습니다.
+    """
+
+    def __init__(
+        self,
+        pool: SQLiteConnectionPool,
+        tasks: SQLiteTaskRepository,
+        changes: ChangeLog | None = None,
+    ) -> None:
+        self._pool = pool
+        self._tasks = tasks
+        self._changes = changes
+        self._locks = EntityLocks()
+
+    def lock(
+        self, entity_ids: Iterable[uuid.UUID]
+    ) -> AbstractAsyncContextManager[None]:
+        return self._locks.acquire(entity_ids)
+
+    async def commit(
+        self, tasks: list[Task], retrospectives: list[Retrospective]
+    ) -> None:
+        updates = _plan_task_updates(tasks)
+        latest = list(
+            {
+                retrospective.id: retrospective for retrospective in retrospectives
+            }.values()
+        )
+        if not updates.tasks and not latest:
+            return
+
+        def _commit(connection: sqlite3.Connection) -> None:
+            with transaction(connection):
+                _write_task_updates(connection, updates)
+                for retrospective in latest:
+                    _write_retrospective(connection, retrospective)
+                if latest:
+                    connection.execute(
+                        _BUMP_VERSION, (_RETROSPECTIVES_VERSION, time.time_ns())
+                    )
+
+        await self._pool.run(_commit)
+        self._tasks._finish_updates(updates.tasks)
+        for retrospective in latest:
+            retrospective.clear_changes()
+        if self._changes is not None:
+            self._changes.record_retrospectives(latest)
+
+    async def close(self) -> None:
+        self._pool.close()
+
+
+__all__ = [
+    "SQLiteTaskRepository",
+    "SQLiteRetrospectiveRepository",
+    "SQLiteTransactionalStore",
+]
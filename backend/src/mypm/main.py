@@ -1,22 +1,245 @@
 """mypm CLI 엔트리포인트."""
 
+import argparse
+import asyncio
+import contextlib
+import os
+import subprocess
+import sys
+import time
+from collections.abc import AsyncIterator
+from typing import BinaryIO
+
 import uvicorn
 
-from mypm.app import create_app
-from mypm.core.config import get_settings
+from mypm.application.tasks import TaskService
+from mypm.application.tasks.transfer import (
+    DEFAULT_BATCH_SIZE,
+    TransferFormat,
+    export_task_stream,
+    import_task_stream,
+)
+from mypm.core.config import Settings, get_settings
+from mypm.domain.tasks.repositories import TransactionalStore
+from mypm.infrastructure.tasks import (
+    StoreServer,
+    build_repositories,
+    close_repositories,
+)
+
+# 스토어 서버 소켓이 생길 때까지 기다리는 최대 시간(초)
+_STORE_STARTUP_TIMEOUT = 30.0
+# 가져올 파일을 읽는 조각 크기
+_READ_CHUNK_BYTES = 64 * 1024
+
+
+def serve(settings: Settings) -> None:
+    """FastAPI 서버를 실행합니다.
+
+    워커가 2개 이상이고 백엔드가 ``remote`` 가 아니면 설정된 백엔드를 소유하는 스토어
+    서버를 자식 프로세스로 띄우고, 워커들은 ``remote`` 백엔드로 그 서버를 공유합니다.
+    """
+
+    store_process = None
+    if settings.workers > 1 and settings.storage_backend != "remote":
+        store_process = _spawn_store_server(settings)
+        os.environ["MYPM_STORAGE_BACKEND"] = "remote"
+        os.environ["MYPM_STORE_SOCKET"] = settings.store_socket
+
+    try:
+        uvicorn.run(
+            "mypm.app:app",
+            host=settings.host,
+            port=settings.port,
+            reload=settings.reload,
+            workers=settings.workers if settings.workers > 1 else None,
+            factory=False,
+        )
+    finally:
+        if store_process is not None:
+            store_process.terminate()
+            store_process.wait()
+
+
+def serve_store(settings: Settings) -> None:
+    """설정된 백엔드를 소유하고 ``store_socket`` 으로 제공하는 스토어 서버를
+    실행합니다."""
+
+    if settings.storage_backend == "remote":
+        raise SystemExit("Store server needs a local storage backend, not 'remote'")
+
+    async def _run() -> None:
+        repositories = build_repositories(settings)
+        server = await StoreServer(*repositories).start(settings.store_socket)
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            await close_repositories(repositories[2])
+
+    try:
+        asyncio.run(_run())
+    except KeyboardInterrupt:
+        pass
+
+
+def import_tasks(
+    settings: Settings, path: str, file_format: TransferFormat, batch_size: int
+) -> int:
+    """``path`` (``-`` 이면 표준 입력)의 Task 를 설정된 저장소에 ``batch_size`` 행씩
+    가져옵니다.
+
+    묶음마다 진행 상황과 실패한 행을 표준 오류에 출력하고, 실패한 행이 있거나 도중에
+    멈췄으면 1 을 반환합니다.
+    """
+
+    service, store = _offline_task_service(settings)
+
+    async def _run() -> bool:
+        try:
+            with _open(path, "rb", sys.stdin.buffer) as source:
+                async for progress in import_task_stream(
+                    service, _read_chunks(source), file_format, batch_size
+                ):
+                    for error in progress.errors:
+                        print(f"row {error.index}: {error.error}", file=sys.stderr)
+                    if not progress.done:
+                        print(
+                            f"{progress.processed} rows, {progress.created} created",
+                            file=sys.stderr,
+                        )
+        finally:
+            await close_repositories(store)
+        if progress.error is not None:
+            print(f"import stopped: {progress.error}", file=sys.stderr)
+        print(
+            f"imported {progress.created} of {progress.processed} rows, "
+            f"{progress.failed} failed",
+            file=sys.stderr,
+        )
+        return progress.failed == 0 and progress.error is None
+
+    return 0 if asyncio.run(_run()) else 1
+
+
+def export_tasks(
+    settings: Settings, path: str, file_format: TransferFormat, batch_size: int
+) -> None:
+    """설정된 저장소의 모든 Task 를 ``path`` (``-`` 이면 표준 출력)에 씁니다."""
+
+    service, store = _offline_task_service(settings)
+
+    async def _run() -> None:
+        try:
+            with _open(path, "wb", sys.stdout.buffer) as target:
+                async for chunk in export_task_stream(
+                    service, file_format, batch_size
+                ):
+                    target.write(chunk)
+        finally:
+            await close_repositories(store)
+
+    asyncio.run(_run())
+
+
+def _offline_task_service(settings: Settings) -> tuple[TaskService, TransactionalStore]:
+    """API 서버를 거치지 않고 설정된 저장소에 직접 연결한 서비스와, 끝나면
+    ``close_repositories`` 로 닫을 트랜잭션 저장소.
+
+    프로세스 안에만 있는 저장소(저널 없는 ``memory``, ``compact``)는 명령이 끝나면
+    사라지므로 거부합니다. 실행 중인 서버의 상태를 다루려면 ``remote`` 로 스토어 서버에
+    연결하거나 ``/tasks/import`` / ``/tasks/export`` 를 씁니다. 실행 중인 서버가 연
+    저널은 열지 못합니다.
+    """
+
+    if settings.storage_backend == "compact" or (
+        settings.storage_backend == "memory" and settings.journal_dir is None
+    ):
+        raise SystemExit(
+            f"Storage backend '{settings.storage_backend}' lives only in this process; "
+            "use sqlite, memory with MYPM_JOURNAL_DIR, or remote"
+        )
+
+    repository, retrospective_repository, store, _ = build_repositories(settings)
+    service = TaskService(
+        repository=repository,
+        retrospective_repository=retrospective_repository,
+        store=store,
+    )
+    return service, store
+
+
+def _open(
+    path: str, mode: str, standard: BinaryIO
+) -> contextlib.AbstractContextManager[BinaryIO]:
+    # 표준 입출력은 닫지 않습니다.
+    return contextlib.nullcontext(standard) if path == "-" else open(path, mode)
+
+
+async def _read_chunks(source: BinaryIO) -> AsyncIterator[bytes]:
+    while chunk := source.read(_READ_CHUNK_BYTES):
+        yield chunk
+
+
+def _spawn_store_server(settings: Settings) -> subprocess.Popen:
+    if os.path.exists(settings.store_socket):
+        os.unlink(settings.store_socket)
+
+    process = subprocess.Popen([sys.executable, "-m", "mypm.main", "store-server"])
+    deadline = time.monotonic() + _STORE_STARTUP_TIMEOUT
+    while not os.path.exists(settings.store_socket):
+        if process.poll() is not None or time.monotonic() > deadline:
+            process.terminate()
+            raise SystemExit("Store server failed to start")
+        time.sleep(0.05)
+    return process
 
 
 def main() -> None:
-    """FastAPI 서버를 실행합니다."""
+    parser = argparse.ArgumentParser(prog="mypm")
+    parser.add_argument(
+        "command",
+        nargs="?",
+        choices=("serve", "store-server", "import", "export"),
+        default="serve",
+        help=(
+            "serve: API 서버 (기본), store-server: 워커들이 공유하는 스토어 서버, "
+            "import/export: 설정된 저장소로 Task 가져오기/내보내기"
+        ),
+    )
+    parser.add_argument(
+        "path",
+        nargs="?",
+        default="-",
+        help="import/export 파일 (기본값 '-': 표준 입출력)",
+    )
+    parser.add_argument(
+        "--format",
+        choices=[file_format.value for file_format in TransferFormat],
+        default=TransferFormat.NDJSON.value,
+        help="import/export 파일 형식",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=DEFAULT_BATCH_SIZE,
+        help="import/export 한 번에 처리할 행 수",
+    )
+    args = parser.parse_args()
 
     settings = get_settings()
-    uvicorn.run(
-        "mypm.app:app",
-        host=settings.host,
-        port=settings.port,
-        reload=settings.reload,
-        factory=False,
-    )
+    if args.command == "store-server":
+        serve_store(settings)
+    elif args.command == "import":
+        sys.exit(
+            import_tasks(
+                settings, args.path, TransferFormat(args.format), args.batch_size
+            )
+        )
+    elif args.command == "export":
+        export_tasks(settings, args.path, TransferFormat(args.format), args.batch_size)
+    else:
+        serve(settings)
 
 
 if __name__ == "__main__":
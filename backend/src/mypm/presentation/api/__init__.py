@@ -2,12 +2,23 @@
 
 from fastapi import APIRouter
 
-from mypm.presentation.api.routes import retrospective, tasks
+from mypm.presentation.api.routes import (
+    changes,
+    health,
+    metrics,
+    profiles,
+    retrospective,
+    tasks,
+)
 
 
 api_router = APIRouter()
 api_router.include_router(tasks.router, prefix="/tasks", tags=["tasks"])
 api_router.include_router(retrospective.router, prefix="/retrospectives", tags=["retrospectives"])
+api_router.include_router(changes.router, prefix="/changes", tags=["changes"])
+api_router.include_router(health.router, prefix="/health", tags=["health"])
+api_router.include_router(metrics.router, tags=["metrics"])
+api_router.include_router(profiles.router, prefix="/profiles", tags=["profiles"])
 
 
 __all__ = ["api_router"]
@@ -0,0 +1,190 @@
+"""버전 기반 ETag 와 응답 본문 캐시."""
+
+from __future__ import annotations
+
+import hashlib
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import dataclass, field
+from datetime import datetime
+
+from fastapi import Request, Response, status
+
+from mypm.presentation.api.wire import JSON, VARY, ResponseEncoder, negotiate_media_type
+
+CACHE_CONTROL = "no-cache"
+
+
+@dataclass(slots=True)
+class CachedResponse:
+    body: bytes
+    headers: dict[str, str] = field(default_factory=dict)
+
+    @property
+    def size(self) -> int:
+        return len(self.body) + sum(
+            len(key) + len(value) for key, value in self.headers.items()
+        )
+
+
+class ResponseCache:
+    """(쿼리, 버전) 별 직렬화된 응답 본문을 담는 LRU 캐시.
+
+    쿼리마다 가장 최근 버전 하나만 보관하며, 전체 본문 크기가 ``max_bytes`` 를
+    넘으면 가장 오래 사용되지 않은 항목부터 제거합니다.
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        self._max_bytes = max_bytes
+        self._entries: OrderedDict[Hashable, tuple[int, CachedResponse]] = OrderedDict()
+        self._bytes = 0
+
+    @property
+    def size_bytes(self) -> int:
+        return self._bytes
+
+    def get(self, key: Hashable, version: int) -> CachedResponse | None:
+        entry = self._entries.get(key)
+        if entry is None or entry[0] != version:
+            return None
+
+        self._entries.move_to_end(key)
+        return entry[1]
+
+    def put(self, key: Hashable, version: int, response: CachedResponse) -> None:
+        size = response.size
+        if size > self._max_bytes:
+            return
+
+        self._discard(key)
+        self._entries[key] = (version, response)
+        self._bytes += size
+        while self._bytes > self._max_bytes:
+            oldest = next(iter(self._entries))
+            self._discard(oldest)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._bytes = 0
+
+    def _discard(self, key: Hashable) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry[1].size
+
+
+def make_etag(key: Hashable, version: int) -> str:
+    """쿼리와 버전으로 강한 ETag 를 만듭니다. 같은 (쿼리, 버전) 이면 본문도 같습니다."""
+
+    digest = hashlib.blake2b(repr(key).encode(), digest_size=8).hexdigest()
+    return f'"{version:x}-{digest}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+def entity_etag(updated_at: datetime) -> str:
+    """엔티티 버전(``updated_at``)으로 만든 강한 ETag. ``If-Match`` 로 되돌려
+    받습니다."""
+
+    return f'"{updated_at.isoformat(timespec="microseconds")}"'
+
+
+def parse_if_match(if_match: str | None) -> datetime | None:
+    """``If-Match`` 헤더에서 기대 버전을 읽습니다. 없거나 ``*`` 이면 ``None``.
+
+    ``entity_etag`` 형식의 강한 ETag 하나만 받으며 그 밖의 값은 ``ValueError`` 입니다.
+    """
+
+    if if_match is None or if_match.strip() == "*":
+        return None
+
+    value = if_match.strip()
+    if len(value) < 2 or value[0] != '"' or value[-1] != '"':
+        raise ValueError("Invalid If-Match header")
+    try:
+        return datetime.fromisoformat(value[1:-1])
+    except ValueError as exc:
+        raise ValueError("Invalid If-Match header") from exc
+
+
+async def conditional_json_response(
+    request: Request,
+    cache: ResponseCache,
+    key: Hashable,
+    version: Callable[[], Awaitable[int]],
+    build: Callable[[], Awaitable[CachedResponse]],
+    encoder: ResponseEncoder | None = None,
+) -> Response:
+    """ETag 일치 시 304 를, 아니면 캐시되었거나 새로 만든 본문을 반환합니다.
+
+    ``encoder`` 를 주면 ``Accept`` 로 MessagePack, ``Accept-Encoding`` 으로 gzip/zstd 를
+    협상합니다. 변환/압축한 본문도 (쿼리, 표현) 별로 같은 버전에 캐시하므로 버전이
+    바뀌기 전까지 다시 압축하지 않습니다. ETag 는 미디어 타입마다 다르고, 압축한
+    응답에는 약한 ETag(``W/``)를 붙입니다. 압축을 풀면 같은 본문이므로 ``If-None-Match``
+    는 압축 여부와 관계없이 일치시킵니다.
+    """
+
+    current = await version()
+    media_type = (
+        JSON if encoder is None else negotiate_media_type(request.headers.get("accept"))
+    )
+    etag = (
+        make_etag(key, current)
+        if media_type == JSON
+        else make_etag((key, media_type), current)
+    )
+    headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+    if encoder is not None:
+        headers["Vary"] = VARY
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    cached = cache.get(key, current)
+    if cached is None:
+        cached = await build()
+        # 본문을 만드는 동안 쓰기가 끼어들었다면 이 버전으로 캐시하지 않습니다.
+        if await version() == current:
+            cache.put(key, current, cached)
+
+    body = cached.body
+    if encoder is not None:
+        encoding = encoder.encoding_for(
+            request.headers.get("accept-encoding"), len(body)
+        )
+        if media_type != JSON or encoding is not None:
+            variant_key = (key, media_type, encoding)
+            encoded = cache.get(variant_key, current)
+            if encoded is None:
+                encoded = CachedResponse(
+                    body=await encoder.encode(body, media_type, encoding)
+                )
+                if await version() == current:
+                    cache.put(variant_key, current, encoded)
+            body = encoded.body
+        if encoding is not None:
+            headers["ETag"] = f"W/{etag}"
+            headers["Content-Encoding"] = encoding
+
+    return Response(
+        content=body, media_type=media_type, headers={**cached.headers, **headers}
+    )
+
+
+__all__ = [
+    "CachedResponse",
+    "ResponseCache",
+    "conditional_json_response",
+    "entity_etag",
+    "etag_matches",
+    "make_etag",
+    "parse_if_match",
+]
@@ -2,18 +2,79 @@
 
 from collections.abc import AsyncIterator
 
-from mypm.application.tasks import RetrospectiveService, TaskService
-from mypm.infrastructure.tasks import InMemoryRetrospectiveRepository, InMemoryTaskRepository
+from mypm.application.tasks import (
+    ChangeService,
+    RetrospectiveService,
+    TaskLoader,
+    TaskService,
+)
+from mypm.core.config import get_settings
+from mypm.core.metrics import MetricsRegistry
+from mypm.core.profiling import ProfileStore
+from mypm.infrastructure.tasks import (
+    InstrumentedRetrospectiveRepository,
+    InstrumentedTaskRepository,
+    build_history,
+    build_repositories,
+    close_repositories,
+    repository_histogram,
+)
+from mypm.presentation.api.caching import ResponseCache
+from mypm.presentation.api.encoding import FragmentCache, compile_encoder
+from mypm.presentation.api.idempotency import IdempotencyStore, MemoryIdempotencyStore
+from mypm.presentation.api.schemas.retrospective import RetrospectiveResponseSchema
+from mypm.presentation.api.schemas.task import TaskResponseSchema
+from mypm.presentation.api.wire import ResponseEncoder
+
 
-_task_repository = InMemoryTaskRepository()
-_retrospective_repository = InMemoryRetrospectiveRepository()
+_settings = get_settings()
+_task_repository, _retrospective_repository, _store, _change_feed = build_repositories(
+    _settings
+)
+_metrics = MetricsRegistry() if _settings.metrics_enabled else None
+if _metrics is not None:
+    # 서비스가 거치는 리포지토리만 감쌉니다. 트랜잭션 저장소는 원래 리포지토리를 직접
+    # 씁니다.
+    _repository_latency = repository_histogram(_metrics)
+    _task_repository = InstrumentedTaskRepository(_task_repository, _repository_latency)
+    _retrospective_repository = InstrumentedRetrospectiveRepository(
+        _retrospective_repository, _repository_latency
+    )
+# 서비스를 거친 쓰기만 기록합니다. 시작할 때 ``load_task_history`` 로 기준선을
+# 잡습니다. 스토어 서버를 쓰면 없습니다.
+_transitions = build_history(_settings)
 _task_service = TaskService(
     repository=_task_repository,
     retrospective_repository=_retrospective_repository,
+    store=_store,
+    history=_transitions,
 )
 _retrospective_service = RetrospectiveService(
     repository=_retrospective_repository,
     task_repository=_task_repository,
+    store=_store,
+)
+_change_service = ChangeService(
+    feed=_change_feed,
+    task_repository=_task_repository,
+    retrospective_repository=_retrospective_repository,
+)
+_profiles = (
+    ProfileStore(_settings.profiling_keep) if _settings.profiling_enabled else None
+)
+_response_cache = ResponseCache(max_bytes=_settings.response_cache_bytes)
+_idempotency_store = MemoryIdempotencyStore(
+    max_bytes=_settings.idempotency_cache_bytes, ttl=_settings.idempotency_ttl_seconds
+)
+_response_encoder = ResponseEncoder(
+    min_bytes=_settings.compression_min_bytes,
+    thread_bytes=_settings.compression_thread_bytes,
+)
+_task_fragments = FragmentCache(
+    compile_encoder(TaskResponseSchema), _settings.fragment_cache_entries
+)
+_retrospective_fragments = FragmentCache(
+    compile_encoder(RetrospectiveResponseSchema), _settings.fragment_cache_entries
 )
 
 
@@ -25,3 +86,56 @@ async def get_retrospective_service() -> AsyncIterator[RetrospectiveService]:
     yield _retrospective_service
 
 
+async def get_change_service() -> AsyncIterator[ChangeService]:
+    yield _change_service
+
+
+async def load_task_history() -> None:
+    await _task_service.load_history()
+
+
+def close_task_history() -> None:
+    if _transitions is not None:
+        _transitions.close()
+
+
+async def close_storage() -> None:
+    await close_repositories(_store)
+
+
+def get_task_loader() -> TaskLoader:
+    """요청마다 새 로더를 만듭니다. 같은 요청 안의 의존성은 이 로더를 함께 씁니다."""
+
+    return TaskLoader(_task_repository)
+
+
+def get_response_cache() -> ResponseCache:
+    return _response_cache
+
+
+def get_idempotency_store() -> IdempotencyStore:
+    return _idempotency_store
+
+
+def get_response_encoder() -> ResponseEncoder:
+    return _response_encoder
+
+
+def get_task_fragments() -> FragmentCache:
+    return _task_fragments
+
+
+def get_retrospective_fragments() -> FragmentCache:
+    return _retrospective_fragments
+
+
+def get_metrics() -> MetricsRegistry | None:
+    """지표 수집이 꺼져 있으면 ``None`` 을 반환합니다."""
+
+    return _metrics
+
+
+def get_profiles() -> ProfileStore | None:
+    """프로파일링이 꺼져 있으면 ``None`` 을 반환합니다."""
+
+    return _profiles
@@ -0,0 +1,125 @@
+"""목록 응답용 JSON 직렬화 고속 경로.
+
+응답 스키마의 필드 구성으로 객체를 바로 JSON 으로 바꾸는 함수를 미리 생성해,
+``model_validate`` 재검증과 pydantic 모델 생성을 건너뜁니다. 생성된 함수는 스키마와
+같은 이름의 속성을 가진 객체(엔티티, DTO)를 그대로 받습니다.
+"""
+
+from __future__ import annotations
+
+import datetime
+import enum
+import types
+import typing
+import uuid
+from collections.abc import Callable, Iterable
+from json.encoder import encode_basestring
+from typing import Any
+
+from pydantic import BaseModel, TypeAdapter
+
+Encoder = Callable[[Any], str]
+
+
+def compile_encoder(schema: type[BaseModel]) -> Encoder:
+    """``schema`` 필드 순서대로 객체 속성을 JSON 객체 문자열로 바꾸는 함수를 생성합니다.
+
+    출력은 ``schema.model_validate(obj).model_dump_json()`` 과 같습니다. 직접 다루지
+    않는 필드 타입은 해당 타입의 pydantic 직렬화기로 처리합니다.
+    """
+
+    namespace: dict[str, Any] = {"_str": encode_basestring}
+    lines = ["def encode(obj):"]
+    parts = []
+    for position, (name, field_info) in enumerate(schema.model_fields.items()):
+        key = field_info.serialization_alias or field_info.alias or name
+        variable = f"v{position}"
+        lines.append(f"    {variable} = obj.{name}")
+        prefix = ("{" if position == 0 else ",") + encode_basestring(key) + ":"
+        value = _value_expression(variable, field_info.annotation, namespace)
+        parts.append(f"{prefix!r} + ({value})")
+
+    lines.append(f"    return {' + '.join(parts) or repr('{')} + '}}'")
+    exec("\n".join(lines), namespace)  # noqa: S102 - 스키마 정의에서만 생성한 코드입니다.
+    return namespace["encode"]
+
+
+def _value_expression(variable: str, annotation: Any, namespace: dict[str, Any]) -> str:
+    origin = typing.get_origin(annotation)
+    if origin in (typing.Union, types.UnionType):
+        members = [
+            member for member in typing.get_args(annotation) if member is not type(None)
+        ]
+        inner = members[0] if len(members) == 1 else annotation
+        if inner is not annotation:
+            value = _value_expression(variable, inner, namespace)
+            return f'"null" if {variable} is None else {value}'
+
+    if origin is list:
+        (item_type,) = typing.get_args(annotation)
+        item = _value_expression("item", item_type, namespace)
+        return f'"[" + ",".join([{item} for item in {variable}]) + "]"'
+
+    if isinstance(annotation, type):
+        if issubclass(annotation, enum.Enum):
+            return f"_str({variable}.value)"
+        if annotation is str:
+            return f"_str({variable})"
+        if annotation is bool:
+            return f'("true" if {variable} else "false")'
+        if annotation in (int, float):
+            return f"repr({variable})"
+        if annotation is uuid.UUID:
+            return f"'\"' + str({variable}) + '\"'"
+        if annotation in (datetime.date, datetime.datetime):
+            return f"'\"' + {variable}.isoformat() + '\"'"
+        if issubclass(annotation, BaseModel):
+            encoder_name = f"_encode_{len(namespace)}"
+            namespace[encoder_name] = compile_encoder(annotation)
+            return f"{encoder_name}({variable})"
+
+    adapter_name = f"_adapter_{len(namespace)}"
+    namespace[adapter_name] = TypeAdapter(annotation)
+    return f"{adapter_name}.dump_json({variable}).decode()"
+
+
+class FragmentCache:
+    """객체별로 인코딩한 JSON 조각 캐시.
+
+    조각은 ``(id, updated_at)`` 이 같을 때만 재사용합니다. 엔티티는 ``touch()`` 로
+    ``updated_at`` 을 갱신하므로 변경된 엔티티는 자동으로 다시 인코딩됩니다.
+    항목 수가 ``max_entries`` 를 넘으면 오래 들어온 순서대로 버립니다.
+    """
+
+    def __init__(self, encoder: Encoder, max_entries: int) -> None:
+        self._encoder = encoder
+        self._max_entries = max_entries
+        self._entries: dict[uuid.UUID, tuple[datetime.datetime, bytes]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def encode(self, obj: Any) -> bytes:
+        entry = self._entries.get(obj.id)
+        if entry is not None and entry[0] == obj.updated_at:
+            return entry[1]
+
+        fragment = self._encoder(obj).encode()
+        if self._max_entries > 0:
+            entries = self._entries
+            entries.pop(obj.id, None)
+            if len(entries) >= self._max_entries:
+                del entries[next(iter(entries))]
+            entries[obj.id] = (obj.updated_at, fragment)
+        return fragment
+
+    def encode_many(self, objs: Iterable[Any]) -> bytes:
+        """JSON 배열로 인코딩합니다."""
+
+        return b"[" + b",".join(map(self.encode, objs)) + b"]"
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+__all__ = ["Encoder", "FragmentCache", "compile_encoder"]
@@ -0,0 +1,303 @@
+"""``Idempotency-Key`` 헤더로 재시도된 POST 요청을 한 번만 실행합니다.
+
+첫 요청의 응답(상태, 헤더, 본문)을 키로 저장해 두고, 같은 키의 재시도에는 라우트와
+서비스를 거치지 않고 저장된 응답을 돌려줍니다. 같은 키로 동시에 들어온 요청은 먼저 온
+요청의 실행을 기다렸다가 그 응답을 받습니다. 같은 키를 다른 요청(메서드, 경로, 본문)에
+쓰면 422 입니다.
+
+5xx 와 409(동시 수정 충돌)는 다시 시도하면 결과가 달라질 수 있으므로 저장하지 않습니다.
+요청과 응답 본문을 모두 메모리에 모으므로 ``ROUTES`` 의 생성/연결 요청에만 적용하고,
+본문이 ``max_body_bytes`` 를 넘으면 413 입니다. ``/tasks/import`` 처럼 본문을
+스트리밍하는 경로는 거치지 않습니다.
+
+저장소는 ``IdempotencyStore`` 를 구현해 바꿀 수 있습니다. 기본 메모리 저장소는 워커마다
+따로이므로 여러 워커가 상태를 공유하는 구성에서는 앱이 이 미들웨어를 켜지 않습니다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import re
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+IDEMPOTENCY_KEY_HEADER = "Idempotency-Key"
+REPLAYED_HEADER = "Idempotent-Replayed"
+
+_KEY_HEADER = IDEMPOTENCY_KEY_HEADER.lower().encode("latin-1")
+_REPLAYED = (REPLAYED_HEADER.lower().encode("latin-1"), b"true")
+_MAX_KEY_LENGTH = 255
+_UUID = r"[0-9A-Fa-f-]{32,36}"
+# 멱등 키를 받는 POST 경로 (클라이언트가 시간 초과 뒤 다시 보내는 생성/연결 요청)
+ROUTES = re.compile(
+    rf"/tasks/?|/retrospectives/?|/retrospectives/{_UUID}/tasks/{_UUID}"
+)
+
+
+@dataclass(frozen=True, slots=True)
+class StoredResponse:
+    fingerprint: str
+    status: int
+    headers: tuple[tuple[bytes, bytes], ...]
+    body: bytes
+
+    @property
+    def size(self) -> int:
+        return (
+            len(self.body)
+            + len(self.fingerprint)
+            + sum(len(name) + len(value) for name, value in self.headers)
+        )
+
+    def storable(self) -> bool:
+        return self.status < 500 and self.status != 409
+
+
+class IdempotencyStore(ABC):
+    """멱등 키별 응답 저장소 인터페이스."""
+
+    @abstractmethod
+    async def get(self, key: str) -> StoredResponse | None:
+        """만료되지 않은 응답을 반환합니다."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def put(self, key: str, response: StoredResponse) -> None:
+        raise NotImplementedError
+
+
+class MemoryIdempotencyStore(IdempotencyStore):
+    """``ttl`` 초 동안 응답을 보관하는 LRU 저장소.
+
+    전체 크기가 ``max_bytes`` 를 넘으면 가장 오래 사용되지 않은 항목부터 버립니다.
+    """
+
+    def __init__(self, max_bytes: int, ttl: float) -> None:
+        self._max_bytes = max_bytes
+        self._ttl = ttl
+        self._entries: OrderedDict[str, tuple[float, StoredResponse]] = OrderedDict()
+        self._bytes = 0
+
+    @property
+    def size_bytes(self) -> int:
+        return self._bytes
+
+    async def get(self, key: str) -> StoredResponse | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            self._discard(key)
+            return None
+
+        self._entries.move_to_end(key)
+        return entry[1]
+
+    async def put(self, key: str, response: StoredResponse) -> None:
+        size = len(key) + response.size
+        if size > self._max_bytes:
+            return
+
+        self._discard(key)
+        self._entries[key] = (time.monotonic() + self._ttl, response)
+        self._bytes += size
+        while self._bytes > self._max_bytes:
+            self._discard(next(iter(self._entries)))
+
+    def _discard(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= len(key) + entry[1].size
+
+
+class IdempotencyMiddleware:
+    """``Idempotency-Key`` 가 있는 POST 요청을 저장된 응답으로 재생하거나 한 번만
+    실행합니다."""
+
+    def __init__(
+        self, app: ASGIApp, store: IdempotencyStore, max_body_bytes: int
+    ) -> None:
+        self.app = app
+        self._store = store
+        self._max_body_bytes = max_body_bytes
+        # 실행 중인 키 -> 그 실행의 응답 (저장하지 않을 응답이면 None)
+        self._in_flight: dict[str, asyncio.Future[StoredResponse | None]] = {}
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or scope["method"] != "POST"
+            or ROUTES.fullmatch(scope["path"]) is None
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        key = _header(scope, _KEY_HEADER)
+        if key is None:
+            await self.app(scope, receive, send)
+            return
+        if not key or len(key) > _MAX_KEY_LENGTH:
+            await _send_error(
+                send,
+                400,
+                f"{IDEMPOTENCY_KEY_HEADER} must be 1-{_MAX_KEY_LENGTH} characters",
+            )
+            return
+
+        body = await _read_body(receive, self._max_body_bytes)
+        if body is None:
+            await _send_error(
+                send,
+                413,
+                f"Request body with {IDEMPOTENCY_KEY_HEADER} must be at most "
+                f"{self._max_body_bytes} bytes",
+            )
+            return
+        fingerprint = _fingerprint(scope, body)
+
+        while True:
+            stored = await self._store.get(key)
+            if stored is not None:
+                await _replay(stored, fingerprint, send)
+                return
+
+            pending = self._in_flight.get(key)
+            if pending is None:
+                break
+            stored = await asyncio.shield(pending)
+            if stored is not None:
+                await _replay(stored, fingerprint, send)
+                return
+            # 먼저 온 요청이 저장하지 않을 결과로 끝났으면 이 요청이 직접 실행합니다.
+
+        future: asyncio.Future[StoredResponse | None] = (
+            asyncio.get_running_loop().create_future()
+        )
+        self._in_flight[key] = future
+        result = None
+        try:
+            stored = await self._execute(scope, body, receive, send, fingerprint)
+            if stored.storable():
+                await self._store.put(key, stored)
+                result = stored
+        finally:
+            del self._in_flight[key]
+            future.set_result(result)
+
+    async def _execute(
+        self, scope: Scope, body: bytes, receive: Receive, send: Send, fingerprint: str
+    ) -> StoredResponse:
+        """앱을 실행하면서 응답을 그대로 보내고 저장할 사본을 모읍니다."""
+
+        replayed_body = False
+        status = 500
+        headers: tuple[tuple[bytes, bytes], ...] = ()
+        chunks: list[bytes] = []
+
+        async def _receive() -> Message:
+            nonlocal replayed_body
+            if not replayed_body:
+                replayed_body = True
+                return {"type": "http.request", "body": body, "more_body": False}
+            return await receive()
+
+        async def _send(message: Message) -> None:
+            nonlocal status, headers
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                headers = tuple(message.get("headers", ()))
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+            await send(message)
+
+        await self.app(scope, _receive, _send)
+        return StoredResponse(
+            fingerprint=fingerprint,
+            status=status,
+            headers=headers,
+            body=b"".join(chunks),
+        )
+
+
+def _header(scope: Scope, name: bytes) -> str | None:
+    for header, value in scope["headers"]:
+        if header == name:
+            return value.decode("latin-1").strip()
+    return None
+
+
+async def _read_body(receive: Receive, limit: int) -> bytes | None:
+    """본문을 모두 읽습니다. ``limit`` 바이트를 넘으면 더 읽지 않고 None 입니다."""
+
+    chunks = []
+    size = 0
+    while True:
+        message = await receive()
+        if message["type"] != "http.request":
+            break
+        chunk = message.get("body", b"")
+        size += len(chunk)
+        if size > limit:
+            return None
+        chunks.append(chunk)
+        if not message.get("more_body", False):
+            break
+    return b"".join(chunks)
+
+
+def _fingerprint(scope: Scope, body: bytes) -> str:
+    digest = hashlib.sha256()
+    digest.update(scope["method"].encode())
+    digest.update(b" ")
+    digest.update(scope["path"].encode())
+    digest.update(b"?")
+    digest.update(scope.get("query_string", b""))
+    digest.update(b"\n")
+    digest.update(body)
+    return digest.hexdigest()
+
+
+async def _replay(stored: StoredResponse, fingerprint: str, send: Send) -> None:
+    if stored.fingerprint != fingerprint:
+        await _send_error(
+            send,
+            422,
+            f"{IDEMPOTENCY_KEY_HEADER} was already used for a different request",
+        )
+        return
+
+    await send(
+        {
+            "type": "http.response.start",
+            "status": stored.status,
+            "headers": [*stored.headers, _REPLAYED],
+        }
+    )
+    await send({"type": "http.response.body", "body": stored.body})
+
+
+async def _send_error(send: Send, status: int, detail: str) -> None:
+    body = json.dumps({"detail": detail}).encode()
+    headers = [
+        (b"content-type", b"application/json"),
+        (b"content-length", str(len(body)).encode()),
+    ]
+    await send({"type": "http.response.start", "status": status, "headers": headers})
+    await send({"type": "http.response.body", "body": body})
+
+
+__all__ = [
+    "IDEMPOTENCY_KEY_HEADER",
+    "REPLAYED_HEADER",
+    "ROUTES",
+    "IdempotencyMiddleware",
+    "IdempotencyStore",
+    "MemoryIdempotencyStore",
+    "StoredResponse",
+]
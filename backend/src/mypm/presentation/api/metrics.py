@@ -0,0 +1,90 @@
+"""요청별 지연과 처리 중인 요청 수를 기록하는 ASGI 미들웨어."""
+
+from __future__ import annotations
+
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from mypm.core.metrics import MetricsRegistry
+
+# 라우트에 매칭되지 않은 요청(404 등)의 라벨. 경로를 그대로 쓰면 라벨 수가 끝없이
+# 늘어납니다.
+UNMATCHED_ROUTE = "unmatched"
+
+
+class MetricsMiddleware:
+    """라우트 템플릿(``/tasks/{task_id}``) 별 요청 지연과 메서드별 처리 중인 요청 수를
+    기록합니다.
+
+    ``BaseHTTPMiddleware`` 와 달리 요청/응답 객체를 만들지 않는 순수 ASGI
+    미들웨어입니다. 라우트는 라우터가 ``scope["route"]`` 에 남긴 값으로 응답이 끝난 뒤
+    정합니다.
+    """
+
+    def __init__(self, app: ASGIApp, registry: MetricsRegistry) -> None:
+        self.app = app
+        self._duration = registry.histogram(
+            "mypm_http_request_duration_seconds",
+            "Latency of HTTP requests by route template.",
+            ("method", "route", "status"),
+        )
+        # 라우트 객체 -> 전체 경로 템플릿. 라우트 수만큼만 늘어납니다.
+        self._templates: dict[int, tuple[object, str]] = {}
+        self._in_flight = registry.gauge(
+            "mypm_http_requests_in_flight",
+            "HTTP requests currently being handled.",
+            ("method",),
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status = 500
+
+        async def _send(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        in_flight = (method,)
+        self._in_flight.add(in_flight, 1)
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, _send)
+        finally:
+            elapsed = time.perf_counter() - started
+            self._in_flight.add(in_flight, -1)
+            self._duration.observe((method, self._template(scope), status), elapsed)
+
+    def _template(self, scope: Scope) -> str:
+        route = scope.get("route")
+        cached = self._templates.get(id(route))
+        if cached is not None and cached[0] is route:
+            return cached[1]
+        template = route_template(scope)
+        if route is not None:
+            self._templates[id(route)] = (route, template)
+        return template
+
+
+def route_template(scope: Scope) -> str:
+    """요청이 매칭된 라우트의 전체 경로 템플릿을 반환합니다.
+
+    FastAPI 버전에 따라 포함된 라우터의 라우트가 prefix 를 뺀 경로만 가지므로, 템플릿에
+    없는 앞부분을 실제 요청 경로에서 채웁니다. prefix 에는 경로 변수가 없다고
+    가정합니다.
+    """
+
+    template = getattr(scope.get("route"), "path_format", None)
+    if template is None:
+        return UNMATCHED_ROUTE
+    segments = scope["path"].split("/")
+    return "/".join(segments[: len(segments) - template.count("/")]) + template
+
+
+__all__ = ["MetricsMiddleware", "UNMATCHED_ROUTE", "route_template"]
@@ -0,0 +1,92 @@
+"""요청 단위 프로파일링 ASGI 미들웨어."""
+
+from __future__ import annotations
+
+import random
+import sys
+import time
+import uuid
+from datetime import datetime, timezone
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from mypm.core.profiling import Profile, ProfileStore, StackProfiler
+from mypm.presentation.api.metrics import route_template
+
+PROFILE_HEADER = "X-Profile"
+PROFILE_ID_HEADER = "X-Profile-Id"
+
+_REQUEST_HEADER = PROFILE_HEADER.lower().encode("latin-1")
+_RESPONSE_HEADER = PROFILE_ID_HEADER.lower().encode("latin-1")
+_TRUTHY = {b"1", b"true", b"on", b"yes"}
+
+
+class ProfilingMiddleware:
+    """``X-Profile: 1`` 헤더가 있거나 ``sample_rate`` 확률로 뽑힌 요청을 프로파일합니다.
+
+    프로파일한 요청의 응답에는 ``X-Profile-Id`` 헤더가 붙고, 결과는 ``store`` 에
+    남습니다. 프로파일 함수는 이벤트 루프 스레드 전체에 걸리므로 한 번에 한 요청만
+    프로파일하며, 그동안 같은 루프의 다른 요청도 이벤트 처리 비용만큼 느려집니다.
+    설정에서 끄면 이 미들웨어 자체를 등록하지 않습니다.
+    """
+
+    def __init__(
+        self, app: ASGIApp, store: ProfileStore, sample_rate: float = 0.0
+    ) -> None:
+        self.app = app
+        self._store = store
+        self._sample_rate = sample_rate
+        self._active = False
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or self._active or not self._selected(scope):
+            await self.app(scope, receive, send)
+            return
+
+        profile_id = uuid.uuid4().hex
+        status = 500
+
+        async def _send(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                headers = [
+                    *message.get("headers", ()),
+                    (_RESPONSE_HEADER, profile_id.encode("latin-1")),
+                ]
+                message = {**message, "headers": headers}
+            await send(message)
+
+        self._active = True
+        profiler = StackProfiler(sys._getframe())
+        started_at = datetime.now(timezone.utc)
+        started = time.perf_counter_ns()
+        profiler.start()
+        try:
+            await self.app(scope, receive, _send)
+        finally:
+            profiler.stop()
+            wall_ns = time.perf_counter_ns() - started
+            self._active = False
+            self._store.add(
+                Profile(
+                    id=profile_id,
+                    method=scope["method"],
+                    path=scope["path"],
+                    route=route_template(scope),
+                    status=status,
+                    started_at=started_at,
+                    wall_ms=wall_ns / 1e6,
+                    cpu_ms=profiler.cpu_ns / 1e6,
+                    collapsed=profiler.collapsed(),
+                )
+            )
+
+    def _selected(self, scope: Scope) -> bool:
+        for name, value in scope["headers"]:
+            if name == _REQUEST_HEADER:
+                return value.lower() in _TRUTHY
+        return self._sample_rate > 0 and random.random() < self._sample_rate
+
+
+__all__ = ["PROFILE_HEADER", "PROFILE_ID_HEADER", "ProfilingMiddleware"]
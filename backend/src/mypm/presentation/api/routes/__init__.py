@@ -1,11 +1,20 @@
 """API 라우터 패키지."""
 
-from mypm.presentation.api.routes import health, retrospective, tasks
-
+from mypm.presentation.api.routes import (
+    changes,
+    health,
+    metrics,
+    profiles,
+    retrospective,
+    tasks,
+)
 
 __all__ = [
     "health",
     "tasks",
     "retrospective",
+    "changes",
+    "metrics",
+    "profiles",
 ]
 
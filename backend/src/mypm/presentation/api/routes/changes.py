@@ -0,0 +1,148 @@
+"""변경 피드 API 라우터."""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, status
+from fastapi.responses import StreamingResponse
+
+from mypm.application.tasks import ChangeService
+from mypm.application.tasks.dto import ChangeOutput, ChangeSetOutput
+from mypm.presentation.api.caching import CACHE_CONTROL
+from mypm.presentation.api.dependencies import (
+    get_change_service,
+    get_retrospective_fragments,
+    get_task_fragments,
+)
+from mypm.presentation.api.encoding import FragmentCache, compile_encoder
+from mypm.presentation.api.schemas.change import (
+    ChangeResponseSchema,
+    ChangeSetResponseSchema,
+)
+
+router = APIRouter()
+
+# 변경이 없을 때 연결이 끊기지 않도록 주석 줄을 보내는 간격(초)
+KEEPALIVE_SECONDS = 15.0
+# 스트림이 한 번에 읽어 보내는 최대 변경 수
+STREAM_BATCH_SIZE = 500
+# 연결이 끊긴 EventSource 가 다시 연결하기 전에 기다리는 시간(밀리초)
+RETRY_MS = 3000
+
+_encode_change = compile_encoder(ChangeResponseSchema)
+
+
+@router.get("/", response_model=ChangeSetResponseSchema)
+async def list_changes(
+    since: int | None = Query(
+        None, description="이전 응답의 cursor (없으면 전체 상태)"
+    ),
+    limit: int = Query(1000, ge=1, le=5000, description="한 번에 받을 최대 변경 수"),
+    service: ChangeService = Depends(get_change_service),
+    task_fragments: FragmentCache = Depends(get_task_fragments),
+    retrospective_fragments: FragmentCache = Depends(get_retrospective_fragments),
+) -> Response:
+    """``since`` 이후의 Task/회고 변경을 순번 순으로 조회합니다.
+
+    ``since`` 가 없거나 보관 범위를 벗어났으면 ``reset`` 과 함께 전체 상태를 반환합니다.
+    """
+
+    result = await service.get_changes(since, limit)
+    return Response(
+        content=_encode_change_set(result, task_fragments, retrospective_fragments),
+        media_type="application/json",
+        headers={"Cache-Control": CACHE_CONTROL},
+    )
+
+
+@router.get("/stream")
+async def stream_changes(
+    since: int | None = Query(
+        None, description="이 순번 다음 변경부터 보냅니다 (없으면 지금부터)"
+    ),
+    last_event_id: str | None = Header(
+        default=None, description="재연결 시 마지막으로 받은 이벤트 id"
+    ),
+    service: ChangeService = Depends(get_change_service),
+) -> StreamingResponse:
+    """변경을 server-sent events 로 보냅니다.
+
+    이벤트 id 는 변경 순번이므로 브라우저는 재연결할 때 ``Last-Event-ID`` 로 이어
+    받습니다. 연결마다 자기 커서를 따라 피드를 읽고, 앞선 이벤트를 소켓에 다 쓴 뒤에
+    다음 묶음을 읽으므로 느린 클라이언트는 그 연결만 뒤처집니다. 뒤처진 커서가 보관
+    범위를 벗어나면 ``reset`` 이벤트를 보내고 최신 위치부터 이어 갑니다. 클라이언트는
+    ``reset`` 을 받으면 ``GET /changes`` 로 전체 상태를 다시 받습니다.
+    """
+
+    if last_event_id is not None:
+        try:
+            since = int(last_event_id)
+        except ValueError as exc:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid Last-Event-ID"
+            ) from exc
+    if since is None:
+        since = await service.get_latest()
+
+    return StreamingResponse(
+        _events(service, since),
+        media_type="text/event-stream",
+        headers={"Cache-Control": CACHE_CONTROL, "X-Accel-Buffering": "no"},
+    )
+
+
+async def _events(service: ChangeService, cursor: int) -> AsyncIterator[bytes]:
+    yield b"retry: %d\n\n" % RETRY_MS
+    while True:
+        result = await service.get_deltas(cursor, STREAM_BATCH_SIZE)
+        if result.reset:
+            yield b'id: %d\nevent: reset\ndata: {"cursor":%d}\n\n' % (
+                result.cursor,
+                result.cursor,
+            )
+        elif result.changes:
+            yield b"".join(map(_change_event, result.changes))
+        cursor = result.cursor
+        if result.has_more:
+            continue
+
+        if await service.wait_for_changes(cursor, KEEPALIVE_SECONDS) <= cursor:
+            yield b": keepalive\n\n"
+
+
+def _change_event(change: ChangeOutput) -> bytes:
+    return b"id: %d\nevent: change\ndata: %s\n\n" % (
+        change.sequence,
+        _encode_change(change).encode(),
+    )
+
+
+def _encode_change_set(
+    result: ChangeSetOutput,
+    task_fragments: FragmentCache,
+    retrospective_fragments: FragmentCache,
+) -> bytes:
+    # 스냅샷은 목록 응답과 같은 조각 캐시로 직렬화합니다.
+    changes = b",".join(_encode_change(change).encode() for change in result.changes)
+    tasks = (
+        task_fragments.encode_many(result.tasks)
+        if result.tasks is not None
+        else b"null"
+    )
+    retrospectives = (
+        retrospective_fragments.encode_many(result.retrospectives)
+        if result.retrospectives is not None
+        else b"null"
+    )
+    return (
+        b'{"cursor":%d,"has_more":%s,"reset":%s,"changes":[%s],"tasks":%s,"retrospectives":%s}'
+        % (
+            result.cursor,
+            b"true" if result.has_more else b"false",
+            b"true" if result.reset else b"false",
+            changes,
+            tasks,
+            retrospectives,
+        )
+    )
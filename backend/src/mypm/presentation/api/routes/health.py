@@ -1,12 +1,39 @@
 """헬스 체크 엔드포인트."""
 
-from fastapi import APIRouter
+import asyncio
+
+from fastapi import APIRouter, Depends, HTTPException, status
+
+from mypm.application.tasks import TaskService
+from mypm.presentation.api.dependencies import get_task_service
 
 router = APIRouter()
 
+# 준비 상태 확인에서 저장소 응답을 기다리는 최대 시간(초)
+READINESS_TIMEOUT = 2.0
+
 
 @router.get("/", summary="Health Check")
 async def health_check() -> dict[str, str]:
     return {"status": "ok"}
 
 
+@router.get("/live", summary="Liveness Check")
+async def liveness() -> dict[str, str]:
+    """프로세스가 요청을 처리하고 있는지만 확인합니다. 저장소는 보지 않습니다."""
+
+    return {"status": "ok"}
+
+
+@router.get("/ready", summary="Readiness Check")
+async def readiness(service: TaskService = Depends(get_task_service)) -> dict[str, str]:
+    """저장소(스토어 서버, SQLite 포함)가 응답하는지 확인합니다. 응답하지 않으면 503."""
+
+    try:
+        await asyncio.wait_for(service.get_version(), READINESS_TIMEOUT)
+    except Exception as exc:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=f"Storage unavailable: {exc!r}",
+        ) from exc
+    return {"status": "ready"}
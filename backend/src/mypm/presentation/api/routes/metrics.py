@@ -0,0 +1,22 @@
+"""Prometheus 지표 엔드포인트."""
+
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+
+from mypm.core.metrics import MetricsRegistry
+from mypm.presentation.api.dependencies import get_metrics
+
+router = APIRouter()
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+@router.get("/metrics", summary="Prometheus Metrics", include_in_schema=False)
+async def metrics(registry: MetricsRegistry | None = Depends(get_metrics)) -> Response:
+    """이 워커 프로세스의 요청/리포지토리 지연 분포를 Prometheus 텍스트 형식으로
+    반환합니다."""
+
+    if registry is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Metrics are disabled"
+        )
+    return Response(content=registry.render(), media_type=PROMETHEUS_CONTENT_TYPE)
@@ -0,0 +1,54 @@
+"""요청 프로파일 API 라우터."""
+
+from __future__ import annotations
+
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+
+from mypm.core.profiling import ProfileStore
+from mypm.presentation.api.dependencies import get_profiles
+from mypm.presentation.api.schemas.profile import ProfileSummaryResponseSchema
+
+router = APIRouter()
+
+
+def _require_profiles(
+    store: ProfileStore | None = Depends(get_profiles),
+) -> ProfileStore:
+    if store is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Profiling is disabled"
+        )
+    return store
+
+
+@router.get("/", response_model=list[ProfileSummaryResponseSchema])
+async def list_profiles(
+    store: ProfileStore = Depends(_require_profiles),
+) -> list[ProfileSummaryResponseSchema]:
+    """이 워커에 남아 있는 최근 프로파일을 최신순으로 반환합니다."""
+
+    return [
+        ProfileSummaryResponseSchema.model_validate(profile)
+        for profile in store.recent()
+    ]
+
+
+@router.get("/{profile_id}", response_class=Response)
+async def download_profile(
+    profile_id: str, store: ProfileStore = Depends(_require_profiles)
+) -> Response:
+    """collapsed-stack 형식(``스택 마이크로초``) 본문을 내려받습니다. flamegraph.pl 이나
+    speedscope 로 엽니다."""
+
+    profile = store.get(profile_id)
+    if profile is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Profile not found"
+        )
+    return Response(
+        content=profile.collapsed,
+        media_type="text/plain; charset=utf-8",
+        headers={
+            "Content-Disposition": f'attachment; filename="{profile.id}.collapsed"'
+        },
+    )
@@ -4,19 +4,42 @@ from __future__ import annotations
 
 import uuid
 from datetime import date
+from typing import Literal
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from pydantic import TypeAdapter
 
-from mypm.application.tasks import RetrospectiveService
+from mypm.application.tasks import RetrospectiveService, TaskLoader
 from mypm.application.tasks.dto import RetrospectiveCreateInput, RetrospectiveOutput
-from mypm.presentation.api.dependencies import get_retrospective_service
+from mypm.domain.tasks.errors import ConflictError
+from mypm.presentation.api.caching import (
+    CachedResponse,
+    ResponseCache,
+    conditional_json_response,
+)
+from mypm.presentation.api.dependencies import (
+    get_response_cache,
+    get_response_encoder,
+    get_retrospective_fragments,
+    get_retrospective_service,
+    get_task_loader,
+)
+from mypm.presentation.api.encoding import FragmentCache, compile_encoder
 from mypm.presentation.api.schemas.retrospective import (
+    RetrospectiveCalendarDaySchema,
     RetrospectiveCreateSchema,
+    RetrospectiveDetailResponseSchema,
     RetrospectiveResponseSchema,
+    RetrospectiveTasksSchema,
 )
+from mypm.presentation.api.wire import ResponseEncoder
+
 
 router = APIRouter()
 
+_CALENDAR_ADAPTER = TypeAdapter(list[RetrospectiveCalendarDaySchema])
+_encode_detail = compile_encoder(RetrospectiveDetailResponseSchema)
+
 
 @router.post("/", response_model=RetrospectiveResponseSchema, status_code=status.HTTP_201_CREATED)
 async def create_retrospective(
@@ -28,6 +51,112 @@ async def create_retrospective(
     return RetrospectiveResponseSchema.model_validate(created)
 
 
+@router.get("/", response_model=list[RetrospectiveResponseSchema])
+async def list_retrospectives(
+    request: Request,
+    start: date = Query(..., alias="from", description="시작일 (포함)"),
+    end: date = Query(..., alias="to", description="종료일 (포함)"),
+    service: RetrospectiveService = Depends(get_retrospective_service),
+    cache: ResponseCache = Depends(get_response_cache),
+    encoder: ResponseEncoder = Depends(get_response_encoder),
+    fragments: FragmentCache = Depends(get_retrospective_fragments),
+) -> Response:
+    """기간 안의 회고를 날짜순으로 조회합니다."""
+
+    async def _build() -> CachedResponse:
+        try:
+            items = await service.list_by_date_range(start, end)
+        except ValueError as exc:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)
+            ) from exc
+
+        return CachedResponse(body=fragments.encode_many(items))
+
+    key = ("retrospectives", "range", start.isoformat(), end.isoformat())
+    return await conditional_json_response(
+        request, cache, key, service.get_version, _build, encoder
+    )
+
+
+@router.get("/calendar", response_model=list[RetrospectiveCalendarDaySchema])
+async def get_calendar(
+    request: Request,
+    start: date = Query(..., alias="from", description="시작일 (포함)"),
+    end: date = Query(..., alias="to", description="종료일 (포함)"),
+    service: RetrospectiveService = Depends(get_retrospective_service),
+    cache: ResponseCache = Depends(get_response_cache),
+    encoder: ResponseEncoder = Depends(get_response_encoder),
+) -> Response:
+    """회고가 있는 날짜별로 연결된 Task 수와 상태별 분포를 한 번에 조회합니다."""
+
+    async def _build() -> CachedResponse:
+        try:
+            days = await service.get_calendar(start, end)
+        except ValueError as exc:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)
+            ) from exc
+
+        return CachedResponse(
+            body=_CALENDAR_ADAPTER.dump_json(
+                [RetrospectiveCalendarDaySchema.model_validate(day) for day in days]
+            )
+        )
+
+    key = ("retrospectives", "calendar", start.isoformat(), end.isoformat())
+    return await conditional_json_response(
+        request, cache, key, service.get_calendar_version, _build, encoder
+    )
+
+
+@router.post(
+    "/{retrospective_id}/tasks/batch", response_model=RetrospectiveResponseSchema
+)
+async def attach_tasks(
+    retrospective_id: uuid.UUID,
+    payload: RetrospectiveTasksSchema,
+    service: RetrospectiveService = Depends(get_retrospective_service),
+) -> RetrospectiveResponseSchema:
+    """여러 Task 를 한 번에 연결합니다. 없는 Task 가 있으면 아무것도 연결하지 않고 404
+    입니다."""
+
+    try:
+        attached = await service.attach_tasks(retrospective_id, payload.ids)
+        return RetrospectiveResponseSchema.model_validate(attached)
+    except ConflictError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT, detail=str(exc)
+        ) from exc
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)
+        ) from exc
+
+
+@router.post(
+    "/{retrospective_id}/tasks/batch/delete", response_model=RetrospectiveResponseSchema
+)
+async def detach_tasks(
+    retrospective_id: uuid.UUID,
+    payload: RetrospectiveTasksSchema,
+    service: RetrospectiveService = Depends(get_retrospective_service),
+) -> RetrospectiveResponseSchema:
+    """여러 Task 를 한 번에 뺍니다. 이 회고에 연결되지 않은 ID 는 무시합니다."""
+
+    try:
+        detached = await service.detach_tasks(retrospective_id, payload.ids)
+        return RetrospectiveResponseSchema.model_validate(detached)
+    except ConflictError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT, detail=str(exc)
+        ) from exc
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)
+        ) from exc
+
+
 @router.post("/{retrospective_id}/tasks/{task_id}", response_model=RetrospectiveResponseSchema)
 async def attach_task(
     retrospective_id: uuid.UUID,
@@ -37,19 +166,74 @@ async def attach_task(
     try:
         attached = await service.attach_task(retrospective_id, task_id)
         return RetrospectiveResponseSchema.model_validate(attached)
+    except ConflictError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT, detail=str(exc)
+        ) from exc
     except ValueError as exc:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)
+        ) from exc
 
 
 @router.get("/date/{retro_date}", response_model=RetrospectiveResponseSchema | None)
 async def get_retrospective_by_date(
+    request: Request,
     retro_date: date,
     service: RetrospectiveService = Depends(get_retrospective_service),
-) -> RetrospectiveResponseSchema | None:
-    result = await service.get_summary(retro_date)
-    if result is None:
-        return None
+    cache: ResponseCache = Depends(get_response_cache),
+    encoder: ResponseEncoder = Depends(get_response_encoder),
+) -> Response:
+    async def _build() -> CachedResponse:
+        result = await service.get_summary(retro_date)
+        if result is None:
+            return CachedResponse(body=b"null")
+
+        return CachedResponse(
+            body=RetrospectiveResponseSchema.model_validate(result)
+            .model_dump_json()
+            .encode()
+        )
 
-    return RetrospectiveResponseSchema.model_validate(result)
+    key = ("retrospectives", "date", retro_date.isoformat())
+    return await conditional_json_response(
+        request, cache, key, service.get_version, _build, encoder
+    )
+
+
+@router.get(
+    "/{retrospective_id}",
+    response_model=RetrospectiveResponseSchema | RetrospectiveDetailResponseSchema,
+)
+async def get_retrospective(
+    request: Request,
+    retrospective_id: uuid.UUID,
+    expand: Literal["tasks"] | None = Query(
+        None, description="``tasks`` 면 Task ID 대신 Task 를 담습니다"
+    ),
+    service: RetrospectiveService = Depends(get_retrospective_service),
+    cache: ResponseCache = Depends(get_response_cache),
+    encoder: ResponseEncoder = Depends(get_response_encoder),
+    fragments: FragmentCache = Depends(get_retrospective_fragments),
+    loader: TaskLoader = Depends(get_task_loader),
+) -> Response:
+    async def _build() -> CachedResponse:
+        if expand is None:
+            result = await service.get_retrospective(retrospective_id)
+            body = None if result is None else fragments.encode(result)
+        else:
+            detail = await service.get_retrospective_detail(retrospective_id, loader)
+            body = None if detail is None else _encode_detail(detail).encode()
+        if body is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="Retrospective not found"
+            )
 
+        return CachedResponse(body=body)
 
+    key = ("retrospectives", "id", retrospective_id, expand)
+    # 펼친 응답은 Task 변경에도 달라지므로 Task 버전까지 포함한 버전을 씁니다.
+    version = service.get_version if expand is None else service.get_calendar_version
+    return await conditional_json_response(
+        request, cache, key, version, _build, encoder
+    )
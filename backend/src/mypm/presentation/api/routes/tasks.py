@@ -3,48 +3,601 @@
 from __future__ import annotations
 
 import uuid
+from collections.abc import AsyncIterator
+from datetime import UTC, date, datetime
+from typing import Any
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import (
+    APIRouter,
+    Depends,
+    Header,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    status,
+)
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, ValidationError
+from starlette.types import Receive, Scope, Send
 
 from mypm.application.tasks import TaskService
-from mypm.application.tasks.dto import TaskCreateInput, TaskOutput, TaskUpdateInput
-from mypm.presentation.api.dependencies import get_task_service
-from mypm.presentation.api.schemas.task import TaskCreateSchema, TaskResponseSchema, TaskUpdateSchema
+from mypm.application.tasks.dto import (
+    TaskBatchItemOutput,
+    TaskCreateInput,
+    TaskUpdateInput,
+)
+from mypm.application.tasks.transfer import (
+    DEFAULT_BATCH_SIZE,
+    TransferFormat,
+    export_task_stream,
+    import_task_stream,
+)
+from mypm.domain.tasks.entities import TaskStatus
+from mypm.domain.tasks.errors import ConflictError, UnavailableError
+from mypm.domain.tasks.queries import TaskFilter, TaskSortField
+from mypm.presentation.api.caching import (
+    CachedResponse,
+    ResponseCache,
+    conditional_json_response,
+    entity_etag,
+    parse_if_match,
+)
+from mypm.presentation.api.dependencies import (
+    get_response_cache,
+    get_response_encoder,
+    get_task_fragments,
+    get_task_service,
+)
+from mypm.presentation.api.encoding import FragmentCache
+from mypm.presentation.api.schemas.task import (
+    MAX_BATCH_SIZE,
+    TaskBatchCreateSchema,
+    TaskBatchDeleteSchema,
+    TaskBatchItemResultSchema,
+    TaskBatchResponseSchema,
+    TaskBatchUpdateItemSchema,
+    TaskBatchUpdateSchema,
+    TaskCreateSchema,
+    TaskCycleTimeSchema,
+    TaskDailyCountSchema,
+    TaskImportProgressSchema,
+    TaskQueryExplainSchema,
+    TaskResponseSchema,
+    TaskSearchResponseSchema,
+    TaskStatsResponseSchema,
+    TaskUpdateSchema,
+)
+from mypm.presentation.api.wire import ResponseEncoder
 
 router = APIRouter()
 
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
 
 @router.post("/", response_model=TaskResponseSchema, status_code=status.HTTP_201_CREATED)
 async def create_task(
     payload: TaskCreateSchema,
+    response: Response,
     service: TaskService = Depends(get_task_service),
 ) -> TaskResponseSchema:
     task_input = TaskCreateInput(**payload.model_dump())
     created = await service.create_task(task_input)
+    response.headers["ETag"] = entity_etag(created.updated_at)
     return TaskResponseSchema.model_validate(created)
 
 
 @router.get("/", response_model=list[TaskResponseSchema])
 async def list_tasks(
+    request: Request,
     status_filter: str | None = None,
+    order_by: TaskSortField = TaskSortField.CREATED_AT,
+    descending: bool = False,
+    limit: int | None = Query(None, ge=1, le=1000, description="페이지 크기"),
+    cursor: str | None = Query(
+        None, description=f"이전 응답의 {NEXT_CURSOR_HEADER} 값"
+    ),
+    due_after: date | None = Query(None, description="이 날짜 이후(제외) 마감"),
+    due_before: date | None = Query(None, description="이 날짜 이전(제외) 마감"),
+    service: TaskService = Depends(get_task_service),
+    cache: ResponseCache = Depends(get_response_cache),
+    encoder: ResponseEncoder = Depends(get_response_encoder),
+    fragments: FragmentCache = Depends(get_task_fragments),
+) -> Response:
+    """Task 목록을 조회합니다.
+
+    마감일 범위를 주면 정렬 기준과 무관하게 마감일 오름차순으로 반환합니다.
+    """
+
+    by_due = due_after is not None or due_before is not None
+
+    async def _build() -> CachedResponse:
+        try:
+            if by_due:
+                page = await service.list_tasks_due(
+                    due_after=due_after,
+                    due_before=due_before,
+                    status=status_filter,
+                    limit=limit,
+                    cursor=cursor,
+                )
+            else:
+                page = await service.list_tasks_page(
+                    status=status_filter,
+                    order_by=order_by,
+                    descending=descending,
+                    limit=limit,
+                    cursor=cursor,
+                )
+        except ValueError as exc:  # 잘못된 커서
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)
+            ) from exc
+
+        headers = (
+            {NEXT_CURSOR_HEADER: page.next_cursor}
+            if page.next_cursor is not None
+            else {}
+        )
+        return CachedResponse(body=fragments.encode_many(page.items), headers=headers)
+
+    if by_due:
+        key = ("tasks", "due", status_filter, due_after, due_before, limit, cursor)
+    else:
+        key = ("tasks", status_filter, order_by.value, descending, limit, cursor)
+    return await conditional_json_response(
+        request, cache, key, lambda: service.get_version(status_filter), _build, encoder
+    )
+
+
+@router.get("/search", response_model=TaskSearchResponseSchema)
+async def search_tasks(
+    request: Request,
+    q: str = Query(..., min_length=1, max_length=200, description="검색어"),
+    limit: int = Query(20, ge=1, le=100),
+    offset: int = Query(0, ge=0, le=10_000),
+    service: TaskService = Depends(get_task_service),
+    cache: ResponseCache = Depends(get_response_cache),
+    encoder: ResponseEncoder = Depends(get_response_encoder),
+    fragments: FragmentCache = Depends(get_task_fragments),
+) -> Response:
+    """제목과 설명에서 검색어의 모든 토큰을 포함하는 Task 를 관련도 순으로
+    조회합니다."""
+
+    async def _build() -> CachedResponse:
+        result = await service.search_tasks(q, limit=limit, offset=offset)
+        items = b",".join(
+            b'{"score":%s,"task":%s}'
+            % (repr(hit.score).encode(), fragments.encode(hit.task))
+            for hit in result.items
+        )
+        return CachedResponse(body=b'{"total":%d,"items":[%s]}' % (result.total, items))
+
+    key = ("tasks", "search", q, limit, offset)
+    return await conditional_json_response(
+        request, cache, key, service.get_version, _build, encoder
+    )
+
+
+def _naive_utc(value: datetime | None) -> datetime | None:
+    # 저장된 시각은 시간대 없는 UTC 입니다.
+    if value is None or value.tzinfo is None:
+        return value
+    return value.astimezone(UTC).replace(tzinfo=None)
+
+
+def get_task_filter(
+    status_filter: list[TaskStatus] | None = Query(
+        None, alias="status", description="상태 (여러 번 지정 가능)"
+    ),
+    due_after: date | None = Query(None, description="이 날짜 이후(제외) 마감"),
+    due_before: date | None = Query(None, description="이 날짜 이전(제외) 마감"),
+    retrospective_id: uuid.UUID | None = Query(None, description="연결된 회고"),
+    created_after: datetime | None = Query(None, description="이 시각 이후(제외) 생성"),
+    created_before: datetime | None = Query(
+        None, description="이 시각 이전(제외) 생성"
+    ),
+    updated_after: datetime | None = Query(None, description="이 시각 이후(제외) 수정"),
+    updated_before: datetime | None = Query(
+        None, description="이 시각 이전(제외) 수정"
+    ),
+    prefix: str | None = Query(
+        None, min_length=1, max_length=200, description="제목 접두어 (대소문자 무시)"
+    ),
+) -> TaskFilter:
+    return TaskFilter(
+        statuses=frozenset(status_filter) if status_filter else None,
+        due_after=due_after,
+        due_before=due_before,
+        retrospective_id=retrospective_id,
+        created_after=_naive_utc(created_after),
+        created_before=_naive_utc(created_before),
+        updated_after=_naive_utc(updated_after),
+        updated_before=_naive_utc(updated_before),
+        title_prefix=prefix,
+    )
+
+
+@router.get("/query", response_model=list[TaskResponseSchema])
+async def query_tasks(
+    request: Request,
+    task_filter: TaskFilter = Depends(get_task_filter),
+    order_by: TaskSortField = TaskSortField.CREATED_AT,
+    descending: bool = False,
+    limit: int | None = Query(None, ge=1, le=1000, description="페이지 크기"),
+    cursor: str | None = Query(
+        None, description=f"이전 응답의 {NEXT_CURSOR_HEADER} 값"
+    ),
+    service: TaskService = Depends(get_task_service),
+    cache: ResponseCache = Depends(get_response_cache),
+    encoder: ResponseEncoder = Depends(get_response_encoder),
+    fragments: FragmentCache = Depends(get_task_fragments),
+) -> Response:
+    """모든 조건을 만족하는 Task 를 조회합니다. 범위 조건은 모두 양 끝을 제외합니다."""
+
+    async def _build() -> CachedResponse:
+        try:
+            page = await service.query_tasks(
+                task_filter,
+                order_by=order_by,
+                descending=descending,
+                limit=limit,
+                cursor=cursor,
+            )
+        except ValueError as exc:  # 잘못된 커서
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)
+            ) from exc
+
+        headers = (
+            {NEXT_CURSOR_HEADER: page.next_cursor}
+            if page.next_cursor is not None
+            else {}
+        )
+        return CachedResponse(body=fragments.encode_many(page.items), headers=headers)
+
+    key = (
+        "tasks",
+        "query",
+        task_filter.cache_key(),
+        order_by.value,
+        descending,
+        limit,
+        cursor,
+    )
+    return await conditional_json_response(
+        request, cache, key, service.get_version, _build, encoder
+    )
+
+
+@router.get("/query/explain", response_model=TaskQueryExplainSchema)
+async def explain_task_query(
+    task_filter: TaskFilter = Depends(get_task_filter),
+    order_by: TaskSortField = TaskSortField.CREATED_AT,
+    descending: bool = False,
+    limit: int | None = Query(None, ge=1, le=1000, description="페이지 크기"),
+    service: TaskService = Depends(get_task_service),
+) -> TaskQueryExplainSchema:
+    """``GET /tasks/query`` 가 같은 조건에서 고르는 인덱스와 단계별 후보 수를
+    보여줍니다."""
+
+    page = await service.query_tasks(
+        task_filter, order_by=order_by, descending=descending, limit=limit, explain=True
+    )
+    return TaskQueryExplainSchema.model_validate(page.plan)
+
+
+@router.get("/stats", response_model=TaskStatsResponseSchema)
+async def get_task_stats(
+    request: Request,
+    today: date | None = Query(None, description="기준일 (기본값: 오늘)"),
+    service: TaskService = Depends(get_task_service),
+    cache: ResponseCache = Depends(get_response_cache),
+    encoder: ResponseEncoder = Depends(get_response_encoder),
+) -> Response:
+    """상태별 수, 완료율, 마감 구간별 미완료 수, 회고 연결 수를 조회합니다."""
+
+    reference = today or date.today()
+
+    async def _build() -> CachedResponse:
+        stats = await service.get_stats(reference)
+        return CachedResponse(
+            body=TaskStatsResponseSchema.model_validate(stats)
+            .model_dump_json()
+            .encode()
+        )
+
+    key = ("tasks", "stats", reference)
+    return await conditional_json_response(
+        request, cache, key, service.get_version, _build, encoder
+    )
+
+
+@router.get("/overdue", response_model=list[TaskResponseSchema])
+async def list_overdue_tasks(
+    request: Request,
+    today: date | None = Query(None, description="기준일 (기본값: 오늘)"),
+    limit: int | None = Query(None, ge=1, le=1000),
+    service: TaskService = Depends(get_task_service),
+    cache: ResponseCache = Depends(get_response_cache),
+    encoder: ResponseEncoder = Depends(get_response_encoder),
+    fragments: FragmentCache = Depends(get_task_fragments),
+) -> Response:
+    """마감일이 지난 미완료 Task 를 마감일 순으로 조회합니다."""
+
+    reference = today or date.today()
+
+    async def _build() -> CachedResponse:
+        return CachedResponse(
+            body=fragments.encode_many(await service.list_overdue(reference, limit))
+        )
+
+    key = ("tasks", "overdue", reference, limit)
+    return await conditional_json_response(
+        request, cache, key, service.get_version, _build, encoder
+    )
+
+
+@router.get("/upcoming", response_model=list[TaskResponseSchema])
+async def list_upcoming_tasks(
+    request: Request,
+    days: int = Query(7, ge=1, le=366, description="기준일부터 포함할 일 수"),
+    today: date | None = Query(None, description="기준일 (기본값: 오늘)"),
+    limit: int | None = Query(None, ge=1, le=1000),
+    service: TaskService = Depends(get_task_service),
+    cache: ResponseCache = Depends(get_response_cache),
+    encoder: ResponseEncoder = Depends(get_response_encoder),
+    fragments: FragmentCache = Depends(get_task_fragments),
+) -> Response:
+    """기준일부터 ``days`` 일 안에 마감되는 미완료 Task 를 마감일 순으로 조회합니다."""
+
+    reference = today or date.today()
+
+    async def _build() -> CachedResponse:
+        return CachedResponse(
+            body=fragments.encode_many(
+                await service.list_upcoming(reference, days, limit)
+            )
+        )
+
+    key = ("tasks", "upcoming", reference, days, limit)
+    return await conditional_json_response(
+        request, cache, key, service.get_version, _build, encoder
+    )
+
+
+@router.get("/analytics/cycle-time", response_model=TaskCycleTimeSchema)
+async def get_cycle_time(
+    start: date = Query(..., alias="from", description="시작일 (포함, UTC)"),
+    end: date = Query(..., alias="to", description="종료일 (포함, UTC)"),
+    percentiles: list[int] | None = Query(
+        None,
+        alias="percentile",
+        description="백분위수 (여러 번 지정 가능, 기본값: 50, 85, 95)",
+    ),
+    service: TaskService = Depends(get_task_service),
+) -> TaskCycleTimeSchema:
+    """기간 안에 완료된 Task 가 처음 진행 중이 된 때부터 완료까지 걸린 시간의 분포를
+    조회합니다. 전이 기록이 없는 저장소 구성(스토어 서버)에서는 501."""
+
+    try:
+        return TaskCycleTimeSchema.model_validate(
+            await service.get_cycle_times(start, end, percentiles)
+        )
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)
+        ) from exc
+    except UnavailableError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_501_NOT_IMPLEMENTED, detail=str(exc)
+        ) from exc
+
+
+@router.get("/analytics/throughput", response_model=list[TaskDailyCountSchema])
+async def get_throughput(
+    start: date = Query(..., alias="from", description="시작일 (포함, UTC)"),
+    end: date = Query(..., alias="to", description="종료일 (포함, UTC)"),
+    service: TaskService = Depends(get_task_service),
+) -> list[TaskDailyCountSchema]:
+    """날짜별로 완료된 Task 수를 조회합니다. 다시 열었다가 완료하면 한 번 더 셉니다."""
+
+    try:
+        days = await service.get_throughput(start, end)
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)
+        ) from exc
+    except UnavailableError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_501_NOT_IMPLEMENTED, detail=str(exc)
+        ) from exc
+    return [TaskDailyCountSchema.model_validate(day) for day in days]
+
+
+@router.get("/analytics/burndown", response_model=list[TaskDailyCountSchema])
+async def get_burndown(
+    start: date = Query(..., alias="from", description="시작일 (포함, UTC)"),
+    end: date = Query(..., alias="to", description="종료일 (포함, UTC)"),
+    service: TaskService = Depends(get_task_service),
+) -> list[TaskDailyCountSchema]:
+    """날짜별로 그날이 끝날 때 남아 있는 미완료 Task 수를 조회합니다."""
+
+    try:
+        days = await service.get_burndown(start, end)
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)
+        ) from exc
+    except UnavailableError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_501_NOT_IMPLEMENTED, detail=str(exc)
+        ) from exc
+    return [TaskDailyCountSchema.model_validate(day) for day in days]
+
+
+@router.post("/batch", response_model=TaskBatchResponseSchema)
+async def create_tasks_batch(
+    payload: TaskBatchCreateSchema,
+    service: TaskService = Depends(get_task_service),
+) -> TaskBatchResponseSchema:
+    valid, results = _validate_items(payload.items, TaskCreateSchema)
+    created = await service.create_tasks(
+        [TaskCreateInput(**item.model_dump()) for _, item in valid]
+    )
+    results.extend(
+        TaskBatchItemOutput(index=index, task=task)
+        for (index, _), task in zip(valid, created)
+    )
+    return _batch_response(results)
+
+
+@router.patch("/batch", response_model=TaskBatchResponseSchema)
+async def update_tasks_batch(
+    payload: TaskBatchUpdateSchema,
+    service: TaskService = Depends(get_task_service),
+) -> TaskBatchResponseSchema:
+    valid, results = _validate_items(payload.items, TaskBatchUpdateItemSchema)
+    try:
+        updated = await service.update_tasks(
+            [
+                (
+                    item.id,
+                    TaskUpdateInput(
+                        **item.model_dump(exclude_unset=True, exclude={"id"})
+                    ),
+                )
+                for _, item in valid
+            ]
+        )
+    # 다른 프로세스의 쓰기와 충돌하면 아무것도 반영되지 않습니다.
+    except ConflictError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT, detail=str(exc)
+        ) from exc
+    # 서비스 결과의 index 는 유효한 항목 목록 기준이므로 원래 요청 위치로 되돌립니다.
+    for result in updated:
+        result.index = valid[result.index][0]
+    results.extend(updated)
+    return _batch_response(results)
+
+
+@router.post("/batch/delete", response_model=TaskBatchResponseSchema)
+async def delete_tasks_batch(
+    payload: TaskBatchDeleteSchema,
     service: TaskService = Depends(get_task_service),
-) -> list[TaskResponseSchema]:
-    result = await service.list_tasks(status=status_filter)
-    return [TaskResponseSchema.model_validate(item) for item in result]
+) -> TaskBatchResponseSchema:
+    results = await service.delete_tasks(payload.ids)
+    return _batch_response(results)
+
+
+@router.post("/import", response_class=StreamingResponse)
+async def import_tasks(
+    request: Request,
+    file_format: TransferFormat = Query(
+        TransferFormat.NDJSON, alias="format", description="본문 형식"
+    ),
+    batch_size: int = Query(
+        DEFAULT_BATCH_SIZE, ge=1, le=MAX_BATCH_SIZE, description="한 번에 커밋할 행 수"
+    ),
+    service: TaskService = Depends(get_task_service),
+) -> StreamingResponse:
+    """NDJSON 또는 CSV 본문을 받는 대로 ``batch_size`` 행씩 검증해 추가합니다.
+
+    응답은 묶음마다 진행 상황(``TaskImportProgressSchema``) 한 줄을 보내는 NDJSON
+    입니다. 묶음은 따로 커밋되므로 도중에 멈추면 그 전 묶음까지는 추가된 채로 남고,
+    마지막 줄의 ``error`` 에 이유가 담깁니다. 본문을 스트리밍하므로
+    ``Idempotency-Key`` 는 적용하지 않습니다.
+    """
+
+    async def _progress() -> AsyncIterator[bytes]:
+        async for progress in import_task_stream(
+            service, request.stream(), file_format, batch_size
+        ):
+            yield (
+                TaskImportProgressSchema.model_validate(progress)
+                .model_dump_json()
+                .encode()
+                + b"\n"
+            )
+
+    return _BodyStreamingResponse(
+        _progress(), media_type=TransferFormat.NDJSON.media_type
+    )
+
+
+@router.get("/export", response_class=StreamingResponse)
+async def export_tasks(
+    file_format: TransferFormat = Query(
+        TransferFormat.NDJSON, alias="format", description="응답 형식"
+    ),
+    batch_size: int = Query(
+        DEFAULT_BATCH_SIZE, ge=1, le=MAX_BATCH_SIZE, description="한 번에 읽을 행 수"
+    ),
+    service: TaskService = Depends(get_task_service),
+) -> StreamingResponse:
+    """모든 Task 를 생성 순으로 NDJSON 또는 CSV 로 내려받습니다.
+
+    ``batch_size`` 개씩 읽어 보내므로 Task 수와 무관하게 한 묶음만 메모리에 올립니다.
+    """
+
+    return StreamingResponse(
+        export_task_stream(service, file_format, batch_size),
+        media_type=file_format.media_type,
+        headers={
+            "Content-Disposition": f'attachment; filename="tasks.{file_format.value}"'
+        },
+    )
+
+
+class _BodyStreamingResponse(StreamingResponse):
+    """요청 본문을 읽으면서 보내는 스트리밍 응답.
+
+    ``StreamingResponse`` 는 ASGI 2.4 미만 서버에서 연결 끊김을 감지하려고 ``receive``
+    를 따로 읽는데, 그러면 아직 읽지 않은 본문 메시지를 빼앗깁니다. 여기서는 본문을
+    생성기가 읽으므로 끊김은 본문 읽기(``ClientDisconnect``)나 응답 쓰기 실패로
+    드러납니다.
+    """
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await self.stream_response(send)
+        if self.background is not None:
+            await self.background()
 
 
 @router.patch("/{task_id}", response_model=TaskResponseSchema)
 async def update_task(
     task_id: uuid.UUID,
     payload: TaskUpdateSchema,
+    response: Response,
+    if_match: str | None = Header(
+        default=None, description="수정할 Task 의 ETag (버전)"
+    ),
     service: TaskService = Depends(get_task_service),
 ) -> TaskResponseSchema:
+    """Task 를 수정합니다. ``If-Match`` 가 현재 ETag 와 다르면 409 를 반환합니다."""
+
+    try:
+        expected_version = parse_if_match(if_match)
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)
+        ) from exc
+
     try:
         update_input = TaskUpdateInput(**payload.model_dump(exclude_unset=True))
-        updated = await service.update_task(task_id, update_input)
-        return TaskResponseSchema.model_validate(updated)
+        updated = await service.update_task(task_id, update_input, expected_version)
+    except ConflictError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT, detail=str(exc)
+        ) from exc
     except ValueError as exc:  # Task not found
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)
+        ) from exc
+
+    response.headers["ETag"] = entity_etag(updated.updated_at)
+    return TaskResponseSchema.model_validate(updated)
 
 
 @router.delete("/{task_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -55,3 +608,39 @@ async def delete_task(
     await service.delete_task(task_id)
 
 
+def _validate_items[SchemaT: BaseModel](
+    items: list[dict[str, Any]], schema: type[SchemaT]
+) -> tuple[list[tuple[int, SchemaT]], list[TaskBatchItemOutput]]:
+    """항목별로 검증해 (원래 위치, 검증된 항목) 목록과 실패 결과 목록을 반환합니다."""
+
+    valid: list[tuple[int, SchemaT]] = []
+    failures: list[TaskBatchItemOutput] = []
+    for index, item in enumerate(items):
+        try:
+            valid.append((index, schema.model_validate(item)))
+        except ValidationError as exc:
+            message = "; ".join(
+                f"{'.'.join(str(part) for part in error['loc'])}: {error['msg']}"
+                for error in exc.errors()
+            )
+            failures.append(TaskBatchItemOutput(index=index, error=message))
+    return valid, failures
+
+
+def _batch_response(results: list[TaskBatchItemOutput]) -> TaskBatchResponseSchema:
+    results.sort(key=lambda result: result.index)
+    items = [
+        TaskBatchItemResultSchema(
+            index=result.index,
+            ok=result.error is None,
+            task=TaskResponseSchema.model_validate(result.task)
+            if result.task is not None
+            else None,
+            error=result.error,
+        )
+        for result in results
+    ]
+    failed = sum(1 for item in items if not item.ok)
+    return TaskBatchResponseSchema(
+        results=items, succeeded=len(items) - failed, failed=failed
+    )
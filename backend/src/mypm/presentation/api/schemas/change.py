@@ -0,0 +1,43 @@
+"""변경 피드 API 스키마."""
+
+from __future__ import annotations
+
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+from mypm.domain.tasks.changes import ChangeKind
+from mypm.presentation.api.schemas.retrospective import RetrospectiveResponseSchema
+from mypm.presentation.api.schemas.task import TaskResponseSchema
+
+
+class ChangeResponseSchema(BaseModel):
+    sequence: int
+    kind: ChangeKind
+    id: UUID
+    deleted: bool
+    task: TaskResponseSchema | None = None
+    retrospective: RetrospectiveResponseSchema | None = None
+
+    class Config:
+        from_attributes = True
+
+
+class ChangeSetResponseSchema(BaseModel):
+    cursor: int = Field(..., description="다음 요청의 since 값")
+    has_more: bool = Field(
+        ..., description="cursor 이후에 아직 받지 않은 변경이 있는지 여부"
+    )
+    reset: bool = Field(
+        ..., description="커서가 없거나 만료되어 전체 상태를 담았는지 여부"
+    )
+    changes: list[ChangeResponseSchema]
+    tasks: list[TaskResponseSchema] | None = Field(
+        None, description="reset 일 때의 전체 Task"
+    )
+    retrospectives: list[RetrospectiveResponseSchema] | None = Field(
+        None, description="reset 일 때의 전체 회고"
+    )
+
+    class Config:
+        from_attributes = True
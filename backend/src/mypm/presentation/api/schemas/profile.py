@@ -0,0 +1,22 @@
+"""프로파일 API 스키마."""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from pydantic import BaseModel, Field
+
+
+class ProfileSummaryResponseSchema(BaseModel):
+    id: str
+    method: str
+    path: str
+    route: str
+    status: int
+    started_at: datetime
+    wall_ms: float = Field(..., description="요청 전체 경과 시간")
+    cpu_ms: float = Field(..., description="요청 코루틴이 이벤트 루프에서 실행된 시간")
+    stacks: int = Field(..., description="collapsed-stack 줄 수")
+
+    class Config:
+        from_attributes = True
@@ -7,6 +7,9 @@ from uuid import UUID
 
 from pydantic import BaseModel, Field
 
+from mypm.domain.tasks.entities import TaskStatus
+from mypm.presentation.api.schemas.task import MAX_BATCH_SIZE, TaskResponseSchema
+
 
 class RetrospectiveCreateSchema(BaseModel):
     title: str = Field(..., description="회고 제목")
@@ -25,3 +28,30 @@ class RetrospectiveResponseSchema(BaseModel):
         from_attributes = True
 
 
+class RetrospectiveDetailResponseSchema(BaseModel):
+    """``expand=tasks`` 응답. ``tasks`` 에 ID 대신 Task 를 담습니다."""
+
+    id: UUID
+    title: str
+    summary: str | None
+    date: datetime.date
+    tasks: list[TaskResponseSchema]
+
+    class Config:
+        from_attributes = True
+
+
+class RetrospectiveTasksSchema(BaseModel):
+    ids: list[UUID] = Field(
+        ..., max_length=MAX_BATCH_SIZE, description="연결하거나 뺄 할 일 ID 목록"
+    )
+
+
+class RetrospectiveCalendarDaySchema(BaseModel):
+    date: datetime.date
+    retrospectives: list[UUID]
+    task_count: int
+    status_counts: dict[TaskStatus, int]
+
+    class Config:
+        from_attributes = True
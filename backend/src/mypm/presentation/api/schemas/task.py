@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import datetime
+from typing import Any
 from uuid import UUID
 
 from pydantic import BaseModel, Field
@@ -35,3 +36,147 @@ class TaskResponseSchema(BaseModel):
         from_attributes = True
 
 
+class TaskStatsResponseSchema(BaseModel):
+    total: int
+    by_status: dict[TaskStatus, int]
+    completion_rate: float = Field(..., description="완료 Task 비율 (0~1)")
+    overdue: int = Field(..., description="마감일이 지난 미완료 Task 수")
+    due_today: int
+    due_this_week: int = Field(
+        ..., description="내일부터 7일 안에 마감되는 미완료 Task 수"
+    )
+    due_later: int
+    no_due_date: int
+    attached_to_retrospective: int
+    retrospective_count: int
+
+    class Config:
+        from_attributes = True
+
+
+class TaskSearchHitSchema(BaseModel):
+    score: float
+    task: TaskResponseSchema
+
+    class Config:
+        from_attributes = True
+
+
+class TaskSearchResponseSchema(BaseModel):
+    total: int
+    items: list[TaskSearchHitSchema]
+
+    class Config:
+        from_attributes = True
+
+
+class TaskPlanStepSchema(BaseModel):
+    index: str = Field(..., description="후보를 좁힌 인덱스")
+    estimated: int | None = Field(
+        ..., description="인덱스가 알려준 후보 수 (알 수 없으면 null)"
+    )
+    candidates: int = Field(..., description="이 단계까지 교집합한 후보 수")
+
+    class Config:
+        from_attributes = True
+
+
+class TaskQueryExplainSchema(BaseModel):
+    steps: list[TaskPlanStepSchema]
+    residual: list[str] = Field(
+        ..., description="인덱스 없이 후보에서 직접 검사한 조건"
+    )
+    scanned: int | None = Field(
+        ..., description="조건을 검사한 후보 수 (알 수 없으면 null)"
+    )
+    matched: int = Field(..., description="일치 건수")
+    detail: str | None = Field(
+        None, description="백엔드별 계획 (SQLite 의 EXPLAIN QUERY PLAN)"
+    )
+
+    class Config:
+        from_attributes = True
+
+
+# 일괄 요청 한 번에 받을 수 있는 최대 항목 수
+MAX_BATCH_SIZE = 5000
+
+
+class TaskBatchUpdateItemSchema(TaskUpdateSchema):
+    id: UUID = Field(..., description="수정할 할 일 ID")
+
+
+class TaskBatchCreateSchema(BaseModel):
+    # 항목별 검증 오류를 개별 결과로 돌려주기 위해 원본 객체로 받습니다.
+    items: list[dict[str, Any]] = Field(
+        ..., max_length=MAX_BATCH_SIZE, description="TaskCreateSchema 목록"
+    )
+
+
+class TaskBatchUpdateSchema(BaseModel):
+    items: list[dict[str, Any]] = Field(
+        ..., max_length=MAX_BATCH_SIZE, description="TaskBatchUpdateItemSchema 목록"
+    )
+
+
+class TaskBatchDeleteSchema(BaseModel):
+    ids: list[UUID] = Field(
+        ..., max_length=MAX_BATCH_SIZE, description="삭제할 할 일 ID 목록"
+    )
+
+
+class TaskBatchItemResultSchema(BaseModel):
+    index: int
+    ok: bool
+    task: TaskResponseSchema | None = None
+    error: str | None = None
+
+
+class TaskBatchResponseSchema(BaseModel):
+    results: list[TaskBatchItemResultSchema]
+    succeeded: int
+    failed: int
+
+
+class TaskImportErrorSchema(BaseModel):
+    index: int = Field(..., description="0부터 센 데이터 행 위치 (CSV 헤더 제외)")
+    error: str
+
+    class Config:
+        from_attributes = True
+
+
+class TaskImportProgressSchema(BaseModel):
+    processed: int = Field(..., description="지금까지 읽은 행 수")
+    created: int = Field(..., description="지금까지 추가한 Task 수")
+    failed: int = Field(..., description="지금까지 실패한 행 수")
+    errors: list[TaskImportErrorSchema] = Field(
+        ..., description="이번 묶음에서 실패한 행"
+    )
+    done: bool = Field(..., description="마지막 진행 상황인지 여부")
+    error: str | None = Field(None, description="본문을 더 읽을 수 없어 멈춘 이유")
+
+    class Config:
+        from_attributes = True
+
+
+class TaskCycleTimeSchema(BaseModel):
+    count: int = Field(..., description="사이클 타임을 잰 완료 수")
+    unmeasured: int = Field(
+        ..., description="진행 중이 된 시점을 기록하지 못한 완료 수"
+    )
+    mean_seconds: float | None
+    percentiles: dict[int, float] = Field(
+        ..., description="백분위수 -> 초 (nearest-rank)"
+    )
+
+    class Config:
+        from_attributes = True
+
+
+class TaskDailyCountSchema(BaseModel):
+    date: datetime.date
+    count: int
+
+    class Config:
+        from_attributes = True
@@ -0,0 +1,149 @@
+"""응답 표현 협상: MessagePack 변환과 gzip/zstd 압축.
+
+``msgpack`` 과 ``zstandard`` 는 선택 의존성(``mypm[wire]``)입니다. 설치되어 있지 않으면
+해당 형식을 협상 후보에서 빼고 JSON/gzip 으로 응답합니다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import gzip
+import json
+from dataclasses import dataclass
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - 선택 의존성
+    msgpack = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - 선택 의존성
+    zstandard = None
+
+JSON = "application/json"
+MSGPACK = "application/msgpack"
+_MSGPACK_ALIASES = {MSGPACK, "application/x-msgpack", "application/vnd.msgpack"}
+
+GZIP = "gzip"
+ZSTD = "zstd"
+
+# 캐시된 응답마다 Accept/Accept-Encoding 에 따라 본문이 달라집니다.
+VARY = "Accept, Accept-Encoding"
+
+
+def _parse_quality(header: str | None) -> dict[str, float]:
+    """``a;q=0.5, b`` 형식 헤더를 소문자 값 -> q 로 읽습니다. q 가 없으면 1 입니다."""
+
+    if not header:
+        return {}
+
+    qualities = {}
+    for part in header.split(","):
+        value, _, params = part.partition(";")
+        value = value.strip().lower()
+        if not value:
+            continue
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, raw = param.partition("=")
+            if name.strip() == "q":
+                try:
+                    quality = float(raw)
+                except ValueError:
+                    quality = 0.0
+        qualities[value] = max(quality, qualities.get(value, 0.0))
+    return qualities
+
+
+def negotiate_media_type(accept: str | None) -> str:
+    """MessagePack 을 JSON 보다 낮지 않은 우선순위로 명시한 경우에만 MessagePack 을
+    고릅니다."""
+
+    if msgpack is None or not accept or "msgpack" not in accept:
+        return JSON
+
+    qualities = _parse_quality(accept)
+    packed = max((qualities.get(alias, 0.0) for alias in _MSGPACK_ALIASES), default=0.0)
+    plain = max(
+        qualities.get(JSON, 0.0),
+        qualities.get("application/*", 0.0),
+        qualities.get("*/*", 0.0),
+    )
+    return MSGPACK if packed > 0 and packed >= plain else JSON
+
+
+def negotiate_encoding(accept_encoding: str | None) -> str | None:
+    """zstd(설치된 경우), gzip 순으로 클라이언트가 받는 압축을 고릅니다. 없으면
+    ``None``."""
+
+    if not accept_encoding:
+        return None
+
+    qualities = _parse_quality(accept_encoding)
+    wildcard = qualities.get("*", 0.0)
+    candidates = [ZSTD, GZIP] if zstandard is not None else [GZIP]
+    best, best_quality = None, 0.0
+    for encoding in candidates:
+        quality = qualities.get(encoding, wildcard)
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+def to_msgpack(json_body: bytes) -> bytes:
+    """캐시된 JSON 본문을 같은 구조의 MessagePack 으로 바꿉니다. 날짜와 UUID 는 JSON 과
+    같은 문자열입니다."""
+
+    return msgpack.packb(json.loads(json_body), use_bin_type=True)
+
+
+@dataclass(frozen=True, slots=True)
+class ResponseEncoder:
+    """협상된 표현으로 본문을 바꾸고 압축합니다.
+
+    ``min_bytes`` 보다 작은 본문은 압축하지 않습니다(헤더와 CPU 비용이 이득보다 큽니다).
+    ``thread_bytes`` 이상인 본문은 이벤트 루프가 멈추지 않도록 스레드 풀에서 압축합니다.
+    """
+
+    min_bytes: int = 1024
+    thread_bytes: int = 256 * 1024
+    gzip_level: int = 3
+    zstd_level: int = 3
+
+    def encoding_for(self, accept_encoding: str | None, size: int) -> str | None:
+        if size < self.min_bytes:
+            return None
+        return negotiate_encoding(accept_encoding)
+
+    async def encode(
+        self, json_body: bytes, media_type: str, encoding: str | None
+    ) -> bytes:
+        if media_type == JSON and encoding is None:
+            return json_body
+        if len(json_body) >= self.thread_bytes:
+            return await asyncio.to_thread(
+                self._encode, json_body, media_type, encoding
+            )
+        return self._encode(json_body, media_type, encoding)
+
+    def _encode(self, json_body: bytes, media_type: str, encoding: str | None) -> bytes:
+        body = to_msgpack(json_body) if media_type == MSGPACK else json_body
+        if encoding == GZIP:
+            return gzip.compress(body, compresslevel=self.gzip_level, mtime=0)
+        if encoding == ZSTD:
+            return zstandard.ZstdCompressor(level=self.zstd_level).compress(body)
+        return body
+
+
+__all__ = [
+    "GZIP",
+    "JSON",
+    "MSGPACK",
+    "VARY",
+    "ZSTD",
+    "ResponseEncoder",
+    "negotiate_encoding",
+    "negotiate_media_type",
+    "to_msgpack",
+]
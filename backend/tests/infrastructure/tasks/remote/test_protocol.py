@@ -0,0 +1,142 @@
+"""스토어 서버 프로토콜의 인코딩/디코딩 왕복."""
+
+from __future__ import annotations
+
+import uuid
+from datetime import date, datetime
+
+import pytest
+
+from mypm.domain.tasks.changes import Change, ChangeBatch, ChangeKind
+from mypm.domain.tasks.entities import Retrospective, Task, TaskStatus
+from mypm.domain.tasks.queries import TaskKeyset, TaskSortField
+from mypm.domain.tasks.stats import TaskStats
+from mypm.infrastructure.tasks.remote.protocol import (
+    FRAME_LENGTH,
+    OP_CODES,
+    STATUS_CONFLICT,
+    decode_message,
+    encode_request,
+    encode_response,
+)
+
+
+def _round_trip(value: object) -> object:
+    frame = encode_response(7, 0, value)
+    _, _, decoded = decode_message(frame[FRAME_LENGTH.size :])
+    return decoded
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        None,
+        True,
+        False,
+        0,
+        -(1 << 63),
+        (1 << 63) - 1,
+        1.5,
+        "",
+        "회고 ✓",
+        uuid.uuid4(),
+        date(2026, 2, 28),
+        datetime(2026, 1, 2, 3, 4, 5, 678901),
+        datetime(1969, 12, 31, 23, 59, 59, 999999),
+        TaskStatus.IN_PROGRESS,
+        TaskSortField.DUE_DATE,
+        [1, "a", None, [2.0]],
+        {"a": {uuid.UUID(int=1): [date(2026, 1, 1)]}, 3: None},
+    ],
+)
+def test_scalar_and_container_round_trip(value: object) -> None:
+    decoded = _round_trip(value)
+    assert decoded == value
+    assert type(decoded) is type(value)
+
+
+def test_tuple_and_set_decode_as_list() -> None:
+    assert _round_trip((1, 2)) == [1, 2]
+    assert _round_trip({3}) == [3]
+
+
+def test_task_round_trip_keeps_change_record() -> None:
+    task = Task(
+        title="write tests",
+        description=None,
+        due_date=date(2026, 3, 1),
+        retrospective_id=uuid.uuid4(),
+    )
+    previous = task.updated_at
+    task.rename("write more tests")
+    task.mark_in_progress()
+
+    decoded = _round_trip(task)
+
+    assert decoded == task
+    assert dict(decoded.changes) == {
+        "title": "write tests",
+        "status": TaskStatus.TODO,
+        "updated_at": previous,
+    }
+    # 서버는 읽은 시점의 버전으로 낙관적 검사를 합니다.
+    assert decoded.previous("updated_at") == previous
+
+
+def test_retrospective_round_trip_keeps_task_order_and_changes() -> None:
+    task_ids = [uuid.uuid4() for _ in range(3)]
+    retrospective = Retrospective(title="daily", date=date(2026, 1, 5))
+    retrospective.add_tasks(task_ids[:2])
+    retrospective.clear_changes()
+    retrospective.add_tasks(task_ids[2:])
+
+    decoded = _round_trip(retrospective)
+
+    assert decoded == retrospective
+    assert list(decoded.tasks) == task_ids
+    assert decoded.changes["tasks"] == tuple(task_ids[:2])
+
+
+def test_record_round_trip() -> None:
+    task = Task(title="t")
+    batch = ChangeBatch(
+        changes=[
+            Change(1, ChangeKind.TASK, task.id, task),
+            Change(2, ChangeKind.TASK, task.id, None),
+        ],
+        latest=2,
+    )
+    stats = TaskStats(total=3, by_status={TaskStatus.TODO: 2, TaskStatus.DONE: 1})
+    keyset = TaskKeyset(value=datetime(2026, 1, 1), task_id=task.id)
+
+    assert _round_trip(batch) == batch
+    assert _round_trip(stats) == stats
+    assert _round_trip(keyset) == keyset
+
+
+def test_request_frame_layout() -> None:
+    op = OP_CODES[("tasks", "get")]
+    task_id = uuid.uuid4()
+    frame = encode_request(0xFFFFFFFF, op, (task_id,), {"limit": 3})
+
+    (length,) = FRAME_LENGTH.unpack_from(frame)
+    assert length == len(frame) - FRAME_LENGTH.size
+    assert decode_message(frame[FRAME_LENGTH.size :]) == (
+        0xFFFFFFFF,
+        op,
+        [[task_id], {"limit": 3}],
+    )
+
+
+def test_error_response_round_trip() -> None:
+    frame = encode_response(3, STATUS_CONFLICT, "Task was modified concurrently")
+    assert decode_message(frame[FRAME_LENGTH.size :]) == (
+        3,
+        STATUS_CONFLICT,
+        "Task was modified concurrently",
+    )
+
+
+def test_unknown_type_is_rejected() -> None:
+    with pytest.raises(TypeError):
+        encode_response(1, 0, object())
@@ -0,0 +1,172 @@
+"""스토어 서버와 원격 리포지토리 클라이언트를 같은 이벤트 루프에서 연결해 봅니다."""
+
+from __future__ import annotations
+
+import asyncio
+import uuid
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+from pathlib import Path
+
+import pytest
+
+from mypm.domain.tasks.entities import Task, TaskStatus
+from mypm.domain.tasks.errors import ConflictError
+from mypm.infrastructure.tasks import (
+    ChangeLog,
+    InMemoryRetrospectiveRepository,
+    InMemoryTaskRepository,
+    InMemoryTransactionalStore,
+    RemoteChangeFeed,
+    RemoteTaskRepository,
+    RemoteTransactionalStore,
+    StoreClient,
+    StoreServer,
+)
+
+# 잠금을 기다리는 쪽이 막혀 있는지 볼 때 기다리는 시간(초)
+_BLOCKED = 0.1
+# 잠금이 풀린 뒤 얻을 때까지의 최대 시간(초)
+_RELEASED = 2.0
+
+
+@asynccontextmanager
+async def _serving(path: str) -> AsyncIterator[Callable[[], StoreClient]]:
+    """서버를 열고 클라이언트를 만드는 함수를 넘깁니다. 서버는 연결이 모두 닫혀야
+    멈추므로 나갈 때 만든 클라이언트를 먼저 닫습니다."""
+
+    changes = ChangeLog(1000)
+    tasks = InMemoryTaskRepository(changes=changes)
+    retrospectives = InMemoryRetrospectiveRepository(changes=changes)
+    server = await StoreServer(
+        tasks,
+        retrospectives,
+        InMemoryTransactionalStore(tasks, retrospectives),
+        changes,
+    ).start(path)
+    clients: list[StoreClient] = []
+
+    def connect() -> StoreClient:
+        clients.append(StoreClient(path, pool_size=1))
+        return clients[-1]
+
+    async with server:
+        try:
+            yield connect
+        finally:
+            for client in clients:
+                client.close()
+
+
+@pytest.fixture
+def socket_path(tmp_path: Path) -> str:
+    return str(tmp_path / "store.sock")
+
+
+async def _lock_then_release(
+    store: RemoteTransactionalStore, task_id: uuid.UUID
+) -> None:
+    async with store.lock([task_id]):
+        pass
+
+
+def test_repository_calls_round_trip(socket_path: str) -> None:
+    async def scenario() -> None:
+        async with _serving(socket_path) as connect:
+            client = connect()
+            tasks = RemoteTaskRepository(client)
+            feed = RemoteChangeFeed(client)
+            before = await feed.latest()
+
+            task = await tasks.add(Task(title="remote"))
+            assert not task.changes
+            stored = await tasks.get(task.id)
+            assert stored == task
+
+            stored.set_status(TaskStatus.DONE)
+            stored.touch()
+            await tasks.update(stored)
+            assert (await tasks.get(task.id)).status is TaskStatus.DONE
+            assert await tasks.get(uuid.uuid4()) is None
+            batch = await feed.since(before, 10)
+            assert [change.entity_id for change in batch.changes] == [task.id] * 2
+
+    asyncio.run(scenario())
+
+
+def test_errors_map_to_client_exceptions(socket_path: str) -> None:
+    async def scenario() -> None:
+        async with _serving(socket_path) as connect:
+            tasks = RemoteTaskRepository(connect())
+            task = await tasks.add(Task(title="conflict"))
+
+            first, second = await tasks.get(task.id), await tasks.get(task.id)
+            first.rename("first")
+            first.touch()
+            await tasks.update(first)
+            second.rename("second")
+            second.touch()
+            with pytest.raises(ConflictError):
+                await tasks.update(second)
+
+            with pytest.raises(ValueError, match="Task not found"):
+                await tasks.update(Task(title="missing"))
+            # 오류 뒤에도 같은 연결을 계속 씁니다.
+            assert (await tasks.get(task.id)).title == "first"
+
+    asyncio.run(scenario())
+
+
+def test_pipelined_requests_are_matched_by_id(socket_path: str) -> None:
+    async def scenario() -> None:
+        async with _serving(socket_path) as connect:
+            tasks = RemoteTaskRepository(connect())
+            added = await tasks.add_many([Task(title=f"t{i}") for i in range(200)])
+
+            found = await asyncio.gather(*(tasks.get(task.id) for task in added))
+
+            assert [task.title for task in found] == [task.title for task in added]
+
+    asyncio.run(scenario())
+
+
+def test_lease_is_released_when_holder_disconnects(socket_path: str) -> None:
+    async def scenario() -> None:
+        async with _serving(socket_path) as connect:
+            holder_client = connect()
+            holder = RemoteTransactionalStore(holder_client)
+            waiter = RemoteTransactionalStore(connect())
+            task_id = uuid.uuid4()
+
+            async with holder.lock([task_id]):
+                blocked = asyncio.create_task(_lock_then_release(waiter, task_id))
+                await asyncio.sleep(_BLOCKED)
+                assert not blocked.done()
+
+                # 해제 요청을 보내기 전에 연결만 끊습니다.
+                holder_client.close()
+                await asyncio.wait_for(blocked, _RELEASED)
+
+    asyncio.run(scenario())
+
+
+def test_pending_lease_is_dropped_when_waiter_disconnects(socket_path: str) -> None:
+    async def scenario() -> None:
+        async with _serving(socket_path) as connect:
+            waiter_client = connect()
+            holder = RemoteTransactionalStore(connect())
+            waiter = RemoteTransactionalStore(waiter_client)
+            late = RemoteTransactionalStore(connect())
+            task_id = uuid.uuid4()
+
+            async with holder.lock([task_id]):
+                abandoned = asyncio.create_task(_lock_then_release(waiter, task_id))
+                await asyncio.sleep(_BLOCKED)
+                waiter_client.close()
+                with pytest.raises(ConnectionError):
+                    await abandoned
+
+            # 끊긴 워커가 기다리던 임대가 잠금을 가져가면 여기서 멈춥니다.
+            await asyncio.wait_for(_lock_then_release(late, task_id), _RELEASED)
+
+    asyncio.run(scenario())